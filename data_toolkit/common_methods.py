@@ -14,7 +14,9 @@
 
 """ """
 
+import numpy as np
 import os.path
+import pandas as pd
 
 
 def create_csv_generic(
@@ -34,3 +36,115 @@ def create_csv_generic(
             f"The file {filename} already exists and overwrite has not been "
             "indicated."
         )
+
+
+def get_weighted_unit_profile_array(
+    conn,
+    raw_data_table,
+    unit_column,
+    value_column,
+    unit_weights,
+):
+    """
+    :param conn: the database connection
+    :param raw_data_table: the raw data table with hourly values by unit,
+        year, month, day_of_month, and hour_of_day
+    :param unit_column: the unit column of the raw data table
+    :param value_column: the value column of the raw data table
+    :param unit_weights: list of (unit, weight) tuples
+    :return: tuple of the first year in the data, the array of the
+        weighted sum of the unit values, and the boolean array of whether any
+        of the units has data, both indexed by (year - first year, month,
+        day of month, hour of day)
+
+    Load the raw hourly profiles of all units with one query, so that the
+    weighted profiles of any number of days can be looked up in memory.
+    """
+    units = list(dict.fromkeys(unit for (unit, weight) in unit_weights))
+    df = pd.read_sql(
+        f"""
+        SELECT {unit_column} AS unit, year, month, day_of_month, hour_of_day,
+        {value_column} AS value
+        FROM {raw_data_table}
+        WHERE {unit_column} IN ({", ".join(["?"] * len(units))})
+        ;
+        """,
+        con=conn,
+        params=units,
+    )
+
+    if df.empty:
+        return 0, np.zeros((0, 13, 32, 24)), np.zeros((0, 13, 32, 24), dtype=bool)
+
+    first_year = int(df["year"].min())
+    shape = (
+        int(df["year"].max()) - first_year + 1,
+        13,
+        32,
+        max(int(df["hour_of_day"].max()) + 1, 24),
+    )
+    weighted_sum = np.zeros(shape)
+    n_values = np.zeros(shape, dtype=int)
+    has_data = np.zeros(shape, dtype=bool)
+
+    weights = {unit: 0 for unit in units}
+    for unit, weight in unit_weights:
+        weights[unit] += float(weight)
+
+    index = (
+        df["year"].to_numpy() - first_year,
+        df["month"].to_numpy(),
+        df["day_of_month"].to_numpy(),
+        df["hour_of_day"].to_numpy(),
+    )
+    values = df["value"].to_numpy(dtype=float) * df["unit"].map(weights).to_numpy()
+    has_value = ~np.isnan(values)
+    np.add.at(weighted_sum, tuple(i[has_value] for i in index), values[has_value])
+    np.add.at(n_values, tuple(i[has_value] for i in index), 1)
+    has_data[index] = True
+
+    # Like a SQL SUM, hours where all values are NULL are NULL
+    weighted_sum[has_data & (n_values == 0)] = np.nan
+
+    return first_year, weighted_sum, has_data
+
+
+def get_day_profiles(
+    first_year,
+    weighted_sum,
+    has_data,
+    years,
+    months,
+    days_of_month,
+):
+    """
+    :param first_year: the first year of the profile arrays
+    :param weighted_sum: the array of weighted values indexed by (year -
+        first year, month, day of month, hour of day)
+    :param has_data: the boolean array of whether there is data, with the
+        same index
+    :param years: array of the year of each day to look up
+    :param months: array of the month of each day to look up
+    :param days_of_month: array of the day of month of each day to look up
+    :return: tuple of the arrays of the weighted values and of whether there
+        is data, indexed by (day, hour of day)
+
+    Days outside of the years of the data have no data.
+    """
+    year_index = np.asarray(years, dtype=int) - first_year
+    months = np.asarray(months, dtype=int)
+    days_of_month = np.asarray(days_of_month, dtype=int)
+    in_range = (year_index >= 0) & (year_index < weighted_sum.shape[0])
+    year_index = np.where(in_range, year_index, 0)
+
+    if weighted_sum.shape[0] == 0:
+        n_hours = weighted_sum.shape[3]
+        return (
+            np.zeros((len(year_index), n_hours)),
+            np.zeros((len(year_index), n_hours), dtype=bool),
+        )
+
+    day_has_data = has_data[year_index, months, days_of_month]
+    day_has_data[~in_range] = False
+
+    return weighted_sum[year_index, months, days_of_month], day_has_data
@@ -13,9 +13,14 @@
 # limitations under the License.
 
 from multiprocessing import get_context
+import numpy as np
 import os.path
 import pandas as pd
 
+from data_toolkit.common_methods import (
+    get_day_profiles,
+    get_weighted_unit_profile_array,
+)
 from data_toolkit.project.common_methods import (
     create_iterations_csv,
 )
@@ -144,51 +149,38 @@ def create_project_csv(
                 ;
                 """).fetchall()
 
-    for weather_iteration, draw_number, year, month, day_of_month in draws:
-        # For each project, get the weighted cap factor for each of its
-        # constituent units, get the UNION of these tables, and then find
-        # the project cap factor with SUM and GROUP BY
-        unit_queries = [
-            f"""
-            SELECT year, month, day_of_month, hour_of_day, unit, 
-            {param_name} * {weight} as weighted_{param_name}
-            FROM {raw_data_table}
-            WHERE year = {year}
-            AND month = {month}
-            AND day_of_month = {day_of_month}
-            AND unit = '{unit}'
-            """
-            for (unit, weight) in timeseries_project_unit_dict[timeseries_name][project]
-        ]
-
-        union_query = " UNION ".join(unit_queries)
-
-        # Get the project cap factor
-        # TODO: start draw numbers at 0 and remove -1 here
-        # We're assuming draws are days, so multiplying the draw
-        # number by 24 here, then adding hour of day to get the
-        # timepoint ID
-        hydro_iter_sql = "" if no_hydro_iteration else "0 AS hydro_iteration,"
-        project_query = (
-            f"""
-                SELECT {weather_iteration} AS weather_iteration,  
-                {hydro_iter_sql}
-                {stage_id} AS stage_id,
-                ({draw_number}-1)*24+hour_of_day AS timepoint, 
-                sum(weighted_{param_name}) as {param_name}
-                FROM (
-            """
-            + union_query
-            + f""")
-            GROUP BY year, month, day_of_month, hour_of_day
-            ORDER BY year, month, day_of_month, hour_of_day
-            ;
-            """
-        )
+    # Load the raw data of the project's units once, and find the project
+    # profile of all draws at once
+    # TODO: start draw numbers at 0 and remove -1 here
+    # We're assuming draws are days, so multiplying the draw
+    # number by 24 here, then adding hour of day to get the
+    # timepoint ID
+    first_year, weighted_sum, has_data = get_weighted_unit_profile_array(
+        conn=conn,
+        raw_data_table=raw_data_table,
+        unit_column="unit",
+        value_column=param_name,
+        unit_weights=timeseries_project_unit_dict[timeseries_name][project],
+    )
+    draws = np.array(draws, dtype=int).reshape(-1, 5)
+    draw_values, draw_has_data = get_day_profiles(
+        first_year=first_year,
+        weighted_sum=weighted_sum,
+        has_data=has_data,
+        years=draws[:, 2],
+        months=draws[:, 3],
+        days_of_month=draws[:, 4],
+    )
+    draw_index, hour_of_day = np.nonzero(draw_has_data)
 
-        # Put into a dataframe and add to file
-        df = pd.read_sql(project_query, con=conn)
+    df = pd.DataFrame({"weather_iteration": draws[draw_index, 0]})
+    if not no_hydro_iteration:
+        df["hydro_iteration"] = 0
+    df["stage_id"] = stage_id
+    df["timepoint"] = (draws[draw_index, 1] - 1) * 24 + hour_of_day
+    df[param_name] = draw_values[draw_index, hour_of_day]
 
+    if len(draws) > 0:
         filename = os.path.join(
             output_directory,
             f"{project}-{profile_scenario_id}-" f"{profile_scenario_name}.csv",
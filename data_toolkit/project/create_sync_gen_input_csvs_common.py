@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import os.path
 import pandas as pd
 
+from data_toolkit.common_methods import (
+    get_weighted_unit_profile_array,
+)
 from db.common_functions import connect_to_database
 
 
@@ -32,42 +36,36 @@ def create_profile_csvs(
     no_hydro_iteration=False,
 ):
     conn = connect_to_database(db_path=db_path)
+    c = conn.cursor()
 
-    # Get the weighted cap factor for each of the project's constituent units,
-    # get the UNION of these tables, and then find the project cap factor
-    # with SUM and GROUP BY
-    hydro_iter_sql = "" if no_hydro_iteration else "0 AS hydro_iteration,"
-    query = f"""
-        SELECT year AS weather_iteration, 
-        {hydro_iter_sql}
-        {stage_id} AS stage_id, 
-        hour_of_year as timepoint, sum(weighted_{param_name}) as {param_name}
-            FROM (
-            SELECT year, month, day_of_month, hour_of_day, unit, 
-            project, unit_weight, {param_name}, unit_weight * {param_name} as weighted_{param_name},
-                (CAST(
-                    strftime('%j',
-                        year || '-' || 
-                        CASE
-                        WHEN month > 9 THEN month
-                        ELSE '0' || month END
-                        || '-' || 
-                        CASE
-                        WHEN day_of_month > 9 THEN day_of_month
-                        ELSE '0' || day_of_month END
-                        ) AS DECIMAL
-                    ) - 1) * 24 + hour_of_day AS hour_of_year
-            FROM {raw_data_table_name}
-            JOIN {raw_data_units_table_name}
-            USING (unit)
-            WHERE project = '{project}'
-            )
-        GROUP BY year, hour_of_year
-        ORDER BY year, hour_of_year
-    """
+    # Load the raw data of the project's units once, and find the project
+    # profile of each year with the unit-weighted sum of the unit profiles
+    unit_weights = c.execute(
+        f"""SELECT unit, unit_weight
+        FROM {raw_data_units_table_name}
+        WHERE project = ?;""",
+        (project,),
+    ).fetchall()
+    first_year, weighted_sum, has_data = get_weighted_unit_profile_array(
+        conn=conn,
+        raw_data_table=raw_data_table_name,
+        unit_column="unit",
+        value_column=param_name,
+        unit_weights=unit_weights,
+    )
+    year_index, month, day_of_month, hour_of_day = np.nonzero(has_data)
+    day_of_year = pd.to_datetime(
+        pd.DataFrame(
+            {"year": year_index + first_year, "month": month, "day": day_of_month}
+        )
+    ).dt.dayofyear.to_numpy()
 
-    # Put into a dataframe and add to file
-    df = pd.read_sql(query, con=conn)
+    df = pd.DataFrame({"weather_iteration": year_index + first_year})
+    if not no_hydro_iteration:
+        df["hydro_iteration"] = 0
+    df["stage_id"] = stage_id
+    df["timepoint"] = (day_of_year - 1) * 24 + hour_of_day
+    df[param_name] = weighted_sum[year_index, month, day_of_month, hour_of_day]
 
     filename = os.path.join(
         output_directory,
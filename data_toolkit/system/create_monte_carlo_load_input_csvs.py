@@ -51,9 +51,14 @@ Settings
 
 import sys
 from argparse import ArgumentParser
+import numpy as np
 import os.path
 import pandas as pd
 
+from data_toolkit.common_methods import (
+    get_day_profiles,
+    get_weighted_unit_profile_array,
+)
 from data_toolkit.system.common_methods import (
     create_load_scenario_csv,
     create_load_components_scenario_csv,
@@ -234,7 +239,7 @@ def create_load_levels_csv(
                 (row["load_zone_unit"], row["unit_weight"])
             ]
         else:
-            load_zone_unit_dict[row["project"]].append(
+            load_zone_unit_dict[row["load_zone"]].append(
                 (row["load_zone_unit"], row["unit_weight"])
             )
 
@@ -248,65 +253,71 @@ def create_load_levels_csv(
                 ;
                 """).fetchall()
 
-    draw_n = 0
-    for d in draws:
-        weather_iteration, draw_number, year, month, day_of_month = d
-
-        for load_zone in load_zone_unit_dict.keys():
-            unit_queries = [f"""
-                SELECT year, month, day_of_month, hour_of_day, load_zone_unit, 
-                load_mw * {weight} as weighted_load
-                FROM raw_data_system_load
-                WHERE year = {year}
-                AND month = {month}
-                AND day_of_month = {day_of_month}
-                AND load_zone_unit = '{unit}'
-                """ for (unit, weight) in load_zone_unit_dict[load_zone]]
-
-            union_query = " UNION ".join(unit_queries)
-
-            load_zone_query = (
-                f"""
-                        SELECT 
-                        '{load_zone}' AS load_zone,
-                        {weather_iteration} AS weather_iteration, 
-                        {stage_id} AS stage_id,
-                        ({draw_number}-1)*24+hour_of_day AS timepoint, 
-                        '{load_component_name}' AS load_component,
-                        sum(weighted_load) AS load_mw
-                        FROM (
-                    """
-                + union_query
-                + f""")
-                    GROUP BY year, month, day_of_month, hour_of_day
-                    ;
-                    """
-            )
-
-            # Put into a dataframe and add to file
-            df = pd.read_sql(load_zone_query, con=conn)
-
-            filename = os.path.join(
-                output_directory,
-                "load_levels",
-                f"{load_levels_scenario_id}_{load_levels_scenario_name}.csv",
-            )
-            if not os.path.exists(filename) or (
-                overwrite_load_levels_csv and draw_n == 0
-            ):
-                mode = "w"
-                write_header = True
-            else:
-                mode = "a"
-                write_header = False
-            df.to_csv(
-                filename,
-                mode=mode,
-                header=write_header,
-                index=False,
-            )
+    # Load the raw data of each load zone's units once, and find the load
+    # profiles of all draws at once
+    draws = np.array(draws, dtype=int).reshape(-1, 5)
+    load_zones = list(load_zone_unit_dict.keys())
+    load_zone_values = list()
+    load_zone_has_data = list()
+    for load_zone in load_zones:
+        first_year, weighted_sum, has_data = get_weighted_unit_profile_array(
+            conn=conn,
+            raw_data_table="raw_data_system_load",
+            unit_column="load_zone_unit",
+            value_column="load_mw",
+            unit_weights=load_zone_unit_dict[load_zone],
+        )
+        draw_values, draw_has_data = get_day_profiles(
+            first_year=first_year,
+            weighted_sum=weighted_sum,
+            has_data=has_data,
+            years=draws[:, 2],
+            months=draws[:, 3],
+            days_of_month=draws[:, 4],
+        )
+        load_zone_values.append(draw_values)
+        load_zone_has_data.append(draw_has_data)
+
+    # Rows are ordered by draw, load zone, and hour
+    n_hours = max([24] + [values.shape[1] for values in load_zone_values])
+    values = np.full((len(draws), len(load_zones), n_hours), np.nan)
+    has_data = np.zeros((len(draws), len(load_zones), n_hours), dtype=bool)
+    for z, (draw_values, draw_has_data) in enumerate(
+        zip(load_zone_values, load_zone_has_data)
+    ):
+        values[:, z, : draw_values.shape[1]] = draw_values
+        has_data[:, z, : draw_has_data.shape[1]] = draw_has_data
+    draw_index, load_zone_index, hour_of_day = np.nonzero(has_data)
+
+    df = pd.DataFrame(
+        {
+            "load_zone": np.array(load_zones, dtype=object)[load_zone_index],
+            "weather_iteration": draws[draw_index, 0],
+            "stage_id": stage_id,
+            "timepoint": (draws[draw_index, 1] - 1) * 24 + hour_of_day,
+            "load_component": load_component_name,
+            "load_mw": values[draw_index, load_zone_index, hour_of_day],
+        }
+    )
 
-            draw_n += 1
+    if len(draws) > 0 and len(load_zones) > 0:
+        filename = os.path.join(
+            output_directory,
+            "load_levels",
+            f"{load_levels_scenario_id}_{load_levels_scenario_name}.csv",
+        )
+        if not os.path.exists(filename) or overwrite_load_levels_csv:
+            mode = "w"
+            write_header = True
+        else:
+            mode = "a"
+            write_header = False
+        df.to_csv(
+            filename,
+            mode=mode,
+            header=write_header,
+            index=False,
+        )
 
 
 def main(args=None):
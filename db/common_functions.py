@@ -19,14 +19,45 @@ import sys
 import time
 import traceback
 
+RESULTS_INDEX_COLUMNS = [
+    "scenario_id",
+    "weather_iteration",
+    "hydro_iteration",
+    "availability_iteration",
+    "subproblem_id",
+    "stage_id",
+]
 
-def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
+
+class BulkImportConnection(sqlite3.Connection):
+    """
+    Connection used for bulk results imports. While *bulk_import* is True,
+    commit() does nothing and the changes are only committed when
+    commit_bulk_import() is called. This allows all results for a
+    subproblem to be imported in a single transaction even though the
+    results-import functions commit after each statement.
+    """
+
+    bulk_import = False
+
+    def commit(self):
+        if not self.bulk_import:
+            super().commit()
+
+    def commit_bulk_import(self):
+        super().commit()
+
+
+def connect_to_database(
+    db_path="../db/io.db", timeout=5, detect_types=0, factory=sqlite3.Connection
+):
     """
     :param db_path: str, the path to the database, relative to the
         current working directory, defaults to "../db/io.db"
     :param timeout: int, number of seconds the connection should wait for the
         database lock to go away before raising an exception, defaults to 5
     :param detect_types: int, type detection parameter, defaults to 0
+    :param factory: the connection class, defaults to sqlite3.Connection
     :return: the sqlite3 database connection object
 
     Connect to a database and return the connection object.
@@ -37,7 +68,9 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
             "specify a different database file?".format(os.path.abspath(db_path))
         )
 
-    conn = sqlite3.connect(db_path, timeout=timeout, detect_types=detect_types)
+    conn = sqlite3.connect(
+        db_path, timeout=timeout, detect_types=detect_types, factory=factory
+    )
     # print("Connected to {}".format(db_path))
 
     # Enforce foreign keys (default = not enforced)
@@ -46,6 +79,88 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
     return conn
 
 
+def get_results_index_columns(conn):
+    """
+    :param conn: the connection object
+    :return: dictionary with the results tables as keys and the list of the
+        RESULTS_INDEX_COLUMNS they have as values
+
+    Results tables without a scenario_id column are not included.
+    """
+    c = conn.cursor()
+    results_tables = [
+        tbl[0]
+        for tbl in c.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' "
+            "AND name LIKE 'results%';"
+        ).fetchall()
+    ]
+
+    index_columns = dict()
+    for tbl in results_tables:
+        tbl_columns = [
+            col[1] for col in c.execute("PRAGMA table_info({});".format(tbl))
+        ]
+        if "scenario_id" in tbl_columns:
+            index_columns[tbl] = [
+                col for col in RESULTS_INDEX_COLUMNS if col in tbl_columns
+            ]
+
+    return index_columns
+
+
+def create_results_indexes(conn):
+    """
+    :param conn: the connection object
+
+    Index each results table on its scenario, iteration, subproblem, and
+    stage columns (the columns results are deleted and imported by), so that
+    the time to delete prior results doesn't grow with the size of the
+    database. Indexes that already exist are left as they are.
+    """
+    c = conn.cursor()
+    for tbl, columns in get_results_index_columns(conn=conn).items():
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS {}_scenario_idx ON {} ({});".format(
+                tbl, tbl, ", ".join(columns)
+            )
+        )
+    conn.commit()
+
+
+def start_bulk_import(conn):
+    """
+    :param conn: a BulkImportConnection object
+
+    Set up the connection for a bulk results import: use write-ahead logging
+    without syncing to disk on every commit and defer commits until
+    commit_bulk_import() is called.
+    """
+    # The PRAGMAs can't be changed inside a transaction
+    conn.commit()
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.bulk_import = True
+
+
+def end_bulk_import(conn):
+    """
+    :param conn: a BulkImportConnection object
+
+    Commit any remaining changes and create the results indexes if they
+    don't exist yet (e.g. in databases created before the indexes were
+    added), building them once over the imported results rather than
+    updating them during the import. The default rollback journal and
+    synchronous mode are then restored, which also checkpoints the
+    write-ahead log and removes its files.
+    """
+    conn.commit_bulk_import()
+    conn.bulk_import = False
+    create_results_indexes(conn=conn)
+    conn.execute("PRAGMA journal_mode=DELETE;")
+    conn.execute("PRAGMA synchronous=FULL;")
+
+
 # TODO: move to spin_database_lock_generic
 def spin_on_database_lock(
     conn, cursor, sql, data, many=True, max_attempts=61, interval=10, quiet=True
@@ -37,7 +37,11 @@ import pandas as pd
 import sqlite3
 import sys
 
-from db.common_functions import spin_on_database_lock, spin_on_database_lock_generic
+from db.common_functions import (
+    create_results_indexes,
+    spin_on_database_lock,
+    spin_on_database_lock_generic,
+)
 
 
 def parse_arguments(arguments):
@@ -293,6 +297,8 @@ def main(args=None):
     conn.execute("PRAGMA foreign_keys=ON;")
     # Create schema
     create_database_schema(conn=conn, parsed_arguments=parsed_args)
+    # Index the results tables by scenario, iteration, subproblem, and stage
+    create_results_indexes(conn=conn)
     # Load data
     if not parsed_args.omit_data:
         load_data(
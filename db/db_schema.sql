@@ -209,6 +209,28 @@ CREATE TABLE results_scenario
     FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
 );
 
+-- Model build profile: time and memory by module and component (only
+-- imported if the scenario was run with profiling)
+DROP TABLE IF EXISTS results_scenario_model_profile;
+CREATE TABLE results_scenario_model_profile
+(
+    scenario_id            INTEGER,
+    weather_iteration      INTEGER,
+    hydro_iteration        INTEGER,
+    availability_iteration INTEGER,
+    subproblem_id          INTEGER,
+    stage_id               INTEGER,
+    step                   VARCHAR(64),
+    gridpath_module        VARCHAR(128),
+    component              VARCHAR(128),
+    component_type         VARCHAR(64),
+    n_components           INTEGER,
+    n_indices              INTEGER,
+    seconds                FLOAT,
+    memory_mb              FLOAT,
+    FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
+);
+
 
 -------------------------------------------------------------------------------
 ---- SUBSCENARIOS AND INPUTS -----
@@ -0,0 +1,186 @@
+# Copyright 2016-2025 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the per-subproblem results import time as the results tables fill
+up, with and without the results indexes (see *create_results_indexes* in
+*db.common_functions*). Each subproblem's project-timepoint results are
+deleted and inserted the way *gridpath_import_results* does, and the import
+time of the first and last subproblems is reported. Without the indexes,
+the time to delete prior results grows with the size of the table.
+
+>>> python -m db.utilities.benchmark_results_import --n_projects 100 --n_timepoints 168 --n_subproblems 200
+"""
+
+from argparse import ArgumentParser
+import os.path
+import sys
+import tempfile
+import time
+
+from db import create_database
+from db.common_functions import (
+    BulkImportConnection,
+    connect_to_database,
+    end_bulk_import,
+    get_results_index_columns,
+    start_bulk_import,
+)
+
+N_PROJECTS_DEFAULT = 100
+N_TIMEPOINTS_DEFAULT = 168
+N_SUBPROBLEMS_DEFAULT = 200
+
+
+def parse_arguments(args):
+    """
+    :param args: the script arguments specified by the user
+    :return: the parsed known argument values (<class 'argparse.Namespace'>
+    Python object)
+    """
+    parser = ArgumentParser(add_help=True)
+    parser.add_argument(
+        "--n_projects",
+        default=N_PROJECTS_DEFAULT,
+        type=int,
+        help=f"Defaults to {N_PROJECTS_DEFAULT}.",
+    )
+    parser.add_argument(
+        "--n_timepoints",
+        default=N_TIMEPOINTS_DEFAULT,
+        type=int,
+        help=f"The number of timepoints per subproblem. Defaults to "
+        f"{N_TIMEPOINTS_DEFAULT}.",
+    )
+    parser.add_argument(
+        "--n_subproblems",
+        default=N_SUBPROBLEMS_DEFAULT,
+        type=int,
+        help=f"Defaults to {N_SUBPROBLEMS_DEFAULT}.",
+    )
+    parser.add_argument(
+        "--bulk_import",
+        default=False,
+        action="store_true",
+        help="Import in bulk mode (see gridpath_import_results).",
+    )
+
+    parsed_arguments = parser.parse_known_args(args=args)[0]
+
+    return parsed_arguments
+
+
+def import_subproblem_results(conn, subproblem, n_projects, n_timepoints):
+    """
+    :param conn: the database connection
+    :param subproblem: the subproblem ID
+    :param n_projects: the number of projects
+    :param n_timepoints: the number of timepoints per subproblem
+    :return: the import time in seconds
+
+    Delete the subproblem's prior results and insert its project-timepoint
+    results.
+    """
+    start = time.perf_counter()
+    conn.execute(
+        """
+        DELETE FROM results_project_timepoint
+        WHERE scenario_id = 1
+        AND weather_iteration = 0
+        AND hydro_iteration = 0
+        AND availability_iteration = 0
+        AND subproblem_id = ?
+        AND stage_id = 1;
+        """,
+        (subproblem,),
+    )
+    conn.executemany(
+        """
+        INSERT INTO results_project_timepoint (scenario_id, project,
+        weather_iteration, hydro_iteration, availability_iteration,
+        timepoint, period, subproblem_id, stage_id, power_mw)
+        VALUES (1, ?, 0, 0, 0, ?, 2030, ?, 1, ?);
+        """,
+        [
+            (
+                f"Project_{prj}",
+                (subproblem - 1) * n_timepoints + tmp,
+                subproblem,
+                float(prj + tmp),
+            )
+            for prj in range(n_projects)
+            for tmp in range(1, n_timepoints + 1)
+        ],
+    )
+    conn.commit_bulk_import()
+
+    return time.perf_counter() - start
+
+
+def benchmark(n_projects, n_timepoints, n_subproblems, indexed, bulk_import):
+    """
+    :return: tuple of the import times of the first and last subproblems
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "benchmark.db")
+        create_database.main(["--database", db_path, "--omit_data"])
+        conn = connect_to_database(db_path=db_path, factory=BulkImportConnection)
+        # There are no scenarios in the database
+        conn.execute("PRAGMA foreign_keys=OFF;")
+        if not indexed:
+            for tbl in get_results_index_columns(conn=conn).keys():
+                conn.execute(f"DROP INDEX IF EXISTS {tbl}_scenario_idx;")
+            conn.commit()
+        if bulk_import:
+            start_bulk_import(conn=conn)
+
+        times = [
+            import_subproblem_results(
+                conn=conn,
+                subproblem=subproblem,
+                n_projects=n_projects,
+                n_timepoints=n_timepoints,
+            )
+            for subproblem in range(1, n_subproblems + 1)
+        ]
+
+        if bulk_import:
+            end_bulk_import(conn=conn)
+        conn.close()
+
+    return times[0], times[-1]
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    parsed_args = parse_arguments(args=args)
+
+    for indexed in [False, True]:
+        first, last = benchmark(
+            n_projects=parsed_args.n_projects,
+            n_timepoints=parsed_args.n_timepoints,
+            n_subproblems=parsed_args.n_subproblems,
+            indexed=indexed,
+            bulk_import=parsed_args.bulk_import,
+        )
+        print(
+            f"{'With' if indexed else 'Without'} results indexes: "
+            f"{first:.3f} s for the first subproblem, "
+            f"{last:.3f} s for the last subproblem"
+        )
+
+
+if __name__ == "__main__":
+    main()
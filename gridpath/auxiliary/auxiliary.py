@@ -17,10 +17,17 @@ Various auxiliary functions used in other modules
 """
 
 from importlib import import_module
+import numpy as np
 import os.path
 import pandas as pd
 import traceback
 
+from gridpath.auxiliary.input_files import read_input_table
+
+# Imported subtype modules, keyed by package and module name (see
+# *load_subtype_modules*)
+_SUBTYPE_MODULES = dict()
+
 
 def get_required_subtype_modules(
     scenario_directory,
@@ -35,7 +42,7 @@ def get_required_subtype_modules(
     """
     Get a list of unique types from projects.tab.
     """
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -45,8 +52,7 @@ def get_required_subtype_modules(
             stage,
             "inputs",
             "{}.tab".format(filename),
-        ),
-        sep="\t",
+        )
     )
 
     required_modules = df[which_type].unique()
@@ -71,6 +77,11 @@ def load_subtype_modules(required_subtype_modules, package, required_attributes)
     """
     imported_subtype_modules = dict()
     for m in required_subtype_modules:
+        # Subtype modules that have already been imported and checked in
+        # this process are reused
+        if (package, m) in _SUBTYPE_MODULES.keys():
+            imported_subtype_modules[m] = _SUBTYPE_MODULES[(package, m)]
+            continue
         try:
             imp_m = import_module("." + m, package=package)
             imported_subtype_modules[m] = imp_m
@@ -83,6 +94,7 @@ def load_subtype_modules(required_subtype_modules, package, required_attributes)
                         + str(imp_m)
                         + "."
                     )
+            _SUBTYPE_MODULES[(package, m)] = imp_m
         except ImportError:
             print("ERROR! Unable to import subtype module " + m + ".")
             traceback.print_exc()
@@ -90,6 +102,13 @@ def load_subtype_modules(required_subtype_modules, package, required_attributes)
     return imported_subtype_modules
 
 
+def clear_subtype_module_cache():
+    """
+    Discard the subtype modules cached by *load_subtype_modules*.
+    """
+    _SUBTYPE_MODULES.clear()
+
+
 def join_sets(mod, set_name_list):
     """
     Join sets in a list.
@@ -136,6 +155,47 @@ def subset_init_by_set_membership(mod, superset, index, membership_set):
     )
 
 
+def subsets_init_by_param_value(mod, set_name, param_name, param_value_set):
+    """
+    Initialize a set indexed by param value (e.g., a set of projects indexed
+    by zone) in a single pass over the superset rather than by filtering the
+    superset separately for each param value.
+
+    :param set_name: the superset
+    :param param_name: the param indexed by the superset
+    :param param_value_set: the set of param values to index the subsets by
+    :return: dictionary with the param values as keys and the list of
+        superset elements with that param value as values
+    """
+    subsets = {v: [] for v in getattr(mod, param_value_set)}
+    for i in getattr(mod, set_name):
+        subsets[getattr(mod, param_name)[i]].append(i)
+
+    return subsets
+
+
+def subsets_init_by_param_value_and_tmp(mod, set_by_tmp, param_name, param_value_set):
+    """
+    Initialize a set indexed by param value and timepoint (e.g., the
+    operational projects in each zone and timepoint) from a set indexed by
+    timepoint in a single pass over the timepoint-indexed set, rather than
+    by filtering it separately for each param value and timepoint.
+
+    :param set_by_tmp: the timepoint-indexed superset
+    :param param_name: the param indexed by the superset's elements
+    :param param_value_set: the set of param values to index the subsets by
+    :return: dictionary with (param value, timepoint) tuples as keys and the
+        list of superset elements with that param value as values; elements
+        remain in the order of the timepoint-indexed superset
+    """
+    subsets = {(v, tmp): [] for v in getattr(mod, param_value_set) for tmp in mod.TMPS}
+    for tmp, tmp_set in getattr(mod, set_by_tmp).items():
+        for i in tmp_set:
+            subsets[getattr(mod, param_name)[i], tmp].append(i)
+
+    return subsets
+
+
 def check_list_has_single_item(l, error_msg):
     if len(l) > 1:
         raise ValueError(error_msg)
@@ -194,6 +254,51 @@ def cursor_to_df(cursor):
     return df
 
 
+def df_to_data_portal(
+    data_portal, df, index_columns, params, set_name=None, broadcast=None
+):
+    """
+    Load data from a dataframe into the Pyomo DataPortal in bulk, without
+    accessing the dataframe row by row.
+
+    :param data_portal: the Pyomo DataPortal
+    :param df: pandas DataFrame with the index and param columns
+    :param index_columns: list of the index column names
+    :param params: dictionary with the param column names as keys and the
+        names of the Pyomo params to load them into as values
+    :param set_name: name of the Pyomo set to initialize with the index
+        values (optional)
+    :param broadcast: dictionary with index column names as keys and
+        iterables as values; a 0 in the index column means that the row
+        applies to all of the values, e.g. {"period": periods} (optional)
+    :return:
+
+    Rows are loaded in the order of the dataframe, with each broadcast row
+    expanded in place to the sorted broadcast values.
+    """
+    if broadcast is not None:
+        for col, values in broadcast.items():
+            values = sorted(values)
+            is_zero = (df[col] == 0).to_numpy()
+            if is_zero.any():
+                counts = np.where(is_zero, len(values), 1)
+                col_values = np.repeat(df[col].to_numpy(), counts)
+                col_values[np.repeat(is_zero, counts)] = np.tile(values, is_zero.sum())
+                df = df.loc[df.index.repeat(counts)]
+                df = df.assign(**{col: col_values})
+
+    if len(index_columns) == 1:
+        index_values = df[index_columns[0]].tolist()
+    else:
+        index_values = list(zip(*[df[c].tolist() for c in index_columns]))
+
+    if set_name is not None:
+        data_portal[set_name] = {None: index_values}
+
+    for col, param_name in params.items():
+        data_portal[param_name] = dict(zip(index_values, df[col].tolist()))
+
+
 def check_for_integer_subdirectories(main_directory):
     """
     :param main_directory: directory where we'll look for subdirectories
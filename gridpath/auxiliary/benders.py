@@ -0,0 +1,767 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benders decomposition of capacity expansion problems. If requested with the
+*--benders* run option, the problem instance is not sent to the solver as a
+whole. Instead:
+
+* The variables added by the project and transmission capacity modules
+  (build, retirement, and other investment decisions) are placed in a
+  master problem along with the constraints and objective function terms
+  that only include these variables.
+* The remaining constraints are grouped into operational subproblems that
+  don't share any variables other than the master variables, e.g., one
+  subproblem per period or per horizon depending on which constraints link
+  timepoints. Each subproblem includes the objective function terms of its
+  variables and a linking constraint setting each master variable it uses to
+  the value found by the master problem.
+* The master problem is solved, then the subproblems are solved given the
+  master variable values (in parallel if requested with the
+  *--n_parallel_benders* option). The duals of the linking constraints are
+  the change in each subproblem's objective function per unit change in the
+  master variables, so each subproblem adds a cut to the master problem. The
+  master problem's objective function is a lower bound for the objective
+  function of the full problem (in minimization form), while the master
+  variables' costs plus the subproblem objective functions is an upper
+  bound. We iterate until the relative gap between the two is below the
+  *--benders_tolerance*.
+
+Before the first iteration, each subproblem is solved without the linking
+constraints to get a lower bound for its objective function, so that the
+first master problems are bounded. The subproblems must have a feasible
+solution for any master variable values, e.g., by allowing unserved energy
+and overgeneration, and must be linear (the master variables' integrality
+is relaxed in the subproblems). Once the iterations end, the subproblems are
+solved for the best master solution found, and their solution and duals are
+loaded into the problem instance, so results are exported as usual. The
+bounds in each iteration are saved in the benders_iterations.csv results
+file.
+
+Each subproblem's model is a standalone copy of its constraints and
+variables, so only that model is sent to a worker process when solving
+subproblems in parallel. Note that the problem instance is still created as
+a whole, so this decomposition reduces the size of the problems sent to the
+solver, not the memory needed to build the instance.
+"""
+
+from contextlib import contextmanager
+from csv import writer
+import dill
+from multiprocessing import get_context
+import os.path
+import time
+
+from pyomo.core.expr.visitor import (
+    identify_mutable_parameters,
+    identify_variables,
+    replace_expressions,
+)
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Objective,
+    Param,
+    Suffix,
+    Reals,
+    Set,
+    Var,
+    maximize,
+    minimize,
+    value,
+)
+from pyomo.opt import TerminationCondition
+from pyomo.repn import generate_standard_repn
+
+# Variables added by these modules (including the capacity type modules
+# they load) are in the master problem
+BENDERS_MASTER_MODULES = ("gridpath.project.capacity", "gridpath.transmission.capacity")
+
+BENDERS_ITERATIONS_FILENAME = "benders_iterations.csv"
+
+# The worker process state when solving subproblems in parallel
+_BENDERS_WORKER = dict()
+
+
+def create_standalone_model(constraints, variables, relaxed_variables=()):
+    """
+    :param constraints: list of the problem instance's constraints
+    :param variables: list of the problem instance's variables, which must
+        include all unfixed variables in the constraints
+    :param relaxed_variables: list of the variables (among the variables)
+        whose integrality is relaxed in the model
+    :return: tuple with the Pyomo model and a dictionary of the model's
+        copy of each variable by the id of the instance's variable
+
+    Create a model with copies of the variables (with their domains,
+    bounds, and values) as the *Variable* component, in the order of the
+    variables, and copies of the constraints as the *Constraints* component,
+    in the order of the constraints. Fixed variables and mutable params in
+    the constraints are replaced by their values and named expressions by
+    their expressions, so that the model doesn't reference the problem
+    instance and can be sent to a worker process by itself.
+    """
+    relaxed_ids = set(id(var) for var in relaxed_variables)
+    m = ConcreteModel()
+    m.VARIABLES = Set(initialize=range(len(variables)))
+    m.Variable = Var(m.VARIABLES, dense=True)
+    copies = dict()
+    for i, var in enumerate(variables):
+        copy = m.Variable[i]
+        copy.domain = Reals if id(var) in relaxed_ids else var.domain
+        copy.setlb(var.lb)
+        copy.setub(var.ub)
+        copy.set_value(var.value, skip_validation=True)
+        copies[id(var)] = copy
+
+    substitution_map = dict(copies)
+    m.Constraints = ConstraintList()
+    for c in constraints:
+        for var in identify_variables(c.body, include_fixed=True):
+            if id(var) not in substitution_map:
+                if not var.fixed:
+                    raise ValueError(
+                        f"Variable {var.name} in constraint {c.name} is not "
+                        f"in the model."
+                    )
+                substitution_map[id(var)] = var.value
+        for param in identify_mutable_parameters(c.body):
+            substitution_map[id(param)] = param.value
+        body = replace_expressions(c.body, substitution_map)
+        if c.equality:
+            m.Constraints.add(body == value(c.upper))
+        else:
+            m.Constraints.add(
+                (
+                    None if c.lower is None else value(c.lower),
+                    body,
+                    None if c.upper is None else value(c.upper),
+                )
+            )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    return m, copies
+
+
+@contextmanager
+def record_master_variables(master_variables, module, model):
+    """
+    :param master_variables: list of the master variable names or None if
+        not solving with Benders decomposition
+    :param module: the GridPath module (Python object)
+    :param model: the model the module adds components to
+
+    Add the names of the variables that a master module adds to the model
+    in this context to the list of master variables. Nothing is done if the
+    list is None or for other modules.
+    """
+    if master_variables is None or not module.__name__.startswith(
+        BENDERS_MASTER_MODULES
+    ):
+        yield
+        return
+
+    variables_before = set(model.component_map(Var).keys())
+    yield
+    master_variables.extend(
+        v for v in model.component_map(Var).keys() if v not in variables_before
+    )
+
+
+class BendersSubproblem(object):
+    """
+    The constraints, variables, and objective function terms (as
+    (coefficient, variable) tuples in minimization form) of an operational
+    subproblem, and the master variables it uses. The subproblem's Pyomo
+    model is created when first needed.
+    """
+
+    def __init__(self, constraints, variables, objective_terms, master_variables):
+        self.constraints = constraints
+        self.variables = variables
+        self.objective_terms = objective_terms
+        self.master_variables = master_variables
+        self.model = None
+
+    def get_model(self):
+        """
+        :return: the subproblem's Pyomo model
+
+        The model is a standalone copy of the subproblem (see
+        *create_standalone_model*): its first variables are the copies of
+        the subproblem's variables and the rest are the copies of the
+        master variables, whose integrality is relaxed. A linking constraint
+        sets each master variable to its value in the master problem.
+        """
+        if self.model is None:
+            m, copies = create_standalone_model(
+                constraints=self.constraints,
+                variables=self.variables + self.master_variables,
+                relaxed_variables=self.master_variables,
+            )
+
+            m.MASTER_VARIABLES = Set(initialize=range(len(self.master_variables)))
+            m.master_variable_value = Param(
+                m.MASTER_VARIABLES, mutable=True, initialize=0
+            )
+            m.Linking_Constraint = ConstraintList()
+            for i in m.MASTER_VARIABLES:
+                m.Linking_Constraint.add(
+                    m.Variable[len(self.variables) + i] == m.master_variable_value[i]
+                )
+
+            m.Operational_Cost = Objective(
+                expr=sum(
+                    coef * copies[id(var)] for (coef, var) in self.objective_terms
+                ),
+                sense=minimize,
+            )
+            self.model = m
+
+        return self.model
+
+
+def solve_subproblem_model(
+    m,
+    master_values,
+    solve_function,
+    parsed_arguments,
+    return_solution=False,
+):
+    """
+    :param m: the subproblem's Pyomo model (see *BendersSubproblem.get_model*)
+    :param master_values: list of the values of the master variables
+        (in the order of the subproblem's master variables) or None to solve
+        without the linking constraints (to get a lower bound)
+    :param solve_function: the function solving a Pyomo model, with the
+        model and the parsed arguments as arguments and returning the
+        Pyomo results object
+    :param parsed_arguments: the parsed run scenario arguments
+    :param return_solution: whether to also return the values of the
+        subproblem's variables and the duals of its constraints
+    :return: tuple with the objective function value, the duals of the
+        linking constraints, and (if requested) the variable values (followed
+        by the master variable values) and constraint duals
+    """
+    if master_values is None:
+        m.Linking_Constraint.deactivate()
+    else:
+        m.Linking_Constraint.activate()
+        for i, master_value in enumerate(master_values):
+            m.master_variable_value[i] = master_value
+    m.dual.clear()
+
+    results = solve_function(m, parsed_arguments)
+
+    if results.solver.termination_condition != TerminationCondition.optimal:
+        raise RuntimeError(
+            f"Benders subproblem solve terminated with condition "
+            f"{results.solver.termination_condition}. Subproblems must "
+            f"have an optimal solution for any master variable values, "
+            f"e.g., by allowing unserved energy and overgeneration."
+        )
+
+    linking_duals = (
+        []
+        if master_values is None
+        else [m.dual.get(c) for c in m.Linking_Constraint.values()]
+    )
+    if None in linking_duals:
+        raise RuntimeError(
+            "The solver did not return the duals of the Benders linking " "constraints."
+        )
+    solution = (
+        (
+            [m.Variable[i].value for i in m.VARIABLES],
+            [m.dual.get(c) for c in m.Constraints.values()],
+        )
+        if return_solution
+        else ()
+    )
+
+    return (value(m.Operational_Cost), linking_duals) + solution
+
+
+def decompose(instance, master_variable_names):
+    """
+    :param instance: the problem instance
+    :param master_variable_names: list of the names of the master variables
+    :return: the master variables, the master constraints, the master
+        objective function terms as (coefficient, variable) tuples, the
+        objective function constant, the objective function sense, and the
+        list of BendersSubproblem objects
+
+    Split the problem into a master problem and the operational subproblems.
+    Constraints that only include master variables (or no variables) are in
+    the master problem. The other constraints are grouped by the connected
+    components of the graph of their non-master variables, i.e., two
+    constraints are in the same subproblem if they share a non-master
+    variable (directly or through other constraints). The objective
+    function is converted to minimization form.
+    """
+    master_variables = [
+        var
+        for name in master_variable_names
+        for var in instance.component(name).values()
+        if not var.fixed
+    ]
+    master_ids = set(id(var) for var in master_variables)
+
+    # Union-find of the non-master variables by id
+    parent = dict()
+    variables = dict()
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def add_variable(var):
+        if id(var) not in parent:
+            parent[id(var)] = id(var)
+            variables[id(var)] = var
+
+    master_constraints = list()
+    operational_constraints = list()
+    for c in instance.component_data_objects(Constraint, active=True):
+        non_master_ids = list()
+        for var in identify_variables(c.body, include_fixed=False):
+            if id(var) not in master_ids:
+                add_variable(var)
+                non_master_ids.append(id(var))
+        if not non_master_ids:
+            master_constraints.append(c)
+            continue
+        root = find(non_master_ids[0])
+        for i in non_master_ids[1:]:
+            other_root = find(i)
+            if other_root != root:
+                parent[other_root] = root
+        operational_constraints.append((c, non_master_ids[0]))
+
+    # Objective function terms
+    objective = next(instance.component_data_objects(Objective, active=True))
+    sense = objective.sense
+    sign = -1 if sense == maximize else 1
+    repn = generate_standard_repn(objective.expr, quadratic=False)
+    if not repn.is_linear():
+        raise ValueError("Benders decomposition requires a linear objective function.")
+    master_objective_terms = list()
+    operational_objective_terms = list()
+    for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+        if id(var) in master_ids:
+            master_objective_terms.append((sign * coef, var))
+        else:
+            add_variable(var)
+            operational_objective_terms.append((sign * coef, var))
+    objective_constant = sign * value(repn.constant)
+
+    # Group the constraints, variables, and objective function terms by
+    # subproblem
+    subproblem_index = dict()
+    subproblem_data = list()
+
+    def get_subproblem_data(variable_id):
+        root = find(variable_id)
+        if root not in subproblem_index:
+            subproblem_index[root] = len(subproblem_data)
+            subproblem_data.append(
+                {"constraints": [], "variables": [], "objective_terms": []}
+            )
+        return subproblem_data[subproblem_index[root]]
+
+    for c, variable_id in operational_constraints:
+        get_subproblem_data(variable_id)["constraints"].append(c)
+    for variable_id, var in variables.items():
+        if var.is_integer():
+            raise ValueError(
+                f"Benders decomposition requires linear operational "
+                f"subproblems, but variable {var.name} is integer."
+            )
+        get_subproblem_data(variable_id)["variables"].append(var)
+    for coef, var in operational_objective_terms:
+        get_subproblem_data(id(var))["objective_terms"].append((coef, var))
+
+    subproblems = list()
+    for data in subproblem_data:
+        subproblem_master_ids = set()
+        subproblem_master_variables = list()
+        for c in data["constraints"]:
+            for var in identify_variables(c.body, include_fixed=False):
+                if id(var) in master_ids and id(var) not in subproblem_master_ids:
+                    subproblem_master_ids.add(id(var))
+                    subproblem_master_variables.append(var)
+        subproblems.append(
+            BendersSubproblem(
+                constraints=data["constraints"],
+                variables=data["variables"],
+                objective_terms=data["objective_terms"],
+                master_variables=subproblem_master_variables,
+            )
+        )
+
+    return (
+        master_variables,
+        master_constraints,
+        master_objective_terms,
+        objective_constant,
+        sense,
+        subproblems,
+    )
+
+
+def create_master_model(
+    master_constraints, master_objective_terms, objective_constant, lower_bounds
+):
+    """
+    :param master_constraints: list of the master constraints
+    :param master_objective_terms: list of (coefficient, variable) tuples
+    :param objective_constant: the objective function constant
+    :param lower_bounds: list of the subproblem objective function lower
+        bounds
+    :return: the master problem's Pyomo model
+
+    The master problem minimizes the cost of the master variables plus the
+    estimated cost of each subproblem, which is bounded by the Benders cuts.
+    """
+    m = ConcreteModel()
+    m.Master_Constraints = ConstraintList()
+    for c in master_constraints:
+        if c.equality:
+            m.Master_Constraints.add(c.body == c.upper)
+        else:
+            m.Master_Constraints.add((c.lower, c.body, c.upper))
+
+    m.SUBPROBLEMS = Set(initialize=range(len(lower_bounds)))
+    m.Subproblem_Cost = Var(
+        m.SUBPROBLEMS,
+        within=Reals,
+        bounds=lambda mod, s: (lower_bounds[s], None),
+    )
+    m.Benders_Cuts = ConstraintList()
+
+    m.Total_Cost = Objective(
+        expr=sum(coef * var for (coef, var) in master_objective_terms)
+        + objective_constant
+        + sum(m.Subproblem_Cost[s] for s in m.SUBPROBLEMS),
+        sense=minimize,
+    )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    return m
+
+
+def get_master_values(master_variables):
+    """
+    :param master_variables: list of the master variables
+    :return: list of the master variable values
+
+    Variables that are not yet in the master problem (e.g., not in any
+    master constraint, cost term, or cut) don't have a value, so they are
+    set to their lower bound (or zero).
+    """
+    master_values = list()
+    for var in master_variables:
+        if var.value is None:
+            var.set_value(
+                var.lb if var.lb is not None and var.lb > 0 else 0,
+                skip_validation=True,
+            )
+        elif var.is_integer():
+            var.set_value(round(var.value), skip_validation=True)
+        master_values.append(var.value)
+    return master_values
+
+
+def initialize_benders_worker(solve_function, parsed_arguments):
+    """
+    :param solve_function: the function solving a Pyomo model
+    :param parsed_arguments: the parsed run scenario arguments
+    """
+    _BENDERS_WORKER["solve_function"] = solve_function
+    _BENDERS_WORKER["parsed_arguments"] = parsed_arguments
+
+
+def solve_benders_subproblem_pool(job):
+    """
+    :param job: tuple with the subproblem index, the dill-pickled subproblem
+        model, the master variable values, and whether to return the
+        solution
+    :return: tuple with the subproblem index and the subproblem results
+
+    Each job includes the subproblem's standalone model, so that the worker
+    processes only hold the subproblem they are solving.
+    """
+    s, pickled_model, master_values, return_solution = job
+    return s, solve_subproblem_model(
+        m=dill.loads(pickled_model),
+        master_values=master_values,
+        solve_function=_BENDERS_WORKER["solve_function"],
+        parsed_arguments=_BENDERS_WORKER["parsed_arguments"],
+        return_solution=return_solution,
+    )
+
+
+def solve_subproblems(
+    subproblems,
+    master_values,
+    solve_function,
+    parsed_arguments,
+    pool,
+    pickled_models,
+    return_solution,
+):
+    """
+    :return: list of the subproblem results, in the order of the subproblems
+
+    Solve the subproblems given the master variable values (dictionary of
+    the values by variable id or None for the lower bounds), in the pool
+    of worker processes if there is one (with the list of the dill-pickled
+    subproblem models).
+    """
+    subproblem_master_values = [
+        (
+            None
+            if master_values is None
+            else [master_values[id(var)] for var in subproblem.master_variables]
+        )
+        for subproblem in subproblems
+    ]
+    if pool is None:
+        return [
+            solve_subproblem_model(
+                m=subproblem.get_model(),
+                master_values=values,
+                solve_function=solve_function,
+                parsed_arguments=parsed_arguments,
+                return_solution=return_solution,
+            )
+            for subproblem, values in zip(subproblems, subproblem_master_values)
+        ]
+
+    jobs = [
+        (s, pickled_models[s], values, return_solution)
+        for s, values in enumerate(subproblem_master_values)
+    ]
+    results = dict(pool.imap_unordered(solve_benders_subproblem_pool, jobs))
+    return [results[s] for s in range(len(subproblems))]
+
+
+def solve_with_benders(
+    instance,
+    master_variable_names,
+    solve_function,
+    parsed_arguments,
+    results_directory,
+):
+    """
+    :param instance: the problem instance
+    :param master_variable_names: list of the names of the master variables
+    :param solve_function: the function solving a Pyomo model, with the
+        model and the parsed arguments as arguments and returning the Pyomo
+        results object
+    :param parsed_arguments: the parsed run scenario arguments
+    :param results_directory: the subproblem/stage results directory
+    :return: the termination condition (optimal if the gap was closed, or
+        maxIterations)
+
+    Solve the problem instance with Benders decomposition and load the best
+    solution found into the instance.
+    """
+    tolerance = getattr(parsed_arguments, "benders_tolerance", 1e-6)
+    max_iterations = getattr(parsed_arguments, "benders_max_iterations", 100)
+    n_parallel = getattr(parsed_arguments, "n_parallel_benders", 1)
+
+    (
+        master_variables,
+        master_constraints,
+        master_objective_terms,
+        objective_constant,
+        sense,
+        subproblems,
+    ) = decompose(instance=instance, master_variable_names=master_variable_names)
+    if not parsed_arguments.quiet:
+        print(
+            f"...{len(master_variables)} master variables, "
+            f"{len(subproblems)} subproblems"
+        )
+
+    pool = None
+    pickled_models = None
+    if n_parallel > 1 and len(subproblems) > 1:
+        pickled_models = [
+            dill.dumps(subproblem.get_model()) for subproblem in subproblems
+        ]
+        pool = get_context("spawn").Pool(
+            min(n_parallel, len(subproblems)),
+            initializer=initialize_benders_worker,
+            initargs=(solve_function, parsed_arguments),
+        )
+
+    # The sign converting the minimization form bounds back to the sense of
+    # the objective function
+    sign = -1 if sense == maximize else 1
+    iterations = list()
+    termination_condition = TerminationCondition.maxIterations
+    try:
+        # Lower bounds for the subproblem costs
+        lower_bounds = [
+            subproblem_results[0]
+            for subproblem_results in solve_subproblems(
+                subproblems=subproblems,
+                master_values=None,
+                solve_function=solve_function,
+                parsed_arguments=parsed_arguments,
+                pool=pool,
+                pickled_models=pickled_models,
+                return_solution=False,
+            )
+        ]
+        master = create_master_model(
+            master_constraints=master_constraints,
+            master_objective_terms=master_objective_terms,
+            objective_constant=objective_constant,
+            lower_bounds=lower_bounds,
+        )
+
+        best_upper_bound = float("inf")
+        best_master_values = None
+        for iteration in range(1, max_iterations + 1):
+            iteration_start_time = time.perf_counter()
+
+            results = solve_function(master, parsed_arguments)
+            if results.solver.termination_condition != TerminationCondition.optimal:
+                raise RuntimeError(
+                    f"Benders master problem solve terminated with condition "
+                    f"{results.solver.termination_condition}."
+                )
+            lower_bound = value(master.Total_Cost)
+            master_values = dict(
+                zip(
+                    [id(var) for var in master_variables],
+                    get_master_values(master_variables),
+                )
+            )
+
+            subproblem_results = solve_subproblems(
+                subproblems=subproblems,
+                master_values=master_values,
+                solve_function=solve_function,
+                parsed_arguments=parsed_arguments,
+                pool=pool,
+                pickled_models=pickled_models,
+                return_solution=False,
+            )
+
+            # Add a cut for each subproblem
+            for s, (subproblem, (cost, linking_duals)) in enumerate(
+                zip(subproblems, subproblem_results)
+            ):
+                master.Benders_Cuts.add(
+                    master.Subproblem_Cost[s]
+                    >= cost
+                    + sum(
+                        dual * (var - master_values[id(var)])
+                        for var, dual in zip(subproblem.master_variables, linking_duals)
+                    )
+                )
+
+            upper_bound = (
+                sum(
+                    coef * master_values[id(var)]
+                    for (coef, var) in master_objective_terms
+                )
+                + objective_constant
+                + sum(cost for (cost, _) in subproblem_results)
+            )
+            if upper_bound < best_upper_bound:
+                best_upper_bound = upper_bound
+                best_master_values = master_values
+
+            gap = (best_upper_bound - lower_bound) / max(abs(best_upper_bound), 1)
+            iterations.append(
+                (
+                    iteration,
+                    sign * lower_bound,
+                    sign * best_upper_bound,
+                    gap,
+                    time.perf_counter() - iteration_start_time,
+                )
+            )
+            if not parsed_arguments.quiet:
+                print(
+                    f"...Benders iteration {iteration}: master bound "
+                    f"{sign * lower_bound:.6g}, best solution "
+                    f"{sign * best_upper_bound:.6g}, gap {gap:.2e}"
+                )
+            if gap <= tolerance:
+                termination_condition = TerminationCondition.optimal
+                break
+
+        # Load the best solution into the instance (the subproblem duals are
+        # in minimization form)
+        for var in master_variables:
+            var.set_value(best_master_values[id(var)], skip_validation=True)
+        instance.dual.clear()
+        for subproblem, (cost, linking_duals, values, duals) in zip(
+            subproblems,
+            solve_subproblems(
+                subproblems=subproblems,
+                master_values=best_master_values,
+                solve_function=solve_function,
+                parsed_arguments=parsed_arguments,
+                pool=pool,
+                pickled_models=pickled_models,
+                return_solution=True,
+            ),
+        ):
+            for var, var_value in zip(subproblem.variables, values):
+                var.set_value(var_value, skip_validation=True)
+            for c, dual in zip(subproblem.constraints, duals):
+                if dual is not None:
+                    instance.dual[c] = sign * dual
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        # Don't leave worker processes behind if a subproblem solve fails
+        if pool is not None:
+            pool.terminate()
+
+    save_benders_iterations(results_directory=results_directory, iterations=iterations)
+
+    return termination_condition
+
+
+def save_benders_iterations(results_directory, iterations):
+    """
+    :param results_directory: the subproblem/stage results directory
+    :param iterations: list of (iteration, lower bound, upper bound, gap,
+        seconds) tuples
+
+    Save the bounds in each Benders iteration (in the sense of the objective
+    function, so the bounds are reversed when maximizing).
+    """
+    if not os.path.exists(results_directory):
+        os.makedirs(results_directory)
+    with open(
+        os.path.join(results_directory, BENDERS_ITERATIONS_FILENAME), "w", newline=""
+    ) as f:
+        _writer = writer(f, delimiter=",")
+        _writer.writerow(
+            ["iteration", "master_bound", "best_solution", "relative_gap", "seconds"]
+        )
+        _writer.writerows(iterations)
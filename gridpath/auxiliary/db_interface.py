@@ -13,9 +13,15 @@
 # limitations under the License.
 
 import os.path
-import pandas as pd
 
 from db.common_functions import spin_on_database_lock, spin_on_database_lock_generic
+from gridpath.auxiliary.results_files import get_results_file_path, read_results_file
+
+# Results dataframes that have already been read (e.g., by parallel worker
+# processes during a results import), keyed by results file path;
+# *import_csv* uses (and removes) a staged dataframe instead of reading the
+# file if one is available
+STAGED_RESULTS = {}
 
 
 def get_required_capacity_types_from_database(conn, scenario_id):
@@ -134,7 +140,13 @@ def setup_results_import(
     Prepare for results import: 1) delete prior results and 2) create a
     temporary table we'll insert into first (for sorting before inserting
     into the final table)
+
+    This is skipped during bulk imports, as all prior results for the
+    scenario are deleted before a bulk import starts.
     """
+    if getattr(conn, "bulk_import", False):
+        return
+
     # Delete prior results
     del_sql = """
         DELETE FROM {} 
@@ -220,40 +232,83 @@ def import_csv(
         stage=stage,
     )
 
-    results_filepath = os.path.join(results_directory, f"{which_results}.csv")
-    if not os.path.exists(results_filepath):
+    results_filepath = get_results_file_path(
+        results_directory=results_directory, which_results=which_results
+    )
+    if results_filepath in STAGED_RESULTS.keys():
+        df = STAGED_RESULTS.pop(results_filepath)
+    elif not os.path.exists(results_filepath):
         print("...not found, skipping...")
+        return
     else:
-        df = pd.read_csv(results_filepath)
-        df["scenario_id"] = scenario_id
-
-        # TODO: DB defaults need to be specified somewhere
-        df["weather_iteration"] = (
-            0
-            if weather_iteration == ""
-            else int(weather_iteration.replace("weather_iteration_", ""))
+        df = read_results_csv(
+            results_filepath=results_filepath,
+            scenario_id=scenario_id,
+            weather_iteration=weather_iteration,
+            hydro_iteration=hydro_iteration,
+            availability_iteration=availability_iteration,
+            subproblem=subproblem,
+            stage=stage,
         )
-        df["hydro_iteration"] = (
-            0
-            if hydro_iteration == ""
-            else int(hydro_iteration.replace("hydro_iteration_", ""))
-        )
-        df["availability_iteration"] = (
-            0
-            if availability_iteration == ""
-            else int(availability_iteration.replace("availability_iteration_", ""))
-        )
-        df["subproblem_id"] = 1 if subproblem == "" else int(subproblem)
-        df["stage_id"] = 1 if stage == "" else int(stage)
-
-        spin_on_database_lock_generic(
-            command=df.to_sql(
-                name=f"results_{which_results}",
-                con=conn,
-                if_exists="append",
-                index=False,
-            )
+
+    spin_on_database_lock_generic(
+        command=df.to_sql(
+            name=f"results_{which_results}",
+            con=conn,
+            if_exists="append",
+            index=False,
         )
+    )
+
+
+def read_results_csv(
+    results_filepath,
+    scenario_id,
+    weather_iteration,
+    hydro_iteration,
+    availability_iteration,
+    subproblem,
+    stage,
+):
+    """
+    :param results_filepath: path to the results file (CSV or columnar, see
+        *gridpath.auxiliary.results_files*)
+    :param scenario_id:
+    :param weather_iteration: the weather iteration directory string
+    :param hydro_iteration: the hydro iteration directory string
+    :param availability_iteration: the availability iteration directory string
+    :param subproblem: the subproblem directory string
+    :param stage: the stage directory string
+    :return: the results dataframe with the scenario, iteration,
+        subproblem, and stage ID columns added
+
+    Read a results file and add the columns identifying the
+    scenario/iteration/subproblem/stage it belongs to, so that it is ready
+    to be appended to its results table.
+    """
+    df = read_results_file(results_filepath)
+    df["scenario_id"] = scenario_id
+
+    # TODO: DB defaults need to be specified somewhere
+    df["weather_iteration"] = (
+        0
+        if weather_iteration == ""
+        else int(weather_iteration.replace("weather_iteration_", ""))
+    )
+    df["hydro_iteration"] = (
+        0
+        if hydro_iteration == ""
+        else int(hydro_iteration.replace("hydro_iteration_", ""))
+    )
+    df["availability_iteration"] = (
+        0
+        if availability_iteration == ""
+        else int(availability_iteration.replace("availability_iteration_", ""))
+    )
+    df["subproblem_id"] = 1 if subproblem == "" else int(subproblem)
+    df["stage_id"] = 1 if stage == "" else int(stage)
+
+    return df
 
 
 def update_prj_zone_column(
@@ -68,6 +68,14 @@ fuel_burn_balance_components = "fuel_burn_balance_components"
 cost_components = "cost_components"
 revenue_components = "revenue_components"
 
+mutable_timeseries_params = "mutable_timeseries_params"
+
+results_file_format = "results_file_format"
+
+model_profile = "model_profile"
+
+benders_master_variables = "benders_master_variables"
+
 
 class DynamicComponents(object):
     """
@@ -162,3 +170,26 @@ class DynamicComponents(object):
         # Modules will add component names to this list
         setattr(self, cost_components, list())
         setattr(self, revenue_components, list())
+
+        # ### Model structure reuse ### #
+        # Whether modules should declare the timepoint-indexed params that
+        # can change between subproblems with the same model structure
+        # (load, variable generation profiles) as mutable, so that their
+        # values can be updated in an existing problem instance
+        setattr(self, mutable_timeseries_params, False)
+
+        # ### Results ### #
+        # The format of the large project results tables (see
+        # *gridpath.auxiliary.results_files*)
+        setattr(self, results_file_format, "csv")
+
+        # ### Profiling ### #
+        # The ModelProfile object recording the time and memory spent in
+        # each module and component, if profiling is requested (see
+        # *gridpath.auxiliary.model_profile*)
+        setattr(self, model_profile, None)
+
+        # ### Decomposition ### #
+        # The names of the variables in the Benders master problem, if
+        # solving with Benders decomposition (see *gridpath.auxiliary.benders*)
+        setattr(self, benders_master_variables, None)
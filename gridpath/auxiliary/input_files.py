@@ -0,0 +1,448 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Input file serialization. Model inputs are written to tab-delimited .tab
+files by default. The large timepoint-indexed inputs listed in
+COLUMNAR_INPUT_FILES can instead be written to typed columnar files (Parquet
+or Feather) if the input file format is set when getting the scenario
+inputs. Writing and reading the columnar formats requires the optional
+pyarrow package.
+
+Readers don't need to know which format was used: the functions here look
+for the columnar file first and fall back to the .tab file.
+
+Some input files (e.g., projects.tab, periods.tab, timepoints.tab) are read
+by many modules. While a model is being built, the .tab files read with
+*read_input_table* are parsed only once and the dataframe is shared by the
+modules (see *input_table_cache*).
+
+Many modules add columns to an input file written by another module (e.g.,
+projects.tab and transmission_lines.tab). While the inputs for a
+subproblem are being written, these columns are kept in memory and each
+file is rewritten only once with all of them (see *input_file_columns*).
+"""
+
+from contextlib import contextmanager
+import csv
+import os.path
+import pandas as pd
+
+INPUT_FILE_FORMAT_FILENAME = "input_file_format.txt"
+
+# File extensions by input file format
+INPUT_FILE_FORMATS = {
+    "tab": ".tab",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
+# Input files (specified by their .tab name) that can be written in a
+# columnar format; all modules reading these files must use the functions
+# in this module
+COLUMNAR_INPUT_FILES = [
+    "variable_generator_profiles.tab",
+    "load_mw.tab",
+    "project_availability_exogenous_independent.tab",
+    "project_availability_exogenous_weather.tab",
+    "project_availability_exogenous_independent_bt_hrz.tab",
+    "project_availability_exogenous_weather_bt_hrz.tab",
+    "hydro_conventional_horizon_params.tab",
+]
+
+
+def write_input_file_format(scenario_directory, input_file_format):
+    """
+    :param scenario_directory: the scenario directory
+    :param input_file_format: string, one of the INPUT_FILE_FORMATS keys
+
+    Record the input file format in the scenario directory, so that the
+    modules know how to write their inputs. Nothing is written for the
+    default .tab format.
+    """
+    if input_file_format not in INPUT_FILE_FORMATS.keys():
+        raise ValueError(
+            f"Unknown input file format '{input_file_format}'. Options are: "
+            f"{list(INPUT_FILE_FORMATS.keys())}."
+        )
+    if input_file_format != "tab":
+        with open(
+            os.path.join(scenario_directory, INPUT_FILE_FORMAT_FILENAME), "w"
+        ) as f:
+            f.write(input_file_format)
+
+
+def get_input_file_format(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: string, the input file format for the scenario; defaults to "tab"
+    """
+    format_file = os.path.join(scenario_directory, INPUT_FILE_FORMAT_FILENAME)
+    if os.path.exists(format_file):
+        with open(format_file, "r") as f:
+            return f.read().strip()
+    else:
+        return "tab"
+
+
+def get_input_file_path(inputs_directory, filename):
+    """
+    :param inputs_directory: the inputs directory
+    :param filename: the .tab filename
+    :return: the path to the file in whichever format it was written or, if
+        the file does not exist, the path to the .tab file
+    """
+    stem = os.path.splitext(filename)[0]
+    for input_file_format in ["parquet", "feather"]:
+        columnar_file = os.path.join(
+            inputs_directory, stem + INPUT_FILE_FORMATS[input_file_format]
+        )
+        if os.path.exists(columnar_file):
+            return columnar_file
+
+    return os.path.join(inputs_directory, filename)
+
+
+def input_file_exists(inputs_directory, filename):
+    """
+    :param inputs_directory: the inputs directory
+    :param filename: the .tab filename
+    :return: Boolean, whether the file exists in any format
+    """
+    return os.path.exists(
+        get_input_file_path(inputs_directory=inputs_directory, filename=filename)
+    )
+
+
+def write_columnar_input_file(
+    scenario_directory, inputs_directory, filename, columns, rows
+):
+    """
+    :param scenario_directory: the scenario directory
+    :param inputs_directory: the inputs directory
+    :param filename: the .tab filename
+    :param columns: list of the column names
+    :param rows: list of the data rows
+    :return: Boolean, whether the data were written in a columnar format
+
+    If a columnar input file format is set for the scenario and the file
+    can be written in a columnar format, write the rows (appending if the
+    file already exists) and return True. Otherwise, return False, and the
+    rows should be written to the .tab file.
+    """
+    input_file_format = get_input_file_format(scenario_directory)
+    if input_file_format == "tab" or filename not in COLUMNAR_INPUT_FILES:
+        return False
+
+    out_file = os.path.join(
+        inputs_directory,
+        os.path.splitext(filename)[0] + INPUT_FILE_FORMATS[input_file_format],
+    )
+    # If appending, infer the column types from all rows at once
+    if os.path.exists(out_file):
+        rows = read_input_file(inputs_directory, filename).to_records(
+            index=False
+        ).tolist() + list(rows)
+    df = pd.DataFrame(data=rows, columns=columns)
+
+    if input_file_format == "parquet":
+        df.to_parquet(out_file, index=False)
+    else:
+        df.to_feather(out_file)
+
+    return True
+
+
+def read_input_file(inputs_directory, filename, usecols=None, dtype=None):
+    """
+    :param inputs_directory: the inputs directory
+    :param filename: the .tab filename
+    :param usecols: list of the columns to read; all columns are read if None
+    :param dtype: dictionary of the column types
+    :return: the input file data as a dataframe
+
+    Read an input file in whichever format it was written. Missing values
+    written as "." in .tab files are NaN/None in the columnar formats.
+    """
+    input_file = get_input_file_path(
+        inputs_directory=inputs_directory, filename=filename
+    )
+    if input_file.endswith(INPUT_FILE_FORMATS["parquet"]):
+        df = pd.read_parquet(input_file, columns=usecols)
+    elif input_file.endswith(INPUT_FILE_FORMATS["feather"]):
+        df = pd.read_feather(input_file, columns=usecols)
+    elif dtype is None:
+        return read_input_table(input_file, usecols=usecols)
+    else:
+        return pd.read_csv(input_file, sep="\t", usecols=usecols, dtype=dtype)
+
+    if dtype is not None:
+        df = df.astype(dtype)
+
+    return df
+
+
+def load_input_file(data_portal, inputs_directory, filename, param, index=None):
+    """
+    :param data_portal: the Pyomo DataPortal
+    :param inputs_directory: the inputs directory
+    :param filename: the .tab filename
+    :param param: Pyomo Param or tuple of Params to load; the param columns
+        are the last columns of the file and the index columns come first
+    :param index: Pyomo Set to initialize with the index values (optional)
+
+    Equivalent of DataPortal.load(filename=..., index=..., param=...) that
+    also handles the columnar formats. For .tab files, the DataPortal is used
+    directly; for columnar files, the Pyomo data dictionaries are created
+    directly from the columns, skipping missing values.
+    """
+    input_file = get_input_file_path(
+        inputs_directory=inputs_directory, filename=filename
+    )
+    if input_file.endswith(INPUT_FILE_FORMATS["tab"]):
+        if index is None:
+            data_portal.load(filename=input_file, param=param)
+        else:
+            data_portal.load(filename=input_file, index=index, param=param)
+        return
+
+    params = param if isinstance(param, tuple) else (param,)
+    df = read_input_file(inputs_directory=inputs_directory, filename=filename)
+    index_columns = df.columns[: len(df.columns) - len(params)]
+    if len(index_columns) == 1:
+        index_values = df[index_columns[0]].tolist()
+    else:
+        index_values = list(zip(*[df[c].tolist() for c in index_columns]))
+
+    if index is not None:
+        data_portal[index.name] = {None: index_values}
+
+    for p, c in zip(params, df.columns[len(index_columns) :]):
+        data_portal[p.name] = {
+            idx: v
+            for idx, v, missing in zip(
+                index_values, df[c].tolist(), df[c].isna().tolist()
+            )
+            if not missing
+        }
+
+
+class InputTableCache(object):
+    """
+    Parsed .tab input files, keyed by inputs directory, filename, and file
+    modification time, along with the number of cache hits and misses.
+    The cache is only used while it is enabled (see *input_table_cache*).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.tables = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.tables = {}
+        self.hits = 0
+        self.misses = 0
+
+
+INPUT_TABLE_CACHE = InputTableCache()
+
+
+@contextmanager
+def input_table_cache(enabled=True):
+    """
+    :param enabled: Boolean; whether to use the cache
+    :return: the InputTableCache object
+
+    Context manager scoping the input table cache to a model build. The
+    cached tables are discarded on exit; the hit and miss counters are kept
+    until the cache is next used.
+    """
+    INPUT_TABLE_CACHE.clear()
+    INPUT_TABLE_CACHE.enabled = enabled
+    try:
+        yield INPUT_TABLE_CACHE
+    finally:
+        INPUT_TABLE_CACHE.enabled = False
+        INPUT_TABLE_CACHE.tables = {}
+
+
+def read_input_table(file_path, usecols=None):
+    """
+    :param file_path: path to the tab-delimited input file
+    :param usecols: list of the columns to read; all columns are read if None
+    :return: the input file data as a dataframe
+
+    Read a tab-delimited input file. If the input table cache is enabled,
+    the whole file is parsed the first time it is requested and later
+    requests get a copy of the requested columns. Columns are returned in
+    file order, as with pd.read_csv.
+    """
+    if not INPUT_TABLE_CACHE.enabled:
+        return pd.read_csv(file_path, sep="\t", usecols=usecols)
+
+    df = _get_cached_input_table(file_path)
+    if usecols is None:
+        return df.copy()
+
+    missing_columns = [c for c in usecols if c not in df.columns]
+    if missing_columns:
+        raise ValueError(
+            f"Usecols do not match columns, columns expected but not found: "
+            f"{missing_columns}"
+        )
+    return df[[c for c in df.columns if c in usecols]].copy()
+
+
+def get_input_table_columns(file_path):
+    """
+    :param file_path: path to the tab-delimited input file
+    :return: list of the column names of the input file
+    """
+    if INPUT_TABLE_CACHE.enabled:
+        return list(_get_cached_input_table(file_path).columns)
+    else:
+        return list(pd.read_csv(file_path, sep="\t", header=None, nrows=1).values[0])
+
+
+def _get_cached_input_table(file_path):
+    """
+    Get the parsed input file from the cache, parsing it first if it isn't
+    there yet. The cached dataframe must not be modified.
+    """
+    key = (
+        os.path.dirname(os.path.abspath(file_path)),
+        os.path.basename(file_path),
+        os.stat(file_path).st_mtime_ns,
+    )
+    if key in INPUT_TABLE_CACHE.tables.keys():
+        INPUT_TABLE_CACHE.hits += 1
+    else:
+        INPUT_TABLE_CACHE.misses += 1
+        INPUT_TABLE_CACHE.tables[key] = pd.read_csv(file_path, sep="\t")
+
+    return INPUT_TABLE_CACHE.tables[key]
+
+
+class InputFileColumns(object):
+    """
+    Columns added to input files by the modules, keyed by inputs directory
+    and filename, in the order they were added. The columns are only kept
+    while enabled (see *input_file_columns*).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.columns = {}
+
+
+INPUT_FILE_COLUMNS = InputFileColumns()
+
+
+@contextmanager
+def input_file_columns():
+    """
+    :return: the InputFileColumns object
+
+    Context manager scoping the input file columns to the writing of the
+    inputs. The columns added with *add_input_file_columns* are written to
+    their input files on exit.
+    """
+    INPUT_FILE_COLUMNS.columns = {}
+    INPUT_FILE_COLUMNS.enabled = True
+    try:
+        yield INPUT_FILE_COLUMNS
+        for (inputs_directory, input_file), fragments in list(
+            INPUT_FILE_COLUMNS.columns.items()
+        ):
+            _write_input_file_columns(
+                inputs_directory=inputs_directory,
+                input_file=input_file,
+                fragments=fragments,
+            )
+    finally:
+        INPUT_FILE_COLUMNS.enabled = False
+        INPUT_FILE_COLUMNS.columns = {}
+
+
+def add_input_file_columns(inputs_directory, input_file, columns, index_n_columns=1):
+    """
+    :param inputs_directory: the inputs directory
+    :param input_file: the .tab filename, e.g., projects.tab
+    :param columns: dictionary with the new column names as keys and
+        dictionaries of the column values by index as values; the index is
+        the value in the first column of the file (e.g., the project) or, if
+        index_n_columns is more than 1, the tuple of the values in the first
+        index_n_columns columns. Values are written as strings; rows with
+        no value or a None value get "." (no value for Pyomo).
+    :param index_n_columns: int, the number of index columns
+
+    Add columns to an existing input file. If the input file columns are
+    being collected (see *input_file_columns*), the columns are kept in
+    memory and written with the other columns for the file at the end;
+    otherwise, the file is rewritten right away.
+    """
+    fragment = (index_n_columns, columns)
+    if INPUT_FILE_COLUMNS.enabled:
+        INPUT_FILE_COLUMNS.columns.setdefault(
+            (os.path.normpath(inputs_directory), input_file), []
+        ).append(fragment)
+    else:
+        _write_input_file_columns(
+            inputs_directory=inputs_directory,
+            input_file=input_file,
+            fragments=[fragment],
+        )
+
+
+def get_pending_input_file_columns(inputs_directory):
+    """
+    :param inputs_directory: the inputs directory
+    :return: dictionary with the filenames as keys and the number of times
+        columns were added to the file but not yet written as values
+    """
+    return {
+        input_file: len(fragments)
+        for (directory, input_file), fragments in INPUT_FILE_COLUMNS.columns.items()
+        if directory == os.path.normpath(inputs_directory)
+    }
+
+
+def _write_input_file_columns(inputs_directory, input_file, fragments):
+    """
+    Read the input file once, join the columns of each fragment to its rows
+    by index, and write the file back.
+    """
+    file_path = os.path.join(inputs_directory, input_file)
+    with open(file_path, "r") as f_in:
+        reader = csv.reader(f_in, delimiter="\t", lineterminator="\n")
+        header = next(reader)
+        rows = list(reader)
+
+    for index_n_columns, columns in fragments:
+        if index_n_columns == 1:
+            row_indices = [row[0] for row in rows]
+        else:
+            row_indices = [tuple(row[:index_n_columns]) for row in rows]
+        for column_name, column_values in columns.items():
+            header.append(column_name)
+            for row, index in zip(rows, row_indices):
+                value = column_values.get(index)
+                row.append("." if value is None else value)
+
+    with open(file_path, "w", newline="") as f_out:
+        writer = csv.writer(f_out, delimiter="\t", lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
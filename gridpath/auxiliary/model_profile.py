@@ -0,0 +1,246 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Model build profiling. If requested with the *--profile_model* run option,
+a *ModelProfile* is added to the dynamic components and the following are
+recorded for each subproblem/stage:
+
+* the time and memory spent in each GridPath module's
+  *add_model_components*, *load_model_data*, *export_results*, and
+  *save_duals* methods, along with the number of optimization components
+  each module adds to the model;
+* the time and memory spent constructing each optimization component when
+  the problem instance is created, along with its number of indices;
+* the time and memory spent in each module's *import_results_into_database*
+  method when the results are imported into the database.
+
+Memory is the change in the memory allocated by Python while the step ran,
+as traced by *tracemalloc*, so profiling slows down the steps being
+profiled. The profile is written to the model_profile.csv file in the
+subproblem/stage logs directory and is imported into the
+results_scenario_model_profile database table along with the scenario
+results, so that runs can be compared.
+"""
+
+from contextlib import contextmanager
+import csv
+import logging
+import os.path
+import time
+import tracemalloc
+
+from pyomo.common.timing import ConstructionTimer
+
+MODEL_PROFILE_FILENAME = "model_profile.csv"
+MODEL_PROFILE_COLUMNS = [
+    "step",
+    "gridpath_module",
+    "component",
+    "component_type",
+    "n_components",
+    "n_indices",
+    "seconds",
+    "memory_mb",
+]
+
+# Pyomo reports the construction time of each component to this logger
+_CONSTRUCTION_LOGGER = logging.getLogger("pyomo.common.timing.construction")
+
+
+class ModelProfile(object):
+    """
+    The profile records, in the order in which the profiled steps ran, and
+    the module that added each optimization component to the model.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.component_modules = dict()
+
+    def add_record(
+        self,
+        step,
+        gridpath_module,
+        seconds,
+        memory,
+        component=None,
+        component_type=None,
+        n_components=None,
+        n_indices=None,
+    ):
+        """
+        :param step: the profiled step (e.g., "add_model_components")
+        :param gridpath_module: the name of the GridPath module
+        :param seconds: the wall time in seconds
+        :param memory: the change in traced memory in bytes
+        :param component: the name of the optimization component (component
+            records only)
+        :param component_type: the type of the optimization component
+        :param n_components: the number of components added
+        :param n_indices: the number of indices of the component
+        """
+        self.records.append(
+            (
+                step,
+                gridpath_module,
+                component,
+                component_type,
+                n_components,
+                n_indices,
+                seconds,
+                memory / 1024**2,
+            )
+        )
+
+
+@contextmanager
+def _traced_memory():
+    """
+    Trace memory allocations while in this context (unless they are already
+    being traced) and yield a function returning the traced memory in bytes.
+    """
+    start_tracing = not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    try:
+        yield lambda: tracemalloc.get_traced_memory()[0]
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def profile_module(profile, step, module, model=None):
+    """
+    :param profile: the ModelProfile object or None if not profiling
+    :param step: the profiled step (e.g., "add_model_components")
+    :param module: the GridPath module (Python object)
+    :param model: the model the module adds components to (optional); if
+        given, the components added in this context are counted
+
+    Record the time and memory spent in this context for a module. Nothing
+    is done if the profile is None.
+    """
+    if profile is None:
+        yield
+        return
+
+    module_name = module.__name__.replace("gridpath.", "", 1)
+    components_before = set() if model is None else set(model.component_map().keys())
+    with _traced_memory() as get_memory:
+        memory_before = get_memory()
+        start_time = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start_time
+        memory = get_memory() - memory_before
+
+    n_components = None
+    if model is not None:
+        new_components = [
+            c for c in model.component_map().keys() if c not in components_before
+        ]
+        for c in new_components:
+            profile.component_modules[c] = module_name
+        n_components = len(new_components)
+
+    profile.add_record(
+        step=step,
+        gridpath_module=module_name,
+        seconds=seconds,
+        memory=memory,
+        n_components=n_components,
+    )
+
+
+class _ConstructionProfileHandler(logging.Handler):
+    """
+    Record the component construction times reported by Pyomo along with
+    the change in traced memory since the previous component was
+    constructed.
+    """
+
+    def __init__(self, profile, get_memory):
+        logging.Handler.__init__(self, level=logging.INFO)
+        self.profile = profile
+        self.get_memory = get_memory
+        self.memory = get_memory()
+
+    def emit(self, record):
+        if not isinstance(record.msg, ConstructionTimer):
+            return
+        memory = self.get_memory()
+        component = record.msg.obj
+        # The model block itself is reported last; its totals are already
+        # covered by the component records
+        if component.parent_block() is not None:
+            # Components without a length (e.g., Suffix) or with an infinite
+            # length (e.g., virtual sets) have no number of indices
+            try:
+                n_indices = len(component)
+            except (TypeError, OverflowError):
+                n_indices = None
+            self.profile.add_record(
+                step="construct_instance",
+                gridpath_module=self.profile.component_modules.get(
+                    component.local_name, ""
+                ),
+                seconds=record.msg.timer,
+                memory=memory - self.memory,
+                component=component.local_name,
+                component_type=component.ctype.__name__,
+                n_indices=n_indices,
+            )
+        self.memory = memory
+
+
+@contextmanager
+def profile_construction(profile):
+    """
+    :param profile: the ModelProfile object or None if not profiling
+
+    Record the time and memory spent constructing each optimization
+    component when the problem instance is created in this context.
+    Nothing is done if the profile is None.
+    """
+    if profile is None:
+        yield
+        return
+
+    old_level = _CONSTRUCTION_LOGGER.level
+    with _traced_memory() as get_memory:
+        handler = _ConstructionProfileHandler(profile=profile, get_memory=get_memory)
+        _CONSTRUCTION_LOGGER.addHandler(handler)
+        _CONSTRUCTION_LOGGER.setLevel(logging.INFO)
+        try:
+            yield
+        finally:
+            _CONSTRUCTION_LOGGER.removeHandler(handler)
+            _CONSTRUCTION_LOGGER.setLevel(old_level)
+
+
+def write_model_profile(profile, logs_directory):
+    """
+    :param profile: the ModelProfile object
+    :param logs_directory: the subproblem/stage logs directory
+
+    Write the profile records to the model_profile.csv file in the logs
+    directory.
+    """
+    with open(
+        os.path.join(logs_directory, MODEL_PROFILE_FILENAME), "w", newline=""
+    ) as f:
+        writer = csv.writer(f, delimiter=",")
+        writer.writerow(MODEL_PROFILE_COLUMNS)
+        writer.writerows(profile.records)
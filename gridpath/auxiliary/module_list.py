@@ -19,7 +19,8 @@ This module contains:
 2) the modules included in each optional feature;
 3) the 'cross-feature' modules;
 4) the method for determining the user-requested features for the scenarios;
-5) the method for loading modules.
+5) the method for loading modules;
+6) the process-level registry of the modules loaded for each scenario.
 """
 
 from importlib import import_module
@@ -28,7 +29,15 @@ import pandas as pd
 import sys
 import traceback
 
-from gridpath.auxiliary.auxiliary import check_for_integer_subdirectories
+from gridpath.auxiliary.auxiliary import (
+    check_for_integer_subdirectories,
+    clear_subtype_module_cache,
+)
+
+# The module names and loaded modules for each scenario run in this process,
+# keyed by scenario directory and multi-stage flag (see
+# *get_scenario_modules*)
+_SCENARIO_MODULES = dict()
 
 
 def all_modules_list():
@@ -765,3 +774,37 @@ def load_modules(modules_to_use):
             sys.exit(1)
 
     return loaded_modules
+
+
+def get_scenario_modules(scenario_directory, multi_stage):
+    """
+    :param scenario_directory: the scenario directory
+    :param multi_stage: Boolean; whether the scenario has stages (see
+        *determine_modules*)
+    :return: list of the names of the modules the scenario uses and list of
+        the loaded modules
+
+    Determine and load the scenario's modules the first time they are
+    requested in this process and return the same module list and loaded
+    modules to every later caller (model build, results export, duals,
+    etc.), so the features file is read and the modules are loaded only
+    once per scenario. Use *clear_module_registry* to discard the registry,
+    e.g., if the scenario's features change.
+    """
+    key = (scenario_directory, multi_stage)
+    if key not in _SCENARIO_MODULES.keys():
+        modules_to_use = determine_modules(
+            scenario_directory=scenario_directory, multi_stage=multi_stage
+        )
+        _SCENARIO_MODULES[key] = (modules_to_use, load_modules(modules_to_use))
+
+    return _SCENARIO_MODULES[key]
+
+
+def clear_module_registry():
+    """
+    Discard the modules registered for all scenarios in this process, along
+    with the cached subtype modules (see *load_subtype_modules*).
+    """
+    _SCENARIO_MODULES.clear()
+    clear_subtype_module_cache()
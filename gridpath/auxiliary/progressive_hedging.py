@@ -0,0 +1,913 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scenario decomposition of stochastic problems with progressive hedging. In
+stochastic problems, periods form a tree defined by the *prev_period*
+param, and each path from the first period to a last period (a period that
+is not the previous period of any other period) is a future trajectory. If
+requested with the *--progressive_hedging* run option, the problem instance
+(the extensive form of the stochastic problem) is not sent to the solver
+as a whole. Instead:
+
+* Each constraint is assigned to the trajectories that include all periods
+  of its variables. A variable's periods are the periods and the periods of
+  the timepoints in the dimensions of its index that are periods or
+  timepoints, e.g., the vintage of a build variable or the period of the
+  timepoint of a dispatch variable. Each trajectory's subproblem includes
+  its constraints and their variables.
+* Variables in more than one subproblem, e.g., the builds and operations in
+  the periods shared by several trajectories, must have the same value in
+  all of them (non-anticipativity). The objective function coefficient of
+  each variable is split equally among its subproblems, so that the sum of
+  the subproblem objective functions is the objective function of the full
+  problem when the shared variables agree.
+* The subproblems are solved separately (in parallel if requested with the
+  *--n_parallel_ph* option) and we iterate: the average of each shared
+  variable's values is computed and each subproblem's objective function
+  is augmented with a multiplier term, updated each iteration, and a
+  quadratic penalty on the distance of its shared variable values from the
+  average. The quadratic penalty is approximated by its tangents at several
+  distances from the average, scaled by the spread of the values in the
+  previous iteration, so the subproblems remain linear. The penalty weight
+  of each shared variable is proportional to its objective function
+  coefficient (clipped to within two orders of magnitude of the median
+  coefficient and scaled with the *--ph_rho* option) and inversely
+  proportional to the spread of its values in the first iteration. We stop
+  when the relative distance between the shared variable values and their
+  averages, plus the change in the averages from the previous iteration, is
+  below the *--ph_tolerance*.
+
+Once the iterations end, the shared variables are fixed to their averages
+and the subproblems are solved once more (without the penalty terms), and
+the solution is loaded into the problem instance, so results are exported
+as usual. The duals of constraints in a single trajectory are loaded as
+well; constraints that only include shared variables have no duals. The
+distance from non-anticipativity in each iteration is saved in the
+progressive_hedging_iterations.csv results file.
+
+Note that the subproblems' penalty terms are created for each solve, as
+they change in every iteration, so persistent solvers do not benefit from
+incremental updates. Progressive hedging converges to the optimal solution
+for linear problems, but may take many iterations to reach a tight
+tolerance, and the solution at the stopping tolerance is not proven
+optimal, so the termination condition is reported as feasible (rather than
+optimal) when the iterations converge; with integer variables, it is a
+heuristic. As with Benders decomposition (see
+*gridpath.auxiliary.benders*), each subproblem's model is a standalone copy
+of its constraints and variables, so only that model is sent to a worker
+process when solving subproblems in parallel, but the problem instance is
+still created as a whole.
+"""
+
+from csv import writer
+import dill
+from multiprocessing import get_context
+import os.path
+import time
+
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import (
+    Any,
+    Constraint,
+    ConstraintList,
+    Expression,
+    NonNegativeReals,
+    Objective,
+    Set,
+    Var,
+    maximize,
+    minimize,
+    value,
+)
+from pyomo.opt import TerminationCondition
+from pyomo.repn import generate_standard_repn
+
+from gridpath.auxiliary.benders import create_standalone_model
+
+PH_ITERATIONS_FILENAME = "progressive_hedging_iterations.csv"
+
+# The penalty terms are approximated by their tangents at these multiples of
+# each shared variable's tangent scale (the maximum distance from its
+# average in the previous iteration) away from its average, as well as two
+# outer tangents (see *TrajectorySubproblem.solve*)
+PROXIMAL_TANGENTS = [sign * 4**j for sign in (-1, 1) for j in range(-4, 5)]
+
+# The objective function coefficients used to set the penalty weights are
+# kept within this factor of their median, so that penalty costs (e.g., for
+# unserved energy) and variables with no cost don't lead to extreme weights
+RHO_COEFFICIENT_RANGE = 100
+
+# The worker process state when solving subproblems in parallel
+_PH_WORKER = dict()
+
+
+def get_trajectories(instance):
+    """
+    :param instance: the problem instance
+    :return: list of the periods on each future trajectory, i.e., each path
+        from the first period to a last period in the period tree
+    """
+    prev_periods = set(instance.prev_period[prd] for prd in instance.NOT_FIRST_PRDS)
+    return [
+        frozenset(instance.FUTURE_TRAJECTORY_PREV_PERIODS_BY_PERIOD[prd])
+        for prd in instance.PERIODS
+        if prd not in prev_periods
+    ]
+
+
+def get_period_dimensions(instance, index_set):
+    """
+    :param instance: the problem instance
+    :param index_set: the index set of a variable
+    :return: tuple of (position, is_timepoint) tuples of the dimensions of
+        the index that are periods or timepoints
+
+    The set of each dimension is determined from the index set's subsets
+    (e.g., the sets a variable is indexed by) and their declared domains
+    (e.g., *within=m.PROJECTS * m.PERIODS*). A dimension is a period
+    dimension if its set is PERIODS or a subset of PERIODS, and similarly
+    for timepoints. If a multi-dimensional set has no declared domain, its
+    dimensions are classified by their members instead: a dimension is a
+    period (timepoint) dimension if all of its members are periods
+    (timepoints).
+    """
+    period_dimensions = list()
+    position = 0
+    for subset in index_set.subsets():
+        if subset.dimen is None:
+            break
+        if subset.dimen == 1:
+            role = get_set_role(instance, subset)
+            if role is not None:
+                period_dimensions.append((position, role))
+        elif subset.domain is not Any and subset.domain.dimen == subset.dimen:
+            period_dimensions.extend(
+                (position + dimension_position, role)
+                for (dimension_position, role) in get_period_dimensions(
+                    instance, subset.domain
+                )
+            )
+        else:
+            for dimension in range(subset.dimen):
+                members = set(index[dimension] for index in subset)
+                if members and members <= set(instance.PERIODS):
+                    period_dimensions.append((position + dimension, False))
+                elif members and members <= set(instance.TMPS):
+                    period_dimensions.append((position + dimension, True))
+        position += subset.dimen
+
+    return tuple(period_dimensions)
+
+
+def get_set_role(instance, one_dimensional_set):
+    """
+    :return: False if the set is PERIODS or a subset of PERIODS, True if it
+        is TMPS or a subset of TMPS, and None otherwise
+    """
+    s = one_dimensional_set
+    while True:
+        if s is instance.PERIODS:
+            return False
+        if s is instance.TMPS:
+            return True
+        if s.domain is Any or s.domain is s or s.domain.dimen != 1:
+            return None
+        s = s.domain
+
+
+def get_variable_periods(var, period_dimensions, instance):
+    """
+    :param var: the Pyomo variable
+    :param period_dimensions: the period and timepoint dimensions of the
+        variable's index (see *get_period_dimensions*)
+    :param instance: the problem instance
+    :return: the set of the periods in the variable's index
+    """
+    index = var.index()
+    if not isinstance(index, tuple):
+        index = (index,)
+    return frozenset(
+        instance.period[index[position]] if is_timepoint else index[position]
+        for (position, is_timepoint) in period_dimensions
+    )
+
+
+class TrajectorySubproblem(object):
+    """
+    The constraints, variables, and objective function terms (as
+    (coefficient, variable) tuples in minimization form) of a trajectory
+    subproblem, and the indices of its shared variables in the list of
+    shared variables. The subproblem's Pyomo model is created when first
+    needed.
+    """
+
+    def __init__(self, constraints, variables, objective_terms, shared_variables):
+        self.constraints = constraints
+        self.variables = variables
+        self.objective_terms = objective_terms
+        self.shared_variables = shared_variables
+        self.model = None
+
+    def get_model(self, shared_variables):
+        """
+        :param shared_variables: the list of all shared variables
+        :return: the subproblem's Pyomo model
+
+        The model is a standalone copy of the subproblem (see
+        *gridpath.auxiliary.benders.create_standalone_model*) with the
+        positions of the copies of its shared variables (in the order of
+        self.shared_variables) and its objective function terms. The
+        objective function and the penalty terms are added for each solve.
+        """
+        if self.model is None:
+            m, copies = create_standalone_model(
+                constraints=self.constraints, variables=self.variables
+            )
+            positions = {id(var): n for n, var in enumerate(self.variables)}
+            m.SHARED_VARIABLES = Set(
+                initialize=[
+                    positions[id(shared_variables[i])] for i in self.shared_variables
+                ],
+                ordered=True,
+            )
+            m.Trajectory_Objective_Terms = Expression(
+                expr=sum(coef * copies[id(var)] for (coef, var) in self.objective_terms)
+            )
+            self.model = m
+
+        return self.model
+
+
+def get_tangents(multipliers, averages, rhos, tangent_scales):
+    """
+    :param multipliers: list of the multipliers of the subproblem's shared
+        variables
+    :param averages: list of the averages of the subproblem's shared
+        variables, or None to solve without the penalty terms
+    :param rhos: list of the penalty weights of the subproblem's shared
+        variables
+    :param tangent_scales: list of the distances from the average between
+        the tangents approximating the penalty terms of the subproblem's
+        shared variables
+    :return: list of the (slope, intercept) tuples of the tangents
+        approximating the penalty term of each of the subproblem's shared
+        variables
+    """
+    tangents = list()
+    for n in range(len(multipliers)):
+        if averages is None or rhos[n] == 0:
+            tangents.append([])
+            continue
+        # The outer tangents are steeper than the multiplier term, so
+        # that the subproblem is bounded
+        outer_tangent = max(
+            tangent_scales[n] * max(PROXIMAL_TANGENTS),
+            2 * abs(multipliers[n]) / rhos[n],
+        )
+        tangents.append(
+            [
+                (
+                    rhos[n] * distance,
+                    -rhos[n] * distance * (averages[n] + distance / 2),
+                )
+                for distance in [tangent_scales[n] * k for k in PROXIMAL_TANGENTS]
+                + [-outer_tangent, outer_tangent]
+            ]
+        )
+    return tangents
+
+
+def add_penalty_terms(m, multipliers, tangents):
+    """
+    :param m: the subproblem's Pyomo model (see
+        *TrajectorySubproblem.get_model*)
+    :param multipliers: list of the multipliers of the subproblem's shared
+        variables
+    :param tangents: list of the (slope, intercept) tuples of the tangents
+        approximating the penalty term of each of the subproblem's shared
+        variables
+
+    Add the objective function with the multiplier and penalty terms to
+    the model, replacing those of the previous solve.
+    """
+    for component in ["Proximal_Term", "Proximal_Term_Constraints", "Trajectory_Cost"]:
+        if m.component(component) is not None:
+            m.del_component(component)
+
+    # The quadratic penalty rho / 2 * (x - average) ^ 2 is approximated
+    # by its tangents, so that the subproblems remain linear
+    m.Proximal_Term = Var(m.SHARED_VARIABLES, within=NonNegativeReals)
+    m.Proximal_Term_Constraints = ConstraintList()
+    for n, i in enumerate(m.SHARED_VARIABLES):
+        for slope, intercept in tangents[n]:
+            m.Proximal_Term_Constraints.add(
+                m.Proximal_Term[i] >= slope * m.Variable[i] + intercept
+            )
+
+    m.Trajectory_Cost = Objective(
+        expr=m.Trajectory_Objective_Terms
+        + sum(
+            multipliers[n] * m.Variable[i] + m.Proximal_Term[i]
+            for n, i in enumerate(m.SHARED_VARIABLES)
+        ),
+        sense=minimize,
+    )
+
+
+def solve_trajectory_model(
+    m,
+    multipliers,
+    averages,
+    rhos,
+    tangent_scales,
+    solve_function,
+    parsed_arguments,
+):
+    """
+    :param m: the subproblem's Pyomo model (see
+        *TrajectorySubproblem.get_model*)
+    :param multipliers: list of the multipliers of the subproblem's
+        shared variables (in the order of the subproblem's shared variables)
+    :param averages: list of the averages of the subproblem's shared
+        variables, or None to solve without the penalty terms
+    :param rhos: list of the penalty weights of the subproblem's shared
+        variables
+    :param tangent_scales: list of the distances from the average
+        between the tangents approximating the penalty terms of the
+        subproblem's shared variables
+    :param solve_function: the function solving a Pyomo model, with the
+        model and the parsed arguments as arguments and returning the
+        Pyomo results object
+    :param parsed_arguments: the parsed run scenario arguments
+    :return: list of the values of the subproblem's shared variables
+
+    If there are no averages, the multipliers must be zero and the
+    subproblem is solved with only its own objective function terms
+    (e.g., in the first iteration).
+    """
+    add_penalty_terms(
+        m=m,
+        multipliers=multipliers,
+        tangents=get_tangents(
+            multipliers=multipliers,
+            averages=averages,
+            rhos=rhos,
+            tangent_scales=tangent_scales,
+        ),
+    )
+    m.dual.clear()
+    results = solve_function(m, parsed_arguments)
+    check_termination_condition(results)
+
+    return [m.Variable[i].value for i in m.SHARED_VARIABLES]
+
+
+def solve_fixed_trajectory_model(m, averages, solve_function, parsed_arguments):
+    """
+    :param m: the subproblem's Pyomo model (see
+        *TrajectorySubproblem.get_model*)
+    :param averages: list of the averages of the subproblem's shared
+        variables
+    :param solve_function: the function solving a Pyomo model
+    :param parsed_arguments: the parsed run scenario arguments
+    :return: tuple with the values of the subproblem's variables and the
+        duals of its constraints (None for constraints that only include
+        shared variables)
+
+    Solve the subproblem with its shared variables fixed to their
+    averages. Constraints that only include shared variables are left
+    out.
+    """
+    shared_positions = set(m.SHARED_VARIABLES)
+    fixed_only = [
+        all(
+            var.index() in shared_positions
+            for var in identify_variables(c.body, include_fixed=False)
+        )
+        for c in m.Constraints.values()
+    ]
+    for i, average in zip(m.SHARED_VARIABLES, averages):
+        m.Variable[i].fix(average, skip_validation=True)
+    for c, fixed in zip(m.Constraints.values(), fixed_only):
+        if fixed:
+            c.deactivate()
+
+    try:
+        add_penalty_terms(
+            m=m,
+            multipliers=[0] * len(m.SHARED_VARIABLES),
+            tangents=[[] for _ in m.SHARED_VARIABLES],
+        )
+        m.dual.clear()
+        results = solve_function(m, parsed_arguments)
+        check_termination_condition(results)
+    finally:
+        for i in m.SHARED_VARIABLES:
+            m.Variable[i].unfix()
+        for c in m.Constraints.values():
+            c.activate()
+
+    return (
+        [m.Variable[i].value for i in m.VARIABLES],
+        [
+            None if fixed else m.dual.get(c)
+            for c, fixed in zip(m.Constraints.values(), fixed_only)
+        ],
+    )
+
+
+def check_termination_condition(results):
+    """
+    :param results: the Pyomo results object of a subproblem solve
+
+    Raise an error if a trajectory subproblem was not solved to optimality.
+    """
+    if results.solver.termination_condition != TerminationCondition.optimal:
+        raise RuntimeError(
+            f"Progressive hedging subproblem solve terminated with "
+            f"condition {results.solver.termination_condition}."
+        )
+
+
+def decompose(instance):
+    """
+    :param instance: the problem instance
+    :return: the list of shared variables, the objective function
+        coefficient of each shared variable (in minimization form), the
+        objective function sense, and the list of TrajectorySubproblem
+        objects
+    """
+    trajectories = get_trajectories(instance)
+
+    variables = dict()
+    variable_periods = dict()
+    variable_trajectories = dict()
+    period_dimensions = dict()
+
+    def add_variable(var):
+        if id(var) not in variables:
+            component = var.parent_component()
+            if id(component) not in period_dimensions:
+                period_dimensions[id(component)] = get_period_dimensions(
+                    instance, component.index_set()
+                )
+            variables[id(var)] = var
+            variable_periods[id(var)] = get_variable_periods(
+                var, period_dimensions[id(component)], instance
+            )
+            variable_trajectories[id(var)] = set()
+
+    # Assign each constraint (and its variables) to the trajectories that
+    # include all of its variables' periods
+    trajectory_constraints = [list() for _ in trajectories]
+    for c in instance.component_data_objects(Constraint, active=True):
+        # Skip constraints with no finite bounds, e.g., total limits that
+        # default to infinity and would otherwise link all trajectories
+        if not (c.has_lb() or c.has_ub()):
+            continue
+        constraint_variables = list(identify_variables(c.body, include_fixed=False))
+        if not constraint_variables:
+            continue
+        for var in constraint_variables:
+            add_variable(var)
+        constraint_periods = frozenset().union(
+            *[variable_periods[id(var)] for var in constraint_variables]
+        )
+        constraint_trajectories = [
+            s
+            for s, trajectory_periods in enumerate(trajectories)
+            if constraint_periods <= trajectory_periods
+        ]
+        if not constraint_trajectories:
+            raise ValueError(
+                f"Constraint {c.name} includes periods "
+                f"{sorted(constraint_periods)} that are not on the same "
+                f"future trajectory."
+            )
+        for s in constraint_trajectories:
+            trajectory_constraints[s].append(c)
+            for var in constraint_variables:
+                variable_trajectories[id(var)].add(s)
+
+    # Objective function terms; variables that are only in the objective
+    # function are assigned to the trajectories that include their periods
+    objective = next(instance.component_data_objects(Objective, active=True))
+    sense = objective.sense
+    sign = -1 if sense == maximize else 1
+    repn = generate_standard_repn(objective.expr, quadratic=False)
+    if not repn.is_linear():
+        raise ValueError("Progressive hedging requires a linear objective function.")
+    objective_coefficients = dict()
+    for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+        add_variable(var)
+        objective_coefficients[id(var)] = (
+            objective_coefficients.get(id(var), 0) + sign * coef
+        )
+        if not variable_trajectories[id(var)]:
+            variable_trajectories[id(var)].update(
+                s
+                for s, trajectory_periods in enumerate(trajectories)
+                if variable_periods[id(var)] <= trajectory_periods
+            )
+
+    # Variables in more than one trajectory are shared
+    shared_variables = list()
+    shared_index = dict()
+    for variable_id, var in variables.items():
+        if len(variable_trajectories[variable_id]) > 1:
+            shared_index[variable_id] = len(shared_variables)
+            shared_variables.append(var)
+    shared_coefficients = [
+        objective_coefficients.get(id(var), 0) for var in shared_variables
+    ]
+
+    trajectory_variables = [list() for _ in trajectories]
+    trajectory_objective_terms = [list() for _ in trajectories]
+    for variable_id, var in variables.items():
+        n_trajectories = len(variable_trajectories[variable_id])
+        for s in sorted(variable_trajectories[variable_id]):
+            trajectory_variables[s].append(var)
+            if variable_id in objective_coefficients:
+                trajectory_objective_terms[s].append(
+                    (objective_coefficients[variable_id] / n_trajectories, var)
+                )
+
+    subproblems = [
+        TrajectorySubproblem(
+            constraints=trajectory_constraints[s],
+            variables=trajectory_variables[s],
+            objective_terms=trajectory_objective_terms[s],
+            shared_variables=[
+                shared_index[id(var)]
+                for var in trajectory_variables[s]
+                if id(var) in shared_index
+            ],
+        )
+        for s in range(len(trajectories))
+    ]
+
+    return shared_variables, shared_coefficients, sense, subproblems
+
+
+def initialize_ph_worker(solve_function, parsed_arguments):
+    """
+    :param solve_function: the function solving a Pyomo model
+    :param parsed_arguments: the parsed run scenario arguments
+    """
+    _PH_WORKER["solve_function"] = solve_function
+    _PH_WORKER["parsed_arguments"] = parsed_arguments
+
+
+def solve_ph_subproblem_pool(job):
+    """
+    :param job: tuple with the subproblem index, the dill-pickled subproblem
+        model, the multipliers, averages, penalty weights, and tangent
+        scales of its shared variables, and whether to solve with the shared
+        variables fixed
+    :return: tuple with the subproblem index and the subproblem results
+
+    Each job includes the subproblem's standalone model, so that the worker
+    processes only hold the subproblem they are solving.
+    """
+    s, pickled_model, multipliers, averages, rhos, tangent_scales, fixed = job
+    m = dill.loads(pickled_model)
+    if fixed:
+        return s, solve_fixed_trajectory_model(
+            m=m,
+            averages=averages,
+            solve_function=_PH_WORKER["solve_function"],
+            parsed_arguments=_PH_WORKER["parsed_arguments"],
+        )
+    return s, solve_trajectory_model(
+        m=m,
+        multipliers=multipliers,
+        averages=averages,
+        rhos=rhos,
+        tangent_scales=tangent_scales,
+        solve_function=_PH_WORKER["solve_function"],
+        parsed_arguments=_PH_WORKER["parsed_arguments"],
+    )
+
+
+def solve_subproblems(
+    subproblems,
+    shared_variables,
+    multipliers,
+    averages,
+    rhos,
+    tangent_scales,
+    solve_function,
+    parsed_arguments,
+    pool,
+    pickled_models=None,
+    fixed=False,
+):
+    """
+    :return: list of the subproblem results, in the order of the subproblems
+
+    Solve the subproblems given the multipliers (list by subproblem of the
+    lists by shared variable), and the shared variable averages (None in the
+    first iteration), penalty weights, and tangent scales (lists by shared
+    variable), in the pool of worker processes if there is one (with the
+    list of the dill-pickled subproblem models).
+    """
+    jobs = [
+        (
+            s,
+            multipliers[s],
+            (
+                None
+                if averages is None
+                else [averages[i] for i in subproblem.shared_variables]
+            ),
+            [rhos[i] for i in subproblem.shared_variables],
+            [tangent_scales[i] for i in subproblem.shared_variables],
+            fixed,
+        )
+        for s, subproblem in enumerate(subproblems)
+    ]
+    if pool is not None:
+        results = dict(
+            pool.imap_unordered(
+                solve_ph_subproblem_pool,
+                [(job[0], pickled_models[job[0]]) + job[1:] for job in jobs],
+            )
+        )
+        return [results[s] for s in range(len(subproblems))]
+
+    results = list()
+    for (
+        s,
+        subproblem_multipliers,
+        subproblem_averages,
+        subproblem_rhos,
+        subproblem_tangent_scales,
+        _,
+    ) in jobs:
+        m = subproblems[s].get_model(shared_variables=shared_variables)
+        if fixed:
+            results.append(
+                solve_fixed_trajectory_model(
+                    m=m,
+                    averages=subproblem_averages,
+                    solve_function=solve_function,
+                    parsed_arguments=parsed_arguments,
+                )
+            )
+        else:
+            results.append(
+                solve_trajectory_model(
+                    m=m,
+                    multipliers=subproblem_multipliers,
+                    averages=subproblem_averages,
+                    rhos=subproblem_rhos,
+                    tangent_scales=subproblem_tangent_scales,
+                    solve_function=solve_function,
+                    parsed_arguments=parsed_arguments,
+                )
+            )
+    return results
+
+
+def get_averages(subproblems, shared_variables, subproblem_values):
+    """
+    :return: list of the average value of each shared variable across the
+        subproblems it is in
+    """
+    totals = [0] * len(shared_variables)
+    counts = [0] * len(shared_variables)
+    for subproblem, values in zip(subproblems, subproblem_values):
+        for i, var_value in zip(subproblem.shared_variables, values):
+            totals[i] += var_value
+            counts[i] += 1
+    return [total / count for total, count in zip(totals, counts)]
+
+
+def solve_with_progressive_hedging(
+    instance,
+    solve_function,
+    parsed_arguments,
+    results_directory,
+):
+    """
+    :param instance: the problem instance
+    :param solve_function: the function solving a Pyomo model, with the
+        model and the parsed arguments as arguments and returning the Pyomo
+        results object
+    :param parsed_arguments: the parsed run scenario arguments
+    :param results_directory: the subproblem/stage results directory
+    :return: the termination condition (feasible if the distance from
+        non-anticipativity is below the tolerance, optimal if there are no
+        shared variables, or maxIterations)
+
+    Solve the problem instance with progressive hedging and load the
+    solution into the instance.
+    """
+    tolerance = getattr(parsed_arguments, "ph_tolerance", 1e-4)
+    max_iterations = getattr(parsed_arguments, "ph_max_iterations", 100)
+    rho_multiplier = getattr(parsed_arguments, "ph_rho", 1.0)
+    n_parallel = getattr(parsed_arguments, "n_parallel_ph", 1)
+
+    (
+        shared_variables,
+        shared_coefficients,
+        sense,
+        subproblems,
+    ) = decompose(instance=instance)
+    if not parsed_arguments.quiet:
+        print(
+            f"...{len(subproblems)} trajectory subproblems, "
+            f"{len(shared_variables)} shared variables"
+        )
+
+    pool = None
+    pickled_models = None
+    if n_parallel > 1 and len(subproblems) > 1:
+        pickled_models = [
+            dill.dumps(subproblem.get_model(shared_variables=shared_variables))
+            for subproblem in subproblems
+        ]
+        pool = get_context("spawn").Pool(
+            min(n_parallel, len(subproblems)),
+            initializer=initialize_ph_worker,
+            initargs=(solve_function, parsed_arguments),
+        )
+
+    iterations = list()
+    termination_condition = TerminationCondition.maxIterations
+    try:
+        multipliers = [
+            [0] * len(subproblem.shared_variables) for subproblem in subproblems
+        ]
+        rhos = [0] * len(shared_variables)
+        tangent_scales = [0] * len(shared_variables)
+        averages = None
+        for iteration in range(max_iterations + 1):
+            iteration_start_time = time.perf_counter()
+
+            subproblem_values = solve_subproblems(
+                subproblems=subproblems,
+                shared_variables=shared_variables,
+                multipliers=multipliers,
+                averages=averages,
+                rhos=rhos,
+                tangent_scales=tangent_scales,
+                solve_function=solve_function,
+                parsed_arguments=parsed_arguments,
+                pool=pool,
+                pickled_models=pickled_models,
+            )
+            previous_averages = averages
+            averages = get_averages(
+                subproblems=subproblems,
+                shared_variables=shared_variables,
+                subproblem_values=subproblem_values,
+            )
+            deviations = [0] * len(shared_variables)
+            for subproblem, values in zip(subproblems, subproblem_values):
+                for i, var_value in zip(subproblem.shared_variables, values):
+                    deviations[i] = max(deviations[i], abs(var_value - averages[i]))
+
+            # In the first iteration, set the penalty weights based on the
+            # objective function coefficients (within a range around their
+            # median, or the median for shared variables with no cost) and
+            # the spread of the values
+            if iteration == 0:
+                nonzero_coefficients = sorted(
+                    abs(coef) for coef in shared_coefficients if coef != 0
+                )
+                median_coefficient = (
+                    nonzero_coefficients[len(nonzero_coefficients) // 2]
+                    if nonzero_coefficients
+                    else 1
+                )
+                rhos = [
+                    rho_multiplier
+                    * (
+                        min(
+                            max(abs(coef), median_coefficient / RHO_COEFFICIENT_RANGE),
+                            median_coefficient * RHO_COEFFICIENT_RANGE,
+                        )
+                        if coef != 0
+                        else median_coefficient
+                    )
+                    / max(1, 2 * deviation)
+                    for coef, deviation in zip(shared_coefficients, deviations)
+                ]
+
+            # Update the multipliers and the penalty term tangents, and
+            # compute the distance from non-anticipativity; the change in
+            # the averages is included, as the subproblems can agree on a
+            # value away from the average they were penalized toward, and
+            # that value is not optimal
+            distance = 0
+            total = 0
+            for s, (subproblem, values) in enumerate(
+                zip(subproblems, subproblem_values)
+            ):
+                for n, (i, var_value) in enumerate(
+                    zip(subproblem.shared_variables, values)
+                ):
+                    multipliers[s][n] += rhos[i] * (var_value - averages[i])
+                    distance += abs(var_value - averages[i])
+                    if previous_averages is not None:
+                        distance += abs(averages[i] - previous_averages[i])
+                    total += abs(averages[i])
+            convergence = distance / max(total, 1)
+            tangent_scales = [
+                max(deviation, tolerance * max(1, abs(average)))
+                for deviation, average in zip(deviations, averages)
+            ]
+
+            iterations.append(
+                (iteration, convergence, time.perf_counter() - iteration_start_time)
+            )
+            if not parsed_arguments.quiet:
+                print(
+                    f"...progressive hedging iteration {iteration}: "
+                    f"convergence {convergence:.2e}"
+                )
+            # The solution is within the tolerance of non-anticipativity, but
+            # is not proven optimal unless the subproblems are independent
+            if convergence <= tolerance:
+                termination_condition = (
+                    TerminationCondition.feasible
+                    if shared_variables
+                    else TerminationCondition.optimal
+                )
+                break
+
+        # Fix the shared variables to their averages, solve the subproblems,
+        # and load the solution into the instance
+        for var, average in zip(shared_variables, averages):
+            if var.is_integer():
+                average = round(average)
+            var.set_value(average, skip_validation=True)
+        instance.dual.clear()
+        sign = -1 if sense == maximize else 1
+        for subproblem, (values, duals) in zip(
+            subproblems,
+            solve_subproblems(
+                subproblems=subproblems,
+                shared_variables=shared_variables,
+                multipliers=[None] * len(subproblems),
+                averages=[var.value for var in shared_variables],
+                rhos=rhos,
+                tangent_scales=tangent_scales,
+                solve_function=solve_function,
+                parsed_arguments=parsed_arguments,
+                pool=pool,
+                pickled_models=pickled_models,
+                fixed=True,
+            ),
+        ):
+            shared_ids = set(
+                id(shared_variables[i]) for i in subproblem.shared_variables
+            )
+            for var, var_value in zip(subproblem.variables, values):
+                if id(var) not in shared_ids:
+                    var.set_value(var_value, skip_validation=True)
+            for c, dual in zip(subproblem.constraints, duals):
+                if dual is not None:
+                    instance.dual[c] = sign * dual
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        # Don't leave worker processes behind if a trajectory solve fails
+        if pool is not None:
+            pool.terminate()
+
+    save_ph_iterations(results_directory=results_directory, iterations=iterations)
+
+    return termination_condition
+
+
+def save_ph_iterations(results_directory, iterations):
+    """
+    :param results_directory: the subproblem/stage results directory
+    :param iterations: list of (iteration, convergence, seconds) tuples
+
+    Save the relative distance from non-anticipativity in each progressive
+    hedging iteration.
+    """
+    if not os.path.exists(results_directory):
+        os.makedirs(results_directory)
+    with open(
+        os.path.join(results_directory, PH_ITERATIONS_FILENAME), "w", newline=""
+    ) as f:
+        _writer = writer(f, delimiter=",")
+        _writer.writerow(["iteration", "convergence", "seconds"])
+        _writer.writerows(iterations)
@@ -0,0 +1,251 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Results file serialization. Results are written to CSV files by default.
+The large project results tables (project_timepoint and project_period),
+which grow with the number of projects and timepoints, are written while
+the modules export their results instead of being assembled in memory first,
+and can be written to compressed columnar files (Parquet or Feather) instead
+of CSV if the results file format is set when running the scenario. The
+results are already partitioned by iteration, subproblem, and stage, as
+each subproblem stage has its own results directory. Writing and reading
+the columnar formats requires the optional pyarrow package.
+
+The *ResultsFileWriter* writes a results table as a directory with one part
+file for each block of results written, e.g., the capacity results of the
+project_period table by one module and its costs by another. Each part has
+the table's index columns (e.g., project and period) and the results
+columns of its block, and is written RESULTS_ROW_GROUP_SIZE rows at a time.
+When the writer is closed, the index columns and the parts are recorded in
+the table's metadata file.
+
+Readers (e.g., the results import) don't need to know how the results were
+written: *get_results_file_path* finds the results table directory or, for
+results written as a single file, the columnar file or the CSV file, and
+*read_results_file* reads it. The parts of a results table are joined on
+its index columns: the first part has all the rows of the table, and each
+following part adds its results columns (or updates their values) for the
+rows it has.
+"""
+
+import json
+import os.path
+import pandas as pd
+import shutil
+
+# File extensions by results file format
+RESULTS_FILE_FORMATS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
+# Compression codec for the columnar formats
+COLUMNAR_RESULTS_COMPRESSION = "zstd"
+
+# Number of rows written at a time
+RESULTS_ROW_GROUP_SIZE = 100000
+
+# The file in a results table directory with the table's index columns and
+# the names of its part files
+RESULTS_TABLE_METADATA_FILENAME = "_metadata.json"
+
+
+class ResultsFileWriter(object):
+    """
+    Write a results table in the requested format, one part file for each
+    dataframe passed to *write* (see the module docstring). All dataframes
+    must have the same index. Use as a context manager to close the writer
+    when done; the results table can't be read until the writer is closed.
+    """
+
+    def __init__(self, results_directory, which_results, results_file_format):
+        """
+        :param results_directory: the results directory
+        :param which_results: the results table name, e.g., project_timepoint
+        :param results_file_format: string, one of the RESULTS_FILE_FORMATS
+            keys
+        """
+        if results_file_format not in RESULTS_FILE_FORMATS.keys():
+            raise ValueError(
+                f"Unknown results file format '{results_file_format}'. Options "
+                f"are: {list(RESULTS_FILE_FORMATS.keys())}."
+            )
+        self.results_file_format = results_file_format
+        self.table_directory = os.path.join(results_directory, which_results)
+        self.index_columns = None
+        self.parts = []
+
+        # Remove results written by a prior run, including results written
+        # as a single file
+        if os.path.isdir(self.table_directory):
+            shutil.rmtree(self.table_directory)
+        for extension in RESULTS_FILE_FORMATS.values():
+            results_file = os.path.join(results_directory, which_results + extension)
+            if os.path.exists(results_file):
+                os.remove(results_file)
+        os.makedirs(self.table_directory)
+
+    def write(self, df):
+        """
+        :param df: a block of results indexed by the table's index columns,
+            e.g., the results columns of one module
+
+        Write the block of results as a new part of the results table.
+        """
+        index_columns = list(df.index.names)
+        if self.index_columns is None:
+            self.index_columns = index_columns
+        elif index_columns != self.index_columns:
+            raise ValueError(
+                f"Results indexed by {index_columns} can't be written to a "
+                f"results table indexed by {self.index_columns}."
+            )
+
+        part = (
+            f"part-{len(self.parts)}" + RESULTS_FILE_FORMATS[self.results_file_format]
+        )
+        file_path = os.path.join(self.table_directory, part)
+        if self.results_file_format == "csv":
+            # Write the headers even if there are no results
+            df.iloc[:0].to_csv(file_path, sep=",", index=True)
+            for start in range(0, len(df), RESULTS_ROW_GROUP_SIZE):
+                df.iloc[start : start + RESULTS_ROW_GROUP_SIZE].to_csv(
+                    file_path, sep=",", index=True, mode="a", header=False
+                )
+        else:
+            import pyarrow as pa
+
+            # The column types are determined from the whole block, so that
+            # they are the same in all of its row groups
+            table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+            if self.results_file_format == "parquet":
+                import pyarrow.parquet as pq
+
+                pq.write_table(
+                    table,
+                    file_path,
+                    row_group_size=RESULTS_ROW_GROUP_SIZE,
+                    compression=COLUMNAR_RESULTS_COMPRESSION,
+                )
+            else:
+                with pa.ipc.new_file(
+                    file_path,
+                    table.schema,
+                    options=pa.ipc.IpcWriteOptions(
+                        compression=COLUMNAR_RESULTS_COMPRESSION
+                    ),
+                ) as ipc_writer:
+                    ipc_writer.write_table(table, max_chunksize=RESULTS_ROW_GROUP_SIZE)
+
+        self.parts.append(part)
+
+    def close(self):
+        """
+        Record the index columns and the parts of the results table.
+        """
+        with open(
+            os.path.join(self.table_directory, RESULTS_TABLE_METADATA_FILENAME), "w"
+        ) as f:
+            json.dump({"index_columns": self.index_columns, "parts": self.parts}, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+
+def get_results_file_path(results_directory, which_results):
+    """
+    :param results_directory: the results directory
+    :param which_results: the results file name without the extension
+    :return: the path to the results table directory (see
+        *ResultsFileWriter*) or the results file in whichever format it was
+        written or, if neither exists, the path to the CSV file
+    """
+    table_directory = os.path.join(results_directory, which_results)
+    if os.path.isdir(table_directory):
+        return table_directory
+
+    for results_file_format in ["parquet", "feather"]:
+        columnar_file = os.path.join(
+            results_directory,
+            which_results + RESULTS_FILE_FORMATS[results_file_format],
+        )
+        if os.path.exists(columnar_file):
+            return columnar_file
+
+    return os.path.join(results_directory, which_results + ".csv")
+
+
+def read_results_file(results_filepath):
+    """
+    :param results_filepath: path to the results table directory or the
+        results file (any format)
+    :return: the results dataframe
+    """
+    if os.path.isdir(results_filepath):
+        return read_results_table(results_filepath)
+    elif results_filepath.endswith(RESULTS_FILE_FORMATS["parquet"]):
+        return pd.read_parquet(results_filepath)
+    elif results_filepath.endswith(RESULTS_FILE_FORMATS["feather"]):
+        return pd.read_feather(results_filepath)
+    else:
+        return pd.read_csv(results_filepath)
+
+
+def read_results_table(table_directory):
+    """
+    :param table_directory: path to the results table directory (see
+        *ResultsFileWriter*)
+    :return: the results dataframe
+
+    Read the parts of a results table and join them on the table's index
+    columns: the first part has all the rows of the table, and the results
+    columns of each following part are added (or their values updated) for
+    the rows it has.
+    """
+    metadata_file = os.path.join(table_directory, RESULTS_TABLE_METADATA_FILENAME)
+    if not os.path.exists(metadata_file):
+        raise ValueError(
+            f"The results in {table_directory} are incomplete: the results "
+            f"table metadata file was not found."
+        )
+    with open(metadata_file, "r") as f:
+        metadata = json.load(f)
+    index_columns = metadata["index_columns"]
+
+    df = None
+    for part in metadata["parts"]:
+        part_df = read_results_file(os.path.join(table_directory, part)).set_index(
+            index_columns
+        )
+        if df is None:
+            df = part_df
+            continue
+        new_columns = [c for c in part_df.columns if c not in df.columns]
+        updated_columns = [c for c in part_df.columns if c in df.columns]
+        if updated_columns:
+            df[updated_columns] = df[updated_columns].astype(object)
+            df.update(part_df[updated_columns])
+        df = df.join(part_df[new_columns], how="left")
+
+    # Nothing was written
+    if df is None:
+        return pd.DataFrame()
+
+    return df.reset_index()
@@ -16,6 +16,7 @@
 Various input validation functions used in other modules
 """
 
+from contextlib import contextmanager
 import datetime
 import numpy as np
 import pandas as pd
@@ -37,6 +38,36 @@ def _get_idx_col(df):
         )
 
 
+class ValidationResults(object):
+    """
+    Validation rows that are collected in memory rather than written to the
+    status_validation table right away, so that they can be written later in
+    a single transaction (see *collect_validation_results*).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.rows = []
+
+
+VALIDATION_RESULTS = ValidationResults()
+
+
+@contextmanager
+def collect_validation_results():
+    """
+    While in this context, *write_validation_to_database* adds the
+    validation rows to VALIDATION_RESULTS instead of inserting them into the
+    database, so validations can be run over a read-only connection.
+    """
+    VALIDATION_RESULTS.rows = []
+    VALIDATION_RESULTS.enabled = True
+    try:
+        yield VALIDATION_RESULTS
+    finally:
+        VALIDATION_RESULTS.enabled = False
+
+
 # TODO: add iterations to validation?
 def write_validation_to_database(
     conn,
@@ -87,6 +118,26 @@ def write_validation_to_database(
         )
         for error in errors
     ]
+    if VALIDATION_RESULTS.enabled:
+        VALIDATION_RESULTS.rows.extend(rows)
+    else:
+        write_validation_rows_to_database(conn=conn, rows=rows)
+
+    return True
+
+
+def write_validation_rows_to_database(conn, rows):
+    """
+    :param conn: The database connection
+    :param rows: list of (scenario_id, subproblem_id, stage_id,
+        gridpath_module, db_table, severity, description, time_stamp) tuples
+
+    Insert the validation rows into the status_validation table in a single
+    transaction.
+    """
+    if not rows:
+        return
+
     c = conn.cursor()
     sql = """
     INSERT INTO status_validation
@@ -96,8 +147,6 @@ def write_validation_to_database(
     """
     spin_on_database_lock(conn, c, sql, rows)
 
-    return True
-
 
 def get_expected_dtypes(conn, tables):
     """
@@ -18,7 +18,9 @@ import warnings
 
 from argparse import ArgumentParser
 
+import numpy as np
 import pandas as pd
+from pyomo.environ import Param, Var, value
 
 
 def determine_scenario_directory(scenario_location, scenario_name):
@@ -159,6 +161,23 @@ def get_get_inputs_parser():
         default=1,
         help="Get inputs for n subproblems in parallel.",
     )
+    parser.add_argument(
+        "--share_scenario_level_inputs",
+        default=False,
+        action="store_true",
+        help="Write the input files that don't vary by iteration, "
+        "subproblem, or stage only once and hard-link them into each "
+        "subproblem's inputs directory.",
+    )
+    parser.add_argument(
+        "--input_file_format",
+        default="tab",
+        choices=["tab", "parquet", "feather"],
+        help="Format of the large timepoint-indexed input files (e.g. "
+        "variable profiles, loads, availability derates, and hydro inputs). "
+        "The columnar Parquet and Feather formats require pyarrow. Defaults "
+        "to tab-delimited .tab files.",
+    )
 
     return parser
 
@@ -223,6 +242,28 @@ def get_run_scenario_parser():
         "--solver option must be the same as the solver "
         "for which you are providing an executable.",
     )
+    parser.add_argument(
+        "--persistent_solver",
+        default=False,
+        action="store_true",
+        help="Solve with Pyomo's in-memory APPSI interface for the solver "
+        "(HiGHS, Gurobi, or CPLEX) instead of writing a problem file. The "
+        "solver object is kept across subproblems and stages; with "
+        "--reuse_model_structure, only the changes to the problem are passed "
+        "to the solver.",
+    )
+    parser.add_argument(
+        "--warm_start",
+        default=False,
+        action="store_true",
+        help="Pass the last solution found in the iteration (the previous "
+        "stage or the overlapping indices of the previous subproblem) to "
+        "the solver as a starting point, if the solver accepts one (the "
+        "--persistent_solver interfaces keep their own previous solution "
+        "instead). The "
+        "solve time is recorded in each subproblem's warm_start.csv results "
+        "file.",
+    )
     parser.add_argument(
         "--mute_solver_output",
         default=False,
@@ -252,6 +293,33 @@ def get_run_scenario_parser():
         default=False,
         action="store_true",
     )
+    parser.add_argument(
+        "--profile_model",
+        default=False,
+        action="store_true",
+        help="Record the time and memory spent in each module's model "
+        "build, data loading, results export, and duals methods and in "
+        "constructing each model component, and write them to "
+        "model_profile.csv in the subproblem/stage logs directory. The "
+        "profile is imported into the database with the results.",
+    )
+    parser.add_argument(
+        "--no_input_table_cache",
+        default=False,
+        action="store_true",
+        help="Don't share the parsed input files (e.g., projects.tab) across "
+        "modules while building the model; each module re-reads them.",
+    )
+    parser.add_argument(
+        "--reuse_model_structure",
+        default=False,
+        action="store_true",
+        help="Reuse the problem instance of the previously solved subproblem "
+        "if the next subproblem has the same model structure, only "
+        "relabeling its set members (e.g., the timepoints) and updating the "
+        "load and variable generation profile params; the instance is "
+        "rebuilt if the structure differs.",
+    )
     # Flag for test runs (various changes in behavior)
     parser.add_argument(
         "--testing",
@@ -266,6 +334,84 @@ def get_run_scenario_parser():
         default=1,
         help="Solve n subproblems in parallel.",
     )
+    parser.add_argument(
+        "--persistent_workers",
+        default=False,
+        action="store_true",
+        help="When solving subproblems in parallel, load the GridPath modules "
+        "only once per worker process and send the workers "
+        "iteration/subproblem jobs over a queue. Per-job timing is reported.",
+    )
+
+    # Benders decomposition
+    parser.add_argument(
+        "--benders",
+        default=False,
+        action="store_true",
+        help="Solve with Benders decomposition: the capacity variables are "
+        "in a master problem and the operational subproblems (e.g., each "
+        "period or horizon) add cuts to the master problem until the gap is "
+        "closed. Subproblems must be linear and always feasible.",
+    )
+    parser.add_argument(
+        "--benders_tolerance",
+        default=1e-6,
+        type=float,
+        help="The relative gap at which to stop the Benders iterations. "
+        "Defaults to 1e-6.",
+    )
+    parser.add_argument(
+        "--benders_max_iterations",
+        default=100,
+        type=int,
+        help="The maximum number of Benders iterations. Defaults to 100.",
+    )
+    parser.add_argument(
+        "--n_parallel_benders",
+        default=1,
+        type=int,
+        help="Solve n Benders subproblems in parallel.",
+    )
+
+    # Progressive hedging
+    parser.add_argument(
+        "--progressive_hedging",
+        default=False,
+        action="store_true",
+        help="Solve stochastic problems with progressive hedging: each "
+        "future trajectory of the period tree is a subproblem and the "
+        "variables shared by trajectories are iteratively brought to "
+        "agreement.",
+    )
+    parser.add_argument(
+        "--ph_tolerance",
+        default=1e-4,
+        type=float,
+        help="The relative distance of the shared variables from their "
+        "averages at which to stop the progressive hedging iterations. "
+        "Defaults to 1e-4.",
+    )
+    parser.add_argument(
+        "--ph_max_iterations",
+        default=100,
+        type=int,
+        help="The maximum number of progressive hedging iterations. "
+        "Defaults to 100.",
+    )
+    parser.add_argument(
+        "--ph_rho",
+        default=1.0,
+        type=float,
+        help="The multiplier of the progressive hedging penalty weights, "
+        "which are otherwise based on the objective function coefficients. "
+        "Defaults to 1.",
+    )
+    parser.add_argument(
+        "--n_parallel_ph",
+        default=1,
+        type=int,
+        help="Solve n progressive hedging subproblems in parallel.",
+    )
 
     # Solve only incomplete subproblems
     parser.add_argument(
@@ -289,6 +435,16 @@ def get_run_scenario_parser():
         "summary results.",
     )
 
+    parser.add_argument(
+        "--results_file_format",
+        default="csv",
+        choices=["csv", "parquet", "feather"],
+        help="Format of the large project results tables (project_timepoint "
+        "and project_period), which are written as directories with a part "
+        "file for each module's results. The compressed columnar Parquet and "
+        "Feather formats require pyarrow. Defaults to CSV.",
+    )
+
     parser.add_argument(
         "--skip_quick_summary",
         default=False,
@@ -313,6 +469,22 @@ def get_import_results_parser():
         "for subproblems before all other subproblems have been solved. "
         "Proceed with caution.",
     )
+    parser.add_argument(
+        "--bulk_import",
+        default=False,
+        action="store_true",
+        help="Import the results for each subproblem in a single transaction "
+        "with write-ahead logging and reduced disk syncing. Prior results for "
+        "the scenario are deleted once up front instead of before each "
+        "results table import.",
+    )
+    parser.add_argument(
+        "--n_parallel_import",
+        default=1,
+        help="Read the subproblem results files with n worker processes "
+        "while a single process inserts them into the database. Implies "
+        "--bulk_import.",
+    )
 
     return parser
 
@@ -446,6 +618,66 @@ def create_results_df(index_columns, results_columns, data):
     return df
 
 
+def get_component_values(component, index):
+    """
+    :param component: an indexed Pyomo component (e.g., a Var, Expression, or
+        Param)
+    :param index: the indices to get values for, e.g., the component's index
+        set
+    :return: NumPy array with the component's value at each index, in the
+        order of the indices
+
+    Extract all of the component's values in a single pass over its data
+    (the variable values are read directly, without evaluating each one),
+    then reorder them by position if the indices are not the component's
+    own indices in order. Variables without a value are NaN.
+    """
+    if component.ctype is Var:
+        values = np.array(
+            [var_data.value for var_data in component.values()], dtype=float
+        )
+    elif component.ctype is Param:
+        values = np.array(list(component.extract_values().values()), dtype=float)
+    else:
+        values = np.array(
+            [value(component_data) for component_data in component.values()],
+            dtype=float,
+        )
+
+    index = list(index)
+    keys = list(component.keys())
+    if index == keys:
+        return values
+
+    position = {key: i for i, key in enumerate(keys)}
+    return values[[position[idx] for idx in index]]
+
+
+def create_component_results_df(index_columns, index, components):
+    """
+    :param index_columns: list of the names of the index columns
+    :param index: the indices of the results rows, e.g., a Pyomo set
+    :param components: dictionary with the results column names as keys and
+        either the indexed Pyomo component to get the column values from or
+        a NumPy array with the column values (in the order of the indices)
+        as values
+    :return: the results dataframe, indexed by the index columns
+
+    Extract each component's values in bulk (see *get_component_values*),
+    instead of looking up each component for each row.
+    """
+    index = list(index)
+    df = pd.DataFrame(columns=index_columns, data=index)
+    for column, component in components.items():
+        df[column] = (
+            component
+            if isinstance(component, np.ndarray)
+            else get_component_values(component=component, index=index)
+        )
+
+    return df.set_index(index_columns)
+
+
 def duals_wrapper(m, component, verbose=False):
     try:
         return m.dual[component]
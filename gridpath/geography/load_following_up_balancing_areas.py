@@ -18,6 +18,8 @@ from pyomo.environ import Set, Param, Boolean, NonNegativeReals
 
 from gridpath.auxiliary.db_interface import directories_to_db_values
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -17,6 +17,13 @@ This script iterates over all modules required for a GridPath scenario and
 calls their *write_model_inputs()* method, which queries the GridPath
 database and writes the .tab input files to the scenario directory.
 
+Input files that don't vary by iteration, subproblem, or stage (e.g. the
+zone definitions) can optionally be written only once and shared across the
+subproblem input directories via hard links (see *write_model_inputs*).
+The large timepoint-indexed inputs can optionally be written in a columnar
+format (Parquet or Feather) instead of as .tab files (see
+*gridpath.auxiliary.input_files*).
+
 The main() function of this script can also be called with the
 *gridpath_get_inputs* command when GridPath is installed.
 """
@@ -26,11 +33,19 @@ import csv
 from multiprocessing import get_context
 import os.path
 import pandas as pd
+import shutil
 import sys
 import warnings
 
 from db.common_functions import connect_to_database
 from gridpath.auxiliary.db_interface import get_scenario_id_and_name
+from gridpath.auxiliary.input_files import (
+    INPUT_FILE_FORMAT_FILENAME,
+    INPUT_FILE_FORMATS,
+    get_pending_input_file_columns,
+    input_file_columns,
+    write_input_file_format,
+)
 from gridpath.common_functions import (
     determine_scenario_directory,
     create_directory_if_not_exists,
@@ -48,6 +63,8 @@ from gridpath.auxiliary.scenario_chars import (
     ScenarioDirectoryStructure,
 )
 
+SHARED_INPUTS_DIRECTORY = "shared_inputs"
+
 
 def write_model_inputs(
     scenario_directory,
@@ -57,11 +74,28 @@ def write_model_inputs(
     subscenarios,
     db_path,
     n_parallel_subproblems,
+    share_scenario_level_inputs=False,
+    input_file_format="tab",
 ):
     """
     For each module, load the inputs from the database and write out the inputs
     into .tab files, which will be used to construct the optimization problem.
 
+    If requested, scenario-level inputs are shared across the subproblem
+    input directories instead of being queried and written for each
+    subproblem. Modules whose inputs don't vary by iteration, subproblem, or
+    stage mark this with a module-level SCENARIO_LEVEL_INPUTS = True. The
+    inputs for the first iteration/subproblem/stage are written as usual,
+    tracking which files each module writes; the files written only by
+    scenario-level modules are then hard-linked (or copied if hard links are
+    not supported) into the *shared_inputs* directory and from there into the
+    other subproblems' input directories, and the scenario-level modules are
+    skipped for the other subproblems. A file that a subproblem-level module
+    also writes is not shared, and neither are the files of any module
+    writing such a file (see *determine_shared_inputs*). Since the shared
+    files are linked into each input directory, the modules' load_model_data
+    methods find them in the usual location.
+
     :param scenario_directory: local scenario directory
     :param scenario_structure: ScenarioStructure object with info on the
         weather/hydro iterations and subproblem/stage structure
@@ -71,7 +105,10 @@ def write_model_inputs(
     :param subscenarios: SubScenarios object with all subscenario info
     :param db_path: database connection
     :param n_parallel_subproblems: int; get inputs for subproblems in parallel
-
+    :param share_scenario_level_inputs: Boolean; whether to write
+        scenario-level inputs only once and share them across subproblems
+    :param input_file_format: string; the format of the large
+        timepoint-indexed input files ("tab", "parquet", or "feather")
 
     :return:
     """
@@ -82,6 +119,11 @@ def write_model_inputs(
     # files
     delete_prior_aux_files(scenario_directory=scenario_directory)
 
+    # Record the input file format for the modules writing the inputs
+    write_input_file_format(
+        scenario_directory=scenario_directory, input_file_format=input_file_format
+    )
+
     # Determine whether we will have iteration (weather, hydro iteration),
     # and subproblem and stage directories
     # The subproblem structure is the same within each iteration
@@ -108,79 +150,84 @@ def write_model_inputs(
             )
         n_parallel_subproblems = 1
 
+    # Make the list of all the input directories to write as
+    # (weather iteration, hydro iteration, availability iteration, subproblem,
+    # stage) directory strings
+    input_directory_strings = []
+    for weather_iteration_str in iteration_directory_strings.keys():
+        for hydro_iteration_str in iteration_directory_strings[
+            weather_iteration_str
+        ].keys():
+            for availability_iteration_str in iteration_directory_strings[
+                weather_iteration_str
+            ][hydro_iteration_str]:
+                # We may have passed "empty_string" to avoid actual empty
+                # strings as dictionary keys; convert to actual empty
+                # strings here to pass to the directory creation methods
+                weather_iteration_str = ensure_empty_string(weather_iteration_str)
+                hydro_iteration_str = ensure_empty_string(hydro_iteration_str)
+                availability_iteration_str = ensure_empty_string(
+                    availability_iteration_str
+                )
+
+                for subproblem_str in subproblem_stage_directory_strings.keys():
+                    for stage_str in subproblem_stage_directory_strings[subproblem_str]:
+                        input_directory_strings.append(
+                            (
+                                weather_iteration_str,
+                                hydro_iteration_str,
+                                availability_iteration_str,
+                                subproblem_str,
+                                stage_str,
+                            )
+                        )
+
+    # Remove shared inputs from prior runs
+    shared_inputs_directory = os.path.join(scenario_directory, SHARED_INPUTS_DIRECTORY)
+    if os.path.exists(shared_inputs_directory):
+        shutil.rmtree(shared_inputs_directory)
+
+    # If sharing scenario-level inputs, write the first input directory and
+    # determine what can be shared with the rest from there
+    shared_inputs = None
+    if share_scenario_level_inputs and len(input_directory_strings) > 1:
+        files_written_by_module = write_inputs(
+            scenario_directory,
+            *input_directory_strings[0],
+            modules_to_use=modules_to_use,
+            scenario_id=scenario_id,
+            subscenarios=subscenarios,
+            db_path=db_path,
+            track_written_files=True,
+        )
+        shared_inputs = share_scenario_level_input_files(
+            scenario_directory=scenario_directory,
+            template_directory_strings=input_directory_strings[0],
+            modules_to_use=modules_to_use,
+            files_written_by_module=files_written_by_module,
+        )
+        input_directory_strings = input_directory_strings[1:]
+
     # If no parallelization requested, loop through the iterations
     # and subproblems
     if n_parallel_subproblems == 1:
-        for weather_iteration_str in iteration_directory_strings.keys():
-            for hydro_iteration_str in iteration_directory_strings[
-                weather_iteration_str
-            ].keys():
-                for availability_iteration_str in iteration_directory_strings[
-                    weather_iteration_str
-                ][hydro_iteration_str]:
-                    # We may have passed "empty_string" to avoid actual empty
-                    # strings as dictionary keys; convert to actual empty
-                    # strings here to pass to the directory creation methods
-                    weather_iteration_str = ensure_empty_string(weather_iteration_str)
-                    hydro_iteration_str = ensure_empty_string(hydro_iteration_str)
-                    availability_iteration_str = ensure_empty_string(
-                        availability_iteration_str
-                    )
-
-                    for subproblem_str in subproblem_stage_directory_strings.keys():
-                        for stage_str in subproblem_stage_directory_strings[
-                            subproblem_str
-                        ]:
-                            write_inputs(
-                                scenario_directory=scenario_directory,
-                                weather_iteration_str=weather_iteration_str,
-                                hydro_iteration_str=hydro_iteration_str,
-                                availability_iteration_str=availability_iteration_str,
-                                subproblem_str=subproblem_str,
-                                stage_str=stage_str,
-                                modules_to_use=modules_to_use,
-                                scenario_id=scenario_id,
-                                subscenarios=subscenarios,
-                                db_path=db_path,
-                            )
+        for directory_strings in input_directory_strings:
+            write_inputs(
+                scenario_directory,
+                *directory_strings,
+                modules_to_use=modules_to_use,
+                scenario_id=scenario_id,
+                subscenarios=subscenarios,
+                db_path=db_path,
+                shared_inputs=shared_inputs,
+            )
     else:
-        pool_data = []
-        for weather_iteration_str in iteration_directory_strings.keys():
-            for hydro_iteration_str in iteration_directory_strings[
-                weather_iteration_str
-            ].keys():
-                for availability_iteration_str in iteration_directory_strings[
-                    weather_iteration_str
-                ][hydro_iteration_str]:
-                    # We may have passed "empty_string" to avoid actual empty
-                    # strings as dictionary keys; convert to actual empty
-                    # strings here to pass to the directory creation methods
-                    weather_iteration_str = ensure_empty_string(weather_iteration_str)
-                    hydro_iteration_str = ensure_empty_string(hydro_iteration_str)
-                    availability_iteration_str = ensure_empty_string(
-                        availability_iteration_str
-                    )
-
-                    for subproblem_str in subproblem_stage_directory_strings.keys():
-                        for stage_str in subproblem_stage_directory_strings[
-                            subproblem_str
-                        ]:
-                            pool_data.append(
-                                [
-                                    scenario_directory,
-                                    weather_iteration_str,
-                                    hydro_iteration_str,
-                                    availability_iteration_str,
-                                    subproblem_str,
-                                    stage_str,
-                                    modules_to_use,
-                                    scenario_id,
-                                    subscenarios,
-                                    db_path,
-                                ]
-                            )
-
-        pool_data = tuple(pool_data)
+        pool_data = tuple(
+            [scenario_directory]
+            + list(directory_strings)
+            + [modules_to_use, scenario_id, subscenarios, db_path, shared_inputs]
+            for directory_strings in input_directory_strings
+        )
 
         # Pool must use spawn to work properly on Linux
         pool = get_context("spawn").Pool(n_parallel_subproblems)
@@ -199,7 +246,20 @@ def write_inputs(
     scenario_id,
     subscenarios,
     db_path,
+    shared_inputs=None,
+    track_written_files=False,
 ):
+    """
+    :param shared_inputs: None or tuple of the list of modules to skip and
+        the list of files to link from the shared inputs directory (see
+        *share_scenario_level_input_files*)
+    :param track_written_files: Boolean; whether to track and return the
+        files each module writes
+    :return: if tracking files, a dictionary with the module names as keys
+        and the set of files each module wrote or modified as values
+
+    Write the input files for a single iteration/subproblem/stage.
+    """
     loaded_modules = load_modules(modules_to_use=modules_to_use)
 
     inputs_directory = os.path.join(
@@ -219,29 +279,173 @@ def write_inputs(
     # phantom inputs
     delete_prior_inputs(inputs_directory=inputs_directory)
 
+    # Link the shared scenario-level input files and skip the modules that
+    # write them
+    modules_to_skip = []
+    if shared_inputs is not None:
+        modules_to_skip, shared_files = shared_inputs
+        for f in shared_files:
+            link_or_copy_file(
+                source=os.path.join(scenario_directory, SHARED_INPUTS_DIRECTORY, f),
+                destination=os.path.join(inputs_directory, f),
+            )
+
     # Write model input .tab files for each of the loaded_modules if
     # appropriate. Note that all input files are saved in the
     # input_directory, even the non-temporal inputs that are not
     # dependent on the subproblem or stage. This simplifies the file
     # structure at the expense of unnecessarily duplicating
-    # non-temporal input files such as projects.tab.
+    # non-temporal input files such as projects.tab unless scenario-level
+    # inputs are shared.
+    # The columns modules add to other modules' input files (e.g.,
+    # projects.tab) are written once all modules are done (see
+    # *input_file_columns*)
+    files_written_by_module = {}
     conn = connect_to_database(db_path=db_path)
-    for m in loaded_modules:
-        if hasattr(m, "write_model_inputs"):
-            m.write_model_inputs(
-                scenario_directory=scenario_directory,
-                scenario_id=scenario_id,
-                subscenarios=subscenarios,
-                weather_iteration=weather_iteration_str,
-                hydro_iteration=hydro_iteration_str,
-                availability_iteration=availability_iteration_str,
-                subproblem=subproblem_str,
-                stage=stage_str,
-                conn=conn,
-            )
+    with input_file_columns():
+        for module_name, m in zip(modules_to_use, loaded_modules):
+            if hasattr(m, "write_model_inputs") and module_name not in modules_to_skip:
+                if track_written_files:
+                    files_before = get_input_files_state(inputs_directory)
+                m.write_model_inputs(
+                    scenario_directory=scenario_directory,
+                    scenario_id=scenario_id,
+                    subscenarios=subscenarios,
+                    weather_iteration=weather_iteration_str,
+                    hydro_iteration=hydro_iteration_str,
+                    availability_iteration=availability_iteration_str,
+                    subproblem=subproblem_str,
+                    stage=stage_str,
+                    conn=conn,
+                )
+                if track_written_files:
+                    files_after = get_input_files_state(inputs_directory)
+                    files_written_by_module[module_name] = set(
+                        f
+                        for f in files_after.keys()
+                        if files_before.get(f) != files_after[f]
+                    )
 
     conn.close()
 
+    if track_written_files:
+        return files_written_by_module
+
+
+def get_input_files_state(inputs_directory):
+    """
+    :param inputs_directory: the input directory
+    :return: dictionary with the filenames as keys and their modification
+        time, size, and number of pending column additions (see
+        *add_input_file_columns*) as values
+    """
+    pending_columns = get_pending_input_file_columns(inputs_directory)
+    files_state = {}
+    for f in os.listdir(inputs_directory):
+        stat = os.stat(os.path.join(inputs_directory, f))
+        files_state[f] = (stat.st_mtime_ns, stat.st_size, pending_columns.get(f, 0))
+
+    return files_state
+
+
+def determine_shared_inputs(modules_to_use, scenario_level_modules, files_by_module):
+    """
+    :param modules_to_use: list of the module names in load order
+    :param scenario_level_modules: list of the module names whose inputs
+        don't vary by iteration, subproblem, or stage
+    :param files_by_module: dictionary with the module names as keys and the
+        set of files each module wrote as values
+    :return: the list of modules that can be skipped after the first
+        subproblem and the sorted list of input files that can be shared
+
+    Modules that are not scenario-level must be run for every subproblem, so
+    the files they write can't be shared. Any scenario-level module that
+    also writes one of those files (e.g. by adding columns to it) must then
+    be run for every subproblem too, so we repeat until no more modules are
+    added.
+    """
+    modules_to_run = set(
+        m for m in files_by_module.keys() if m not in scenario_level_modules
+    )
+    while True:
+        unshared_files = set()
+        for m in modules_to_run:
+            unshared_files.update(files_by_module[m])
+        additional_modules = set(
+            m
+            for m in files_by_module.keys()
+            if m not in modules_to_run and files_by_module[m] & unshared_files
+        )
+        if not additional_modules:
+            break
+        modules_to_run.update(additional_modules)
+
+    modules_to_skip = [
+        m for m in modules_to_use if m in files_by_module and m not in modules_to_run
+    ]
+    shared_files = set()
+    for m in modules_to_skip:
+        shared_files.update(files_by_module[m])
+
+    return modules_to_skip, sorted(shared_files)
+
+
+def share_scenario_level_input_files(
+    scenario_directory,
+    template_directory_strings,
+    modules_to_use,
+    files_written_by_module,
+):
+    """
+    :param scenario_directory: the scenario directory
+    :param template_directory_strings: tuple of the iteration, subproblem,
+        and stage directory strings of the input directory written first
+    :param modules_to_use: list of the module names
+    :param files_written_by_module: dictionary with the module names as keys
+        and the set of files each module wrote in the template input directory
+    :return: tuple of the list of modules to skip and the list of shared
+        files for the remaining input directories
+
+    Determine the shareable files and link them from the template input
+    directory into the shared inputs directory.
+    """
+    loaded_modules = load_modules(modules_to_use=modules_to_use)
+    scenario_level_modules = [
+        module_name
+        for module_name, m in zip(modules_to_use, loaded_modules)
+        if getattr(m, "SCENARIO_LEVEL_INPUTS", False)
+    ]
+
+    modules_to_skip, shared_files = determine_shared_inputs(
+        modules_to_use=modules_to_use,
+        scenario_level_modules=scenario_level_modules,
+        files_by_module=files_written_by_module,
+    )
+
+    template_inputs_directory = os.path.join(
+        scenario_directory, *template_directory_strings, "inputs"
+    )
+    shared_inputs_directory = os.path.join(scenario_directory, SHARED_INPUTS_DIRECTORY)
+    create_directory_if_not_exists(directory=shared_inputs_directory)
+    for f in shared_files:
+        link_or_copy_file(
+            source=os.path.join(template_inputs_directory, f),
+            destination=os.path.join(shared_inputs_directory, f),
+        )
+
+    return modules_to_skip, shared_files
+
+
+def link_or_copy_file(source, destination):
+    """
+    Hard-link the source file to the destination; copy it if the file system
+    does not support hard links.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
 
 def get_inputs_for_subproblem_pool(pool_datum):
     """
@@ -259,6 +463,7 @@ def get_inputs_for_subproblem_pool(pool_datum):
         scenario_id,
         subscenarios,
         db_path,
+        shared_inputs,
     ] = pool_datum
 
     write_inputs(
@@ -272,6 +477,7 @@ def get_inputs_for_subproblem_pool(pool_datum):
         scenario_id=scenario_id,
         subscenarios=subscenarios,
         db_path=db_path,
+        shared_inputs=shared_inputs,
     )
 
 
@@ -286,6 +492,7 @@ def delete_prior_aux_files(scenario_directory):
         "scenario_description.csv",
         "solver_options.csv",
         "linked_subproblems_map.csv",
+        INPUT_FILE_FORMAT_FILENAME,
     ]
 
     for f in prior_aux_files:
@@ -295,12 +502,15 @@ def delete_prior_aux_files(scenario_directory):
 
 def delete_prior_inputs(inputs_directory):
     """
-    Delete all .tab files that may exist in the specified directory
-    :param inputs_directory: local directory where .tab files are saved
+    Delete all input files (.tab or columnar) that may exist in the
+    specified directory
+    :param inputs_directory: local directory where input files are saved
     :return:
     """
     prior_input_tab_files = [
-        f for f in os.listdir(inputs_directory) if f.endswith(".tab")
+        f
+        for f in os.listdir(inputs_directory)
+        if f.endswith(tuple(INPUT_FILE_FORMATS.values()))
     ]
 
     for f in prior_input_tab_files:
@@ -507,6 +717,8 @@ def main(args=None):
         subscenarios=subscenarios,
         db_path=db_path,
         n_parallel_subproblems=int(parsed_arguments.n_parallel_get_inputs),
+        share_scenario_level_inputs=parsed_arguments.share_scenario_level_inputs,
+        input_file_format=parsed_arguments.input_file_format,
     )
 
     # Save the list of optional features to a file (will be used to determine
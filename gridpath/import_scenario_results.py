@@ -23,12 +23,27 @@ The main()_ function of this script can also be called with the
 
 import warnings
 from argparse import ArgumentParser
+from collections import deque
+from multiprocessing import get_context
 import os.path
 import pandas as pd
+import sqlite3
 import sys
+import time
 
-from gridpath.auxiliary.db_interface import get_scenario_id_and_name
+from gridpath.auxiliary.db_interface import (
+    get_scenario_id_and_name,
+    read_results_csv,
+    STAGED_RESULTS,
+)
 from gridpath.auxiliary.import_export_rules import import_export_rules
+from gridpath.auxiliary.model_profile import (
+    MODEL_PROFILE_COLUMNS,
+    MODEL_PROFILE_FILENAME,
+    ModelProfile,
+    profile_module,
+)
+from gridpath.auxiliary.results_files import get_results_file_path
 from gridpath.common_functions import (
     determine_scenario_directory,
     get_db_parser,
@@ -36,7 +51,13 @@ from gridpath.common_functions import (
     get_import_results_parser,
     ensure_empty_string,
 )
-from db.common_functions import connect_to_database, spin_on_database_lock
+from db.common_functions import (
+    BulkImportConnection,
+    connect_to_database,
+    end_bulk_import,
+    spin_on_database_lock,
+    start_bulk_import,
+)
 from db.utilities.scenario import delete_scenario_results
 from gridpath.auxiliary.module_list import determine_modules, load_modules
 from gridpath.auxiliary.scenario_chars import (
@@ -57,29 +78,16 @@ def _import_rule(results_directory, quiet):
     return import_results
 
 
-def import_scenario_results_into_database(
-    import_rule,
-    loaded_modules,
-    scenario_id,
-    scenario_structure,
-    db,
-    scenario_directory,
-    ignore_incomplete,
-    quiet,
-):
+def get_subproblem_stage_results_to_import(scenario_structure, scenario_directory):
     """
-    :param import_rule:
-    :param loaded_modules:
-    :param scenario_id:
-    :param scenario_structure:
-    :param db:
-    :param scenario_directory:
-    :param ignore_incomplete: boolean
-    :param quiet: boolean
+    :param scenario_structure: the scenario structure object
+    :param scenario_directory: the scenario directory
+    :return: list of (weather_iteration_str, hydro_iteration_str,
+        availability_iteration_str, subproblem_str, stage_str,
+        results_directory) tuples, in import order
 
-    :return:
+    Determine the iteration/subproblem/stage results directories to import.
     """
-
     iteration_directory_strings = ScenarioDirectoryStructure(
         scenario_structure
     ).ITERATION_DIRECTORIES
@@ -87,6 +95,7 @@ def import_scenario_results_into_database(
         scenario_structure
     ).SUBPROBLEM_STAGE_DIRECTORIES
 
+    subproblem_stages = []
     # Hydro years first
     for weather_iteration_str in iteration_directory_strings.keys():
         for hydro_iteration_str in iteration_directory_strings[
@@ -103,30 +112,8 @@ def import_scenario_results_into_database(
                 availability_iteration_str = ensure_empty_string(
                     availability_iteration_str
                 )
-
-                weather_iteration = (
-                    0
-                    if weather_iteration_str == ""
-                    else int(weather_iteration_str.replace("weather_iteration_", ""))
-                )
-                hydro_iteration = (
-                    0
-                    if hydro_iteration_str == ""
-                    else int(hydro_iteration_str.replace("hydro_iteration_", ""))
-                )
-                availability_iteration = (
-                    0
-                    if availability_iteration_str == ""
-                    else int(
-                        availability_iteration_str.replace(
-                            "availability_iteration_", ""
-                        )
-                    )
-                )
                 for subproblem_str in subproblem_stage_directory_strings.keys():
-                    subproblem = 0 if subproblem_str == "" else int(subproblem_str)
                     for stage_str in subproblem_stage_directory_strings[subproblem_str]:
-                        stage = 0 if stage_str == "" else int(stage_str)
                         results_directory = os.path.join(
                             scenario_directory,
                             weather_iteration_str,
@@ -136,124 +123,407 @@ def import_scenario_results_into_database(
                             stage_str,
                             "results",
                         )
-                        if not quiet:
-                            current_suproblem = os.path.join(
+                        subproblem_stages.append(
+                            (
                                 weather_iteration_str,
                                 hydro_iteration_str,
                                 availability_iteration_str,
                                 subproblem_str,
                                 stage_str,
+                                results_directory,
                             )
-                            if current_suproblem.endswith("/"):
-                                current_suproblem = current_suproblem[:-1]
-
-                            print(f"--- subproblem: {current_suproblem}")
-
-                        # Import termination condition data
-                        c = db.cursor()
-                        try:
-                            with open(
-                                os.path.join(
-                                    results_directory, "termination_condition.txt"
-                                ),
-                                "r",
-                            ) as f:
-                                termination_condition = f.read()
-                        except FileNotFoundError:
-                            if ignore_incomplete:
-                                warnings.warn(
-                                    "GridPath Warning: termination "
-                                    "condition file not found."
-                                )
-                                termination_condition = (
-                                    "termination condition file not found"
-                                )
-                            else:
-                                tc_fname = os.path.join(
-                                    results_directory, "termination_condition.txt"
-                                )
-                                raise FileNotFoundError(f"{tc_fname} not " f"found.")
-
-                        termination_condition_sql = """
-                            INSERT INTO results_scenario
-                            (scenario_id, weather_iteration, hydro_iteration, availability_iteration, subproblem_id, 
-                            stage_id, solver_termination_condition)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ;"""
-
-                        termination_condition_data = (
-                            scenario_id,
-                            weather_iteration,
-                            hydro_iteration,
-                            availability_iteration,
-                            subproblem,
-                            stage,
-                            termination_condition,
                         )
-                        spin_on_database_lock(
-                            conn=db,
-                            cursor=c,
-                            sql=termination_condition_sql,
-                            data=termination_condition_data,
-                            many=False,
+
+    return subproblem_stages
+
+
+def stage_subproblem_stage_results(job):
+    """
+    :param job: list of the scenario_id, the subproblem/stage tuple (see
+        *get_subproblem_stage_results_to_import*), and the list of results
+        table names without the "results" prefix
+    :return: dictionary of the normalized results dataframes keyed by
+        results file path, and the time it took to read them
+
+    Read the subproblem/stage results files that have a corresponding results
+    table in the database, so that the main process only needs to insert
+    them. This is the worker function for parallel results imports.
+    """
+    scenario_id, subproblem_stage, which_results_list = job
+    (
+        weather_iteration_str,
+        hydro_iteration_str,
+        availability_iteration_str,
+        subproblem_str,
+        stage_str,
+        results_directory,
+    ) = subproblem_stage
+
+    start_time = time.perf_counter()
+    staged_results = {}
+    for which_results in which_results_list:
+        results_filepath = get_results_file_path(
+            results_directory=results_directory, which_results=which_results
+        )
+        if os.path.exists(results_filepath):
+            staged_results[results_filepath] = read_results_csv(
+                results_filepath=results_filepath,
+                scenario_id=scenario_id,
+                weather_iteration=weather_iteration_str,
+                hydro_iteration=hydro_iteration_str,
+                availability_iteration=availability_iteration_str,
+                subproblem=subproblem_str,
+                stage=stage_str,
+            )
+
+    return staged_results, time.perf_counter() - start_time
+
+
+def import_scenario_results_into_database(
+    import_rule,
+    loaded_modules,
+    scenario_id,
+    scenario_structure,
+    db,
+    scenario_directory,
+    ignore_incomplete,
+    quiet,
+    n_parallel_import=1,
+):
+    """
+    :param import_rule:
+    :param loaded_modules:
+    :param scenario_id:
+    :param scenario_structure:
+    :param db:
+    :param scenario_directory:
+    :param ignore_incomplete: boolean
+    :param quiet: boolean
+    :param n_parallel_import: integer; the number of worker processes
+        reading the results files
+
+    :return:
+
+    If *n_parallel_import* is greater than 1, a pool of worker processes
+    reads the results CSVs of upcoming subproblems/stages while the
+    subproblem/stage results that have already been read are inserted into
+    the database by this (single writer) process.
+    """
+    subproblem_stages = get_subproblem_stage_results_to_import(
+        scenario_structure=scenario_structure,
+        scenario_directory=scenario_directory,
+    )
+
+    # Keep track of the time spent importing results by module
+    module_times = {}
+
+    if n_parallel_import > 1:
+        which_results_list = [tbl[0][len("results_") :] for tbl in db.execute("""
+                SELECT name FROM sqlite_master 
+                WHERE type='table' AND name LIKE 'results_%';
+                """).fetchall()]
+        jobs = [
+            [scenario_id, subproblem_stage, which_results_list]
+            for subproblem_stage in subproblem_stages
+        ]
+        # Pool must use spawn to work properly on Linux
+        pool = get_context("spawn").Pool(n_parallel_import)
+        # Only read ahead a limited number of subproblems/stages, so that the
+        # staged results don't accumulate in memory if the writer falls
+        # behind; results are used in order, so that the database rows are
+        # inserted in the same order as when importing sequentially
+        staged_results_queue = deque(
+            pool.apply_async(stage_subproblem_stage_results, (job,))
+            for job in jobs[: 2 * n_parallel_import]
+        )
+        jobs_to_submit = deque(jobs[2 * n_parallel_import :])
+    else:
+        pool = None
+
+    start_time = time.perf_counter()
+    try:
+        for subproblem_stage in subproblem_stages:
+            if pool is not None:
+                staged_results, staging_time = staged_results_queue.popleft().get()
+                if jobs_to_submit:
+                    staged_results_queue.append(
+                        pool.apply_async(
+                            stage_subproblem_stage_results, (jobs_to_submit.popleft(),)
                         )
+                    )
+                STAGED_RESULTS.update(staged_results)
+                module_times["(reading results files in workers)"] = (
+                    module_times.get("(reading results files in workers)", 0)
+                    + staging_time
+                )
 
-                        try:
-                            with open(
-                                os.path.join(results_directory, "solver_status.txt"),
-                                "r",
-                            ) as status_f:
-                                solver_status = status_f.read()
-                        except FileNotFoundError:
-                            if ignore_incomplete:
-                                warnings.warn(
-                                    "GridPath Warning: solver status " "file not found."
-                                )
-                                termination_condition = "solver status file not found"
-                            else:
-                                ss_fname = os.path.join(
-                                    results_directory, "solver_status.txt"
-                                )
-                                raise FileNotFoundError(f"{ss_fname} not found.")
-
-                        # Only import other results if solver status was "ok"
-                        # When the problem is infeasible, the solver status is "warning"
-                        # If there's no solution, variables remain uninitialized,
-                        # throwing an error at some point during results-export,
-                        # so we don't attempt to import missing results into the database
-                        if solver_status == "ok":
-                            import_objective_function_value(
-                                db=db,
-                                scenario_id=scenario_id,
-                                weather_iteration=weather_iteration_str,
-                                hydro_iteration=hydro_iteration_str,
-                                availability_iteration=availability_iteration,
-                                subproblem=subproblem_str,
-                                stage=stage_str,
-                                results_directory=results_directory,
-                            )
-                            import_subproblem_stage_results_into_database(
-                                import_rule=import_rule,
-                                db=db,
-                                scenario_id=scenario_id,
-                                weather_iteration=weather_iteration_str,
-                                hydro_iteration=hydro_iteration_str,
-                                availability_iteration=availability_iteration_str,
-                                subproblem=subproblem_str,
-                                stage=stage_str,
-                                results_directory=results_directory,
-                                loaded_modules=loaded_modules,
-                                quiet=quiet,
-                            )
-                        else:
-                            if not quiet:
-                                print(f"""
-                                Solver status for weather iteration {weather_iteration_str}, 
-                                hydro_iteration {hydro_iteration_str}, subproblem {subproblem_str}, 
-                                stage {stage_str} was '{solver_status}', 
-                                not 'ok', so there are no results to import. 
-                                Termination condition was '{termination_condition}'.
-                                """)
+            import_subproblem_stage_results(
+                import_rule=import_rule,
+                loaded_modules=loaded_modules,
+                scenario_id=scenario_id,
+                subproblem_stage=subproblem_stage,
+                db=db,
+                ignore_incomplete=ignore_incomplete,
+                quiet=quiet,
+                module_times=module_times,
+            )
+
+            # Discard staged results that no module imported
+            STAGED_RESULTS.clear()
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        # Don't leave worker processes behind if the import fails
+        if pool is not None:
+            pool.terminate()
+
+    if not quiet:
+        print(
+            f"Imported results for {len(subproblem_stages)} subproblems/stages "
+            f"in {time.perf_counter() - start_time:.2f} seconds."
+        )
+        for m in sorted(module_times.keys(), key=lambda k: -module_times[k]):
+            print(f"--- {m}: {module_times[m]:.2f} seconds")
+
+
+def import_subproblem_stage_results(
+    import_rule,
+    loaded_modules,
+    scenario_id,
+    subproblem_stage,
+    db,
+    ignore_incomplete,
+    quiet,
+    module_times=None,
+):
+    """
+    :param import_rule:
+    :param loaded_modules:
+    :param scenario_id:
+    :param subproblem_stage: tuple of the iteration, subproblem, and stage
+        directory strings and the results directory (see
+        *get_subproblem_stage_results_to_import*)
+    :param db:
+    :param ignore_incomplete: boolean
+    :param quiet: boolean
+    :param module_times: dictionary in which to accumulate the import time
+        by module
+    :return:
+
+    Import the termination condition, solver status, objective function
+    value, and module results for a subproblem/stage, as well as the model
+    profile if the subproblem/stage was run with profiling.
+    """
+    (
+        weather_iteration_str,
+        hydro_iteration_str,
+        availability_iteration_str,
+        subproblem_str,
+        stage_str,
+        results_directory,
+    ) = subproblem_stage
+
+    weather_iteration = (
+        0
+        if weather_iteration_str == ""
+        else int(weather_iteration_str.replace("weather_iteration_", ""))
+    )
+    hydro_iteration = (
+        0
+        if hydro_iteration_str == ""
+        else int(hydro_iteration_str.replace("hydro_iteration_", ""))
+    )
+    availability_iteration = (
+        0
+        if availability_iteration_str == ""
+        else int(availability_iteration_str.replace("availability_iteration_", ""))
+    )
+    subproblem = 0 if subproblem_str == "" else int(subproblem_str)
+    stage = 0 if stage_str == "" else int(stage_str)
+
+    if not quiet:
+        current_suproblem = os.path.join(
+            weather_iteration_str,
+            hydro_iteration_str,
+            availability_iteration_str,
+            subproblem_str,
+            stage_str,
+        )
+        if current_suproblem.endswith("/"):
+            current_suproblem = current_suproblem[:-1]
+
+        print(f"--- subproblem: {current_suproblem}")
+
+    # Import termination condition data
+    c = db.cursor()
+    try:
+        with open(
+            os.path.join(results_directory, "termination_condition.txt"),
+            "r",
+        ) as f:
+            termination_condition = f.read()
+    except FileNotFoundError:
+        if ignore_incomplete:
+            warnings.warn("GridPath Warning: termination " "condition file not found.")
+            termination_condition = "termination condition file not found"
+        else:
+            tc_fname = os.path.join(results_directory, "termination_condition.txt")
+            raise FileNotFoundError(f"{tc_fname} not " f"found.")
+
+    termination_condition_sql = """
+        INSERT INTO results_scenario
+        (scenario_id, weather_iteration, hydro_iteration, availability_iteration, subproblem_id, 
+        stage_id, solver_termination_condition)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ;"""
+
+    termination_condition_data = (
+        scenario_id,
+        weather_iteration,
+        hydro_iteration,
+        availability_iteration,
+        subproblem,
+        stage,
+        termination_condition,
+    )
+    spin_on_database_lock(
+        conn=db,
+        cursor=c,
+        sql=termination_condition_sql,
+        data=termination_condition_data,
+        many=False,
+    )
+
+    # If the subproblem/stage was run with profiling, also profile the
+    # import of its results
+    logs_directory = os.path.join(os.path.dirname(results_directory), "logs")
+    profile = (
+        ModelProfile()
+        if os.path.exists(os.path.join(logs_directory, MODEL_PROFILE_FILENAME))
+        else None
+    )
+
+    try:
+        with open(
+            os.path.join(results_directory, "solver_status.txt"),
+            "r",
+        ) as status_f:
+            solver_status = status_f.read()
+    except FileNotFoundError:
+        if ignore_incomplete:
+            warnings.warn("GridPath Warning: solver status " "file not found.")
+            termination_condition = "solver status file not found"
+        else:
+            ss_fname = os.path.join(results_directory, "solver_status.txt")
+            raise FileNotFoundError(f"{ss_fname} not found.")
+
+    # Only import other results if solver status was "ok"
+    # When the problem is infeasible, the solver status is "warning"
+    # If there's no solution, variables remain uninitialized,
+    # throwing an error at some point during results-export,
+    # so we don't attempt to import missing results into the database
+    if solver_status == "ok":
+        import_objective_function_value(
+            db=db,
+            scenario_id=scenario_id,
+            weather_iteration=weather_iteration_str,
+            hydro_iteration=hydro_iteration_str,
+            availability_iteration=availability_iteration,
+            subproblem=subproblem_str,
+            stage=stage_str,
+            results_directory=results_directory,
+        )
+        import_subproblem_stage_results_into_database(
+            import_rule=import_rule,
+            db=db,
+            scenario_id=scenario_id,
+            weather_iteration=weather_iteration_str,
+            hydro_iteration=hydro_iteration_str,
+            availability_iteration=availability_iteration_str,
+            subproblem=subproblem_str,
+            stage=stage_str,
+            results_directory=results_directory,
+            loaded_modules=loaded_modules,
+            quiet=quiet,
+            module_times=module_times,
+            profile=profile,
+        )
+    else:
+        if not quiet:
+            print(f"""
+            Solver status for weather iteration {weather_iteration_str}, 
+            hydro_iteration {hydro_iteration_str}, subproblem {subproblem_str}, 
+            stage {stage_str} was '{solver_status}', 
+            not 'ok', so there are no results to import. 
+            Termination condition was '{termination_condition}'.
+            """)
+
+    import_model_profile(
+        db=db,
+        scenario_id=scenario_id,
+        weather_iteration=weather_iteration,
+        hydro_iteration=hydro_iteration,
+        availability_iteration=availability_iteration,
+        subproblem=subproblem,
+        stage=stage,
+        logs_directory=logs_directory,
+        import_profile=profile,
+    )
+
+    # Commit the subproblem's results in a single
+    # transaction if bulk-importing
+    if getattr(db, "bulk_import", False):
+        db.commit_bulk_import()
+
+
+def import_model_profile(
+    db,
+    scenario_id,
+    weather_iteration,
+    hydro_iteration,
+    availability_iteration,
+    subproblem,
+    stage,
+    logs_directory,
+    import_profile=None,
+):
+    """
+    Import the model profile for the subproblem/stage if one was written to
+    the logs directory (see *gridpath.auxiliary.model_profile*), along with
+    the records of the *import_profile* of its results import, if any.
+    """
+    profile_file = os.path.join(logs_directory, MODEL_PROFILE_FILENAME)
+    if not os.path.exists(profile_file):
+        return
+
+    profile_df = pd.read_csv(profile_file)
+    profile_df = profile_df.astype(object).where(pd.notnull(profile_df), None)
+
+    rows = [
+        (
+            scenario_id,
+            weather_iteration,
+            hydro_iteration,
+            availability_iteration,
+            subproblem,
+            stage,
+        )
+        + tuple(row)
+        for row in list(profile_df[MODEL_PROFILE_COLUMNS].itertuples(index=False))
+        + ([] if import_profile is None else import_profile.records)
+    ]
+
+    c = db.cursor()
+    profile_sql = f"""
+        INSERT INTO results_scenario_model_profile
+        (scenario_id, weather_iteration, hydro_iteration,
+        availability_iteration, subproblem_id, stage_id,
+        {", ".join(MODEL_PROFILE_COLUMNS)})
+        VALUES ({", ".join(["?"] * (6 + len(MODEL_PROFILE_COLUMNS)))})
+    ;"""
+    spin_on_database_lock(conn=db, cursor=c, sql=profile_sql, data=rows)
 
 
 def import_objective_function_value(
@@ -312,10 +582,15 @@ def import_subproblem_stage_results_into_database(
     results_directory,
     loaded_modules,
     quiet,
+    module_times=None,
+    profile=None,
 ):
     """
     Import results for a subproblem/stage. We first check the import rule to
-    determine whether to import.
+    determine whether to import. If a *module_times* dictionary is passed,
+    the time spent in each module's import is added to it. If a
+    *ModelProfile* is passed, the time and memory spent in each module's
+    import are recorded in it.
     """
     if import_rule is None:
         import_results = _import_rule(results_directory=results_directory, quiet=quiet)
@@ -328,18 +603,26 @@ def import_subproblem_stage_results_into_database(
         c = db.cursor()
         for m in loaded_modules:
             if hasattr(m, "import_results_into_database"):
-                m.import_results_into_database(
-                    scenario_id=scenario_id,
-                    weather_iteration=weather_iteration,
-                    hydro_iteration=hydro_iteration,
-                    availability_iteration=availability_iteration,
-                    subproblem=subproblem,
-                    stage=stage,
-                    c=c,
-                    db=db,
-                    results_directory=results_directory,
-                    quiet=quiet,
-                )
+                module_start_time = time.perf_counter()
+                with profile_module(profile, "import_results_into_database", m):
+                    m.import_results_into_database(
+                        scenario_id=scenario_id,
+                        weather_iteration=weather_iteration,
+                        hydro_iteration=hydro_iteration,
+                        availability_iteration=availability_iteration,
+                        subproblem=subproblem,
+                        stage=stage,
+                        c=c,
+                        db=db,
+                        results_directory=results_directory,
+                        quiet=quiet,
+                    )
+                if module_times is not None:
+                    module_times[m.__name__] = (
+                        module_times.get(m.__name__, 0)
+                        + time.perf_counter()
+                        - module_start_time
+                    )
     else:
         if not quiet:
             print("Results-import skipped based on import rule.")
@@ -385,8 +668,16 @@ def main(args=None):
     quiet = parsed_arguments.quiet
     import_rule = parsed_arguments.results_import_rule
     ignore_incomplete = parsed_arguments.ignore_incomplete
-
-    conn = connect_to_database(db_path=db_path)
+    bulk_import = parsed_arguments.bulk_import
+    n_parallel_import = int(parsed_arguments.n_parallel_import)
+    # Parallel imports always use a single bulk-import writer
+    if n_parallel_import > 1:
+        bulk_import = True
+
+    conn = connect_to_database(
+        db_path=db_path,
+        factory=BulkImportConnection if bulk_import else sqlite3.Connection,
+    )
     c = conn.cursor()
 
     if not parsed_arguments.quiet:
@@ -428,6 +719,9 @@ def main(args=None):
     modules_to_use = determine_modules(scenario_directory=scenario_directory)
     loaded_modules = load_modules(modules_to_use)
 
+    if bulk_import:
+        start_bulk_import(conn=conn)
+
     # Import appropriate results into database
     import_scenario_results_into_database(
         import_rule=import_rule,
@@ -438,8 +732,12 @@ def main(args=None):
         scenario_directory=scenario_directory,
         ignore_incomplete=ignore_incomplete,
         quiet=quiet,
+        n_parallel_import=n_parallel_import,
     )
 
+    if bulk_import:
+        end_bulk_import(conn=conn)
+
     # Close the database connection
     conn.close()
 
@@ -23,8 +23,11 @@ import os.path
 import pandas as pd
 from pyomo.environ import Set, Param, Any, value, NonNegativeReals
 
+from gridpath.auxiliary.input_files import get_input_table_columns
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.db_interface import directories_to_db_values
+from gridpath.auxiliary.dynamic_components import results_file_format
+from gridpath.auxiliary.results_files import ResultsFileWriter
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     validate_dtypes,
@@ -38,8 +41,9 @@ from gridpath.project.operations.operational_types.common_functions import (
 )
 
 DEFAULT_AVAILABILITY_TYPE = "exogenous"
-PROJECT_PERIOD_DF = "project_period_df"
-PROJECT_TIMEPOINT_DF = "project_timepoint_df"
+PROJECT_PERIOD_RESULTS = "project_period_results"
+PROJECT_TIMEPOINT_RESULTS = "project_timepoint_results"
+SCENARIO_LEVEL_INPUTS = True
 
 
 def add_model_components(
@@ -248,7 +252,7 @@ def load_model_data(
     )
 
     # Technology column is optional (default param value is 'unspecified')
-    header = pd.read_csv(
+    header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -258,11 +262,8 @@ def load_model_data(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     if "technology" in header:
         data_portal.load(
@@ -308,11 +309,34 @@ def export_results(
     Nothing
     """
 
-    # First create the results dataframes
-    # Other modules will update these dataframe with actual results
-    # The results dataframes are by index
+    # First open the writers of the project results tables and write the
+    # project characteristics; other modules will write their results to
+    # these tables and the writers are closed by
+    # *gridpath.project.consolidate_results*
+    results_directory = os.path.join(
+        scenario_directory,
+        weather_iteration,
+        hydro_iteration,
+        availability_iteration,
+        subproblem,
+        stage,
+        "results",
+    )
+    for which_results, writer_name in [
+        ("project_period", PROJECT_PERIOD_RESULTS),
+        ("project_timepoint", PROJECT_TIMEPOINT_RESULTS),
+    ]:
+        setattr(
+            d,
+            writer_name,
+            ResultsFileWriter(
+                results_directory=results_directory,
+                which_results=which_results,
+                results_file_format=getattr(d, results_file_format),
+            ),
+        )
 
-    # Project-period DF
+    # Project-period results
     project_period_df = pd.DataFrame(
         columns=[
             "project",
@@ -343,10 +367,9 @@ def export_results(
 
     project_period_df.sort_index(inplace=True)
 
-    # Add the dataframe to the dynamic components to pass to other modules
-    setattr(d, PROJECT_PERIOD_DF, project_period_df)
+    getattr(d, PROJECT_PERIOD_RESULTS).write(project_period_df)
 
-    # Project-timepoint DF
+    # Project-timepoint results
     project_timepoint_df = pd.DataFrame(
         columns=[
             "project",
@@ -393,8 +416,7 @@ def export_results(
 
     project_timepoint_df.sort_index(inplace=True)
 
-    # Add the dataframe to the dynamic components to pass to other modules
-    setattr(d, PROJECT_TIMEPOINT_DF, project_timepoint_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(project_timepoint_df)
 
 
 # Database
@@ -12,14 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pyomo.environ import Expression, value
+from pyomo.environ import Expression
 
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     load_subtype_modules,
 )
-from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_TIMEPOINT_DF, DEFAULT_AVAILABILITY_TYPE
+from gridpath.common_functions import create_component_results_df
+from gridpath.project import DEFAULT_AVAILABILITY_TYPE
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 
 
 def add_model_components(
@@ -251,26 +252,12 @@ def export_results(
     Export availability results.
     """
 
-    results_columns = [
-        "availability_derate",
-    ]
-    data = [
-        [
-            prj,
-            tmp,
-            value(m.Availability_Derate[prj, tmp]),
-        ]
-        for (prj, tmp) in m.PRJ_OPR_TMPS
-    ]
-    results_df = create_results_df(
+    results_df = create_component_results_df(
         index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
+        index=m.PRJ_OPR_TMPS,
+        components={"availability_derate": m.Availability_Derate},
     )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
     # Module-specific availability results
     required_availability_modules = list(
@@ -312,10 +299,7 @@ def export_results(
                 m,
                 d,
             )
-            for c in op_m_results_columns:
-                getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-
-            getattr(d, PROJECT_TIMEPOINT_DF).update(op_m_results_df)
+            getattr(d, PROJECT_TIMEPOINT_RESULTS).write(op_m_results_df)
 
 
 def validate_inputs(
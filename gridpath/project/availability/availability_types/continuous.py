@@ -42,7 +42,7 @@ from gridpath.auxiliary.validations import (
     validate_column_monotonicity,
 )
 from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 from gridpath.project.operations.operational_types.common_functions import (
     determine_relevant_timepoints,
 )
@@ -28,6 +28,7 @@ from pyomo.environ import Param, Set, NonNegativeReals
 
 from gridpath.auxiliary.auxiliary import cursor_to_df, subset_init_by_set_membership
 from gridpath.auxiliary.db_interface import directories_to_db_values
+from gridpath.auxiliary.input_files import input_file_exists, load_input_file
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     get_expected_dtypes,
@@ -301,52 +302,46 @@ def load_model_data(
         "inputs",
     )
 
-    availability_independent_file = os.path.join(
-        input_directory,
-        "project_availability_exogenous_independent.tab",
-    )
-
-    if os.path.exists(availability_independent_file):
-        data_portal.load(
-            filename=availability_independent_file,
+    if input_file_exists(
+        input_directory, "project_availability_exogenous_independent.tab"
+    ):
+        load_input_file(
+            data_portal=data_portal,
+            inputs_directory=input_directory,
+            filename="project_availability_exogenous_independent.tab",
             param=(
                 m.avl_exog_cap_derate_independent,
                 m.avl_exog_hyb_stor_cap_derate_independent,
             ),
         )
 
-    availability_weather_file = os.path.join(
-        input_directory,
-        "project_availability_exogenous_weather.tab",
-    )
-
-    if os.path.exists(availability_weather_file):
-        data_portal.load(
-            filename=availability_weather_file,
+    if input_file_exists(input_directory, "project_availability_exogenous_weather.tab"):
+        load_input_file(
+            data_portal=data_portal,
+            inputs_directory=input_directory,
+            filename="project_availability_exogenous_weather.tab",
             param=m.avl_exog_cap_derate_weather,
         )
 
     # Balancing type - horizon inputs
-    availability_independent_bt_hrz_file = os.path.join(
-        input_directory,
-        "project_availability_exogenous_independent_bt_hrz.tab",
-    )
-
-    if os.path.exists(availability_independent_bt_hrz_file):
-        data_portal.load(
-            filename=availability_independent_bt_hrz_file,
+    if input_file_exists(
+        input_directory, "project_availability_exogenous_independent_bt_hrz.tab"
+    ):
+        load_input_file(
+            data_portal=data_portal,
+            inputs_directory=input_directory,
+            filename="project_availability_exogenous_independent_bt_hrz.tab",
             index=m.AVL_EXOG_PRJ_BT_HRZ_W_INDEPENDENT_DERATES,
             param=m.avl_exog_cap_derate_independent_bt_hrz,
         )
 
-    availability_weather_bt_hrz_file = os.path.join(
-        input_directory,
-        "project_availability_exogenous_weather_bt_hrz.tab",
-    )
-
-    if os.path.exists(availability_weather_bt_hrz_file):
-        data_portal.load(
-            filename=availability_weather_bt_hrz_file,
+    if input_file_exists(
+        input_directory, "project_availability_exogenous_weather_bt_hrz.tab"
+    ):
+        load_input_file(
+            data_portal=data_portal,
+            inputs_directory=input_directory,
+            filename="project_availability_exogenous_weather_bt_hrz.tab",
             index=m.AVL_EXOG_PRJ_BT_HRZ_W_WEATHER_DERATES,
             param=m.avl_exog_cap_derate_weather_bt_hrz,
         )
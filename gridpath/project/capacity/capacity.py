@@ -29,13 +29,14 @@ from pyomo.environ import Set, Expression, value
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     join_sets,
+    subsets_init_by_param_value_and_tmp,
 )
 from gridpath.auxiliary.dynamic_components import capacity_type_operational_period_sets
 from gridpath.common_functions import create_results_df
 from gridpath.project.capacity.common_functions import (
     load_project_capacity_type_modules,
 )
-from gridpath.project import PROJECT_PERIOD_DF
+from gridpath.project import PROJECT_PERIOD_RESULTS
 import gridpath.project.capacity.capacity_types as cap_type_init
 
 
@@ -88,6 +89,12 @@ def add_model_components(
     | Indexed set that describes all projects that could be operational in    |
     | each timepoint.                                                         |
     +-------------------------------------------------------------------------+
+    | | :code:`OPR_PRJS_IN_LZ_TMP`                                            |
+    | | *Defined over*: :code:`LOAD_ZONES x TMPS`                             |
+    |                                                                         |
+    | Indexed set that describes all projects that could be operational in    |
+    | each load zone and timepoint.                                           |
+    +-------------------------------------------------------------------------+
 
     |
 
@@ -185,6 +192,18 @@ def add_model_components(
         initialize=op_gens_by_tmp,
     )
 
+    m.OPR_PRJS_IN_LZ_TMP = Set(
+        m.LOAD_ZONES,
+        m.TMPS,
+        within=m.PROJECTS,
+        initialize=lambda mod: subsets_init_by_param_value_and_tmp(
+            mod=mod,
+            set_by_tmp="OPR_PRJS_IN_TMP",
+            param_name="load_zone",
+            param_value_set="LOAD_ZONES",
+        ),
+    )
+
     # Expressions
     ###########################################################################
 
@@ -409,9 +428,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(results_df)
+    getattr(d, PROJECT_PERIOD_RESULTS).write(results_df)
 
     # Module-specific capacity results
     required_capacity_modules = get_required_subtype_modules(
@@ -442,7 +459,4 @@ def export_results(
                 m,
                 d,
             )
-            for column in results_columns:
-                if column not in getattr(d, PROJECT_PERIOD_DF):
-                    getattr(d, PROJECT_PERIOD_DF)[column] = None
-            getattr(d, PROJECT_PERIOD_DF).update(optype_df)
+            getattr(d, PROJECT_PERIOD_RESULTS).write(optype_df)
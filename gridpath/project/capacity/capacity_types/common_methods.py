@@ -21,6 +21,8 @@ import os.path
 import pandas as pd
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.input_files import read_input_table
+from gridpath.auxiliary.results_files import get_results_file_path, read_results_file
 from gridpath.project.common_functions import get_column_row_value
 
 
@@ -347,7 +349,7 @@ def spec_determine_inputs(
     # Determine the relevant projects
     project_list = list()
 
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -358,7 +360,6 @@ def spec_determine_inputs(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=["project", "capacity_type"],
     )
 
@@ -387,7 +388,7 @@ def spec_determine_inputs(
     spec_fuel_rel_fixed_cost_dict = dict()
     spec_fuel_stor_fixed_cost_dict = dict()
 
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -397,8 +398,7 @@ def spec_determine_inputs(
             stage,
             "inputs",
             "spec_capacity_period_params.tab",
-        ),
-        sep="\t",
+        )
     )
 
     for row in zip(
@@ -522,17 +522,19 @@ def read_results_file_generic(
     :return:
     """
 
-    # Get the results CSV as dataframe
-    df = pd.read_csv(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "results",
-            "project_period.csv",
+    # Get the results as dataframe (in whichever format they were written)
+    df = read_results_file(
+        get_results_file_path(
+            results_directory=os.path.join(
+                scenario_directory,
+                weather_iteration,
+                hydro_iteration,
+                availability_iteration,
+                subproblem,
+                stage,
+                "results",
+            ),
+            which_results="project_period",
         )
     )
 
@@ -32,7 +32,6 @@ in less than N hours, as the max power constraint will bind).
 
 import csv
 import os.path
-import pandas as pd
 from pathlib import Path
 from pyomo.environ import (
     Set,
@@ -45,6 +44,7 @@ from pyomo.environ import (
     Constraint,
 )
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
@@ -375,7 +375,7 @@ def load_model_data(
         projects = list()
         max_fraction = dict()
 
-        df = pd.read_csv(
+        df = read_input_table(
             os.path.join(
                 scenario_directory,
                 weather_iteration,
@@ -386,7 +386,6 @@ def load_model_data(
                 "inputs",
                 "projects.tab",
             ),
-            sep="\t",
             usecols=["project", "capacity_type", "minimum_duration_hours"],
         )
         for r in zip(df["project"], df["capacity_type"], df["minimum_duration_hours"]):
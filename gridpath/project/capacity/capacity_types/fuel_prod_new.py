@@ -27,7 +27,6 @@ import csv
 import os.path
 from pathlib import Path
 
-import pandas as pd
 from pyomo.environ import (
     Set,
     Param,
@@ -37,6 +36,7 @@ from pyomo.environ import (
     value,
 )
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.dynamic_components import (
     capacity_type_operational_period_sets,
@@ -578,7 +578,7 @@ def load_model_data(
     """
     fuel_prod_new_projects = list()
 
-    _df = pd.read_csv(
+    _df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -589,7 +589,6 @@ def load_model_data(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=[
             "project",
             "capacity_type",
@@ -32,7 +32,7 @@ from gridpath.auxiliary.auxiliary import (
 from gridpath.project.capacity.common_functions import (
     load_project_capacity_type_modules,
 )
-from gridpath.project import PROJECT_PERIOD_DF
+from gridpath.project import PROJECT_PERIOD_RESULTS
 from gridpath.auxiliary.dynamic_components import capacity_type_financial_period_sets
 import gridpath.project.capacity.capacity_types as cap_type_init
 
@@ -228,9 +228,7 @@ def export_results(
         data=data1,
     )
 
-    for c in results_columns1:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(cost_df1)
+    getattr(d, PROJECT_PERIOD_RESULTS).write(cost_df1)
 
     results_columns2 = [
         "hours_in_period_timepoints",
@@ -254,9 +252,7 @@ def export_results(
         data=data2,
     )
 
-    for c in results_columns2:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(cost_df2)
+    getattr(d, PROJECT_PERIOD_RESULTS).write(cost_df2)
 
 
 # Database
@@ -29,7 +29,7 @@ from gridpath.auxiliary.validations import (
 )
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
 from gridpath.common_functions import create_results_df, duals_wrapper
-from gridpath.project import PROJECT_PERIOD_DF
+from gridpath.project import PROJECT_PERIOD_RESULTS
 from gridpath.project.capacity.common_functions import (
     load_project_capacity_type_modules,
 )
@@ -883,9 +883,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(results_df)
+    getattr(d, PROJECT_PERIOD_RESULTS).write(results_df)
 
 
 # Validation
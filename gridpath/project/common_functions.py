@@ -14,9 +14,9 @@
 
 """ """
 
-import csv
 import os.path
-import pandas as pd
+
+from gridpath.auxiliary.input_files import add_input_file_columns, read_input_table
 
 
 # TODO: use this in capacity and operational type project subset
@@ -44,7 +44,7 @@ def determine_project_subset(
 
     project_subset = list()
 
-    dynamic_components = pd.read_csv(
+    dynamic_components = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -55,7 +55,6 @@ def determine_project_subset(
             "inputs",
             "{}s.tab".format(prj_or_tx),
         ),
-        sep="\t",
         usecols=[prj_or_tx, column],
     )
 
@@ -133,55 +132,24 @@ def append_to_input_file(
     :param query_results:
     :param new_column_names:
     :return:
-    """
 
-    # Make a dictionary by project for easy access
-    dict_by_project = dict()
+    Add the query results to the input file as new columns (see
+    *add_input_file_columns*); the first index_n_columns of each query
+    results row identify the input file row.
+    """
+    columns = {c: dict() for c in new_column_names}
     for row in query_results:
-        indx = tuple(row[:index_n_columns])
-        indx_char = row[index_n_columns:]
-        # Assign values for each project key
-        # Replace None values with "." to feed into Pyomo
-        dict_by_project[indx] = ["." if x is None else x for x in indx_char]
-
-    # Open the projects file
-
-    with open(os.path.join(inputs_directory, input_file), "r") as f_in:
-        # Read in the file
-        reader = csv.reader(f_in, delimiter="\t", lineterminator="\n")
-
-        # We'll be changing each row of the reader and adding the updated
-        # row to this list
-        new_rows = list()
-
-        # First, add the new items to the header and append the updated
-        # header to the new_rows list
-        header = next(reader)
-        for h in new_column_names:
-            header.append(h)
-        new_rows.append(header)
-
-        # Next, append the new values to the row for each project and add
-        # the updated row to the new_rows list
-        for row in reader:
-            indx = tuple(row[:index_n_columns])
-            # If the project is in the dictionary keys, add the values from
-            # the dictionary to the project row and append the updated row
-            # to the new_rows list
-            if indx in list(dict_by_project.keys()):
-                for char in dict_by_project[indx]:
-                    row.append(char)
-                new_rows.append(row)
-            # If project is not in the dictionary keys, fill the row with
-            # "." to feed empty values into Pyomo and append the updated row
-            # to the new_rows list
-            else:
-                for h in new_column_names:
-                    row.append(".")
-                new_rows.append(row)
-
-    # Now that we have updated all our rows, overwrite the previous
-    # projects.tab file
-    with open(os.path.join(inputs_directory, input_file), "w", newline="") as f_out:
-        writer = csv.writer(f_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        indx = (
+            str(row[0])
+            if index_n_columns == 1
+            else tuple(str(i) for i in row[:index_n_columns])
+        )
+        for c, char in zip(new_column_names, row[index_n_columns:]):
+            columns[c][indx] = char
+
+    add_input_file_columns(
+        inputs_directory=inputs_directory,
+        input_file=input_file,
+        columns=columns,
+        index_n_columns=index_n_columns,
+    )
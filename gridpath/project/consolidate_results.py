@@ -14,10 +14,8 @@
 
 """ """
 
-import os.path
-
-from gridpath.project import PROJECT_PERIOD_DF
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_PERIOD_RESULTS
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 
 
 def export_results(
@@ -31,35 +29,9 @@ def export_results(
     d,
 ):
     """
-    Export all results from the PROJECT_CAPACITY_DF and PROJECT_OPERATIONS_DF
-    that various modules have added to
+    Close the writers of the project_period and project_timepoint results
+    tables that various modules have written to (see *export_results* in
+    *gridpath.project*)
     """
-    getattr(d, PROJECT_PERIOD_DF).to_csv(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "results",
-            "project_period.csv",
-        ),
-        sep=",",
-        index=True,
-    )
-
-    getattr(d, PROJECT_TIMEPOINT_DF).to_csv(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "results",
-            "project_timepoint.csv",
-        ),
-        sep=",",
-        index=True,
-    )
+    for writer_name in [PROJECT_PERIOD_RESULTS, PROJECT_TIMEPOINT_RESULTS]:
+        getattr(d, writer_name).close()
@@ -18,6 +18,7 @@ import csv
 import os.path
 import pandas as pd
 from pyomo.environ import Param, Set, NonNegativeReals, Reals, Any
+from gridpath.auxiliary.input_files import get_input_table_columns
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.validations import (
@@ -108,7 +109,7 @@ def load_model_data(
             param=m.co2_intensity_tons_per_mmbtu,
         )
 
-        header = pd.read_csv(
+        header = get_input_table_columns(
             os.path.join(
                 scenario_directory,
                 weather_iteration,
@@ -118,11 +119,8 @@ def load_model_data(
                 stage,
                 "inputs",
                 "fuels.tab",
-            ),
-            sep="\t",
-            header=None,
-            nrows=1,
-        ).values[0]
+            )
+        )
 
         if "fuel_group" in header:
             data_portal.data()["FUEL_GROUPS"] = fuels_df["fuel_group"].unique()
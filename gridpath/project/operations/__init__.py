@@ -41,7 +41,8 @@ import os.path
 import pandas as pd
 from pyomo.environ import Set, Param, NonNegativeReals, Reals, PositiveReals
 
-from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.input_files import read_input_table
+from gridpath.auxiliary.auxiliary import cursor_to_df, df_to_data_portal
 from gridpath.auxiliary.db_interface import import_csv, directories_to_db_values
 from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
 from gridpath.auxiliary.validations import (
@@ -596,7 +597,7 @@ def record_dynamic_components(
     'footroom_variables' dictionary.
     """
 
-    project_df = pd.read_csv(
+    project_df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -606,8 +607,7 @@ def record_dynamic_components(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
+        )
     )
 
     # Reserve variables
@@ -699,7 +699,7 @@ def load_model_data(
         "inputs",
         "periods.tab",
     )
-    periods_df = pd.read_csv(periods_file, sep="\t")
+    periods_df = read_input_table(periods_file)
     prd_set = set(periods_df["period"])
 
     timepoints_file = os.path.join(
@@ -712,7 +712,7 @@ def load_model_data(
         "inputs",
         "timepoints.tab",
     )
-    timepoints_df = pd.read_csv(timepoints_file, sep="\t")
+    timepoints_df = read_input_table(timepoints_file)
     tmp_set = set(timepoints_df["timepoint"])
 
     # Variable O&M by period and timepoint
@@ -728,36 +728,24 @@ def load_model_data(
             f"project_variable_om_by_{prd_or_tmp_str}.tab",
         )
         if os.path.exists(project_var_om_file):
-            var_om_df = pd.read_csv(project_var_om_file, sep="\t").set_index(
-                ["project", prd_or_tmp_str]
-            )
-            var_om_prj_idx_list = []
-            var_om_by_idx_dict = {}
-
-            for idx, val in var_om_df.iterrows():
-                prj, prd_or_tmp = idx
-                if prd_or_tmp == 0:
-                    if prd_or_tmp_str == "period":
-                        set_to_use = prd_set
-                    else:
-                        set_to_use = tmp_set
-                    for _prd_or_tmp in sorted(list(set_to_use)):
-                        var_om_prj_idx_list.append((prj, _prd_or_tmp))
-                        var_om_by_idx_dict[prj, _prd_or_tmp] = var_om_df.loc[
-                            prj, prd_or_tmp
-                        ][f"variable_om_cost_by_{prd_or_tmp_str}"]
-                else:
-                    var_om_prj_idx_list.append((prj, prd_or_tmp))
-                    var_om_by_idx_dict[prj, prd_or_tmp] = var_om_df.loc[
-                        prj, prd_or_tmp
-                    ][f"variable_om_cost_by_{prd_or_tmp_str}"]
             set_name_prd_or_tmp = "PRD" if prd_or_tmp_str == "period" else "TMP"
-            data_portal.data()[
-                f"VAR_OM_COST_BY_{set_name_prd_or_tmp}_PRJ_{set_name_prd_or_tmp}S"
-            ] = {None: var_om_prj_idx_list}
-            data_portal.data()[
-                f"variable_om_cost_per_mwh_by_{prd_or_tmp_str}"
-            ] = var_om_by_idx_dict
+            # Rows with a period/timepoint of 0 apply to all periods/timepoints
+            df_to_data_portal(
+                data_portal=data_portal,
+                df=read_input_table(project_var_om_file),
+                index_columns=["project", prd_or_tmp_str],
+                params={
+                    f"variable_om_cost_by_{prd_or_tmp_str}": (
+                        f"variable_om_cost_per_mwh_by_{prd_or_tmp_str}"
+                    )
+                },
+                set_name=(
+                    f"VAR_OM_COST_BY_{set_name_prd_or_tmp}_PRJ_{set_name_prd_or_tmp}S"
+                ),
+                broadcast={
+                    prd_or_tmp_str: prd_set if prd_or_tmp_str == "period" else tmp_set
+                },
+            )
 
     # Fuels
     project_fuels_file = os.path.join(
@@ -822,31 +810,18 @@ def load_model_data(
         "project_curtailment_cost.tab",
     )
     if os.path.exists(project_curtailment_cost_file):
-        curtailment_df = pd.read_csv(project_curtailment_cost_file, sep="\t").set_index(
-            ["project", "period"]
-        )
-        curtailment_prj_idx_list = []
-        curtailment_by_idx_dict = {}
-
-        for idx, val in curtailment_df.iterrows():
-            prj, prd = idx
-            if prd == 0:
-                for _prd in sorted(list(prd_set)):
-                    curtailment_prj_idx_list.append((prj, _prd))
-                    curtailment_by_idx_dict[prj, _prd] = curtailment_df.loc[prj, prd][
-                        "curtailment_cost_per_powerunithour"
-                    ]
-            else:
-                curtailment_prj_idx_list.append((prj, prd))
-                curtailment_by_idx_dict[prj, prd] = curtailment_df.loc[prj, prd][
+        df_to_data_portal(
+            data_portal=data_portal,
+            df=read_input_table(project_curtailment_cost_file),
+            index_columns=["project", "period"],
+            params={
+                "curtailment_cost_per_powerunithour": (
                     "curtailment_cost_per_powerunithour"
-                ]
-        data_portal.data()[f"CURTAILMENT_COST_PRJ_PRDS"] = {
-            None: curtailment_prj_idx_list
-        }
-        data_portal.data()[
-            "curtailment_cost_per_powerunithour"
-        ] = curtailment_by_idx_dict
+                )
+            },
+            set_name="CURTAILMENT_COST_PRJ_PRDS",
+            broadcast={"period": prd_set},
+        )
 
     data_portal.data()["SOC_PENALTY_COST_PRJS"] = {
         None: list(data_portal.data()["soc_penalty_cost_per_energyunit"].keys())
@@ -875,7 +850,7 @@ def load_model_data(
     )
 
     if os.path.exists(vom_curves_file):
-        vom_df = pd.read_csv(vom_curves_file, sep="\t")
+        vom_df = read_input_table(vom_curves_file)
         vom_projects = set(vom_df["project"].unique())
 
         slope_dict, intercept_dict = get_slopes_intercept_by_project_period_segment(
@@ -902,7 +877,7 @@ def load_model_data(
     )
 
     if os.path.exists(startup_chars_file):
-        df = pd.read_csv(startup_chars_file, sep="\t")
+        df = read_input_table(startup_chars_file)
 
         # Note: the rank function requires at least one numeric input in the
         # down_time_cutoff_hours column (can't be all NULL/None).
@@ -910,21 +885,16 @@ def load_model_data(
             df["startup_type_id"] = df.groupby("project")[
                 "down_time_cutoff_hours"
             ].rank()
-
-        startup_ramp_projects_types = list()
-        startup_cost_dict = dict()
-        for i, row in df.iterrows():
-            project = row["project"]
-            startup_type_id = row["startup_type_id"]
-            startup_cost = row["startup_cost_per_mw"]
-
-            startup_ramp_projects_types.append((project, startup_type_id))
-            startup_cost_dict[(project, startup_type_id)] = float(startup_cost)
-
-        data_portal.data()["STARTUP_BY_ST_PRJS_TYPES"] = {
-            None: startup_ramp_projects_types
-        }
-        data_portal.data()["startup_cost_by_st_per_mw"] = startup_cost_dict
+        else:
+            df["startup_type_id"] = pd.Series(dtype=float)
+
+        df_to_data_portal(
+            data_portal=data_portal,
+            df=df.astype({"startup_cost_per_mw": float}),
+            index_columns=["project", "startup_type_id"],
+            params={"startup_cost_per_mw": "startup_cost_by_st_per_mw"},
+            set_name="STARTUP_BY_ST_PRJS_TYPES",
+        )
 
     # HR curves
     hr_curves_file = os.path.join(
@@ -951,10 +921,10 @@ def load_model_data(
     # Get column names as a few columns will be optional;
     # won't load data if fuel column does not exist
     if os.path.exists(hr_curves_file) and os.path.exists(project_fuels_file):
-        hr_df = pd.read_csv(hr_curves_file, sep="\t")
+        hr_df = read_input_table(hr_curves_file)
         projects = set(hr_df["project"].unique())
 
-        pr_df = pd.read_csv(project_fuels_file, sep="\t", usecols=["project", "fuel"])
+        pr_df = read_input_table(project_fuels_file, usecols=["project", "fuel"])
         pr_df = pr_df[(pr_df["fuel"] != ".") & (pr_df["project"].isin(projects))]
 
         fuel_projects = pr_df["project"].unique()
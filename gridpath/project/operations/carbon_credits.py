@@ -18,6 +18,7 @@ import csv
 import os.path
 from pyomo.environ import Param, Set, NonNegativeReals, Var, Constraint, value
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import (
     cursor_to_df,
     subset_init_by_param_value,
@@ -26,7 +27,7 @@ from gridpath.auxiliary.auxiliary import (
 )
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_PERIOD_DF
+from gridpath.project import PROJECT_PERIOD_RESULTS
 from gridpath.project.operations.common_functions import load_operational_type_modules
 import gridpath.project.operations.operational_types as op_type_init
 
@@ -610,41 +611,8 @@ def write_model_inputs(
     for prj, zone in project_generation_zones:
         prj_zone_dict[str(prj)] = "." if zone is None else str(zone)
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("carbon_credits_generation_zone")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zone_dict.keys()):
-                row.append(prj_zone_dict[row[0]])
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -652,13 +620,12 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "carbon_credits_generation_zone": prj_zone_dict,
+        },
+    )
 
     # project_carbon_credits.tab
     ct_df = cursor_to_df(project_carbon_credits)
@@ -731,9 +698,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_PERIOD_DF)[c] = None
-    getattr(d, PROJECT_PERIOD_DF).update(results_df)
+    getattr(d, PROJECT_PERIOD_RESULTS).write(results_df)
 
     # Carbon credits purchase
     with open(
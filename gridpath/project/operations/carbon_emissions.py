@@ -18,11 +18,11 @@ Carbon emissions from each carbonaceous project.
 
 import csv
 import os.path
-from pyomo.environ import Expression, value
+from pyomo.environ import Expression
 
 from db.common_functions import spin_on_database_lock
-from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.common_functions import create_component_results_df
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 
 
 def add_model_components(
@@ -110,26 +110,13 @@ def export_results(
     :return:
     """
 
-    results_columns = [
-        "carbon_emissions_tons",
-    ]
-    data = [
-        [
-            prj,
-            tmp,
-            value(m.Project_Carbon_Emissions[prj, tmp]),
-        ]
-        for (prj, tmp) in m.PRJ_OPR_TMPS
-    ]
-    emissions_df = create_results_df(
+    emissions_df = create_component_results_df(
         index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
+        index=m.PRJ_OPR_TMPS,
+        components={"carbon_emissions_tons": m.Project_Carbon_Emissions},
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(emissions_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(emissions_df)
 
 
 # Database
@@ -16,7 +16,6 @@
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import (
     Param,
     Set,
@@ -27,6 +26,7 @@ from pyomo.environ import (
     Reals,
 )
 
+from gridpath.auxiliary.input_files import add_input_file_columns, read_input_table
 from gridpath.auxiliary.auxiliary import (
     cursor_to_df,
     subset_init_by_param_value,
@@ -315,13 +315,13 @@ def load_model_data(
     )
 
     if os.path.exists(hr_curves_file) and os.path.exists(carbon_tax_allowance_file):
-        hr_df = pd.read_csv(hr_curves_file, sep="\t")
+        hr_df = read_input_table(hr_curves_file)
         projects = set(hr_df["project"].unique())
 
         input_col = "average_heat_rate_mmbtu_per_mwh"
 
-        periods_df = pd.read_csv(periods_file, sep="\t")
-        cta_df = pd.read_csv(carbon_tax_allowance_file, sep="\t")
+        periods_df = read_input_table(periods_file)
+        cta_df = read_input_table(carbon_tax_allowance_file)
         cta_df = cta_df[cta_df["project"].isin(projects)]
 
         periods = set(periods_df["period"])
@@ -519,8 +519,8 @@ def write_model_inputs(
     for prj, zone in project_zones:
         prj_zone_dict[str(prj)] = "." if zone is None else str(zone)
 
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -528,46 +528,12 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("carbon_tax_zone")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zone_dict.keys()):
-                row.append(prj_zone_dict[row[0]])
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "carbon_tax_zone": prj_zone_dict,
+        },
+    )
 
     # project_carbon_tax_allowance.tab
     ct_allowance_df = cursor_to_df(project_carbon_tax_allowance)
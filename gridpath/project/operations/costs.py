@@ -34,7 +34,7 @@ from gridpath.project.operations.common_functions import (
 )
 from gridpath.common_functions import create_results_df
 import gridpath.project.operations.operational_types as op_type_init
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 
 
 def add_model_components(
@@ -702,9 +702,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
     # for prj, prd in m.PRJ_OPR_PRDS:
     #     for mnth in m.MONTHS:
@@ -16,14 +16,15 @@
 Get RECs for each project
 """
 
-import csv
 import os.path
 from pyomo.environ import Param, Set, Expression, value
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     cursor_to_df,
     subset_init_by_set_membership,
+    subsets_init_by_param_value,
 )
 from gridpath.auxiliary.db_interface import (
     update_prj_zone_column,
@@ -34,7 +35,9 @@ from gridpath.common_functions import create_results_df
 from gridpath.project.operations.common_functions import load_operational_type_modules
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 import gridpath.project.operations.operational_types as op_type_init
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
+
+SCENARIO_LEVEL_INPUTS = True
 
 
 def add_model_components(
@@ -162,7 +165,12 @@ def add_model_components(
     m.ENERGY_TARGET_PRJS_BY_ENERGY_TARGET_ZONE = Set(
         m.ENERGY_TARGET_ZONES,
         within=m.ENERGY_TARGET_PRJS,
-        initialize=determine_energy_target_generators_by_energy_target_zone,
+        initialize=lambda mod: subsets_init_by_param_value(
+            mod=mod,
+            set_name="ENERGY_TARGET_PRJS",
+            param_name="energy_target_zone",
+            param_value_set="ENERGY_TARGET_ZONES",
+        ),
     )
 
     # Expressions
@@ -241,18 +249,6 @@ def add_model_components(
     )
 
 
-# Set Rules
-###############################################################################
-
-
-def determine_energy_target_generators_by_energy_target_zone(mod, energy_target_z):
-    return [
-        p
-        for p in mod.ENERGY_TARGET_PRJS
-        if mod.energy_target_zone[p] == energy_target_z
-    ]
-
-
 # Input-Output
 ###############################################################################
 
@@ -344,9 +340,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
 
 # Database
@@ -454,41 +448,8 @@ def write_model_inputs(
     for prj, zone in project_zones:
         prj_zone_dict[str(prj)] = "." if zone is None else str(zone)
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("energy_target_zone")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zone_dict.keys()):
-                row.append(prj_zone_dict[row[0]])
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -496,13 +457,12 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "energy_target_zone": prj_zone_dict,
+        },
+    )
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
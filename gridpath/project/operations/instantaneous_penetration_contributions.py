@@ -16,10 +16,11 @@
 Get RECs for each project
 """
 
-import csv
+import numpy as np
 import os.path
-from pyomo.environ import Param, Set, value
+from pyomo.environ import Param, Set
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import (
     cursor_to_df,
     subset_init_by_set_membership,
@@ -29,9 +30,11 @@ from gridpath.auxiliary.db_interface import (
     determine_table_subset_by_start_and_column,
     directories_to_db_values,
 )
-from gridpath.common_functions import create_results_df
+from gridpath.common_functions import create_component_results_df
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
+
+SCENARIO_LEVEL_INPUTS = True
 
 
 def add_model_components(
@@ -193,29 +196,21 @@ def export_results(
     :return:
     """
 
-    results_columns = [
-        "instantaneous_penetration_zone",
-        "instantaneous_penetration_power_mw",
-    ]
-    data = [
-        [
-            prj,
-            tmp,
-            m.instantaneous_penetration_zone[prj],
-            value(m.Bulk_Power_Provision_MW[prj, tmp]),
-        ]
-        for (prj, tmp) in m.INST_PEN_PRJ_OPR_TMP
-    ]
-
-    results_df = create_results_df(
+    results_df = create_component_results_df(
         index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
+        index=m.INST_PEN_PRJ_OPR_TMP,
+        components={
+            "instantaneous_penetration_zone": np.array(
+                [
+                    m.instantaneous_penetration_zone[prj]
+                    for (prj, tmp) in m.INST_PEN_PRJ_OPR_TMP
+                ],
+                dtype=object,
+            ),
+            "instantaneous_penetration_power_mw": m.Bulk_Power_Provision_MW,
+        },
     )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
 
 # Database
@@ -323,41 +318,8 @@ def write_model_inputs(
     for prj, zone in project_zones:
         prj_zone_dict[str(prj)] = "." if zone is None else str(zone)
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("instantaneous_penetration_zone")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zone_dict.keys()):
-                row.append(prj_zone_dict[row[0]])
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -365,13 +327,12 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "instantaneous_penetration_zone": prj_zone_dict,
+        },
+    )
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
@@ -15,14 +15,17 @@
 import csv
 import os.path
 import pandas as pd
+from pyomo.environ import value
 import warnings
 
 from gridpath.auxiliary.db_interface import directories_to_db_values
-from gridpath.project.common_functions import (
-    check_if_boundary_type_and_first_timepoint,
-    check_boundary_type,
+from gridpath.auxiliary.auxiliary import cursor_to_df, df_to_data_portal
+from gridpath.auxiliary.input_files import (
+    get_input_table_columns,
+    read_input_file,
+    read_input_table,
+    write_columnar_input_file,
 )
-from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     validate_req_cols,
@@ -73,38 +76,46 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
     t-2. By the time we reach t-3, we will have reached the 4-hour minimum
     up/down time, so t-3 will not be relevant for the minimum up time
     constraint in timepoint *t*.
+
+    The relevant timepoints only depend on the project's balancing type and
+    on the min time, so they are determined for all timepoints at once and
+    cached on the model for all projects with the same balancing type and
+    min time (see *get_relevant_timepoints_by_tmp*).
     """
+    relevant_tmps_by_tmp = get_relevant_timepoints_by_tmp(
+        mod=mod, balancing_type=mod.balancing_type_project[g], min_time=min_time
+    )
 
-    # The first possible relevant timepoint is the current timepoint
-    relevant_tmps = [tmp]
-    relevant_linked_tmps = []
-    # The first possible linked timepoint is 0
-    linked_tmp = 0
-
-    # If we have already reached the first timepoint of a horizon in a
-    # linear boundary type we'll just pass, as there are no more relevant
-    # timepoints to add
-    if check_if_boundary_type_and_first_timepoint(
-        mod=mod,
-        tmp=tmp,
-        balancing_type=mod.balancing_type_project[g],
-        boundary_type="linear",
-    ):
-        pass  # no more relevant timepoints, keep list limited to *t*
-    # If we have already reached the first timepoint in a linked horizon
-    # setting, we'll immediately move on to the linked timepoints without
-    # looking for a previous timepoint
-    elif check_if_boundary_type_and_first_timepoint(
-        mod=mod,
-        tmp=tmp,
-        balancing_type=mod.balancing_type_project[g],
-        boundary_type="linked",
-    ):
+    return relevant_tmps_by_tmp[tmp]
+
+
+def get_relevant_timepoints_by_tmp(mod, balancing_type, min_time):
+    """
+    :param mod:
+    :param balancing_type:
+    :param min_time:
+    :return: dictionary with each timepoint as key and a tuple of the
+        relevant timepoints and relevant linked timepoints as value
+
+    Determine the relevant timepoints for the minimum up/down time
+    constraints (see *determine_relevant_timepoints*) for all timepoints in
+    the horizons of the balancing type, walking back through each horizon's
+    timepoints once. The results are cached on the model by balancing type
+    and min time.
+    """
+    min_time = value(min_time)
+    if not hasattr(mod, "relevant_tmps_by_bt_min_time"):
+        mod.relevant_tmps_by_bt_min_time = dict()
+    if (balancing_type, min_time) in mod.relevant_tmps_by_bt_min_time:
+        return mod.relevant_tmps_by_bt_min_time[balancing_type, min_time]
+
+    def get_relevant_linked_tmps(hours_from_tmp):
         # Add the first linked timepoint's duration to hours_from_tmp
-        hours_from_tmp = mod.hrs_in_linked_tmp[linked_tmp]
-        # If we haven't exceeded the min time yet, the first linked
-        # timepoint is relevant, so we'll add it and move on to the
-        # next one
+        linked_tmp = 0
+        relevant_linked_tmps = []
+        hours_from_tmp += mod.hrs_in_linked_tmp[linked_tmp]
+        # If we haven't exceeded the min time yet, the linked timepoint is
+        # relevant, so we'll add it and move on to the next one
         while hours_from_tmp < min_time:
             relevant_linked_tmps.append(linked_tmp)
             # If this is the furthest linked timepoint, break out of
@@ -115,85 +126,75 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
             else:
                 linked_tmp += -1
                 hours_from_tmp += mod.hrs_in_linked_tmp[linked_tmp]
-    # If we haven't reached the first timepoint of a linear or linked
-    # horizon, we'll look for the previous timepoint
-    else:
-        # The next possible relevant timepoint is the previous timepoint,
-        # so we'll check its duration (if it's longer than or equal to the
-        # minimum up/down time, we'll break out of the loop immediately)
-        relevant_tmp = mod.prev_tmp[tmp, mod.balancing_type_project[g]]
-        hours_from_tmp = mod.hrs_in_tmp[
-            mod.prev_tmp[tmp, mod.balancing_type_project[g]]
-        ]
 
-        while hours_from_tmp < min_time:
-            # If we haven't exceed the minimum up/down time yet, this timepoint
-            # is relevant and we add it to our list
-            relevant_tmps.append(relevant_tmp)
-
-            # In a 'linear' horizon setting, once we reach the first
-            # timepoint of the horizon, we break out of the loop since there
-            # are no more timepoints to consider
-            if check_if_boundary_type_and_first_timepoint(
-                mod=mod,
-                tmp=relevant_tmp,
-                balancing_type=mod.balancing_type_project[g],
-                boundary_type="linear",
-            ):
-                break
-            # In a 'circular' horizon setting, once we reach timepoint *t*,
-            # we break out of the loop since there are no more timepoints to
-            # consider (we have already added all horizon timepoints as
-            # relevant)
-            elif (
-                check_boundary_type(
-                    mod=mod,
-                    tmp=tmp,
-                    balancing_type=mod.balancing_type_project[g],
-                    boundary_type="circular",
-                )
-                and relevant_tmp == tmp
-            ):
-                break
-            # TODO: only allow the first horizon of a subproblem to have
-            #  linked timepoints
-            # In a 'linked' horizon setting, once we reach the first
-            # timepoint of the horizon, we'll start adding the linked
-            # timepoints until we reach the target min time
-            elif check_if_boundary_type_and_first_timepoint(
-                mod=mod,
-                tmp=relevant_tmp,
-                balancing_type=mod.balancing_type_project[g],
-                boundary_type="linked",
-            ):
-                # Add the first linked timepoint's duration to hours_from_tmp
-                hours_from_tmp += mod.hrs_in_linked_tmp[linked_tmp]
-                # If we haven't exceeded the min time yet, the first linked
-                # timepoint is relevant, so we'll add it and move on to the
-                # next one
+        return relevant_linked_tmps
+
+    relevant_tmps_by_tmp = dict()
+    for hrz in mod.HRZS_BY_BLN_TYPE[balancing_type]:
+        hrz_tmps = list(mod.TMPS_BY_BLN_TYPE_HRZ[balancing_type, hrz])
+        hrz_hrs = [mod.hrs_in_tmp[t] for t in hrz_tmps]
+        boundary = mod.boundary[balancing_type, hrz]
+        n_tmps = len(hrz_tmps)
+
+        for tmp_position, tmp in enumerate(hrz_tmps):
+            # Timepoints are assigned to the first horizon they belong to
+            if mod.horizon[tmp, balancing_type] != hrz:
+                continue
+
+            # The first possible relevant timepoint is the current timepoint
+            relevant_tmps = [tmp]
+            relevant_linked_tmps = []
+
+            # If we have already reached the first timepoint of a horizon in a
+            # linear boundary type, there are no more relevant timepoints to
+            # add; if we have reached the first timepoint in a linked horizon
+            # setting, we'll immediately move on to the linked timepoints
+            if tmp_position == 0 and boundary == "linear":
+                pass
+            elif tmp_position == 0 and boundary == "linked":
+                relevant_linked_tmps = get_relevant_linked_tmps(hours_from_tmp=0)
+            # Otherwise, walk back through the previous timepoints of the
+            # horizon (wrapping around in the circular setting) until we
+            # reach the min time
+            else:
+                position = (tmp_position - 1) % n_tmps
+                hours_from_tmp = hrz_hrs[position]
                 while hours_from_tmp < min_time:
-                    relevant_linked_tmps.append(linked_tmp)
-                    # If this is the furthest linked timepoint, break out of
-                    # the linked timepoints loop; otherwise, move on to the
-                    # next linked timepoint
-                    if linked_tmp == mod.furthest_linked_tmp:
+                    # If we haven't exceed the minimum up/down time yet, this
+                    # timepoint is relevant and we add it to our list
+                    relevant_tmps.append(hrz_tmps[position])
+
+                    # In a 'linear' horizon setting, once we reach the first
+                    # timepoint of the horizon, we break out of the loop
+                    # since there are no more timepoints to consider
+                    if position == 0 and boundary == "linear":
+                        break
+                    # In a 'circular' horizon setting, once we reach
+                    # timepoint *t*, we break out of the loop since we have
+                    # already added all horizon timepoints as relevant
+                    elif boundary == "circular" and position == tmp_position:
+                        break
+                    # TODO: only allow the first horizon of a subproblem to
+                    #  have linked timepoints
+                    # In a 'linked' horizon setting, once we reach the first
+                    # timepoint of the horizon, we'll start adding the linked
+                    # timepoints until we reach the target min time
+                    elif position == 0 and boundary == "linked":
+                        relevant_linked_tmps = get_relevant_linked_tmps(
+                            hours_from_tmp=hours_from_tmp
+                        )
                         break
+                    # Otherwise, we move on to the previous timepoint and
+                    # add its duration to hours_from_tmp
                     else:
-                        linked_tmp += -1
-                        hours_from_tmp += mod.hrs_in_linked_tmp[linked_tmp]
-                # Break out from the outer while loop when done with the
-                # linked timepoints
-                break
-            # Otherwise, we move on to the relevant timepoint's previous
-            # timepoint and will add that timepoint's duration to
-            # hours_from_tmp
-            else:
-                hours_from_tmp += mod.hrs_in_tmp[
-                    mod.prev_tmp[relevant_tmp, mod.balancing_type_project[g]]
-                ]
-                relevant_tmp = mod.prev_tmp[relevant_tmp, mod.balancing_type_project[g]]
+                        position = (position - 1) % n_tmps
+                        hours_from_tmp += hrz_hrs[position]
 
-    return relevant_tmps, relevant_linked_tmps
+            relevant_tmps_by_tmp[tmp] = (relevant_tmps, relevant_linked_tmps)
+
+    mod.relevant_tmps_by_bt_min_time[balancing_type, min_time] = relevant_tmps_by_tmp
+
+    return relevant_tmps_by_tmp
 
 
 def get_optype_inputs_as_df(
@@ -223,7 +224,7 @@ def get_optype_inputs_as_df(
     """
 
     # Figure out which headers we have
-    header = pd.read_csv(
+    header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -233,18 +234,15 @@ def get_optype_inputs_as_df(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     # Get the columns for the optional params (it's OK if they don't exist)
     used_columns = [c for c in optional_columns if c in header]
 
     # Read in the appropriate columns for the operational type from
     # projects.tab
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -255,7 +253,6 @@ def get_optype_inputs_as_df(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=["project", "operational_type"] + required_columns + used_columns,
     )
 
@@ -430,7 +427,7 @@ def write_tab_file_model_inputs(
     :return:
     """
 
-    out_file = os.path.join(
+    inputs_directory = os.path.join(
         scenario_directory,
         weather_iteration,
         hydro_iteration,
@@ -438,14 +435,25 @@ def write_tab_file_model_inputs(
         subproblem,
         stage,
         "inputs",
-        fname,
     )
+    out_file = os.path.join(inputs_directory, fname)
     f_exists = os.path.isfile(out_file)
     append_mode = "a" if f_exists else "w"
 
     # Only write if we have data
     data_list = [row for row in data.fetchall()]
     if data_list:
+        # Large timepoint-indexed inputs are written in a columnar format
+        # instead if one is set for the scenario (nulls are kept as nulls)
+        if write_columnar_input_file(
+            scenario_directory=scenario_directory,
+            inputs_directory=inputs_directory,
+            filename=fname,
+            columns=[s[0] for s in data.description],
+            rows=data_list,
+        ):
+            return
+
         with open(out_file, append_mode, newline="") as f:
             writer = csv.writer(f, delimiter="\t", lineterminator="\n")
 
@@ -499,7 +507,7 @@ def load_var_profile_inputs(
 
     # Determine projects of this op_type and other var op_types
     # TODO: re-factor getting projects of certain op-type?
-    prj_df = pd.read_csv(
+    prj_df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -510,7 +518,6 @@ def load_var_profile_inputs(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=["project", "operational_type"],
     )
     op_type_prjs = prj_df[prj_df["operational_type"] == op_type]["project"]
@@ -521,8 +528,8 @@ def load_var_profile_inputs(
 
     # Read in the cap factors, filter for projects with the correct op_type
     # and convert to dictionary
-    cf_df = pd.read_csv(
-        os.path.join(
+    cf_df = read_input_file(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -530,9 +537,8 @@ def load_var_profile_inputs(
             subproblem,
             stage,
             "inputs",
-            tab_filename,
         ),
-        sep="\t",
+        filename=tab_filename,
         usecols=["project", "timepoint", param_name],
         dtype={param_name: float},
     )
@@ -925,8 +931,8 @@ def load_hydro_opchars(
     min = dict()
     max = dict()
 
-    prj_hor_opchar_df = pd.read_csv(
-        os.path.join(
+    prj_hor_opchar_df = read_input_file(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -934,9 +940,8 @@ def load_hydro_opchars(
             subproblem,
             stage,
             "inputs",
-            "hydro_conventional_horizon_params.tab",
         ),
-        sep="\t",
+        filename="hydro_conventional_horizon_params.tab",
         usecols=[
             "project",
             "balancing_type_project",
@@ -1093,7 +1098,7 @@ def load_startup_chars(
     )
 
     if os.path.exists(startup_chars_file):
-        df = pd.read_csv(startup_chars_file, sep="\t")
+        df = read_input_table(startup_chars_file)
 
         # Note: the rank function requires at least one numeric input in the
         # down_time_cutoff_hours column (can't be all NULL/None).
@@ -1102,38 +1107,24 @@ def load_startup_chars(
                 "down_time_cutoff_hours"
             ].rank()
 
-        startup_ramp_projects = set()
-        startup_ramp_projects_types = list()
-        down_time_cutoff_hours_dict = dict()
-        startup_plus_ramp_up_rate_dict = dict()
-
-        for i, row in df.iterrows():
-            project = row["project"]
-            startup_type_id = row["startup_type_id"]
-            down_time_cutoff_hours = row["down_time_cutoff_hours"]
-            startup_plus_ramp_up_rate = row["startup_plus_ramp_up_rate"]
-
-            if (
-                down_time_cutoff_hours != "."
-                and startup_plus_ramp_up_rate != "."
-                and project in projects
-            ):
-                startup_ramp_projects.add(project)
-                startup_ramp_projects_types.append((project, startup_type_id))
-                down_time_cutoff_hours_dict[(project, startup_type_id)] = float(
-                    down_time_cutoff_hours
-                )
-                startup_plus_ramp_up_rate_dict[(project, startup_type_id)] = float(
-                    startup_plus_ramp_up_rate
-                )
-
-        if startup_ramp_projects:
-            data_portal.data()[
-                "{}_down_time_cutoff_hours".format(op_type)
-            ] = down_time_cutoff_hours_dict
-            data_portal.data()[
-                "{}_startup_plus_ramp_up_rate_by_st".format(op_type)
-            ] = startup_plus_ramp_up_rate_dict
+        df = df[
+            (df["down_time_cutoff_hours"] != ".")
+            & (df["startup_plus_ramp_up_rate"] != ".")
+            & (df["project"].isin(projects))
+        ].astype({"down_time_cutoff_hours": float, "startup_plus_ramp_up_rate": float})
+
+        if len(df) > 0:
+            df_to_data_portal(
+                data_portal=data_portal,
+                df=df,
+                index_columns=["project", "startup_type_id"],
+                params={
+                    "down_time_cutoff_hours": f"{op_type}_down_time_cutoff_hours",
+                    "startup_plus_ramp_up_rate": (
+                        f"{op_type}_startup_plus_ramp_up_rate_by_st"
+                    ),
+                },
+            )
 
 
 def check_for_tmps_to_link(scenario_directory, subproblem, stage):
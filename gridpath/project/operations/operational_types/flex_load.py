@@ -643,6 +643,9 @@ def export_results(
         with open(
             os.path.join(
                 scenario_directory,
+                weather_iteration,
+                hydro_iteration,
+                availability_iteration,
                 next_subproblem,
                 stage,
                 "inputs",
@@ -257,7 +257,10 @@ def load_model_data(
 
 
 def add_to_prj_tmp_results(mod):
-    results_columns, data = gen_commit_unit_common.add_to_prj_tmp_results(
+    (
+        results_columns,
+        optype_dispatch_df,
+    ) = gen_commit_unit_common.add_to_prj_tmp_results(
         mod=mod,
         BIN_OR_LIN="LIN",
         Bin_or_Lin="Lin",
@@ -273,13 +276,6 @@ def add_to_prj_tmp_results(mod):
         Bin_or_Lin="Lin",
     )
 
-    # Create DF
-    optype_dispatch_df = create_results_df(
-        index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
-    )
-
     # Get the duals
     optype_duals_df = create_results_df(
         index_columns=["project", "timepoint"],
@@ -289,9 +285,7 @@ def add_to_prj_tmp_results(mod):
 
     # Add duals to dispatch DF
     results_columns += duals_results_columns
-    for column in duals_results_columns:
-        optype_dispatch_df[column] = None
-    optype_dispatch_df.update(optype_duals_df)
+    optype_dispatch_df = optype_dispatch_df.join(optype_duals_df)
 
     return results_columns, optype_dispatch_df
 
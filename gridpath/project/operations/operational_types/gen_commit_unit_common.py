@@ -64,7 +64,11 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_set_membership,
 )
 from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
-from gridpath.common_functions import duals_wrapper
+from gridpath.common_functions import (
+    create_component_results_df,
+    duals_wrapper,
+    get_component_values,
+)
 from gridpath.project.operations.operational_types.common_functions import (
     determine_relevant_timepoints,
     load_optype_model_data,
@@ -3654,86 +3658,41 @@ def add_to_prj_tmp_results(
     bin_or_lin,
 ):
     """ """
+    prj_tmps = list(getattr(mod, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN)))
 
-    results_columns = [
-        "gross_power_mw",
-        "auxiliary_consumption_mw",
-        "net_power_mw",
-        "committed_mw",
-        "committed_units",
-        "started_units",
-        "stopped_units",
-        "synced_units",
-        "active_startup_type",
-        "ramp_up_violation",
-        "ramp_down_violation",
-        "min_up_time_violation",
-        "min_down_time_violation",
-    ]
+    def get_values(component_name):
+        return get_component_values(
+            component=getattr(mod, component_name.format(Bin_or_Lin)),
+            index=prj_tmps,
+        )
 
-    data = [
-        [
-            prj,
-            tmp,
-            value(
-                getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
+    gross_power = get_values("GenCommit{}_Provide_Power_MW")
+    auxiliary_consumption = get_values("GenCommit{}_Auxiliary_Consumption_MW")
+    commit = get_values("GenCommit{}_Commit")
+
+    optype_dispatch_df = create_component_results_df(
+        index_columns=["project", "timepoint"],
+        index=prj_tmps,
+        components={
+            "gross_power_mw": gross_power,
+            "auxiliary_consumption_mw": auxiliary_consumption,
+            "net_power_mw": gross_power - auxiliary_consumption,
+            "committed_mw": get_values("GenCommit{}_Pmax_MW") * commit,
+            "committed_units": commit,
+            "started_units": get_values("GenCommit{}_Startup"),
+            "stopped_units": get_values("GenCommit{}_Shutdown"),
+            "synced_units": get_values("GenCommit{}_Synced"),
+            "active_startup_type": get_values("GenCommit{}_Active_Startup_Type"),
+            "ramp_up_violation": get_values("GenCommit{}_Ramp_Up_Violation_MW"),
+            "ramp_down_violation": get_values("GenCommit{}_Ramp_Down_Violation_MW"),
+            "min_up_time_violation": get_values("GenCommit{}_Min_Up_Time_Violation"),
+            "min_down_time_violation": get_values(
+                "GenCommit{}_Min_Down_Time_Violation"
             ),
-            value(
-                getattr(
-                    mod,
-                    "GenCommit{}_Auxiliary_Consumption_MW".format(Bin_or_Lin),
-                )[prj, tmp]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Provide_Power_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            )
-            - value(
-                getattr(
-                    mod,
-                    "GenCommit{}_Auxiliary_Consumption_MW".format(Bin_or_Lin),
-                )[prj, tmp]
-            ),
-            value(getattr(mod, "GenCommit{}_Pmax_MW".format(Bin_or_Lin))[prj, tmp])
-            * value(getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Commit".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Startup".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Shutdown".format(Bin_or_Lin))[prj, tmp]),
-            value(getattr(mod, "GenCommit{}_Synced".format(Bin_or_Lin))[prj, tmp]),
-            value(
-                getattr(mod, "GenCommit{}_Active_Startup_Type".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Ramp_Up_Violation_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Ramp_Down_Violation_MW".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(mod, "GenCommit{}_Min_Up_Time_Violation".format(Bin_or_Lin))[
-                    prj, tmp
-                ]
-            ),
-            value(
-                getattr(
-                    mod,
-                    "GenCommit{}_Min_Down_Time_Violation".format(Bin_or_Lin),
-                )[prj, tmp]
-            ),
-        ]
-        for (prj, tmp) in getattr(mod, "GEN_COMMIT_{}_OPR_TMPS".format(BIN_OR_LIN))
-    ]
+        },
+    )
 
-    return results_columns, data
+    return list(optype_dispatch_df.columns), optype_dispatch_df
 
 
 def export_linked_subproblem_inputs(
@@ -3945,6 +3904,9 @@ def export_linked_subproblem_inputs(
                 with open(
                     os.path.join(
                         scenario_directory,
+                        weather_iteration,
+                        hydro_iteration,
+                        availability_iteration,
                         next_subproblem,
                         stage,
                         "inputs",
@@ -45,6 +45,7 @@ from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.dynamic_components import (
     footroom_variables,
     headroom_variables,
+    mutable_timeseries_params,
     reserve_variable_derate_params,
 )
 from gridpath.project.operations.reserves.subhourly_energy_adjustment import (
@@ -63,7 +64,7 @@ from gridpath.project.operations.operational_types.common_functions import (
     validate_var_profiles,
     load_optype_model_data,
 )
-from gridpath.common_functions import create_results_df
+from gridpath.common_functions import create_component_results_df
 
 
 def add_model_components(
@@ -199,7 +200,9 @@ def add_model_components(
     # Required Params
     ###########################################################################
 
-    m.gen_var_cap_factor = Param(m.GEN_VAR_OPR_TMPS, within=Reals)
+    m.gen_var_cap_factor = Param(
+        m.GEN_VAR_OPR_TMPS, within=Reals, mutable=getattr(d, mutable_timeseries_params)
+    )
 
     # Variables
     ###########################################################################
@@ -347,7 +350,7 @@ def max_downward_reserves_rule(mod, g, tmp):
 
     Downward reserves can't exceed power provision.
     """
-    if mod.gen_var_cap_factor[g, tmp] >= 0:
+    if value(mod.gen_var_cap_factor[g, tmp]) >= 0:
         return (
             mod.GenVar_Downwards_Reserves_MW[g, tmp]
             <= mod.GenVar_Provide_Power_MW[g, tmp]
@@ -490,7 +493,7 @@ def capacity_providing_inertia_rule(mod, g, tmp):
     Capacity providing inertia for GEN_VAR project is equal to the online
     capacity if any of it is generating
     """
-    if mod.gen_var_cap_factor[g, tmp] >= 0:
+    if value(mod.gen_var_cap_factor[g, tmp]) >= 0:
         return mod.Capacity_MW[g, mod.period[tmp]] * mod.Availability_Derate[g, tmp]
     else:
         return 0
@@ -546,29 +549,17 @@ def load_model_data(
 
 
 def add_to_prj_tmp_results(mod):
-    results_columns = [
-        "scheduled_curtailment_mw",
-        "subhourly_curtailment_mw",
-        "subhourly_energy_delivered_mw",
-        "total_curtailment_mw",
-    ]
-    data = [
-        [
-            prj,
-            tmp,
-            value(mod.GenVar_Scheduled_Curtailment_MW[prj, tmp]),
-            value(mod.GenVar_Subhourly_Curtailment_MW[prj, tmp]),
-            value(mod.GenVar_Subhourly_Energy_Delivered_MW[prj, tmp]),
-            value(mod.GenVar_Total_Curtailment_MW[prj, tmp]),
-        ]
-        for (prj, tmp) in mod.GEN_VAR_OPR_TMPS
-    ]
-
-    optype_dispatch_df = create_results_df(
+    optype_dispatch_df = create_component_results_df(
         index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
+        index=mod.GEN_VAR_OPR_TMPS,
+        components={
+            "scheduled_curtailment_mw": mod.GenVar_Scheduled_Curtailment_MW,
+            "subhourly_curtailment_mw": mod.GenVar_Subhourly_Curtailment_MW,
+            "subhourly_energy_delivered_mw": mod.GenVar_Subhourly_Energy_Delivered_MW,
+            "total_curtailment_mw": mod.GenVar_Total_Curtailment_MW,
+        },
     )
+    results_columns = list(optype_dispatch_df.columns)
 
     return results_columns, optype_dispatch_df
 
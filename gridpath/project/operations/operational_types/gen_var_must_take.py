@@ -19,7 +19,7 @@ not allowed. Second, because the project's output is not controllable, projects
 of this operational type cannot provide operational reserves .
 """
 
-from pyomo.environ import Param, Set, Reals, Constraint
+from pyomo.environ import Param, Set, Reals, Constraint, value
 import warnings
 
 from gridpath.auxiliary.auxiliary import (
@@ -32,7 +32,11 @@ from gridpath.auxiliary.validations import (
     get_projects_by_reserve,
     validate_idxs,
 )
-from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
+from gridpath.auxiliary.dynamic_components import (
+    headroom_variables,
+    footroom_variables,
+    mutable_timeseries_params,
+)
 from gridpath.project.common_functions import (
     check_if_first_timepoint,
     check_boundary_type,
@@ -129,7 +133,11 @@ def add_model_components(
     # Required Params
     ###########################################################################
 
-    m.gen_var_must_take_cap_factor = Param(m.GEN_VAR_MUST_TAKE_OPR_TMPS, within=Reals)
+    m.gen_var_must_take_cap_factor = Param(
+        m.GEN_VAR_MUST_TAKE_OPR_TMPS,
+        within=Reals,
+        mutable=getattr(d, mutable_timeseries_params),
+    )
 
     # Constraints
     ###########################################################################
@@ -255,7 +263,7 @@ def capacity_providing_inertia_rule(mod, g, tmp):
     Capacity providing inertia for GEN_VAR_must_take project is equal to the online
     capacity if any of it is generating
     """
-    if mod.gen_var_must_take_cap_factor[g, tmp] >= 0:
+    if value(mod.gen_var_must_take_cap_factor[g, tmp]) >= 0:
         return mod.Capacity_MW[g, mod.period[tmp]] * mod.Availability_Derate[g, tmp]
     else:
         return 0
@@ -59,6 +59,7 @@ from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.dynamic_components import (
     footroom_variables,
     headroom_variables,
+    mutable_timeseries_params,
     reserve_variable_derate_params,
 )
 from gridpath.project.operations.operational_types.stor import (
@@ -290,7 +291,9 @@ def add_model_components(
     ###########################################################################
 
     m.gen_var_stor_hyb_cap_factor = Param(
-        m.GEN_VAR_STOR_HYB_OPR_TMPS, within=NonNegativeReals
+        m.GEN_VAR_STOR_HYB_OPR_TMPS,
+        within=NonNegativeReals,
+        mutable=getattr(d, mutable_timeseries_params),
     )
 
     m.gen_var_stor_hyb_charging_efficiency = Param(
@@ -876,7 +879,7 @@ def capacity_providing_inertia_rule(mod, prj, tmp):
     Capacity providing inertia for GEN_VAR_STOR_HYB project is equal to the online
     capacity if any of it is generating
     """
-    if mod.gen_var_stor_hyb_cap_factor[prj, tmp] >= 0:
+    if value(mod.gen_var_stor_hyb_cap_factor[prj, tmp]) >= 0:
         return mod.Capacity_MW[prj, mod.period[tmp]] * mod.Availability_Derate[prj, tmp]
     else:
         return 0
@@ -19,7 +19,7 @@ based on 1) the project capacity relative to the load component peak load and
 values indicate a load reduction and negative values indicate a load increase.
 """
 
-from pyomo.environ import Param, Set, Reals, Constraint, Var, Any
+from pyomo.environ import Param, Set, Reals, Constraint, Var, Any, value
 import warnings
 
 from gridpath.auxiliary.auxiliary import (
@@ -32,7 +32,11 @@ from gridpath.auxiliary.validations import (
     get_projects_by_reserve,
     validate_idxs,
 )
-from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
+from gridpath.auxiliary.dynamic_components import (
+    headroom_variables,
+    footroom_variables,
+    mutable_timeseries_params,
+)
 from gridpath.project.common_functions import (
     check_if_first_timepoint,
     check_boundary_type,
@@ -139,14 +143,17 @@ def add_model_components(
         m.LOAD_COMPONENT_MODIFIER_PRJS_OPR_PRDS,
         initialize=lambda mod, prj, prd: max(
             [
-                mod.component_static_load_mw[
-                    mod.load_zone[prj],
-                    tmp,
-                    mod.load_component_modifier_linked_load_component[prj],
-                ]
+                value(
+                    mod.component_static_load_mw[
+                        mod.load_zone[prj],
+                        tmp,
+                        mod.load_component_modifier_linked_load_component[prj],
+                    ]
+                )
                 for tmp in mod.TMPS_IN_PRD[prd]
             ]
         ),
+        mutable=getattr(d, mutable_timeseries_params),
     )
 
     m.Load_Component_Modifier_Fraction_Invested = Var(
@@ -30,6 +30,7 @@ from pyomo.environ import (
     Any,
     NonNegativeReals,
     Expression,
+    value,
 )
 import warnings
 
@@ -43,7 +44,11 @@ from gridpath.auxiliary.validations import (
     get_projects_by_reserve,
     validate_idxs,
 )
-from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
+from gridpath.auxiliary.dynamic_components import (
+    headroom_variables,
+    footroom_variables,
+    mutable_timeseries_params,
+)
 from gridpath.project.common_functions import (
     check_if_first_timepoint,
     check_boundary_type,
@@ -161,14 +166,17 @@ def add_model_components(
         m.LOAD_COMPONENT_SHIFT_PRJS_OPR_PRDS,
         initialize=lambda mod, prj, prd: max(
             [
-                mod.component_static_load_mw[
-                    mod.load_zone[prj],
-                    tmp,
-                    mod.load_component_shift_linked_load_component[prj],
-                ]
+                value(
+                    mod.component_static_load_mw[
+                        mod.load_zone[prj],
+                        tmp,
+                        mod.load_component_shift_linked_load_component[prj],
+                    ]
+                )
                 for tmp in mod.TMPS_IN_PRD[prd]
             ]
         ),
+        mutable=getattr(d, mutable_timeseries_params),
     )
 
     # Optional params
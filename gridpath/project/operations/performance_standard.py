@@ -30,6 +30,8 @@ from gridpath.auxiliary.db_interface import (
 )
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -20,14 +20,14 @@ power that a project is providing in each study timepoint.
 
 import os.path
 import pandas as pd
-from pyomo.environ import Expression, value, Constraint
+from pyomo.environ import Expression, Constraint
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
-from gridpath.common_functions import create_results_df
+from gridpath.common_functions import create_component_results_df
 from gridpath.project.operations.common_functions import load_operational_type_modules
 import gridpath.project.operations.operational_types as op_type_init
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 
 
 def add_model_components(
@@ -157,25 +157,15 @@ def export_results(
     Nothing
     """
 
-    results_columns = ["project_power_mw", "power_mw"]
-    data = [
-        [
-            prj,
-            tmp,
-            value(m.Project_Power_Provision_MW[prj, tmp]),
-            value(m.Bulk_Power_Provision_MW[prj, tmp]),
-        ]
-        for (prj, tmp) in m.PRJ_OPR_TMPS
-    ]
-    results_df = create_results_df(
+    results_df = create_component_results_df(
         index_columns=["project", "timepoint"],
-        results_columns=results_columns,
-        data=data,
+        index=m.PRJ_OPR_TMPS,
+        components={
+            "project_power_mw": m.Project_Power_Provision_MW,
+            "power_mw": m.Bulk_Power_Provision_MW,
+        },
     )
-
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
     required_operational_modules = get_required_subtype_modules(
         scenario_directory=scenario_directory,
@@ -191,6 +181,8 @@ def export_results(
         required_operational_modules
     )
 
+    # The operational types' results are for different projects, so each
+    # operational type writes its own block of the project-timepoint results
     for optype_module in imported_operational_modules:
         if hasattr(
             imported_operational_modules[optype_module], "add_to_prj_tmp_results"
@@ -198,10 +190,7 @@ def export_results(
             results_columns, optype_df = imported_operational_modules[
                 optype_module
             ].add_to_prj_tmp_results(mod=m)
-            for column in results_columns:
-                if column not in getattr(d, PROJECT_TIMEPOINT_DF):
-                    getattr(d, PROJECT_TIMEPOINT_DF)[column] = None
-            getattr(d, PROJECT_TIMEPOINT_DF).update(optype_df)
+            getattr(d, PROJECT_TIMEPOINT_RESULTS).write(optype_df)
 
 
 # Database
@@ -16,15 +16,14 @@
 Add project-level components for frequency response reserves
 """
 
-import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Set, value
 
+from gridpath.auxiliary.input_files import add_input_file_columns, read_input_table
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.dynamic_components import headroom_variables
 from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 from gridpath.project.operations.reserves.reserve_provision import (
     generic_record_dynamic_components,
     generic_add_model_components,
@@ -51,6 +50,7 @@ RESERVE_BALANCING_AREA_PARAM_NAME = "frequency_response_ba"
 RESERVE_PROJECTS_SET_NAME = "FREQUENCY_RESPONSE_PROJECTS"
 RESERVE_BALANCING_AREAS_SET_NAME = "FREQUENCY_RESPONSE_BAS"
 RESERVE_PRJ_OPR_TMPS_SET_NAME = "FREQUENCY_RESPONSE_PRJ_OPR_TMPS"
+SCENARIO_LEVEL_INPUTS = True
 
 
 def record_dynamic_components(
@@ -182,7 +182,7 @@ def load_model_data(
     # Load projects that can contribute to the partial frequency response
     # requirement
     project_fr_partial_list = list()
-    projects = pd.read_csv(
+    projects = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -192,8 +192,7 @@ def load_model_data(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
+        )
     )
 
     for row in zip(
@@ -258,9 +257,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
 
 def get_inputs_from_database(
@@ -408,8 +405,11 @@ def write_model_inputs(
 
     # Make a dict for easy access
     prj_ba_dict = dict()
+    prj_partial_dict = dict()
     for prj, ba, partial in project_bas:
-        prj_ba_dict[str(prj)] = (".", ".") if ba is None else (str(ba), partial)
+        if ba is not None:
+            prj_ba_dict[str(prj)] = str(ba)
+            prj_partial_dict[str(prj)] = partial
 
     # Make a dict for easy access
     prj_derate_dict = dict()
@@ -417,8 +417,8 @@ def write_model_inputs(
         prj_derate_dict[str(prj)] = "." if derate is None else str(derate)
 
     # Add params to projects file
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -426,57 +426,11 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("frequency_response_ba")
-        header.append("frequency_response_partial")
-        header.append("frequency_response_derate")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_ba_dict.keys()):
-                # Add BA and whether project contributes to partial freq resp
-                row.append(prj_ba_dict[row[0]][0])
-                row.append(prj_ba_dict[row[0]][1])
-
-            # If project not specified, specify no BA and no partial freq resp
-            else:
-                for i in range(2):
-                    row.append(".")
-
-            # If project specified, check if derate specified or not
-            if row[0] in list(prj_derate_dict.keys()):
-                row.append(prj_derate_dict[row[0]])
-            # If project not specified, specify no derate
-            else:
-                row.append(".")
-
-            # Add resulting row to new_rows list
-            new_rows.append(row)
-
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "frequency_response_ba": prj_ba_dict,
+            "frequency_response_partial": prj_partial_dict,
+            "frequency_response_derate": prj_derate_dict,
+        },
+    )
@@ -18,8 +18,11 @@ Add project-level components for downward load-following reserves
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Set, Param, Var, NonNegativeReals, PercentFraction, value
+from gridpath.auxiliary.input_files import (
+    add_input_file_columns,
+    get_input_table_columns,
+)
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.dynamic_components import (
     reserve_variable_derate_params,
@@ -32,7 +35,9 @@ from gridpath.auxiliary.auxiliary import (
     subset_init_by_set_membership,
 )
 from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
+
+SCENARIO_LEVEL_INPUTS = True
 
 
 def record_dynamic_components(
@@ -221,7 +226,7 @@ def load_model_data(
         "inertia_reserves_ba",
     )
     params_to_import = (m.inertia_reserves_zone,)
-    projects_file_header = pd.read_csv(
+    projects_file_header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -231,11 +236,8 @@ def load_model_data(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     # Import reserve provision headroom/footroom de-rate parameter only if
     # column is present
@@ -306,9 +308,7 @@ def export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
 
 def get_inputs_from_database(
@@ -531,50 +531,8 @@ def write_model_inputs(
         prj_derate_dict[str(prj)] = "." if derate is None else str(derate)
 
     # Add params to projects file
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("inertia_reserves_ba")
-        header.append("inertia_reserves_derate")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_ba_dict.keys()):
-                row.append(prj_ba_dict[row[0]])
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-
-            # If project specified, check if derate specified or not
-            if row[0] in list(prj_derate_dict.keys()):
-                row.append(prj_derate_dict[row[0]])
-            # If project not specified, specify no derate
-            else:
-                row.append(".")
-
-            # Add resulting row to new_rows list
-            new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -582,10 +540,10 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "inertia_reserves_ba": prj_ba_dict,
+            "inertia_reserves_derate": prj_derate_dict,
+        },
+    )
@@ -17,9 +17,9 @@ Add project-level components for upward frequency response reserves that also
 depend on operational type
 """
 
-import csv
 import os.path
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.validations import write_validation_to_database, validate_values
@@ -40,6 +40,7 @@ RESERVE_PROVISION_RAMP_RATE_LIMIT_CONSTRAINT_NAME = (
 RESERVE_PROVISION_RAMP_RATE_LIMIT_PARAM_NAME = "frequency_response_ramp_rate_limit"
 RESERVE_PROJECTS_SET_NAME = "FREQUENCY_RESPONSE_PROJECTS"
 RESERVE_PRJ_OPR_TMPS_SET_NAME = "FREQUENCY_RESPONSE_PRJ_OPR_TMPS"
+SCENARIO_LEVEL_INPUTS = True
 
 
 def add_model_components(
@@ -238,8 +239,8 @@ def write_model_inputs(
         prj_ramp_rate_dict[str(prj)] = "." if ramp_rate is None else str(ramp_rate)
 
     # Add params to projects file
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -247,44 +248,9 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("frequency_response_ramp_rate")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if ramp rate specified or not
-            if row[0] in list(prj_ramp_rate_dict.keys()):
-                row.append(prj_ramp_rate_dict[row[0]])
-            # If project not specified, specify no ramp rate
-            else:
-                row.append(".")
-
-            # Add resulting row to new_rows list
-            new_rows.append(row)
-
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "frequency_response_ramp_rate": prj_ramp_rate_dict,
+        },
+    )
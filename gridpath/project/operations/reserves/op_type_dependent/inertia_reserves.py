@@ -17,11 +17,13 @@ Add project-level components for spinning reserves that also
 depend on operational type
 """
 
-import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Param, Constraint, NonNegativeReals
 
+from gridpath.auxiliary.input_files import (
+    add_input_file_columns,
+    get_input_table_columns,
+)
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
 from gridpath.auxiliary.db_interface import directories_to_db_values
@@ -33,6 +35,8 @@ from gridpath.project.operations.reserves.op_type_dependent.reserve_limits_by_op
 from gridpath.project.operations.common_functions import load_operational_type_modules
 import gridpath.project.operations.operational_types as op_type
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -132,7 +136,7 @@ def load_model_data(
 
     columns_to_import = ("project",)
     params_to_import = ()
-    projects_file_header = pd.read_csv(
+    projects_file_header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -142,11 +146,8 @@ def load_model_data(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     # Import reserve provision ramp rate limit parameter only if
     # column is present
@@ -298,42 +299,8 @@ def write_model_inputs(
         prj_iner_const_dict[str(prj)] = "." if iner_const is None else str(iner_const)
 
     # Add params to projects file
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("inertia_constant_sec")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if ramp rate specified or not
-            if row[0] in list(prj_iner_const_dict.keys()):
-                row.append(prj_iner_const_dict[row[0]])
-            # If project not specified, specify no ramp rate
-            else:
-                row.append(".")
-
-            # Add resulting row to new_rows list
-            new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -341,10 +308,9 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "inertia_constant_sec": prj_iner_const_dict,
+        },
+    )
@@ -18,9 +18,9 @@
 # TODO: move this functionality to the optype modules
 
 import os.path
-import pandas as pd
 from pyomo.environ import Param, NonNegativeReals, Constraint
 
+from gridpath.auxiliary.input_files import get_input_table_columns
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules
 from gridpath.project.operations.common_functions import load_operational_type_modules
 import gridpath.project.operations.operational_types as op_type
@@ -152,7 +152,7 @@ def generic_load_model_data(
 
     columns_to_import = ("project",)
     params_to_import = ()
-    projects_file_header = pd.read_csv(
+    projects_file_header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -162,11 +162,8 @@ def generic_load_model_data(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     # Import reserve provision ramp rate limit parameter only if
     # column is present
@@ -16,9 +16,9 @@
 Add project-level components for downward regulation reserves
 """
 
-import csv
 import os.path
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.dynamic_components import footroom_variables
 from gridpath.project.operations.reserves.reserve_provision import (
@@ -46,6 +46,7 @@ RESERVE_BALANCING_AREA_PARAM_NAME = "regulation_down_zone"
 RESERVE_PROJECTS_SET_NAME = "REGULATION_DOWN_PROJECTS"
 RESERVE_BALANCING_AREAS_SET_NAME = "REGULATION_DOWN_ZONES"
 RESERVE_PRJ_OPR_TMPS_SET_NAME = "REGULATION_DOWN_PRJ_OPR_TMPS"
+SCENARIO_LEVEL_INPUTS = True
 
 
 def record_dynamic_components(
@@ -323,8 +324,8 @@ def write_model_inputs(
         prj_derate_dict[str(prj)] = "." if derate is None else str(derate)
 
     # Add params to projects file
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -332,52 +333,10 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("regulation_down_ba")
-        header.append("regulation_down_derate")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_ba_dict.keys()):
-                row.append(prj_ba_dict[row[0]])
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-
-            # If project specified, check if derate specified or not
-            if row[0] in list(prj_derate_dict.keys()):
-                row.append(prj_derate_dict[row[0]])
-            # If project not specified, specify no derate
-            else:
-                row.append(".")
-
-            # Add resulting row to new_rows list
-            new_rows.append(row)
-
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "regulation_down_ba": prj_ba_dict,
+            "regulation_down_derate": prj_derate_dict,
+        },
+    )
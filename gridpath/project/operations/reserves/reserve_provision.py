@@ -16,10 +16,10 @@
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Set, Param, Var, NonNegativeReals, PercentFraction, value
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.input_files import get_input_table_columns
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 from gridpath.auxiliary.auxiliary import (
@@ -33,7 +33,7 @@ from gridpath.auxiliary.dynamic_components import (
     reserve_to_energy_adjustment_params,
 )
 from gridpath.common_functions import create_results_df
-from gridpath.project import PROJECT_TIMEPOINT_DF
+from gridpath.project import PROJECT_TIMEPOINT_RESULTS
 
 
 def generic_record_dynamic_components(
@@ -321,7 +321,7 @@ def generic_load_model_data(
         ba_column_name,
     )
     params_to_import = (getattr(m, reserve_balancing_area_param),)
-    projects_file_header = pd.read_csv(
+    projects_file_header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -331,11 +331,8 @@ def generic_load_model_data(
             stage,
             "inputs",
             "projects.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     # Import reserve provision headroom/footroom de-rate parameter only if
     # column is present
@@ -367,7 +364,7 @@ def generic_load_model_data(
     # Load reserve provision subhourly energy adjustment (e.g. for storage
     # state of charge adjustment or delivered variable RPS energy adjustment)
     # if specified; otherwise it will default to 0
-    ba_file_header = pd.read_csv(
+    ba_file_header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -377,11 +374,8 @@ def generic_load_model_data(
             stage,
             "inputs",
             reserve_balancing_areas_input_file,
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     if "reserve_to_energy_adjustment" in ba_file_header:
         data_portal.load(
@@ -449,9 +443,7 @@ def generic_export_results(
         data=data,
     )
 
-    for c in results_columns:
-        getattr(d, PROJECT_TIMEPOINT_DF)[c] = None
-    getattr(d, PROJECT_TIMEPOINT_DF).update(results_df)
+    getattr(d, PROJECT_TIMEPOINT_RESULTS).write(results_df)
 
 
 def generic_get_inputs_from_database(
@@ -18,9 +18,9 @@ Get contributions for each project and policy
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Param, Set, Expression, value, Reals
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     load_subtype_modules,
@@ -225,7 +225,7 @@ def load_model_data(
         param=m.compliance_type,
     )
 
-    project_df = pd.read_csv(
+    project_df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -236,7 +236,6 @@ def load_model_data(
             "inputs",
             "project_policy_zones.tab",
         ),
-        sep="\t",
         usecols=["project", "compliance_type"],
     )
     required_compliance_modules = [
@@ -513,11 +512,7 @@ def write_model_inputs(
         "inputs",
         "project_policy_zones.tab",
     )
-    project_df = pd.read_csv(
-        project_policy_zone_file,
-        sep="\t",
-        usecols=["compliance_type"],
-    )
+    project_df = read_input_table(project_policy_zone_file, usecols=["compliance_type"])
     required_compliance_modules = [
         comp_type for comp_type in project_df.compliance_type.dropna().unique()
     ]
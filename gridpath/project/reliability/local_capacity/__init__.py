@@ -16,14 +16,20 @@
 Local capacity projects and the zone they contribute to
 """
 
-import csv
 import os.path
 from pyomo.environ import Param, Set
 
-from gridpath.auxiliary.auxiliary import cursor_to_df, subset_init_by_set_membership
+from gridpath.auxiliary.input_files import add_input_file_columns
+from gridpath.auxiliary.auxiliary import (
+    cursor_to_df,
+    subset_init_by_set_membership,
+    subsets_init_by_param_value,
+)
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -51,11 +57,12 @@ def add_model_components(
     m.LOCAL_CAPACITY_PROJECTS_BY_LOCAL_CAPACITY_ZONE = Set(
         m.LOCAL_CAPACITY_ZONES,
         within=m.LOCAL_CAPACITY_PROJECTS,
-        initialize=lambda mod, local_capacity_z: [
-            p
-            for p in mod.LOCAL_CAPACITY_PROJECTS
-            if mod.local_capacity_zone[p] == local_capacity_z
-        ],
+        initialize=lambda mod: subsets_init_by_param_value(
+            mod=mod,
+            set_name="LOCAL_CAPACITY_PROJECTS",
+            param_name="local_capacity_zone",
+            param_value_set="LOCAL_CAPACITY_ZONES",
+        ),
     )
 
     # Get operational local capacity projects - timepoints combinations
@@ -261,41 +268,8 @@ def write_model_inputs(
 
     prj_zones_dict = {p: "." if z is None else z for (p, z) in project_zones}
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("local_capacity_zone")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zones_dict.keys()):
-                row.append(prj_zones_dict[row[0]])
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -303,10 +277,9 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "local_capacity_zone": prj_zones_dict,
+        },
+    )
@@ -16,14 +16,14 @@
 PRM projects and the zone they contribute to
 """
 
-import csv
 import os.path
 from pyomo.environ import Param, Set
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import (
     cursor_to_df,
-    subset_init_by_param_value,
     subset_init_by_set_membership,
+    subsets_init_by_param_value,
 )
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.validations import (
@@ -32,6 +32,8 @@ from gridpath.auxiliary.validations import (
     validate_missing_inputs,
 )
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -64,8 +66,11 @@ def add_model_components(
     m.PRM_PROJECTS_BY_PRM_ZONE = Set(
         m.PRM_ZONES,
         within=m.PRM_PROJECTS,
-        initialize=lambda mod, prm_z: subset_init_by_param_value(
-            mod, "PRM_PROJECTS", "prm_zone", prm_z
+        initialize=lambda mod: subsets_init_by_param_value(
+            mod=mod,
+            set_name="PRM_PROJECTS",
+            param_name="prm_zone",
+            param_value_set="PRM_ZONES",
         ),
     )
 
@@ -299,14 +304,15 @@ def write_model_inputs(
     # Make a dict for easy access
     # Only assign a type to projects that contribute to a PRM zone in case
     # we have projects with missing zones here
-    prj_zone_type_dict = dict()
+    prj_zone_dict = dict()
+    prj_type_dict = dict()
     for prj, zone, prm_type in project_zones:
-        prj_zone_type_dict[str(prj)] = (
-            (".", ".") if zone is None else (str(zone), str(prm_type))
-        )
+        if zone is not None:
+            prj_zone_dict[str(prj)] = str(zone)
+            prj_type_dict[str(prj)] = str(prm_type)
 
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -314,49 +320,10 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        for new_column in ["prm_zone", "prm_type"]:
-            header.append(new_column)
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zone_type_dict.keys()):
-                for new_column_value in [
-                    prj_zone_type_dict[row[0]][0],
-                    prj_zone_type_dict[row[0]][1],
-                ]:
-                    row.append(new_column_value)
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                for new_column in range(2):
-                    row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "prm_zone": prj_zone_dict,
+            "prm_type": prj_type_dict,
+        },
+    )
@@ -20,6 +20,7 @@ import csv
 import os.path
 from pyomo.environ import Param, Set, NonNegativeReals, Binary, Expression, value, Any
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.db_interface import import_csv, directories_to_db_values
 
 
@@ -434,57 +435,14 @@ def write_model_inputs(
     )
 
     # Make a dict for easy access
-    prj_contr_cf_dict = dict()
+    prj_contr_dict = dict()
+    prj_cf_dict = dict()
     for prj, contr, cf in project_contr_cf:
-        prj_contr_cf_dict[str(prj)] = (contr, cf)
+        prj_contr_dict[str(prj)] = contr
+        prj_cf_dict[str(prj)] = cf
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("elcc_surface_name")
-        header.append("elcc_surface_cap_factor")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            prj = row[0]
-            # If project specified add the values
-            if prj in list(prj_contr_cf_dict.keys()):
-                row.append(
-                    prj_contr_cf_dict[prj][0]
-                    if prj_contr_cf_dict[prj][0] is not None
-                    else "."
-                )
-                row.append(
-                    prj_contr_cf_dict[prj][1]
-                    if prj_contr_cf_dict[prj][1] is not None
-                    else "."
-                )
-                new_rows.append(row)
-            # If project not specified, specify no chars
-            else:
-                row.append(".")
-                row.append(".")
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -492,13 +450,13 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "elcc_surface_name": prj_contr_dict,
+            "elcc_surface_cap_factor": prj_cf_dict,
+        },
+    )
 
     with open(
         os.path.join(
@@ -17,9 +17,9 @@ Describe ELCC-eligibility constraints on infrastructure.
 """
 
 import os.path
-import pandas as pd
 from pyomo.environ import Expression
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.project.reliability.prm.common_functions import load_prm_type_modules
 
 
@@ -42,7 +42,7 @@ def add_model_components(
     :return:
     """
     # Import needed PRM modules
-    project_df = pd.read_csv(
+    project_df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -53,7 +53,6 @@ def add_model_components(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=["project", "prm_type"],
     )
     required_prm_modules = [
@@ -110,7 +109,7 @@ def load_model_data(
     :param stage:
     :return:
     """
-    project_df = pd.read_csv(
+    project_df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -121,7 +120,6 @@ def load_model_data(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=["project", "prm_type"],
     )
     required_prm_modules = [
@@ -170,7 +168,7 @@ def export_results(
 
     # Export module-specific results
     # Operational type modules
-    project_df = pd.read_csv(
+    project_df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -181,7 +179,6 @@ def export_results(
             "inputs",
             "projects.tab",
         ),
-        sep="\t",
         usecols=["project", "prm_type"],
     )
     required_prm_modules = [
@@ -17,10 +17,10 @@ Storage projects with additional constraints on deliverability based on their
 duration
 """
 
-import csv
 import os.path
 from pyomo.environ import Param, Var, Set, Constraint, PositiveReals, NonNegativeReals
 
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import (
     cursor_to_df,
     subset_init_by_param_value,
@@ -306,8 +306,8 @@ def write_model_inputs(
     for prj, zone, min_dur in project_zone_dur:
         prj_zone_dur_dict[str(prj)] = "." if zone is None else min_dur
 
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -315,45 +315,9 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "projects.tab",
         ),
-        "r",
-    ) as projects_file_in:
-        reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.append("minimum_duration_for_full_capacity_credit_hours")
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            if row[0] in list(prj_zone_dur_dict.keys()):
-                (
-                    row.append(".")
-                    if prj_zone_dur_dict[row[0]] is None
-                    else row.append(prj_zone_dur_dict[row[0]])
-                )
-                new_rows.append(row)
-            # If project not specified
-            else:
-                row.append(".")
-                new_rows.append(row)
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
-        writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="projects.tab",
+        columns={
+            "minimum_duration_for_full_capacity_credit_hours": prj_zone_dur_dict,
+        },
+    )
@@ -27,22 +27,32 @@ import dill
 import json
 from multiprocessing import get_context, Manager
 import os.path
+import pandas as pd
+from queue import Queue
+import time
 import xml.etree.ElementTree as ET
 
 from pyomo.environ import (
     AbstractModel,
     Suffix,
     DataPortal,
+    Param,
+    RangeSet,
+    Set,
     SolverFactory,
     SolverStatus,
     TerminationCondition,
+    Var,
+    value,
 )
 
 # from pyomo.util.infeasible import log_infeasible_constraints
+from pyomo.common.collections import ComponentSet
 from pyomo.common.timing import report_timing
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.core import ComponentUID, SymbolMap
 from pyomo.opt import ReaderFactory, ResultsFormat, ProblemFormat
+from pyomo.version import version_info as pyomo_version_info
 import sys
 import warnings
 
@@ -60,8 +70,56 @@ from gridpath.common_functions import (
     Logging,
     ensure_empty_string,
 )
-from gridpath.auxiliary.dynamic_components import DynamicComponents
-from gridpath.auxiliary.module_list import determine_modules, load_modules
+from gridpath.auxiliary.benders import record_master_variables, solve_with_benders
+from gridpath.auxiliary.dynamic_components import (
+    benders_master_variables,
+    DynamicComponents,
+    model_profile,
+    mutable_timeseries_params,
+    results_file_format,
+)
+from gridpath.auxiliary.input_files import input_table_cache
+from gridpath.auxiliary.progressive_hedging import solve_with_progressive_hedging
+from gridpath.auxiliary.model_profile import (
+    ModelProfile,
+    profile_construction,
+    profile_module,
+    write_model_profile,
+)
+from gridpath.auxiliary.module_list import get_scenario_modules
+
+# If reusing the model structure, the last problem instance built by this
+# process, keyed by scenario directory and multi-stage flag, along with its
+# model structure, the members of its loaded sets, and the variables that
+# were fixed before calling the modules' *fix_variables* (see
+# *create_problem*)
+_REUSABLE_INSTANCES = dict()
+
+# The Pyomo versions (from inclusive, to exclusive) whose component layout
+# *relabel_instance* has been checked against; with other versions, the
+# problem instance is rebuilt instead of relabeled (see
+# *can_relabel_instance*)
+RELABEL_PYOMO_VERSIONS = ((6, 9), (6, 10))
+
+# The Pyomo APPSI solver interfaces used if a persistent solver is requested,
+# by solver name
+PERSISTENT_SOLVER_INTERFACES = {
+    "highs": "appsi_highs",
+    "appsi_highs": "appsi_highs",
+    "gurobi": "appsi_gurobi",
+    "appsi_gurobi": "appsi_gurobi",
+    "cplex": "appsi_cplex",
+    "appsi_cplex": "appsi_cplex",
+}
+
+# Persistent solver objects created by this process, keyed by the APPSI
+# interface name (see *solve_with_persistent_solver*)
+_PERSISTENT_SOLVERS = dict()
+
+# If warm-starting, the variable values of the last solution found by this
+# process, keyed by scenario directory and iteration directories (see
+# *run_optimization_for_subproblem_stage*)
+_WARM_START_SOLUTIONS = dict()
 
 
 def create_problem(
@@ -105,82 +163,228 @@ def create_problem(
     Finally, we compile the problem (see *create_problem_instance* method).
     If any variables need to be fixed, this is done as the last step here
     (see the *fix_variables* method).
+
+    If the user requests to reuse the model structure, the load and variable
+    generation profile params are declared as mutable and the problem
+    instance is kept after it is solved. If the next problem created in this
+    process has the same model structure (see *get_model_structure*), the
+    kept instance is reused: the members of its sets are relabeled with the
+    IDs of the new problem (e.g., its timepoints; see *get_relabel_map* and
+    *relabel_instance*), its mutable params are updated with the new data
+    (see *update_mutable_params*) and the variables fixed for the
+    previous problem are unfixed before calling *fix_variables* again. If
+    the structure differs, or the instance's set members would need to be
+    relabeled with a Pyomo version whose component layout hasn't been
+    checked (see *can_relabel_instance*), the problem instance is rebuilt.
     """
-    # Create pyomo abstract model class
-    model = AbstractModel()
-    dynamic_components = DynamicComponents()
+    reuse_model_structure = getattr(parsed_arguments, "reuse_model_structure", False)
+
+    # Parse input files shared across modules (e.g., projects.tab) only once
+    # while building the model
+    with input_table_cache(
+        enabled=not getattr(parsed_arguments, "no_input_table_cache", False)
+    ) as cache:
+        # Create pyomo abstract model class
+        model = AbstractModel()
+        dynamic_components = DynamicComponents()
+        setattr(dynamic_components, mutable_timeseries_params, reuse_model_structure)
+        setattr(
+            dynamic_components,
+            results_file_format,
+            getattr(parsed_arguments, "results_file_format", "csv"),
+        )
+        if getattr(parsed_arguments, "profile_model", False):
+            setattr(dynamic_components, model_profile, ModelProfile())
+        if getattr(parsed_arguments, "benders", False):
+            setattr(dynamic_components, benders_master_variables, list())
 
-    # Determine/load modules and dynamic components
-    modules_to_use, loaded_modules = set_up_gridpath_modules(
-        scenario_directory=scenario_directory, multi_stage=multi_stage
-    )
+        # Determine/load modules and dynamic components
+        modules_to_use, loaded_modules = set_up_gridpath_modules(
+            scenario_directory=scenario_directory, multi_stage=multi_stage
+        )
 
-    # Create the abstract model; some components are initialized here
-    if not parsed_arguments.quiet:
-        print("Building model...")
-    create_abstract_model(
-        model,
-        dynamic_components,
-        loaded_modules,
-        scenario_directory,
-        weather_iteration,
-        hydro_iteration,
-        availability_iteration,
-        subproblem,
-        stage,
-    )
+        # Create the abstract model; some components are initialized here
+        if not parsed_arguments.quiet:
+            print("Building model...")
+        create_abstract_model(
+            model,
+            dynamic_components,
+            loaded_modules,
+            scenario_directory,
+            weather_iteration,
+            hydro_iteration,
+            availability_iteration,
+            subproblem,
+            stage,
+        )
 
-    if parsed_arguments.report_timing:
-        report_timing()
+        if parsed_arguments.report_timing:
+            report_timing()
 
-    # Create a dual suffix component
-    # TODO: maybe this shouldn't always be needed
-    model.dual = Suffix(direction=Suffix.IMPORT)
+        # Create a dual suffix component
+        # TODO: maybe this shouldn't always be needed
+        model.dual = Suffix(direction=Suffix.IMPORT)
 
-    # Load the scenario data
-    if not parsed_arguments.quiet:
-        print("Loading data...")
-    scenario_data = load_scenario_data(
-        model,
-        dynamic_components,
-        loaded_modules,
-        scenario_directory,
-        weather_iteration,
-        hydro_iteration,
-        availability_iteration,
-        subproblem,
-        stage,
-    )
+        # Load the scenario data
+        if not parsed_arguments.quiet:
+            print("Loading data...")
+        scenario_data = load_scenario_data(
+            model,
+            dynamic_components,
+            loaded_modules,
+            scenario_directory,
+            weather_iteration,
+            hydro_iteration,
+            availability_iteration,
+            subproblem,
+            stage,
+        )
 
-    if not parsed_arguments.quiet:
-        print("Creating problem instance...")
-    instance = create_problem_instance(model, scenario_data)
+        reusable_instance = None
+        if reuse_model_structure:
+            model_structure = get_model_structure(
+                model, dynamic_components, scenario_data
+            )
+            reusable_instance = _REUSABLE_INSTANCES.get(
+                (scenario_directory, multi_stage)
+            )
+            if (
+                reusable_instance is not None
+                and reusable_instance["model_structure"] != model_structure
+            ):
+                reusable_instance = None
+            set_members = get_set_members(model, scenario_data)
+            if reusable_instance is not None:
+                data_instance = create_data_instance(model, scenario_data)
+                relabel = get_relabel_map(
+                    reusable_instance["instance"],
+                    reusable_instance["set_members"],
+                    data_instance,
+                    set_members,
+                )
+                if relabel is None or (
+                    any(old != new for old, new in relabel.items())
+                    and not can_relabel_instance(reusable_instance["instance"])
+                ):
+                    reusable_instance = None
 
-    # Fix variables if modules request so
-    instance = fix_variables(
-        instance,
-        dynamic_components,
-        scenario_directory,
-        weather_iteration,
-        hydro_iteration,
-        availability_iteration,
-        subproblem,
-        stage,
-        loaded_modules,
-    )
+        if reusable_instance is not None:
+            if not parsed_arguments.quiet:
+                print("Reusing problem instance...")
+            instance = reusable_instance["instance"]
+            relabel_instance(instance, relabel, data_instance)
+            update_mutable_params(instance, data_instance)
+            reusable_instance["set_members"] = set_members
+            for var in instance.component_data_objects(Var):
+                if var.fixed and var not in reusable_instance["fixed_variables"]:
+                    var.unfix()
+            instance.dual.clear()
+            instance.solutions.clear()
+        else:
+            if not parsed_arguments.quiet:
+                print("Creating problem instance...")
+            with profile_construction(getattr(dynamic_components, model_profile)):
+                instance = create_problem_instance(model, scenario_data)
+            if reuse_model_structure:
+                _REUSABLE_INSTANCES[(scenario_directory, multi_stage)] = {
+                    "model_structure": model_structure,
+                    "set_members": set_members,
+                    "instance": instance,
+                    "fixed_variables": ComponentSet(
+                        var for var in instance.component_data_objects(Var) if var.fixed
+                    ),
+                }
+
+        # Fix variables if modules request so
+        instance = fix_variables(
+            instance,
+            dynamic_components,
+            scenario_directory,
+            weather_iteration,
+            hydro_iteration,
+            availability_iteration,
+            subproblem,
+            stage,
+            loaded_modules,
+        )
+
+    if parsed_arguments.report_timing:
+        print(f"Input table cache: {cache.hits} hits, {cache.misses} misses")
 
     return dynamic_components, instance
 
 
-def solve_problem(parsed_arguments, instance):
+def solve_problem(parsed_arguments, instance, warm_start=False):
     # Solve
     if not parsed_arguments.quiet:
         print("Solving...")
-    results = solve(instance, parsed_arguments)
+    results = solve(instance, parsed_arguments, warm_start=warm_start)
 
     return instance, results
 
 
+def solve_problem_with_benders(
+    parsed_arguments, instance, dynamic_components, results_directory
+):
+    """
+    :param parsed_arguments: the parsed script arguments
+    :param instance: the compiled problem instance
+    :param dynamic_components: the populated dynamic components class
+    :param results_directory: the subproblem stage results directory
+    :return: the solved instance and a results object
+
+    Solve the instance with Benders decomposition (see
+    *gridpath.auxiliary.benders*), using the *solve* function for the
+    master problem and the operational subproblems. The best solution found
+    is loaded into the instance.
+    """
+    if not parsed_arguments.quiet:
+        print("Solving with Benders decomposition...")
+    termination_condition = solve_with_benders(
+        instance=instance,
+        master_variable_names=getattr(dynamic_components, benders_master_variables),
+        solve_function=solve,
+        parsed_arguments=parsed_arguments,
+        results_directory=results_directory,
+    )
+
+    return instance, Results(
+        solver_status=SolverStatus.ok, termination_condition=termination_condition
+    )
+
+
+def solve_problem_with_progressive_hedging(
+    parsed_arguments, instance, results_directory
+):
+    """
+    :param parsed_arguments: the parsed script arguments
+    :param instance: the compiled problem instance
+    :param results_directory: the subproblem stage results directory
+    :return: the solved instance and a results object
+
+    Solve the instance with progressive hedging over its future trajectories
+    (see *gridpath.auxiliary.progressive_hedging*), using the *solve*
+    function for the trajectory subproblems. The solution is loaded into the
+    instance.
+    """
+    if getattr(parsed_arguments, "benders", False):
+        raise ValueError(
+            "The --progressive_hedging and --benders options can't be combined."
+        )
+    if not parsed_arguments.quiet:
+        print("Solving with progressive hedging...")
+    termination_condition = solve_with_progressive_hedging(
+        instance=instance,
+        solve_function=solve,
+        parsed_arguments=parsed_arguments,
+        results_directory=results_directory,
+    )
+
+    return instance, Results(
+        solver_status=SolverStatus.ok, termination_condition=termination_condition
+    )
+
+
 def run_optimization_for_subproblem_stage(
     scenario_directory,
     weather_iteration_directory,
@@ -369,10 +573,81 @@ def run_optimization_for_subproblem_stage(
                 print("Problem file written to {}".format(prob_sol_files_directory))
                 sys.exit()
             else:
-                solved_instance, results = solve_problem(
-                    parsed_arguments=parsed_arguments,
-                    instance=instance,
+                # If warm-starting, seed the variable values with the last
+                # solution found in this iteration, i.e., the previous stage
+                # or the overlapping indices of the previous subproblem
+                seeded_variables = 0
+                iteration_key = (
+                    scenario_directory,
+                    weather_iteration_directory,
+                    hydro_iteration_directory,
+                    availability_iteration_directory,
                 )
+                if parsed_arguments.warm_start:
+                    seeded_variables = set_warm_start_values(
+                        instance=instance,
+                        solution=_WARM_START_SOLUTIONS.get(iteration_key, dict()),
+                    )
+
+                solve_start_time = time.perf_counter()
+                if getattr(parsed_arguments, "progressive_hedging", False):
+                    solved_instance, results = solve_problem_with_progressive_hedging(
+                        parsed_arguments=parsed_arguments,
+                        instance=instance,
+                        results_directory=os.path.join(
+                            scenario_directory,
+                            weather_iteration_directory,
+                            hydro_iteration_directory,
+                            availability_iteration_directory,
+                            subproblem_directory,
+                            stage_directory,
+                            "results",
+                        ),
+                    )
+                elif getattr(parsed_arguments, "benders", False):
+                    solved_instance, results = solve_problem_with_benders(
+                        parsed_arguments=parsed_arguments,
+                        instance=instance,
+                        dynamic_components=dynamic_components,
+                        results_directory=os.path.join(
+                            scenario_directory,
+                            weather_iteration_directory,
+                            hydro_iteration_directory,
+                            availability_iteration_directory,
+                            subproblem_directory,
+                            stage_directory,
+                            "results",
+                        ),
+                    )
+                else:
+                    solved_instance, results = solve_problem(
+                        parsed_arguments=parsed_arguments,
+                        instance=instance,
+                        warm_start=seeded_variables > 0,
+                    )
+                solve_time = time.perf_counter() - solve_start_time
+                if parsed_arguments.report_timing:
+                    print(f"Solve time: {solve_time:.2f} seconds")
+
+                if parsed_arguments.warm_start:
+                    _WARM_START_SOLUTIONS.clear()
+                    if results.solver.status == SolverStatus.ok:
+                        _WARM_START_SOLUTIONS[iteration_key] = get_solution_values(
+                            instance=solved_instance
+                        )
+                    save_warm_start_summary(
+                        results_directory=os.path.join(
+                            scenario_directory,
+                            weather_iteration_directory,
+                            hydro_iteration_directory,
+                            availability_iteration_directory,
+                            subproblem_directory,
+                            stage_directory,
+                            "results",
+                        ),
+                        seeded_variables=seeded_variables,
+                        solve_time=solve_time,
+                    )
 
         # Save the scenario results to disk
         save_results(
@@ -473,6 +748,402 @@ def run_optimization_for_subproblem_pool(pool_datum):
     )
 
 
+def initialize_persistent_worker(scenario_directory, multi_stage):
+    """
+    :param scenario_directory: the main scenario directory
+    :param multi_stage: Boolean; whether the scenario has stages
+
+    Pool initializer for persistent workers. Import and load the scenario's
+    GridPath modules once when the worker process starts; they are then
+    reused for all the jobs the worker handles (see
+    *set_up_gridpath_modules*).
+    """
+    set_up_gridpath_modules(
+        scenario_directory=scenario_directory, multi_stage=multi_stage
+    )
+
+
+def run_optimization_for_subproblem_persistent_worker(job):
+    """
+    :param job: list with the scenario directory, iteration directories,
+        subproblem directory, stage directories, multi-stage flag, and parsed
+        arguments
+    :return: the (iteration, subproblem) key, a dictionary with the stage
+        objective function values, a dictionary with the stage solve times
+        in seconds, and the worker's process ID
+
+    Job function for the persistent worker pool. Stages are solved
+    sequentially within the job as they depend on each other. The objective
+    function values are returned to the parent process rather than written
+    to a shared dictionary.
+    """
+    [
+        scenario_directory,
+        weather_iteration_directory,
+        hydro_iteration_directory,
+        availability_iteration_directory,
+        subproblem_directory,
+        stage_directories,
+        multi_stage,
+        parsed_arguments,
+    ] = job
+
+    subproblem = 1 if subproblem_directory == "" else int(subproblem_directory)
+
+    stage_objective_values = {}
+    stage_times = {}
+    for stage_directory in stage_directories:
+        stage = 1 if stage_directory == "" else int(stage_directory)
+        start_time = time.perf_counter()
+        stage_objective_values[stage] = run_optimization_for_subproblem_stage(
+            scenario_directory,
+            weather_iteration_directory,
+            hydro_iteration_directory,
+            availability_iteration_directory,
+            subproblem_directory,
+            stage_directory,
+            multi_stage,
+            parsed_arguments,
+        )
+        stage_times[stage] = time.perf_counter() - start_time
+
+    return (
+        (
+            weather_iteration_directory,
+            hydro_iteration_directory,
+            availability_iteration_directory,
+            subproblem,
+        ),
+        stage_objective_values,
+        stage_times,
+        os.getpid(),
+    )
+
+
+def solve_with_persistent_workers(
+    iteration_directory_strings,
+    subproblem_stage_directory_strings,
+    scenario_directory,
+    scenario_structure,
+    parsed_arguments,
+    n_parallel_subproblems,
+):
+    """
+    Solve independent subproblems with a pool of long-lived worker
+    processes. Each worker loads the GridPath modules once (see
+    *initialize_persistent_worker*) and then takes iteration/subproblem jobs
+    from the pool's queue until all are done. The objective function values
+    are collected in the same structure as when solving sequentially.
+    """
+    # Create dictionary with which we'll keep track of subproblem/stage
+    # objective function values; keys are added in solve order, so that the
+    # dictionary is the same regardless of the order in which jobs finish
+    objective_values = {}
+
+    jobs = []
+    for weather_iteration_str in iteration_directory_strings.keys():
+        for hydro_iteration_str in iteration_directory_strings[
+            weather_iteration_str
+        ].keys():
+            for availability_iteration_str in iteration_directory_strings[
+                weather_iteration_str
+            ][hydro_iteration_str]:
+                # We may have passed "empty_string" to avoid actual empty
+                # strings as dictionary keys; convert to actual empty
+                # strings here to pass to the directory creation methods
+                weather_iteration_str = ensure_empty_string(weather_iteration_str)
+                hydro_iteration_str = ensure_empty_string(hydro_iteration_str)
+                availability_iteration_str = ensure_empty_string(
+                    availability_iteration_str
+                )
+                for subproblem_str in subproblem_stage_directory_strings.keys():
+                    if scenario_structure.MULTI_STAGE:
+                        create_pass_through_inputs(
+                            scenario_directory,
+                            scenario_structure,
+                            subproblem_str,
+                            weather_iteration_str,
+                            hydro_iteration_str,
+                            availability_iteration_str,
+                        )
+
+                    subproblem = 1 if subproblem_str == "" else int(subproblem_str)
+                    objective_values[
+                        (
+                            weather_iteration_str,
+                            hydro_iteration_str,
+                            availability_iteration_str,
+                            subproblem,
+                        )
+                    ] = {}
+
+                    jobs.append(
+                        [
+                            scenario_directory,
+                            weather_iteration_str,
+                            hydro_iteration_str,
+                            availability_iteration_str,
+                            subproblem_str,
+                            subproblem_stage_directory_strings[subproblem_str],
+                            scenario_structure.MULTI_STAGE,
+                            parsed_arguments,
+                        ]
+                    )
+
+    # Pool must use spawn to work properly on Linux
+    pool = get_context("spawn").Pool(
+        n_parallel_subproblems,
+        initializer=initialize_persistent_worker,
+        initargs=(scenario_directory, scenario_structure.MULTI_STAGE),
+    )
+
+    start_time = time.perf_counter()
+    for (
+        subproblem_key,
+        stage_objective_values,
+        stage_times,
+        worker_id,
+    ) in pool.imap_unordered(run_optimization_for_subproblem_persistent_worker, jobs):
+        objective_values[subproblem_key] = stage_objective_values
+        if not parsed_arguments.quiet:
+            for stage in stage_times.keys():
+                print(
+                    f"--- subproblem {subproblem_key}, stage {stage}: "
+                    f"{stage_times[stage]:.2f} seconds (worker {worker_id})"
+                )
+    pool.close()
+    pool.join()
+
+    if not parsed_arguments.quiet:
+        print(
+            f"Solved {len(jobs)} subproblems with {n_parallel_subproblems} "
+            f"persistent workers in {time.perf_counter() - start_time:.2f} "
+            f"seconds."
+        )
+
+    return objective_values
+
+
+def get_subproblem_stage_dependencies(
+    iteration_directory_strings,
+    subproblem_stage_directory_strings,
+    linked_subproblems,
+):
+    """
+    :param iteration_directory_strings: the iteration directory structure
+        (see *ScenarioDirectoryStructure*)
+    :param subproblem_stage_directory_strings: the subproblem/stage directory
+        structure (see *ScenarioDirectoryStructure*)
+    :param linked_subproblems: Boolean; whether subproblems are linked
+    :return: dictionary with (weather_iteration, hydro_iteration,
+        availability_iteration, subproblem, stage) directory tuples as keys
+        and the list of the nodes each node depends on as values; keys are in
+        sequential solve order
+
+    Build the dependency graph of the scenario's
+    iteration x subproblem x stage nodes. Each stage depends on the previous
+    stage of the same subproblem. If subproblems are linked, the first stage
+    of a subproblem also depends on the last stage of the previous subproblem
+    in the same iteration. Iterations never depend on each other.
+    """
+    dependencies = {}
+    for weather_iteration_str in iteration_directory_strings.keys():
+        for hydro_iteration_str in iteration_directory_strings[
+            weather_iteration_str
+        ].keys():
+            for availability_iteration_str in iteration_directory_strings[
+                weather_iteration_str
+            ][hydro_iteration_str]:
+                iteration_node = (
+                    ensure_empty_string(weather_iteration_str),
+                    ensure_empty_string(hydro_iteration_str),
+                    ensure_empty_string(availability_iteration_str),
+                )
+                previous_node = None
+                for subproblem_str in subproblem_stage_directory_strings.keys():
+                    if not linked_subproblems:
+                        previous_node = None
+                    for stage_str in subproblem_stage_directory_strings[subproblem_str]:
+                        node = iteration_node + (subproblem_str, stage_str)
+                        dependencies[node] = (
+                            [] if previous_node is None else [previous_node]
+                        )
+                        previous_node = node
+
+    return dependencies
+
+
+def run_optimization_for_subproblem_stage_pool(pool_datum):
+    """
+    :param pool_datum: list with the scenario directory, the node (iteration,
+        subproblem, and stage directories), the multi-stage flag, and the
+        parsed arguments
+    :return: the node, the objective function value, the solve time in
+        seconds, and the worker's process ID
+
+    Helper function to pass to the pool when scheduling subproblem stages
+    based on their dependencies.
+    """
+    [scenario_directory, node, multi_stage, parsed_arguments] = pool_datum
+
+    start_time = time.perf_counter()
+    objective_value = run_optimization_for_subproblem_stage(
+        scenario_directory,
+        *node,
+        multi_stage,
+        parsed_arguments,
+    )
+
+    return node, objective_value, time.perf_counter() - start_time, os.getpid()
+
+
+def solve_with_dependency_scheduler(
+    iteration_directory_strings,
+    subproblem_stage_directory_strings,
+    scenario_directory,
+    scenario_structure,
+    parsed_arguments,
+    n_parallel_subproblems,
+):
+    """
+    Solve the scenario's subproblem stages in parallel while respecting the
+    order they depend on (see *get_subproblem_stage_dependencies*): a stage
+    is sent to the pool as soon as all the stages it depends on are solved.
+    With linked subproblems, this runs the independent iteration chains
+    concurrently while solving the subproblems and stages within each chain
+    in order.
+    """
+    linked_subproblems = os.path.exists(
+        os.path.join(scenario_directory, "linked_subproblems_map.csv")
+    )
+    dependencies = get_subproblem_stage_dependencies(
+        iteration_directory_strings=iteration_directory_strings,
+        subproblem_stage_directory_strings=subproblem_stage_directory_strings,
+        linked_subproblems=linked_subproblems,
+    )
+
+    # Reverse the dependencies to know which nodes to release when a node
+    # is solved, and count how many dependencies each node is waiting on
+    dependents = {node: [] for node in dependencies.keys()}
+    n_unsolved_dependencies = {}
+    for node in dependencies.keys():
+        n_unsolved_dependencies[node] = len(dependencies[node])
+        for dependency in dependencies[node]:
+            dependents[dependency].append(node)
+
+    # Create dictionary with which we'll keep track of subproblem/stage
+    # objective function values; write pass through input file headers
+    # before any stage is solved
+    objective_values = {}
+    for node in dependencies.keys():
+        (
+            weather_iteration_str,
+            hydro_iteration_str,
+            availability_iteration_str,
+            subproblem_str,
+            stage_str,
+        ) = node
+        subproblem = 1 if subproblem_str == "" else int(subproblem_str)
+        subproblem_key = (
+            weather_iteration_str,
+            hydro_iteration_str,
+            availability_iteration_str,
+            subproblem,
+        )
+        if subproblem_key not in objective_values.keys():
+            objective_values[subproblem_key] = {}
+            if scenario_structure.MULTI_STAGE:
+                create_pass_through_inputs(
+                    scenario_directory,
+                    scenario_structure,
+                    subproblem_str,
+                    weather_iteration_str,
+                    hydro_iteration_str,
+                    availability_iteration_str,
+                )
+
+    # Pool must use spawn to work properly on Linux; workers load the
+    # GridPath modules once
+    pool = get_context("spawn").Pool(
+        n_parallel_subproblems,
+        initializer=initialize_persistent_worker,
+        initargs=(scenario_directory, scenario_structure.MULTI_STAGE),
+    )
+
+    # The pool's result handler puts solved nodes (or exceptions) here
+    solved = Queue()
+
+    def submit(node_to_submit):
+        pool.apply_async(
+            run_optimization_for_subproblem_stage_pool,
+            (
+                [
+                    scenario_directory,
+                    node_to_submit,
+                    scenario_structure.MULTI_STAGE,
+                    parsed_arguments,
+                ],
+            ),
+            callback=solved.put,
+            error_callback=solved.put,
+        )
+
+    for node in dependencies.keys():
+        if n_unsolved_dependencies[node] == 0:
+            submit(node)
+
+    n_solved = 0
+    while n_solved < len(dependencies):
+        result = solved.get()
+        # Stop the run if a stage failed, e.g. if a linked subproblem
+        # was infeasible
+        if isinstance(result, BaseException):
+            pool.terminate()
+            raise result
+
+        node, objective_value, solve_time, worker_id = result
+        (
+            weather_iteration_str,
+            hydro_iteration_str,
+            availability_iteration_str,
+            subproblem_str,
+            stage_str,
+        ) = node
+        subproblem = 1 if subproblem_str == "" else int(subproblem_str)
+        stage = 1 if stage_str == "" else int(stage_str)
+        objective_values[
+            (
+                weather_iteration_str,
+                hydro_iteration_str,
+                availability_iteration_str,
+                subproblem,
+            )
+        ][stage] = objective_value
+        if not parsed_arguments.quiet:
+            print(
+                f"--- subproblem {node[:3] + (subproblem,)}, stage {stage}: "
+                f"{solve_time:.2f} seconds (worker {worker_id})"
+            )
+
+        n_solved += 1
+        for dependent in dependents[node]:
+            n_unsolved_dependencies[dependent] -= 1
+            if n_unsolved_dependencies[dependent] == 0:
+                submit(dependent)
+
+    pool.close()
+    pool.join()
+
+    # Sort the stage objective values, as stages of independent subproblems
+    # may finish out of order
+    for subproblem_key in objective_values.keys():
+        objective_values[subproblem_key] = dict(
+            sorted(objective_values[subproblem_key].items())
+        )
+
+    return objective_values
+
+
 def solve_sequentially(
     iteration_directory_strings,
     subproblem_stage_directory_strings,
@@ -606,12 +1277,35 @@ def run_scenario(
 
     # If parallelization is requested, proceed with some checks
     elif n_parallel_subproblems > 1:
-        # Check if the subproblems are linked, in which case
-        # we can't parallelize and throw a warning, then solve
-        # sequentially
-        if os.path.exists(
+        # Check if the subproblems are linked, in which case we can only
+        # parallelize across iterations; if there is a single iteration,
+        # throw a warning, then solve sequentially
+        linked_subproblems = os.path.exists(
             os.path.join(scenario_directory, "linked_subproblems_map.csv")
-        ):
+        )
+        n_iterations = sum(
+            len(iteration_directory_strings[w][h])
+            for w in iteration_directory_strings.keys()
+            for h in iteration_directory_strings[w].keys()
+        )
+        if linked_subproblems and n_iterations > 1:
+            # Each iteration is a chain of linked subproblems, so don't
+            # launch more processes than there are chains
+            if n_parallel_subproblems > n_iterations:
+                n_parallel_subproblems = n_iterations
+
+            objective_values = solve_with_dependency_scheduler(
+                iteration_directory_strings=iteration_directory_strings,
+                subproblem_stage_directory_strings=subproblem_stage_directory_strings,
+                scenario_directory=scenario_directory,
+                scenario_structure=scenario_structure,
+                parsed_arguments=parsed_arguments,
+                n_parallel_subproblems=n_parallel_subproblems,
+            )
+
+            return objective_values
+
+        elif linked_subproblems:
             warnings.warn(
                 "GridPath WARNING: subproblems are linked and "
                 "cannot be solved in parallel. Solving "
@@ -627,6 +1321,25 @@ def run_scenario(
 
             return objective_values
 
+        # If subproblems are independent and persistent workers are
+        # requested, send the subproblems to a pool of long-lived workers
+        # that have already loaded the GridPath modules
+        elif parsed_arguments.persistent_workers:
+            # Don't launch more processes than there are subproblems
+            if n_parallel_subproblems > scenario_structure.N_SUBPROBLEMS:
+                n_parallel_subproblems = scenario_structure.N_SUBPROBLEMS
+
+            objective_values = solve_with_persistent_workers(
+                iteration_directory_strings=iteration_directory_strings,
+                subproblem_stage_directory_strings=subproblem_stage_directory_strings,
+                scenario_directory=scenario_directory,
+                scenario_structure=scenario_structure,
+                parsed_arguments=parsed_arguments,
+                n_parallel_subproblems=n_parallel_subproblems,
+            )
+
+            return objective_values
+
         # If subproblems are independent, we create pool of subproblems
         # and solve them in parallel
         else:
@@ -782,6 +1495,7 @@ def save_results(
     Export pass through imports.
     Save objective function value.
     Save constraint duals.
+    Write the model profile if profiling.
     """
     if not parsed_arguments.quiet:
         print("Saving results...")
@@ -925,6 +1639,21 @@ def save_results(
                     "Exiting linked subproblem run.".format(subproblem, stage)
                 )
 
+    # Write the model profile to the logs directory if profiling
+    profile = getattr(dynamic_components, model_profile, None)
+    if profile is not None:
+        write_model_profile(
+            profile=profile,
+            logs_directory=create_logs_directory_if_not_exists(
+                scenario_directory,
+                weather_iteration,
+                hydro_iteration,
+                availability_iteration,
+                subproblem,
+                stage,
+            ),
+        )
+
 
 def create_abstract_model(
     model,
@@ -950,19 +1679,31 @@ def create_abstract_model(
     AbstractModel. Some modules' *add_model_components* method also require the
     dynamic component class as an argument for any dynamic components to be
     added to the model.
+
+    If profiling, the time and memory spent in each module and the number of
+    components it adds are recorded (see *gridpath.auxiliary.model_profile*).
+
+    If solving with Benders decomposition, the names of the variables added
+    by the capacity modules are recorded as the master problem variables
+    (see *gridpath.auxiliary.benders*).
     """
+    profile = getattr(dynamic_components, model_profile, None)
+    master_variables = getattr(dynamic_components, benders_master_variables, None)
     for m in loaded_modules:
         if hasattr(m, "add_model_components"):
-            m.add_model_components(
-                model,
-                dynamic_components,
-                scenario_directory,
-                weather_iteration,
-                hydro_iteration,
-                availability_iteration,
-                subproblem,
-                stage,
-            )
+            with profile_module(
+                profile, "add_model_components", m, model=model
+            ), record_master_variables(master_variables, m, model):
+                m.add_model_components(
+                    model,
+                    dynamic_components,
+                    scenario_directory,
+                    weather_iteration,
+                    hydro_iteration,
+                    availability_iteration,
+                    subproblem,
+                    stage,
+                )
 
 
 def load_scenario_data(
@@ -992,20 +1733,22 @@ def load_scenario_data(
     loaded in.
     """
     # Load data
+    profile = getattr(dynamic_components, model_profile, None)
     data_portal = DataPortal()
     for m in loaded_modules:
         if hasattr(m, "load_model_data"):
-            m.load_model_data(
-                model,
-                dynamic_components,
-                data_portal,
-                scenario_directory,
-                weather_iteration,
-                hydro_iteration,
-                availability_iteration,
-                subproblem,
-                stage,
-            )
+            with profile_module(profile, "load_model_data", m):
+                m.load_model_data(
+                    model,
+                    dynamic_components,
+                    data_portal,
+                    scenario_directory,
+                    weather_iteration,
+                    hydro_iteration,
+                    availability_iteration,
+                    subproblem,
+                    stage,
+                )
     return data_portal
 
 
@@ -1024,6 +1767,336 @@ def create_problem_instance(model, loaded_data):
     return instance
 
 
+def get_model_structure(model, dynamic_components, loaded_data):
+    """
+    :param model: the AbstractModel Pyomo object with components added
+    :param dynamic_components: the populated dynamic component class
+    :param loaded_data: the DataPortal object with the data loaded in and
+        linked to the relevant model components
+    :return: dictionary describing the model structure
+
+    The problem instance is determined by the dynamic components and the
+    data loaded into the model components. The set members (e.g., the
+    timepoint IDs) can be relabeled in an existing instance, so they are
+    replaced by their position in the loaded set data (see
+    *get_set_members*); only the sizes and shapes of the sets and the order
+    of their members are part of the model structure. Similarly, the values
+    of the mutable params can be updated in an existing instance, so only
+    their indices and the sign of their values (which determines the form of
+    some constraints) are part of the model structure.
+    """
+    mutable_params = [
+        param.name for param in model.component_objects(Param) if param.mutable
+    ]
+    set_data = get_set_data(model, loaded_data)
+    positions = {
+        member: _SetMember(position)
+        for position, member in enumerate(get_set_members(model, loaded_data))
+    }
+
+    def to_position(data_value):
+        if isinstance(data_value, tuple):
+            return tuple(to_position(atom) for atom in data_value)
+        try:
+            return positions.get(data_value, data_value)
+        except TypeError:
+            return data_value
+
+    # The dataframes in the dynamic components (used to export results) are
+    # derived from the loaded data
+    model_structure = {
+        "dynamic_components": {
+            name: component
+            for name, component in vars(dynamic_components).items()
+            if not isinstance(component, pd.DataFrame)
+        }
+    }
+    for component_name, component_data in loaded_data.data().items():
+        if component_name in set_data.keys():
+            model_structure[component_name] = {
+                to_position(index): (
+                    [to_position(member) for member in members],
+                    _get_sort_order(members),
+                )
+                for index, members in set_data[component_name].items()
+            }
+        elif component_name in mutable_params:
+            model_structure[component_name] = {
+                to_position(index): data_value >= 0
+                for index, data_value in component_data.items()
+            }
+        elif isinstance(component_data, dict):
+            model_structure[component_name] = {
+                to_position(index): to_position(_to_comparable(data_value))
+                for index, data_value in component_data.items()
+            }
+        else:
+            model_structure[component_name] = _to_comparable(component_data)
+
+    return model_structure
+
+
+def get_set_data(model, loaded_data):
+    """
+    :param model: the AbstractModel Pyomo object with components added
+    :param loaded_data: the DataPortal object with the data loaded in and
+        linked to the relevant model components
+    :return: dictionary of the members of the loaded sets by set name and
+        set index (None for sets that aren't indexed)
+    """
+    return {
+        component_name: (
+            component_data
+            if isinstance(component_data, dict)
+            else {None: component_data}
+        )
+        for component_name, component_data in loaded_data.data().items()
+        if isinstance(model.component(component_name), Set)
+    }
+
+
+def get_set_members(model, loaded_data):
+    """
+    :param model: the AbstractModel Pyomo object with components added
+    :param loaded_data: the DataPortal object with the data loaded in and
+        linked to the relevant model components
+    :return: list of the distinct set members (e.g., project names or
+        timepoint IDs) in the order they first appear in the loaded set data
+    """
+    set_members = dict()
+    for members_by_index in get_set_data(model, loaded_data).values():
+        for members in members_by_index.values():
+            for member in members:
+                for atom in member if isinstance(member, tuple) else (member,):
+                    set_members.setdefault(atom, None)
+
+    return list(set_members.keys())
+
+
+class _SetMember(object):
+    """
+    The position of a set member in the model structure (see
+    *get_model_structure*); unlike an integer, it can't be equal to a param
+    value.
+    """
+
+    def __init__(self, position):
+        self.position = position
+
+    def __eq__(self, other):
+        return isinstance(other, _SetMember) and self.position == other.position
+
+    def __hash__(self):
+        return hash(self.position)
+
+
+def _get_sort_order(members):
+    """
+    The positions of the set members in sorted order, so that reused
+    instances are only relabeled with IDs in the same order; None if the
+    members can't be sorted.
+    """
+    try:
+        return sorted(range(len(members)), key=list(members).__getitem__)
+    except TypeError:
+        return None
+
+
+def _to_comparable(data_value):
+    """
+    Some modules load data as numpy arrays; convert them to lists, so that
+    the model structures can be compared.
+    """
+    return data_value.tolist() if hasattr(data_value, "tolist") else data_value
+
+
+def create_data_instance(model, loaded_data):
+    """
+    :param model: the AbstractModel Pyomo object with components added
+    :param loaded_data: the DataPortal object with the data loaded in and
+        linked to the relevant model components
+    :return: an instance with only the sets and params of the model
+
+    Construct the model's sets and params from the loaded data, including
+    the ones initialized by rules or left to their defaults, without
+    building the variables and constraints.
+    """
+    data_model = model.clone()
+    for component in list(data_model.component_objects(descend_into=False)):
+        if component.ctype not in [Set, RangeSet, Param]:
+            data_model.del_component(component)
+
+    return data_model.create_instance(loaded_data)
+
+
+def get_relabel_map(instance, set_members, data_instance, new_set_members):
+    """
+    :param instance: the compiled problem instance to reuse
+    :param set_members: the set members of the instance's loaded data (see
+        *get_set_members*)
+    :param data_instance: the sets and params of the new problem (see
+        *create_data_instance*)
+    :param new_set_members: the set members of the new problem's loaded data
+    :return: dictionary mapping the set members of the instance to the set
+        members of the new problem or None if the instance can't be reused
+
+    The set members of the instance are matched by position to the set
+    members of the new problem. The instance can be reused only if, with
+    its set members relabeled, all of its sets, including the ones derived
+    from other sets, have the same members as the new problem's, and each
+    immutable param value is the same or, for indexed params whose values
+    are set members (e.g., the previous timepoint), the value's match.
+    """
+    if len(set_members) != len(new_set_members):
+        return None
+    relabel = dict(zip(set_members, new_set_members))
+
+    for new_set in data_instance.component_objects([Set, RangeSet], descend_into=True):
+        old_set = instance.find_component(new_set.name)
+        if old_set is None or len(old_set) != len(new_set):
+            return None
+        for old_index, old_members in old_set.items():
+            new_index = _relabel(old_index, relabel)
+            if new_index not in new_set.keys():
+                return None
+            new_members = set(new_set[new_index])
+            if len(old_members) != len(new_members) or new_members != {
+                _relabel(member, relabel) for member in old_members
+            }:
+                return None
+
+    for new_param in data_instance.component_objects(Param, descend_into=True):
+        old_param = instance.find_component(new_param.name)
+        if old_param is None or len(old_param) != len(new_param):
+            return None
+        if old_param.mutable:
+            continue
+        for old_index in old_param.keys():
+            try:
+                old_value = value(old_param[old_index])
+                new_value = value(new_param[_relabel(old_index, relabel)])
+                if new_value != old_value and (
+                    not old_param.is_indexed()
+                    or new_value != relabel.get(old_value, old_value)
+                ):
+                    return None
+            except (KeyError, TypeError, ValueError):
+                return None
+
+    return relabel
+
+
+def _relabel(index, relabel):
+    if isinstance(index, tuple):
+        return tuple(relabel.get(atom, atom) for atom in index)
+    return relabel.get(index, index)
+
+
+def can_relabel_instance(instance):
+    """
+    :param instance: the compiled problem instance
+    :return: boolean, whether the instance's set members can be relabeled
+        (see *relabel_instance*)
+
+    Pyomo has no public interface for changing the indices of a constructed
+    component, so *relabel_instance* relies on Pyomo's private component
+    layout: each indexed component keeps its component data objects (or,
+    for immutable params, their values) in a *_data* dictionary by index,
+    and each component data object keeps its index in its *_index*
+    attribute. This is only relied on with the Pyomo versions it has been
+    checked against (see *RELABEL_PYOMO_VERSIONS*) and if the instance's
+    components have that layout.
+    """
+    from_version, to_version = RELABEL_PYOMO_VERSIONS
+    if not from_version <= tuple(pyomo_version_info[:2]) < to_version:
+        return False
+
+    for component in instance.component_objects(descend_into=True):
+        if not component.is_indexed():
+            continue
+        component_data_by_index = getattr(component, "_data", None)
+        if not isinstance(component_data_by_index, dict):
+            return False
+        for index, component_data in component_data_by_index.items():
+            if getattr(component_data, "_index", index) != index:
+                return False
+            break
+
+    return True
+
+
+def relabel_instance(instance, relabel, data_instance):
+    """
+    :param instance: the compiled problem instance
+    :param relabel: dictionary mapping the instance's set members to new set
+        members (see *get_relabel_map*)
+    :param data_instance: the sets and params constructed from the new
+        problem's data (see *create_data_instance*)
+
+    Replace the members of the instance's sets and the indices of its
+    components with their new labels. The component data objects are kept,
+    so the constraints and expressions built from them remain the same.
+    The immutable params can only differ in the set members they hold (see
+    *get_relabel_map*); their values aren't part of the constraints, so
+    they are replaced with the new problem's. This relies on Pyomo's
+    private component layout and must only be called if
+    *can_relabel_instance* is True.
+    """
+    relabel = {old: new for old, new in relabel.items() if old != new}
+    if not relabel:
+        return
+
+    def relabel_members(set_data):
+        members = [_relabel(member, relabel) for member in set_data]
+        if members != list(set_data):
+            set_data.clear()
+            set_data.update(members)
+
+    for component in instance.component_objects(descend_into=True):
+        if component.is_indexed():
+            if component.ctype is Param and not component.mutable:
+                data_param = data_instance.find_component(component.name)
+                component._data = {
+                    _relabel(index, relabel): value(
+                        data_param[_relabel(index, relabel)]
+                    )
+                    for index in component._data.keys()
+                }
+                continue
+            component._data = {
+                _relabel(index, relabel): component_data
+                for index, component_data in component._data.items()
+            }
+            for index, component_data in component._data.items():
+                if hasattr(component_data, "_index"):
+                    component_data._index = index
+            if component.ctype is Set:
+                for set_data in component.values():
+                    relabel_members(set_data)
+        elif component.ctype is Set:
+            relabel_members(component)
+
+
+def update_mutable_params(instance, data_instance):
+    """
+    :param instance: the compiled problem instance
+    :param data_instance: the sets and params constructed from the new
+        problem's data (see *create_data_instance*)
+
+    Set the values of the instance's mutable params (e.g., the load and
+    variable generation profiles; see *mutable_timeseries_params*) in place
+    to the values constructed from the new data, including the values of
+    the params derived from other params via their initialization or
+    default rules.
+    """
+    for param in instance.component_objects(Param, descend_into=True):
+        if param.mutable:
+            data_param = data_instance.find_component(param.name)
+            param.store_values(
+                {index: value(data_param[index]) for index in param.keys()}
+            )
+
+
 def fix_variables(
     instance,
     dynamic_components,
@@ -1077,10 +2150,12 @@ def view_loaded_data(loaded_modules, instance):
             m.view_loaded_data(instance)
 
 
-def solve(instance, parsed_arguments):
+def solve(instance, parsed_arguments, warm_start=False):
     """
     :param instance: the compiled problem instance
     :param parsed_arguments: the user-defined arguments (parsed)
+    :param warm_start: Boolean; whether to pass the current variable values
+        to the solver as a starting point (if the solver accepts one)
     :return: the problem results
 
     Send the compiled problem instance to the solver and solve.
@@ -1131,6 +2206,16 @@ def solve(instance, parsed_arguments):
         if parsed_arguments.solver is None:
             solver_name = "cbc"
 
+    # If requested, solve with a persistent solver object kept across
+    # subproblems and stages
+    if getattr(parsed_arguments, "persistent_solver", False):
+        return solve_with_persistent_solver(
+            instance=instance,
+            solver_name=solver_name,
+            solver_options=solver_options,
+            parsed_arguments=parsed_arguments,
+        )
+
     # Get solver
     # If a solver executable is specified, pass it to Pyomo
     if parsed_arguments.solver_executable is not None:
@@ -1188,11 +2273,19 @@ def solve(instance, parsed_arguments):
         for opt in solver_options.keys():
             optimizer.options[opt] = solver_options[opt]
 
+        # Only pass the warm start argument to solvers that accept it
+        warm_start_kwargs = (
+            {"warmstart": True}
+            if warm_start and optimizer.warm_start_capable()
+            else dict()
+        )
+
         results = optimizer.solve(
             instance,
             tee=not parsed_arguments.mute_solver_output,
             keepfiles=parsed_arguments.keepfiles,
             symbolic_solver_labels=parsed_arguments.symbolic,
+            **warm_start_kwargs,
         )
 
     # Can optionally log infeasibilities but this has resulted in false
@@ -1203,6 +2296,131 @@ def solve(instance, parsed_arguments):
     return results
 
 
+def solve_with_persistent_solver(
+    instance, solver_name, solver_options, parsed_arguments
+):
+    """
+    :param instance: the compiled problem instance
+    :param solver_name: str, the name of the solver
+    :param solver_options: dictionary of the solver options
+    :param parsed_arguments: the user-defined arguments (parsed)
+    :return: the problem results
+
+    Solve with one of Pyomo's APPSI solver interfaces (see
+    PERSISTENT_SOLVER_INTERFACES). The solver object is created once per
+    process and kept for all subproblems and stages. A new problem instance
+    is loaded into the solver in memory (the APPSI CPLEX interface still
+    writes an LP file); if the same instance is solved again (see the
+    --reuse_model_structure option), only what changed since the previous
+    solve, e.g., the mutable param values and the variables fixed by
+    *fix_variables*, is passed to the solver as an incremental update.
+
+    The solution is loaded into the instance only if one was found and the
+    legacy Pyomo results object is returned, so results are handled the
+    same way as with the default *SolverFactory* interface.
+    """
+    if solver_name not in PERSISTENT_SOLVER_INTERFACES.keys():
+        raise ValueError(
+            f"No persistent solver interface available for solver "
+            f"'{solver_name}'. Options are: "
+            f"{list(PERSISTENT_SOLVER_INTERFACES.keys())}."
+        )
+    if parsed_arguments.solver_executable is not None:
+        warnings.warn(
+            "The solver executable is ignored when using a persistent solver."
+        )
+
+    interface_name = PERSISTENT_SOLVER_INTERFACES[solver_name]
+    if interface_name not in _PERSISTENT_SOLVERS.keys():
+        optimizer = SolverFactory(interface_name)
+        if not optimizer.available():
+            raise RuntimeError(
+                f"The persistent solver interface '{interface_name}' is not "
+                f"available. Check that the solver's Python package is "
+                f"installed."
+            )
+        _PERSISTENT_SOLVERS[interface_name] = optimizer
+    optimizer = _PERSISTENT_SOLVERS[interface_name]
+
+    for opt in solver_options.keys():
+        optimizer.options[opt] = solver_options[opt]
+
+    results = optimizer.solve(
+        instance,
+        tee=not parsed_arguments.mute_solver_output,
+        load_solutions=False,
+        keepfiles=parsed_arguments.keepfiles,
+        symbolic_solver_labels=parsed_arguments.symbolic,
+    )
+    if len(results.solution) > 0:
+        instance.solutions.load_from(results)
+
+    return results
+
+
+def get_solution_values(instance):
+    """
+    :param instance: the solved problem instance
+    :return: dictionary of the variable values by variable name and index
+    """
+    return {
+        var.name: {
+            index: var_data.value
+            for index, var_data in var.items()
+            if var_data.value is not None
+        }
+        for var in instance.component_objects(Var)
+    }
+
+
+def set_warm_start_values(instance, solution):
+    """
+    :param instance: the compiled problem instance
+    :param solution: dictionary of the variable values by variable name and
+        index (see *get_solution_values*)
+    :return: the number of variables that were given a value
+
+    Set the values of the instance variables that are not fixed to their
+    value in a previous solution where the variable and index exist in both
+    (e.g., the same timepoint in the previous stage, or the capacity and
+    overlapping timepoints of the previous subproblem). The values of
+    integer variables are rounded.
+    """
+    seeded_variables = 0
+    for var in instance.component_objects(Var):
+        if var.name not in solution.keys():
+            continue
+        var_solution = solution[var.name]
+        for index, var_data in var.items():
+            if var_data.fixed or index not in var_solution.keys():
+                continue
+            var_value = var_solution[index]
+            if var_data.is_integer():
+                var_value = round(var_value)
+            var_data.set_value(var_value, skip_validation=True)
+            seeded_variables += 1
+
+    return seeded_variables
+
+
+def save_warm_start_summary(results_directory, seeded_variables, solve_time):
+    """
+    :param results_directory: the subproblem stage results directory
+    :param seeded_variables: int, the number of variables given a starting
+        value
+    :param solve_time: float, the solve time in seconds
+
+    Record whether the solver was given a starting point and the solve time
+    (in warm_start.csv) to compare against cold-started solves.
+    """
+    if not os.path.exists(results_directory):
+        os.makedirs(results_directory)
+    with open(os.path.join(results_directory, "warm_start.csv"), "w", newline="") as f:
+        _writer = writer(f, delimiter=",")
+        _writer.writerow(["warm_started", "seeded_variables", "solve_time_seconds"])
+        _writer.writerow([int(seeded_variables > 0), seeded_variables, solve_time])
+
+
 def export_results(
     scenario_directory,
     weather_iteration,
@@ -1235,21 +2453,23 @@ def export_results(
             scenario_directory=scenario_directory, multi_stage=multi_stage
         )
 
+        profile = getattr(dynamic_components, model_profile, None)
         n = 0
         for m in loaded_modules:
             if hasattr(m, "export_results"):
                 if verbose:
                     print(f"... {modules_to_use[n]}")
-                m.export_results(
-                    scenario_directory,
-                    weather_iteration,
-                    hydro_iteration,
-                    availability_iteration,
-                    subproblem,
-                    stage,
-                    instance,
-                    dynamic_components,
-                )
+                with profile_module(profile, "export_results", m):
+                    m.export_results(
+                        scenario_directory,
+                        weather_iteration,
+                        hydro_iteration,
+                        availability_iteration,
+                        subproblem,
+                        stage,
+                        instance,
+                        dynamic_components,
+                    )
 
             n += 1
 
@@ -1416,43 +2636,39 @@ def save_duals(
 
     instance.constraint_indices = {}
 
+    profile = getattr(dynamic_components, model_profile, None)
     n = 0
     for m in loaded_modules:
         if verbose:
             print(f"... {modules_to_use[n]}")
         if hasattr(m, "save_duals"):
-            m.save_duals(
-                scenario_directory,
-                weather_iteration,
-                hydro_iteration,
-                availability_iteration,
-                subproblem,
-                stage,
-                instance,
-                dynamic_components,
-            )
+            with profile_module(profile, "save_duals", m):
+                m.save_duals(
+                    scenario_directory,
+                    weather_iteration,
+                    hydro_iteration,
+                    availability_iteration,
+                    subproblem,
+                    stage,
+                    instance,
+                    dynamic_components,
+                )
         n += 1
 
 
 def set_up_gridpath_modules(scenario_directory, multi_stage):
     """
-    :return: list of the names of the modules the scenario uses, list of the
-        loaded modules, and the populated dynamic components for the scenario
+    :return: list of the names of the modules the scenario uses and list of
+        the loaded modules
 
-    Set up the modules and dynamic components for a scenario run problem
-    instance.
+    Set up the modules for a scenario run problem instance. The modules are
+    determined and loaded once per process and the same loaded modules are
+    used for the model build, results export, duals, etc. (see
+    *get_scenario_modules* in *gridpath.auxiliary.module_list*).
     """
-    # Determine and load modules
-    modules_to_use = determine_modules(
+    return get_scenario_modules(
         scenario_directory=scenario_directory, multi_stage=multi_stage
     )
-    loaded_modules = load_modules(modules_to_use)
-    # Determine the dynamic components based on the needed modules and input
-    # data
-    # populate_dynamic_inputs(dynamic_components, loaded_modules,
-    #                         scenario_directory, subproblem, stage)
-
-    return modules_to_use, loaded_modules
 
 
 # Parse run options
@@ -47,8 +47,8 @@ def add_model_components(
         """
         return sum(
             mod.Bulk_Power_Provision_MW[prj, tmp]
-            for prj in mod.OPR_PRJS_IN_TMP[tmp]
-            if mod.load_zone[prj] == z and mod.load_modifier_flag[prj] == 1
+            for prj in mod.OPR_PRJS_IN_LZ_TMP[z, tmp]
+            if mod.load_modifier_flag[prj] == 1
         )
 
     m.Load_Modifier_Power_Production_in_Zone_MW = Expression(
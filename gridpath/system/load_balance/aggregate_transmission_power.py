@@ -15,7 +15,10 @@
 """
 This module aggregates the net power flow in/out of a load zone on all
 transmission lines connected to the load zone to create a load-balance
-production component, and adds it to the load-balance constraint.
+production component, and adds it to the load-balance constraint. For lines
+of the *tx_ptdf* operational type, the zone's net injection into the PTDF
+network is used instead of the flows on the individual lines, as the line
+flows are sums over all zones in the network.
 """
 
 from pyomo.environ import Expression, value
@@ -52,11 +55,12 @@ def add_model_components(
         minus any losses incurred. Tx_Losses_LZ_To_MW is positive when
         Transmit_Power_MW is positive (losses are accounted for when the
         transmission flow is to the destination load zone) and 0 otherwise.
+        The tx_ptdf lines are accounted for in the exports (see below).
         """
         return sum(
             (mod.Transmit_Power_MW[tx, tmp] - mod.Tx_Losses_LZ_To_MW[tx, tmp])
             for tx in mod.TX_LINES_OPR_IN_TMP[tmp]
-            if mod.load_zone_to[tx] == z
+            if mod.load_zone_to[tx] == z and not is_ptdf_line(mod, tx)
         )
 
     m.Transmission_to_Zone_MW = Expression(
@@ -70,11 +74,19 @@ def add_model_components(
         minus any losses incurred. Tx_Losses_LZ_From_MW is positive when
         Transmit_Power_MW is negative (losses are accounted for when the
         transmission flow is to the origin load zone) and 0 otherwise.
+
+        The net exports on the tx_ptdf lines are the zone's net injection
+        into the PTDF network (the tx_ptdf lines have no losses).
         """
         return sum(
             (mod.Transmit_Power_MW[tx, tmp] + mod.Tx_Losses_LZ_From_MW[tx, tmp])
             for tx in mod.TX_LINES_OPR_IN_TMP[tmp]
-            if mod.load_zone_from[tx] == z
+            if mod.load_zone_from[tx] == z and not is_ptdf_line(mod, tx)
+        ) + (
+            mod.TxPtdf_Net_Injection_MW[z, tmp]
+            if hasattr(mod, "TX_PTDF_ZONES_OPR_TMPS")
+            and (z, tmp) in mod.TX_PTDF_ZONES_OPR_TMPS
+            else 0
         )
 
     m.Transmission_from_Zone_MW = Expression(
@@ -84,6 +96,14 @@ def add_model_components(
     record_dynamic_components(dynamic_components=d)
 
 
+def is_ptdf_line(mod, tx):
+    """
+    :return: boolean; whether the line is of the tx_ptdf operational type,
+        whose flows enter the load balance via the zone net injections
+    """
+    return hasattr(mod, "TX_PTDF") and tx in mod.TX_PTDF
+
+
 def record_dynamic_components(dynamic_components):
     """
     :param dynamic_components:
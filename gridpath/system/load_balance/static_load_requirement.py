@@ -22,7 +22,11 @@ import os.path
 from pyomo.environ import Set, Param, Any, NonNegativeReals, Expression, value
 
 from gridpath.auxiliary.db_interface import directories_to_db_values
-from gridpath.auxiliary.dynamic_components import load_balance_consumption_components
+from gridpath.auxiliary.dynamic_components import (
+    load_balance_consumption_components,
+    mutable_timeseries_params,
+)
+from gridpath.auxiliary.input_files import load_input_file
 from gridpath.common_functions import create_results_df
 from gridpath.project.operations.operational_types.common_functions import (
     write_tab_file_model_inputs,
@@ -166,6 +170,7 @@ def add_model_components(
     m.component_static_load_mw_w_tmp_value = Param(
         m.LOAD_ZONE_TMP_LOAD_CMPNTS_W_DEFINED_LOAD,
         within=NonNegativeReals,
+        mutable=getattr(d, mutable_timeseries_params),
     )
 
     def set_default_and_warn_about_undefined_loads(mod, lz, tmp, cmp):
@@ -177,7 +182,7 @@ def add_model_components(
                     Please check your inputs and select either one or the other.
                 """)
             else:
-                return mod.component_static_load_mw_w_tmp_value[lz, tmp, cmp]
+                return value(mod.component_static_load_mw_w_tmp_value[lz, tmp, cmp])
         else:
             check_for_value_and_raise_value_error(
                 param=mod.load_level_default[lz, cmp],
@@ -199,6 +204,7 @@ def add_model_components(
         default=lambda mod, lz, tmp, cmp: set_default_and_warn_about_undefined_loads(
             mod, lz, tmp, cmp
         ),
+        mutable=getattr(d, mutable_timeseries_params),
     )
 
     def total_static_load_from_components_init(mod):
@@ -209,7 +215,7 @@ def add_model_components(
             component,
         ) in mod.LOAD_ZONE_TMP_LOAD_CMPNTS_ALL:
             if (
-                mod.component_static_load_mw[load_zone, timepoint, component]
+                value(mod.component_static_load_mw[load_zone, timepoint, component])
                 == "undefined"
             ):
                 raise ValueError(f"""
@@ -268,8 +274,9 @@ def load_model_data(
     :param stage:
     :return:
     """
-    data_portal.load(
-        filename=os.path.join(
+    load_input_file(
+        data_portal=data_portal,
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -277,8 +284,8 @@ def load_model_data(
             subproblem,
             stage,
             "inputs",
-            "load_mw.tab",
         ),
+        filename="load_mw.tab",
         index=m.LOAD_ZONE_TMP_LOAD_CMPNTS_W_DEFINED_LOAD,
         param=m.component_static_load_mw_w_tmp_value,
     )
@@ -37,6 +37,8 @@ from gridpath.auxiliary.db_interface import (
 from gridpath.common_functions import create_results_df
 from gridpath.system.load_balance import LOAD_ZONE_TMP_DF
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
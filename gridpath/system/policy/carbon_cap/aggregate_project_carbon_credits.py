@@ -26,6 +26,8 @@ from gridpath.auxiliary.dynamic_components import carbon_cap_balance_credit_comp
 from gridpath.common_functions import create_results_df
 from gridpath.system.policy.carbon_cap import CARBON_CAP_ZONE_PRD_DF
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -20,10 +20,12 @@ period level.
 import csv
 import os.path
 from pyomo.environ import Param, Set, Expression
-import pandas as pd
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.db_interface import directories_to_db_values
 from gridpath.auxiliary.dynamic_components import fuel_burn_balance_components
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -151,7 +153,7 @@ def load_model_data(
     project_list = list()
     fuel_list = list()
 
-    _df = pd.read_csv(
+    _df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -162,7 +164,6 @@ def load_model_data(
             "inputs",
             "project_and_fuels_fuel_burn_limit_bas.tab",
         ),
-        sep="\t",
         usecols=[
             "project",
             "fuel",
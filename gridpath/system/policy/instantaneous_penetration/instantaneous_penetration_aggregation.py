@@ -15,6 +15,8 @@
 
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import subsets_init_by_param_value_and_tmp
+
 
 def add_model_components(
     m,
@@ -37,6 +39,18 @@ def add_model_components(
         m.TMPS, initialize=lambda mod, tmp: mod.INST_PEN_PRJS & mod.OPR_PRJS_IN_TMP[tmp]
     )
 
+    m.INST_PEN_PRJ_OPERATIONAL_IN_ZONE_TIMEPOINT = Set(
+        m.INSTANTANEOUS_PENETRATION_ZONES,
+        m.TMPS,
+        within=m.INST_PEN_PRJS,
+        initialize=lambda mod: subsets_init_by_param_value_and_tmp(
+            mod=mod,
+            set_by_tmp="INST_PEN_PRJ_OPERATIONAL_IN_TIMEPOINT",
+            param_name="instantaneous_penetration_zone",
+            param_value_set="INSTANTANEOUS_PENETRATION_ZONES",
+        ),
+    )
+
     # instantaneous penetration provision
     def total_instantaneous_penetration_rule(mod, z, tmp):
         """
@@ -48,8 +62,7 @@ def add_model_components(
         """
         return sum(
             mod.Bulk_Power_Provision_MW[g, tmp]
-            for g in mod.INST_PEN_PRJ_OPERATIONAL_IN_TIMEPOINT[tmp]
-            if mod.instantaneous_penetration_zone[g] == z
+            for g in mod.INST_PEN_PRJ_OPERATIONAL_IN_ZONE_TIMEPOINT[z, tmp]
         )
 
     m.Total_Instantaneous_Penetration_Energy_MWh = Expression(
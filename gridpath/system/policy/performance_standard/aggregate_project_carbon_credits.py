@@ -28,6 +28,8 @@ from gridpath.auxiliary.dynamic_components import (
 from gridpath.common_functions import create_results_df
 from gridpath.system.policy.performance_standard import PERFORMANCE_STANDARD_Z_PRD_DF
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -15,6 +15,7 @@
 
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import subsets_init_by_param_value_and_tmp
 from .reserve_aggregation import generic_add_model_components
 
 
@@ -51,14 +52,25 @@ def add_model_components(
         & mod.OPR_PRJS_IN_TMP[tmp],
     )
 
+    m.FREQUENCY_RESPONSE_PARTIAL_PROJECTS_OPERATIONAL_IN_BA_TIMEPOINT = Set(
+        m.FREQUENCY_RESPONSE_BAS,
+        m.TMPS,
+        within=m.FREQUENCY_RESPONSE_PARTIAL_PROJECTS,
+        initialize=lambda mod: subsets_init_by_param_value_and_tmp(
+            mod=mod,
+            set_by_tmp="FREQUENCY_RESPONSE_PARTIAL_PROJECTS_OPERATIONAL_IN_TIMEPOINT",
+            param_name="frequency_response_ba",
+            param_value_set="FREQUENCY_RESPONSE_BAS",
+        ),
+    )
+
     # Reserve provision
     def total_partial_frequency_response_rule(mod, ba, tmp):
         return sum(
             mod.Provide_Frequency_Response_MW[g, tmp]
-            for g in mod.FREQUENCY_RESPONSE_PARTIAL_PROJECTS_OPERATIONAL_IN_TIMEPOINT[
-                tmp
+            for g in mod.FREQUENCY_RESPONSE_PARTIAL_PROJECTS_OPERATIONAL_IN_BA_TIMEPOINT[
+                ba, tmp
             ]
-            if mod.frequency_response_ba[g] == ba
         )
 
     m.Total_Partial_Frequency_Response_Provision_MW = Expression(
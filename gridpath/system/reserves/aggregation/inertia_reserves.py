@@ -15,6 +15,8 @@
 
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import subsets_init_by_param_value_and_tmp
+
 
 def add_model_components(
     m,
@@ -51,12 +53,25 @@ def add_model_components(
         & mod.OPR_PRJS_IN_TMP[tmp],
     )
 
+    m.INERTIA_RESERVES_PROJECTS_OPERATIONAL_IN_ZONE_TIMEPOINT = Set(
+        m.INERTIA_RESERVES_ZONES,
+        m.TMPS,
+        within=m.INERTIA_RESERVES_PROJECTS,
+        initialize=lambda mod: subsets_init_by_param_value_and_tmp(
+            mod=mod,
+            set_by_tmp="INERTIA_RESERVES_PROJECTS_OPERATIONAL_IN_TIMEPOINT",
+            param_name="inertia_reserves_zone",
+            param_value_set="INERTIA_RESERVES_ZONES",
+        ),
+    )
+
     # Reserve provision
     def total_reserve_rule(mod, ba, tmp):
         return sum(
             mod.Provide_Inertia_Reserves_MWs[g, tmp]
-            for g in mod.INERTIA_RESERVES_PROJECTS_OPERATIONAL_IN_TIMEPOINT[tmp]
-            if mod.inertia_reserves_zone[g] == ba
+            for g in mod.INERTIA_RESERVES_PROJECTS_OPERATIONAL_IN_ZONE_TIMEPOINT[
+                ba, tmp
+            ]
         )
 
     m.Total_Inertia_Reserves_Provision_MWs = Expression(
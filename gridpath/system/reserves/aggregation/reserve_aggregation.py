@@ -15,6 +15,8 @@
 
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import subsets_init_by_param_value_and_tmp
+
 
 def generic_add_model_components(
     m,
@@ -53,12 +55,29 @@ def generic_add_model_components(
         ),
     )
 
+    # Reserve generators operational in each balancing area and timepoint
+    op_ba_set = str(reserve_generator_set) + "_OPERATIONAL_IN_BA_TIMEPOINT"
+    setattr(
+        m,
+        op_ba_set,
+        Set(
+            getattr(m, reserve_zone_set),
+            m.TMPS,
+            within=getattr(m, reserve_generator_set),
+            initialize=lambda mod: subsets_init_by_param_value_and_tmp(
+                mod=mod,
+                set_by_tmp=op_set,
+                param_name=reserve_zone_param,
+                param_value_set=reserve_zone_set,
+            ),
+        ),
+    )
+
     # Reserve provision
     def total_reserve_rule(mod, ba, tmp):
         return sum(
             getattr(mod, generator_reserve_provision_variable)[g, tmp]
-            for g in getattr(mod, op_set)[tmp]
-            if getattr(mod, reserve_zone_param)[g] == ba
+            for g in getattr(mod, op_ba_set)[ba, tmp]
         )
 
     setattr(
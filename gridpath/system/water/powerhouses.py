@@ -38,6 +38,8 @@ from gridpath.project.operations.operational_types.common_functions import (
     get_optype_inputs_as_df,
 )
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -316,10 +316,21 @@ def add_model_components(
     # Required Params
     ###########################################################################
 
-    def horizon_init(mod, tmp, bt):
-        for h in mod.HRZS_BY_BLN_TYPE[bt]:
-            if tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]:
-                return h
+    def horizon_init(mod):
+        """
+        Find each timepoint's horizon in a single pass over the horizons of
+        each balancing type (the first horizon wins if a timepoint is in
+        more than one); timepoints not in any horizon of a balancing type
+        get None.
+        """
+        horizons = {(tmp, bt): None for tmp in mod.TMPS for bt in mod.BLN_TYPES}
+        for bt in mod.BLN_TYPES:
+            for h in mod.HRZS_BY_BLN_TYPE[bt]:
+                for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]:
+                    if (tmp, bt) in horizons and horizons[tmp, bt] is None:
+                        horizons[tmp, bt] = h
+
+        return horizons
 
     m.horizon = Param(
         m.TMPS,
@@ -362,7 +373,7 @@ def add_model_components(
     ###########################################################################
 
     def first_hrz_tmp_init(mod, b, h):
-        return list(mod.TMPS_BY_BLN_TYPE_HRZ[b, h])[0]
+        return mod.TMPS_BY_BLN_TYPE_HRZ[b, h].first()
 
     m.first_hrz_tmp = Param(
         m.BLN_TYPE_HRZS,
@@ -371,7 +382,7 @@ def add_model_components(
     )
 
     def last_hrz_tmp_init(mod, b, h):
-        return list(mod.TMPS_BY_BLN_TYPE_HRZ[b, h])[-1]
+        return mod.TMPS_BY_BLN_TYPE_HRZ[b, h].last()
 
     m.last_hrz_tmp = Param(
         m.BLN_TYPE_HRZS,
@@ -472,9 +483,7 @@ def prev_tmp_init(mod, tmp, bt):
                 "or 'linked.'"
             )
     else:
-        prev_tmp = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])[
-            list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]).index(tmp) - 1
-        ]
+        prev_tmp = get_tmp_by_offset(mod=mod, tmp=tmp, bt=bt, offset=-1)
 
     return prev_tmp
 
@@ -507,13 +516,40 @@ def next_tmp_init(mod, tmp, bt):
                 "or 'linked.'"
             )
     else:
-        next_tmp = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])[
-            list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]).index(tmp) + 1
-        ]
+        next_tmp = get_tmp_by_offset(mod=mod, tmp=tmp, bt=bt, offset=1)
 
     return next_tmp
 
 
+def get_tmp_by_offset(mod, tmp, bt, offset):
+    """
+    :param mod: the Pyomo model
+    :param tmp: the timepoint
+    :param bt: the balancing type
+    :param offset: int; the number of timepoints to move forward (positive)
+        or back (negative) from *tmp* within its horizon
+    :return: the timepoint *offset* positions away from *tmp* in its
+        horizon of balancing type *bt*; beyond the edges of the horizon,
+        wraps around if the horizon boundary is circular and returns "."
+        otherwise
+
+    TMPS_BY_BLN_TYPE_HRZ is an ordered set, which keeps a map of each
+    timepoint's position, so this lookup doesn't depend on the horizon
+    length.
+    """
+    hrz = mod.horizon[tmp, bt]
+    hrz_tmps = mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]
+    # Pyomo set positions start at 1
+    position = hrz_tmps.ord(tmp) - 1 + offset
+
+    if 0 <= position < len(hrz_tmps):
+        return hrz_tmps.at(position + 1)
+    elif mod.boundary[bt, hrz] == "circular":
+        return hrz_tmps.at(position % len(hrz_tmps) + 1)
+    else:
+        return "."
+
+
 # Input-Output
 ###############################################################################
 
@@ -40,6 +40,7 @@ from gridpath.project.operations.operational_types.common_functions import (
 DEFAULT_TX_AVAILABILITY_TYPE = "exogenous"
 TX_PERIOD_DF = "transmission_period_df"
 TX_TIMEPOINT_DF = "transmission_timepoint_df"
+SCENARIO_LEVEL_INPUTS = True
 
 
 def add_model_components(
@@ -86,7 +87,7 @@ def add_model_components(
     +-------------------------------------------------------------------------+
     | | :code:`tx_operational_type`                                           |
     | | *Defined over*: :code:`TX_LINES`                                      |
-    | | *Within*: :code:`["tx_dcopf", "tx_simple"]`                           |
+    | | *Within*: :code:`["tx_dcopf", "tx_ptdf", "tx_simple"]`                |
     |                                                                         |
     | The transmission line's operational type. This will determine how the   |
     | operations of the line are modeled, e.g. through a simple linear        |
@@ -125,7 +126,7 @@ def add_model_components(
         default=DEFAULT_TX_AVAILABILITY_TYPE,
     )
     m.tx_operational_type = Param(
-        m.TX_LINES, within=["tx_dcopf", "tx_simple", "tx_simple_binary"]
+        m.TX_LINES, within=["tx_dcopf", "tx_ptdf", "tx_simple", "tx_simple_binary"]
     )
     m.load_zone_from = Param(m.TX_LINES, within=m.LOAD_ZONES)
     m.load_zone_to = Param(m.TX_LINES, within=m.LOAD_ZONES)
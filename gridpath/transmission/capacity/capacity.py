@@ -23,10 +23,10 @@ again depend on the line's *capacity_type*.
 """
 
 import os.path
-import pandas as pd
 from pyomo.environ import Set, Expression, value
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules,
     join_sets,
@@ -291,7 +291,7 @@ def save_duals(
 ):
     # Save module-specific duals
     # Capacity type modules
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -302,7 +302,6 @@ def save_duals(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
@@ -19,9 +19,9 @@ treated in the optimization problem, e.g. as specified, available to be
 built, available to be retired, etc.
 """
 
-import pandas as pd
 import os.path
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.transmission.capacity.common_functions import (
     load_tx_capacity_type_modules,
 )
@@ -41,7 +41,7 @@ def add_model_components(
 
     # Dynamic Inputs
     ###########################################################################
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -52,7 +52,6 @@ def add_model_components(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
@@ -102,7 +101,7 @@ def load_model_data(
     :param stage:
     :return:
     """
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -113,7 +112,6 @@ def load_model_data(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
@@ -32,7 +32,6 @@ transmission line's lifetime.
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import (
     Set,
     Param,
@@ -44,6 +43,10 @@ from pyomo.environ import (
 )
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.input_files import (
+    get_input_table_columns,
+    read_input_table,
+)
 from gridpath.auxiliary.auxiliary import cursor_to_df
 from gridpath.auxiliary.db_interface import setup_results_import
 from gridpath.auxiliary.dynamic_components import (
@@ -583,7 +586,7 @@ def load_model_data(
     min_cumulative_mw = dict()
     max_cumulative_mw = dict()
 
-    header = pd.read_csv(
+    header = get_input_table_columns(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -593,16 +596,13 @@ def load_model_data(
             stage,
             "inputs",
             "new_build_transmission_vintage_costs.tab",
-        ),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+        )
+    )
 
     optional_columns = ["min_cumulative_new_build_mw", "max_cumulative_new_build_mw"]
     used_columns = [c for c in optional_columns if c in header]
 
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -613,7 +613,6 @@ def load_model_data(
             "inputs",
             "new_build_transmission_vintage_costs.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "vintage"] + used_columns,
     )
 
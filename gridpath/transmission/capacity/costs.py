@@ -20,10 +20,10 @@ optimization for each period, which depend on the line's *capacity_type*.
 
 import csv
 import os.path
-import pandas as pd
 from pyomo.environ import Set, Expression, value
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import join_sets
 from gridpath.common_functions import create_results_df
 from gridpath.transmission.capacity.common_functions import (
@@ -100,7 +100,7 @@ def add_model_components(
     +-------------------------------------------------------------------------+
 
     """
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -111,7 +111,6 @@ def add_model_components(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
@@ -209,7 +208,7 @@ def load_model_data(
     :param stage:
     :return:
     """
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -220,7 +219,6 @@ def load_model_data(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
@@ -330,7 +328,7 @@ def save_duals(
 ):
     # Save module-specific duals
     # Capacity type modules
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -341,7 +339,6 @@ def save_duals(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
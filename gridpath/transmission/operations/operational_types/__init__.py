@@ -20,8 +20,8 @@ OPF.
 """
 
 import os.path
-import pandas as pd
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.transmission.operations.common_functions import (
     load_tx_operational_type_modules,
 )
@@ -44,7 +44,7 @@ def add_model_components(
     for that operational type.
     """
     # Import needed transmission operational type modules
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -55,7 +55,6 @@ def add_model_components(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
@@ -109,7 +108,7 @@ def load_model_data(
     :return:
     """
     # Import needed operational modules
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -120,7 +119,6 @@ def load_model_data(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=["transmission_line", "tx_capacity_type", "tx_operational_type"],
     )
 
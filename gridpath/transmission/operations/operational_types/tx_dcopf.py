@@ -48,17 +48,22 @@ Linear Optimal Power Flow Using Cycle Flows".
 
 """
 
+from collections import namedtuple
+from functools import lru_cache
 import networkx as nx
 import os
 import pandas as pd
 
 from pyomo.environ import Set, Var, Constraint, Reals, Param
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
 )
 
+DcopfCycle = namedtuple("DcopfCycle", ["zones", "tx_lines", "directions"])
+
 
 def add_model_components(
     m,
@@ -276,108 +281,155 @@ def add_model_components(
     )
 
 
-# Set Rules
+# Network Analysis
 ###############################################################################
 
 
-def periods_cycles_zones_init(mod):
+@lru_cache(maxsize=None)
+def get_network_cycles(topology):
     """
+    :param topology: tuple of (tx_line, load_zone_from, load_zone_to) tuples
+        describing the network
+    :return: tuple of DcopfCycle namedtuples with the ordered zones of each
+        cycle, the transmission lines in the cycle, and their direction
+
     Use the networkx module to determine the elementary (basic) cycles in the
-    network graph, where a cycle is defined by the list of unordered zones
-    (nodes) that belong to it. We do this for each period since the network
-    can change between periods as we add/remove transmission lines (edges).
-
-    The result is returned as a 3-dimensional set of period-cycle-zone
-    combinations, e.g. (2030, 1, zone1) means that zone1 belongs to cycle 1
-    in period 2030. This is the key set on which all other derived sets are
-    based such that we onlyl have to perform the networkx calculations once.
+    network graph, where a cycle is defined by the list of ordered zones
+    (nodes) that belong to it, and find the transmission line connecting
+    each pair of consecutive zones in the cycle. The direction is 1 if the
+    line goes in the cycle's direction and -1 if it goes in the opposite
+    direction.
+
+    Results are cached by topology, so the cycles are only computed once
+    for each distinct network, e.g. when the network doesn't change across
+    periods or subproblems.
+    """
+    # Get the edges from the tx_lines; with parallel lines, the first one is
+    # used in the cycles
+    # TODO: make sure there are no parallel edges (or pre-process those)
+    edges = [(zone_to, zone_from) for (tx, zone_from, zone_to) in topology]
+    tx_line_by_edge = dict()
+    for tx, zone_from, zone_to in topology:
+        tx_line_by_edge.setdefault(frozenset((zone_from, zone_to)), tx)
+    from_to_by_tx_line = {
+        tx: (zone_from, zone_to) for (tx, zone_from, zone_to) in topology
+    }
+
+    # Create a network graph from the list of lines (edges) and find
+    # the elementary cycles (if any)
+    graph = nx.Graph()
+    graph.add_edges_from(edges)
+    cycles = list()
+    for zones in nx.cycle_basis(graph):  # list w list of zones for each cycle
+        tx_lines, directions = list(), list()
+        for branch_from, branch_to in zip(zones[-1:] + zones[:-1], zones):
+            try:
+                tx = tx_line_by_edge[frozenset((branch_from, branch_to))]
+            except KeyError:
+                raise ValueError(
+                    "The branch connecting {} and {} is not in the "
+                    "transmission line inputs".format(branch_from, branch_to)
+                )
+            tx_lines.append(tx)
+            directions.append(
+                1 if from_to_by_tx_line[tx] == (branch_from, branch_to) else -1
+            )
+        cycles.append(
+            DcopfCycle(
+                zones=tuple(zones),
+                tx_lines=tuple(tx_lines),
+                directions=tuple(directions),
+            )
+        )
+
+    return tuple(cycles)
+
+
+def get_cycles_by_period(mod):
+    """
+    Get the cycles of the network of tx_dcopf lines operational in each
+    period. We do this for each period since the network can change between
+    periods as we add/remove transmission lines (edges).
     """
-    result = list()
+    cycles_by_period = dict()
     for period in mod.PERIODS:
         # Get the relevant tx_lines (= currently operational & DC OPF)
-        tx_lines = list(mod.TX_DCOPF & mod.TX_LINES_OPR_IN_PRD[period])
+        topology = tuple(
+            sorted(
+                (tx, mod.load_zone_from[tx], mod.load_zone_to[tx])
+                for tx in mod.TX_LINES_OPR_IN_PRD[period]
+                if tx in mod.TX_DCOPF
+            )
+        )
+        cycles_by_period[period] = get_network_cycles(topology)
+    return cycles_by_period
+
 
-        # Get the edges from the relevant tx_lines
-        edges = [(mod.load_zone_to[tx], mod.load_zone_from[tx]) for tx in tx_lines]
-        # TODO: make sure there are no parallel edges (or pre-process those)
+# Set Rules
+###############################################################################
 
-        # Create a network graph from the list of lines (edges) and find
-        # the elementary cycles (if any)
-        graph = nx.Graph()
-        graph.add_edges_from(edges)
-        cycles = nx.cycle_basis(graph)  # list w list of zones for each cycle
-        for cycle_id, cycle in enumerate(cycles):
-            for zone in cycle:
-                result.append((period, cycle_id, zone))
-    return result
+
+def periods_cycles_zones_init(mod):
+    """
+    Determine the period-cycle-zone combinations from the elementary
+    (basic) cycles in the network graph in each period, e.g. (2030, 1,
+    zone1) means that zone1 belongs to cycle 1 in period 2030. This is the
+    key set on which all other derived sets are based.
+    """
+    return [
+        (period, cycle_id, zone)
+        for period, cycles in get_cycles_by_period(mod).items()
+        for cycle_id, cycle in enumerate(cycles)
+        for zone in cycle.zones
+    ]
 
 
 def period_cycles_init(mod):
     """
     Determine the period-cycle combinations from the larger PRDS_CYCLES_ZONES
-    set. Note: set() will remove duplicates.
+    set. Note: dict.fromkeys() will remove duplicates.
     """
-    return list(set([(p, c) for (p, c, z) in mod.PRDS_CYCLES_ZONES]))
+    return list(dict.fromkeys((p, c) for (p, c, z) in mod.PRDS_CYCLES_ZONES))
 
 
-def zones_by_period_cycle_init(mod, period, cycle):
+def zones_by_period_cycle_init(mod):
     """
     Re-arrange the 3-dimensional PRDS_CYCLES_ZONES set into a 1-dimensional
     set of ZONES, indexed by PRD_CYCLES
     """
-    zones = [z for (p, c, z) in mod.PRDS_CYCLES_ZONES if p == period and c == cycle]
+    zones = {(p, c): [] for (p, c) in mod.PRDS_CYCLES}
+    for p, c, z in mod.PRDS_CYCLES_ZONES:
+        zones[p, c].append(z)
     return zones
 
 
 def periods_cycles_transmission_lines_init(mod):
     """
-    Based on which zones are in which cycle in each period (as defined in
-    ZONES_IN_PRD_CYCLE), create a 3-dimensional set describing which
-    transmission lines are in which cycle during each period.
+    Create a 3-dimensional set describing which transmission lines are in
+    which cycle during each period.
 
     Note: Alternatively, we could simply define this set by the bigger set
     m.PRDS_CYCLES * m.TX_DCOPF and set the tx_dcopf_cycle_direction to zero
-    whenever the line is not part of the cycle. This would get rid of the
-    repetitive code in the init function below at the cost of iterating over
-    more tx_lines than necessary in the summation of the KVL constraint.
+    whenever the line is not part of the cycle. This would come at the cost
+    of iterating over more tx_lines than necessary in the summation of the
+    KVL constraint.
     """
-    result = list()
-    for p, c in mod.PRDS_CYCLES:
-        # Ordered list of zones in the current cycle
-        zones = list(mod.ZONES_IN_PRD_CYCLE[(p, c)])
-
-        # Relevant tx_lines
-        tx_lines = list(mod.TX_DCOPF & mod.TX_LINES_OPR_IN_PRD[p])
+    return [
+        (period, cycle_id, tx)
+        for period, cycles in get_cycles_by_period(mod).items()
+        for cycle_id, cycle in enumerate(cycles)
+        for tx in cycle.tx_lines
+    ]
 
-        # Get the edges from the relevant tx_lines
-        edges = [(mod.load_zone_to[tx], mod.load_zone_from[tx]) for tx in tx_lines]
 
-        # Get the tx lines in this cycle
-        for tx_from, tx_to in zip(zones[-1:] + zones[:-1], zones):
-            try:
-                index = edges.index((tx_from, tx_to))
-            except:
-                try:
-                    # Revert direction
-                    index = edges.index((tx_to, tx_from))
-                except:
-                    raise ValueError(
-                        "The branch connecting {} and {} is not in the "
-                        "transmission line inputs".format(tx_from, tx_to)
-                    )
-            tx_line = tx_lines[index]
-            result.append((p, c, tx_line))
-    return result
-
-
-def tx_lines_by_period_cycle_init(mod, period, cycle):
+def tx_lines_by_period_cycle_init(mod):
     """
     Re-arrange the 3-dimensional PRDS_CYCLES_TX_DCOPF set into a 1-dimensional
     set of TX_DCOPF, indexed by PRD_CYCLES.
     """
-    txs = list(
-        tx for (p, c, tx) in mod.PRDS_CYCLES_TX_DCOPF if c == cycle and p == period
-    )
+    txs = {(p, c): [] for (p, c) in mod.PRDS_CYCLES}
+    for p, c, tx in mod.PRDS_CYCLES_TX_DCOPF:
+        txs[p, c].append(tx)
     return txs
 
 
@@ -385,7 +437,7 @@ def tx_lines_by_period_cycle_init(mod, period, cycle):
 ###############################################################################
 
 
-def tx_dcopf_cycle_direction_init(mod, period, cycle, tx_line):
+def tx_dcopf_cycle_direction_init(mod):
     """
     **Param Name**: tx_dcopf_cycle_direction
     **Defined Over**: PRDS_CYCLES_TX_DCOPF
@@ -404,20 +456,12 @@ def tx_dcopf_cycle_direction_init(mod, period, cycle, tx_line):
     See "Horsch et al. (2018). Linear Optimal Power Flow Using Cycle Flows"
     for more background.
     """
-    zones = list(mod.ZONES_IN_PRD_CYCLE[(period, cycle)])
-    from_to = (mod.load_zone_from[tx_line], mod.load_zone_to[tx_line])
-    if from_to in zip(zones[-1:] + zones[:-1], zones):
-        direction = 1
-    elif from_to in zip(zones, zones[-1:] + zones[:-1]):
-        direction = -1
-    else:
-        raise ValueError(
-            "The branch connecting {} and {} is not in the "
-            "transmission line inputs".format(
-                mod.load_zone_from[tx_line], mod.load_zone_to[tx_line]
-            )
-        )
-    return direction
+    return {
+        (period, cycle_id, tx): direction
+        for period, cycles in get_cycles_by_period(mod).items()
+        for cycle_id, cycle in enumerate(cycles)
+        for tx, direction in zip(cycle.tx_lines, cycle.directions)
+    }
 
 
 # Constraint Formulations
@@ -546,7 +590,7 @@ def load_model_data(
     """
 
     # Get the DC OPF lines
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -557,7 +601,6 @@ def load_model_data(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=[
             "transmission_line",
             "load_zone_from",
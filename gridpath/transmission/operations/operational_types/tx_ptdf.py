@@ -0,0 +1,867 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+r"""
+This operational type describes transmission lines whose flows are simulated
+with the same DC power flow approximation as the *tx_dcopf* operational
+type, but using power transfer distribution factors (PTDFs) instead of the
+cycle flow formulation. The PTDF of a line with respect to a zone is the
+change in flow on the line when one MW is injected in the zone and withdrawn
+at the reference (slack) zone of its network island. The PTDFs only depend
+on the network topology and line reactances, so they are computed once for
+each distinct set of *tx_ptdf* lines operational in a period.
+
+The net injection of each zone into the *tx_ptdf* network is a variable,
+which enters the zone's load balance directly (see
+*gridpath.system.load_balance.aggregate_transmission_power*), and the flow
+on each line is expressed as the sum of the zone injections multiplied by
+the line's PTDFs. Injections must balance in each network island, and each
+zone's injection is limited by the capacity of the lines connected to it.
+Flow limits are then only added for the lines that could reach their
+minimum or maximum flow given the zone injection limits (the *monitored*
+lines); the flows on the other lines are guaranteed to be within their
+limits. This screening is exact, i.e. it does not change the solution, and
+it keeps the problem small for large networks in which most lines rarely
+bind. The module's flow expressions are only built for the monitored
+lines. The flows on the other lines are only available through the
+generic *Transmit_Power_MW* expression, e.g. for the results or for
+modules such as the hurdle costs; since the load balance doesn't use the
+line flows, they only enter the problem if such a module uses them.
+
+.. warning:: Transmission operational types can be optionally be mixed.
+    However, if there are any transmission lines that do not have the
+    *tx_ptdf* operational types, they will simply not be considered when
+    setting up the network in the *tx_ptdf* module, so the network flows
+    will be inaccurate.
+
+.. warning:: As with the *tx_dcopf* operational type, GridPath uses one
+    user-specified reactance to characterize a transmission line and this
+    value doesn't change across time periods. Lines whose capacity or
+    availability is determined by the optimization are always monitored.
+
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+import os
+import pandas as pd
+
+from pyomo.environ import Set, Var, Constraint, Expression, Reals, Param, value
+
+from gridpath.auxiliary.input_files import read_input_table
+from gridpath.auxiliary.auxiliary import (
+    subset_init_by_param_value,
+    subset_init_by_set_membership,
+)
+
+# PTDFs smaller than this (in absolute value) are numerical noise and are
+# not included in the model
+PTDF_TOLERANCE = 1e-9
+
+PtdfNetwork = namedtuple(
+    "PtdfNetwork", ["islands", "island_lines", "ptdfs", "lines_from", "lines_to"]
+)
+
+
+def add_model_components(
+    m,
+    d,
+    scenario_directory,
+    weather_iteration,
+    hydro_iteration,
+    availability_iteration,
+    subproblem,
+    stage,
+):
+    """
+    The following Pyomo model components are defined in this module:
+
+    +-------------------------------------------------------------------------+
+    | Sets                                                                    |
+    +=========================================================================+
+    | | :code:`TX_PTDF`                                                       |
+    |                                                                         |
+    | The set of transmission lines of the :code:`tx_ptdf` operational type.  |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_OPR_TMPS`                                              |
+    |                                                                         |
+    | Two-dimensional set with transmission lines of the :code:`tx_ptdf`      |
+    | operational type and their operational timepoints.                      |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_OPR_PRDS`                                              |
+    |                                                                         |
+    | Two-dimensional set with transmission lines of the :code:`tx_ptdf`      |
+    | operational type and their operational periods.                         |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Derived Sets                                                            |
+    +=========================================================================+
+    | | :code:`PRDS_TX_PTDF_ISLANDS`                                          |
+    |                                                                         |
+    | Two-dimensional set with the period and island_id of the connected      |
+    | components (islands) of the network graph in each period.               |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_ZONES_IN_PRD_ISLAND`                                   |
+    | | *Defined over*: :code:`PRDS_TX_PTDF_ISLANDS`                          |
+    |                                                                         |
+    | Indexed set of ordered zones/nodes by period-island. The first zone is  |
+    | the island's reference (slack) zone.                                    |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_ISLANDS_OPR_TMPS`                                      |
+    |                                                                         |
+    | Two-dimensional set of island IDs and operational timepoints. The       |
+    | injection balance constraint is indexed by this set.                    |
+    +-------------------------------------------------------------------------+
+    | | :code:`PRDS_TX_PTDF_ZONES`                                            |
+    |                                                                         |
+    | Two-dimensional set of periods and the zones connected to at least one  |
+    | operational :code:`tx_ptdf` line in that period.                        |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_ZONES_OPR_TMPS`                                        |
+    |                                                                         |
+    | Two-dimensional set of zones and the operational timepoints in which    |
+    | they are connected to the :code:`tx_ptdf` network.                      |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_FROM_PRD_ZONE`                                         |
+    | | *Defined over*: :code:`PRDS_TX_PTDF_ZONES`                            |
+    |                                                                         |
+    | Indexed set of the operational lines starting in each zone by period.   |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_TO_PRD_ZONE`                                           |
+    | | *Defined over*: :code:`PRDS_TX_PTDF_ZONES`                            |
+    |                                                                         |
+    | Indexed set of the operational lines ending in each zone by period.     |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_OPR_PRDS_ZONES`                                        |
+    |                                                                         |
+    | Three-dimensional set of the line-period-zone combinations with a       |
+    | non-zero PTDF.                                                          |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_ZONES_BY_OPR_PRD`                                      |
+    | | *Defined over*: :code:`TX_PTDF_OPR_PRDS`                              |
+    |                                                                         |
+    | Indexed set of the zones with a non-zero PTDF for each line-period.     |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_PTDF_MONITORED_OPR_TMPS`                                    |
+    |                                                                         |
+    | Two-dimensional set of the line-timepoints in which the line flow could |
+    | reach its limits given the zone injection limits. The flow limit        |
+    | constraints are indexed by this set.                                    |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Required Params                                                         |
+    +=========================================================================+
+    | | :code:`tx_ptdf_reactance_ohms`                                        |
+    | | *Defined over*: :code:`TX_PTDF`                                       |
+    |                                                                         |
+    | The series reactance in Ohms for each :code:`tx_ptdf` transmission      |
+    | line.                                                                   |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Derived Params                                                          |
+    +=========================================================================+
+    | | :code:`tx_ptdf_factor`                                                |
+    | | *Defined over*: :code:`TX_PTDF_OPR_PRDS_ZONES`                        |
+    |                                                                         |
+    | The power transfer distribution factor of each line with respect to     |
+    | each zone in each period.                                               |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Variables                                                               |
+    +=========================================================================+
+    | | :code:`TxPtdf_Net_Injection_MW`                                       |
+    | | *Defined over*: :code:`TX_PTDF_ZONES_OPR_TMPS`                        |
+    | | *Within*: :code:`Reals`                                               |
+    |                                                                         |
+    | The zone's net injection into the :code:`tx_ptdf` network, i.e. the     |
+    | flow on the lines starting in the zone minus the flow on the lines      |
+    | ending in the zone.                                                     |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Expressions                                                             |
+    +=========================================================================+
+    | | :code:`TxPtdf_Transmit_Power_MW`                                      |
+    | | *Defined over*: :code:`TX_PTDF_MONITORED_OPR_TMPS`                    |
+    |                                                                         |
+    | The transmission line's power flow in each monitored timepoint, i.e.    |
+    | the sum of the zone injections multiplied by the line's PTDFs. Negative |
+    | power means the power flow goes in the opposite direction of the line's |
+    | defined direction.                                                      |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Constraints                                                             |
+    +=========================================================================+
+    | | :code:`TxPtdf_Injection_Balance_Constraint`                           |
+    | | *Defined over*: :code:`TX_PTDF_ISLANDS_OPR_TMPS`                      |
+    |                                                                         |
+    | The net injections of the zones in each network island must sum to      |
+    | zero in every operational timepoint.                                    |
+    +-------------------------------------------------------------------------+
+    | | :code:`TxPtdf_Min_Injection_Constraint`                               |
+    | | *Defined over*: :code:`TX_PTDF_ZONES_OPR_TMPS`                        |
+    |                                                                         |
+    | A zone's net injection should exceed the sum of the minimum flows on    |
+    | the lines connected to it.                                              |
+    +-------------------------------------------------------------------------+
+    | | :code:`TxPtdf_Max_Injection_Constraint`                               |
+    | | *Defined over*: :code:`TX_PTDF_ZONES_OPR_TMPS`                        |
+    |                                                                         |
+    | A zone's net injection cannot exceed the sum of the maximum flows on    |
+    | the lines connected to it.                                              |
+    +-------------------------------------------------------------------------+
+    | | :code:`TxPtdf_Min_Transmit_Constraint`                                |
+    | | *Defined over*: :code:`TX_PTDF_MONITORED_OPR_TMPS`                    |
+    |                                                                         |
+    | Transmitted power should exceed the transmission line's minimum power   |
+    | flow in every monitored timepoint.                                      |
+    +-------------------------------------------------------------------------+
+    | | :code:`TxPtdf_Max_Transmit_Constraint`                                |
+    | | *Defined over*: :code:`TX_PTDF_MONITORED_OPR_TMPS`                    |
+    |                                                                         |
+    | Transmitted power cannot exceed the transmission line's maximum power   |
+    | flow in every monitored timepoint.                                      |
+    +-------------------------------------------------------------------------+
+
+    """
+
+    # Sets
+    ###########################################################################
+
+    m.TX_PTDF = Set(
+        within=m.TX_LINES,
+        initialize=lambda mod: subset_init_by_param_value(
+            mod=mod,
+            set_name="TX_LINES",
+            param_name="tx_operational_type",
+            param_value="tx_ptdf",
+        ),
+    )
+
+    m.TX_PTDF_OPR_TMPS = Set(
+        dimen=2,
+        within=m.TX_OPR_TMPS,
+        initialize=lambda mod: subset_init_by_set_membership(
+            mod=mod, superset="TX_OPR_TMPS", index=0, membership_set=mod.TX_PTDF
+        ),
+    )
+
+    m.TX_PTDF_OPR_PRDS = Set(
+        dimen=2,
+        within=m.TX_OPR_PRDS,
+        initialize=lambda mod: subset_init_by_set_membership(
+            mod=mod, superset="TX_OPR_PRDS", index=0, membership_set=mod.TX_PTDF
+        ),
+    )
+
+    # Required Params
+    ###########################################################################
+
+    m.tx_ptdf_reactance_ohms = Param(m.TX_PTDF)
+
+    # Derived Sets
+    ###########################################################################
+
+    m.PRDS_TX_PTDF_ISLANDS = Set(dimen=2, initialize=periods_islands_init)
+
+    m.TX_PTDF_ZONES_IN_PRD_ISLAND = Set(
+        m.PRDS_TX_PTDF_ISLANDS, initialize=zones_by_period_island_init, ordered=True
+    )
+
+    # Note: This assumes timepoints are unique across periods
+    m.TX_PTDF_ISLANDS_OPR_TMPS = Set(
+        dimen=2,
+        initialize=lambda mod: [
+            (i, tmp)
+            for (p, i) in mod.PRDS_TX_PTDF_ISLANDS
+            for tmp in mod.TMPS_IN_PRD[p]
+        ],
+    )
+
+    m.PRDS_TX_PTDF_ZONES = Set(dimen=2, initialize=periods_zones_init)
+
+    m.TX_PTDF_ZONES_OPR_TMPS = Set(
+        dimen=2,
+        initialize=lambda mod: [
+            (z, tmp) for (p, z) in mod.PRDS_TX_PTDF_ZONES for tmp in mod.TMPS_IN_PRD[p]
+        ],
+    )
+
+    m.TX_PTDF_FROM_PRD_ZONE = Set(
+        m.PRDS_TX_PTDF_ZONES,
+        within=m.TX_PTDF,
+        initialize=lambda mod: tx_lines_by_period_zone_init(mod, "lines_from"),
+    )
+
+    m.TX_PTDF_TO_PRD_ZONE = Set(
+        m.PRDS_TX_PTDF_ZONES,
+        within=m.TX_PTDF,
+        initialize=lambda mod: tx_lines_by_period_zone_init(mod, "lines_to"),
+    )
+
+    m.TX_PTDF_OPR_PRDS_ZONES = Set(
+        dimen=3, within=m.TX_PTDF_OPR_PRDS * m.LOAD_ZONES, initialize=ptdfs_init
+    )
+
+    m.TX_PTDF_ZONES_BY_OPR_PRD = Set(
+        m.TX_PTDF_OPR_PRDS, initialize=zones_by_tx_line_period_init
+    )
+
+    m.TX_PTDF_MONITORED_OPR_TMPS = Set(
+        dimen=2, within=m.TX_PTDF_OPR_TMPS, initialize=monitored_tx_lines_tmps_init
+    )
+
+    # Derived Params
+    ###########################################################################
+
+    m.tx_ptdf_factor = Param(
+        m.TX_PTDF_OPR_PRDS_ZONES,
+        within=Reals,
+        initialize=lambda mod: {(l, p, z): ptdf for (l, p, z, ptdf) in get_ptdfs(mod)},
+    )
+
+    # Variables
+    ###########################################################################
+
+    m.TxPtdf_Net_Injection_MW = Var(m.TX_PTDF_ZONES_OPR_TMPS, within=Reals)
+
+    # Expressions
+    ###########################################################################
+
+    m.TxPtdf_Transmit_Power_MW = Expression(
+        m.TX_PTDF_MONITORED_OPR_TMPS, rule=transmit_power_expression_rule
+    )
+
+    # Constraints
+    ###########################################################################
+
+    m.TxPtdf_Injection_Balance_Constraint = Constraint(
+        m.TX_PTDF_ISLANDS_OPR_TMPS, rule=injection_balance_rule
+    )
+
+    m.TxPtdf_Min_Injection_Constraint = Constraint(
+        m.TX_PTDF_ZONES_OPR_TMPS, rule=min_injection_rule
+    )
+
+    m.TxPtdf_Max_Injection_Constraint = Constraint(
+        m.TX_PTDF_ZONES_OPR_TMPS, rule=max_injection_rule
+    )
+
+    m.TxPtdf_Min_Transmit_Constraint = Constraint(
+        m.TX_PTDF_MONITORED_OPR_TMPS, rule=min_transmit_rule
+    )
+
+    m.TxPtdf_Max_Transmit_Constraint = Constraint(
+        m.TX_PTDF_MONITORED_OPR_TMPS, rule=max_transmit_rule
+    )
+
+
+# PTDF Calculation
+###############################################################################
+
+
+@lru_cache(maxsize=None)
+def get_ptdf_network(topology):
+    """
+    :param topology: tuple of (tx_line, load_zone_from, load_zone_to,
+        reactance_ohms) tuples describing the network
+    :return: PtdfNetwork namedtuple with the islands (tuples of zones, the
+        first one being the reference zone), the lines in each island, the
+        PTDF matrix of each island (lines by zones), and the lines starting
+        and ending in each zone
+
+    Find the islands (connected components) of the network and compute
+    their PTDF matrices. With the branch-zone incidence matrix :math:`A`
+    (1 for a line's starting zone, -1 for its ending zone) and the diagonal
+    matrix of line susceptances :math:`B_d` (the inverse of the reactances),
+    the nodal susceptance matrix is :math:`B = A^T B_d A` and the PTDF
+    matrix is :math:`B_d A_r B_r^{-1}`, where the reference zone's row and
+    column are removed from :math:`A` and :math:`B`. The reference zone's
+    PTDFs are zero.
+
+    Results are cached by topology, so the PTDFs are only computed once for
+    each distinct network, e.g. when the network doesn't change across
+    periods or subproblems.
+    """
+    lines_from, lines_to, neighbors = dict(), dict(), dict()
+    for tx_line, zone_from, zone_to, reactance in topology:
+        lines_from.setdefault(zone_from, []).append(tx_line)
+        lines_to.setdefault(zone_to, []).append(tx_line)
+        neighbors.setdefault(zone_from, set()).add(zone_to)
+        neighbors.setdefault(zone_to, set()).add(zone_from)
+
+    # Find the islands
+    island_by_zone = dict()
+    islands = list()
+    for zone in sorted(neighbors):
+        if zone in island_by_zone:
+            continue
+        island = [zone]
+        island_by_zone[zone] = len(islands)
+        for z in island:
+            for neighbor in sorted(neighbors[z]):
+                if neighbor not in island_by_zone:
+                    island_by_zone[neighbor] = len(islands)
+                    island.append(neighbor)
+        islands.append(island)
+
+    island_lines = [[] for _ in islands]
+    for line_tuple in topology:
+        island_lines[island_by_zone[line_tuple[1]]].append(line_tuple)
+
+    ptdfs = list()
+    for island, lines in zip(islands, island_lines):
+        zone_index = {z: i for i, z in enumerate(island)}
+        incidence = np.zeros((len(lines), len(island)))
+        for row, (tx_line, zone_from, zone_to, reactance) in enumerate(lines):
+            incidence[row, zone_index[zone_from]] += 1
+            incidence[row, zone_index[zone_to]] -= 1
+        susceptance = 1 / np.array([reactance for (_, _, _, reactance) in lines])
+
+        # Drop the reference zone
+        branch_susceptance = susceptance[:, None] * incidence[:, 1:]
+        nodal_susceptance = incidence[:, 1:].T @ branch_susceptance
+
+        ptdf = np.zeros((len(lines), len(island)))
+        # The nodal susceptance matrix is symmetric
+        ptdf[:, 1:] = np.linalg.solve(nodal_susceptance, branch_susceptance.T).T
+        ptdf[np.abs(ptdf) < PTDF_TOLERANCE] = 0
+        ptdfs.append(ptdf)
+
+    return PtdfNetwork(
+        islands=tuple(tuple(island) for island in islands),
+        island_lines=tuple(
+            tuple(tx_line for (tx_line, _, _, _) in lines) for lines in island_lines
+        ),
+        ptdfs=tuple(ptdfs),
+        lines_from={z: tuple(lines) for z, lines in lines_from.items()},
+        lines_to={z: tuple(lines) for z, lines in lines_to.items()},
+    )
+
+
+def get_networks_by_period(mod):
+    """
+    Get the PtdfNetwork of the tx_ptdf lines operational in each period.
+    """
+    networks = dict()
+    for period in mod.PERIODS:
+        topology = tuple(
+            sorted(
+                (
+                    tx_line,
+                    mod.load_zone_from[tx_line],
+                    mod.load_zone_to[tx_line],
+                    float(mod.tx_ptdf_reactance_ohms[tx_line]),
+                )
+                for tx_line in mod.TX_LINES_OPR_IN_PRD[period]
+                if tx_line in mod.TX_PTDF
+            )
+        )
+        networks[period] = get_ptdf_network(topology)
+    return networks
+
+
+def get_ptdfs(mod):
+    """
+    Get the (tx_line, period, zone, ptdf) tuples of the non-zero PTDFs.
+    """
+    result = list()
+    for period, network in get_networks_by_period(mod).items():
+        for island, lines, ptdf in zip(
+            network.islands, network.island_lines, network.ptdfs
+        ):
+            rows, columns = np.nonzero(ptdf)
+            for row, column in zip(rows, columns):
+                result.append(
+                    (lines[row], period, island[column], float(ptdf[row, column]))
+                )
+    return result
+
+
+# Set Rules
+###############################################################################
+
+
+def periods_islands_init(mod):
+    """
+    Determine the period-island combinations.
+    """
+    return [
+        (period, island_id)
+        for period, network in get_networks_by_period(mod).items()
+        for island_id in range(len(network.islands))
+    ]
+
+
+def zones_by_period_island_init(mod):
+    """
+    Get the ordered zones in each period-island.
+    """
+    return {
+        (period, island_id): list(island)
+        for period, network in get_networks_by_period(mod).items()
+        for island_id, island in enumerate(network.islands)
+    }
+
+
+def periods_zones_init(mod):
+    """
+    Determine the period-zone combinations of the zones that are connected
+    to the network in each period.
+    """
+    return [
+        (period, zone)
+        for period, network in get_networks_by_period(mod).items()
+        for island in network.islands
+        for zone in island
+    ]
+
+
+def tx_lines_by_period_zone_init(mod, direction):
+    """
+    Get the lines starting ("lines_from") or ending ("lines_to") in each
+    zone by period.
+    """
+    result = dict()
+    for period, network in get_networks_by_period(mod).items():
+        lines_by_zone = getattr(network, direction)
+        for island in network.islands:
+            for zone in island:
+                result[period, zone] = list(lines_by_zone.get(zone, ()))
+    return result
+
+
+def ptdfs_init(mod):
+    """
+    Determine the line-period-zone combinations with a non-zero PTDF.
+    """
+    return [(l, p, z) for (l, p, z, ptdf) in get_ptdfs(mod)]
+
+
+def zones_by_tx_line_period_init(mod):
+    """
+    Re-arrange the 3-dimensional TX_PTDF_OPR_PRDS_ZONES set into a
+    1-dimensional set of zones, indexed by TX_PTDF_OPR_PRDS.
+    """
+    result = {(l, p): [] for (l, p) in mod.TX_PTDF_OPR_PRDS}
+    for l, p, z in mod.TX_PTDF_OPR_PRDS_ZONES:
+        result[l, p].append(z)
+    return result
+
+
+def monitored_tx_lines_tmps_init(mod):
+    """
+    Determine the line-timepoints in which the line flow could reach its
+    minimum or maximum flow given the zone injection limits.
+
+    Since injections sum to zero in each island, the flow on a line is
+    :math:`\\sum_{z} (PTDF_{l,z} - s) * inj_{z}` for any shift :math:`s`
+    (we use the median of the line's PTDFs, which gives tight bounds for
+    meshed networks). Given the zone injection limits
+    :math:`L_{z} \\leq inj_{z} \\leq U_{z}`, the line flow can't exceed the
+    sum of :math:`max((PTDF_{l,z} - s) * U_{z}, (PTDF_{l,z} - s) * L_{z})`
+    over the zones (and similarly for the minimum flow). If these bounds are
+    within the line's limits, the flow limit constraints can't bind and
+    the line is not monitored in that timepoint.
+
+    Lines with flow limits that can't be evaluated when the instance is
+    constructed (e.g., capacity determined by the optimization) are always
+    monitored, and the injections of the zones they connect are treated as
+    unbounded.
+    """
+    result = list()
+    for period, network in get_networks_by_period(mod).items():
+        for island, lines, ptdf in zip(
+            network.islands, network.island_lines, network.ptdfs
+        ):
+            # Line-zone matrices of the lines starting and ending in each zone
+            zone_index = {z: i for i, z in enumerate(island)}
+            starts = np.zeros((len(lines), len(island)))
+            ends = np.zeros((len(lines), len(island)))
+            for row, l in enumerate(lines):
+                starts[row, zone_index[mod.load_zone_from[l]]] = 1
+                ends[row, zone_index[mod.load_zone_to[l]]] = 1
+
+            shifted_ptdf = ptdf - np.median(ptdf, axis=1)[:, None]
+            positive = shifted_ptdf > 0
+            negative = shifted_ptdf < 0
+
+            for tmp in mod.TMPS_IN_PRD[period]:
+                min_flow = np.array([get_flow_limit(mod, l, tmp, "min") for l in lines])
+                max_flow = np.array([get_flow_limit(mod, l, tmp, "max") for l in lines])
+                unknown = np.isnan(min_flow) | np.isnan(max_flow)
+                min_flow[unknown], max_flow[unknown] = 0, 0
+
+                # Zone injection limits; zones connected to a line with
+                # unknown limits are unbounded
+                unbounded = (unknown @ (starts + ends)) > 0
+                min_injection = min_flow @ starts - max_flow @ ends
+                max_injection = max_flow @ starts - min_flow @ ends
+                min_injection[unbounded] = -np.inf
+                max_injection[unbounded] = np.inf
+
+                # Zones with a zero shifted PTDF don't contribute to the
+                # bounds (this also skips multiplying zero by infinity)
+                with np.errstate(invalid="ignore"):
+                    upper_bound = (
+                        np.where(positive, shifted_ptdf * max_injection, 0)
+                        + np.where(negative, shifted_ptdf * min_injection, 0)
+                    ).sum(axis=1)
+                    lower_bound = (
+                        np.where(positive, shifted_ptdf * min_injection, 0)
+                        + np.where(negative, shifted_ptdf * max_injection, 0)
+                    ).sum(axis=1)
+
+                monitored = (
+                    unknown | (upper_bound > max_flow) | (lower_bound < min_flow)
+                )
+                for row in np.nonzero(monitored)[0]:
+                    result.append((lines[row], tmp))
+
+    return result
+
+
+def get_flow_limit(mod, l, tmp, limit):
+    """
+    :param limit: "min" or "max"
+    :return: the line's minimum or maximum flow in the timepoint, or NaN if
+        it can't be evaluated
+
+    Get the numerical value of the line's flow limit for screening.
+    """
+    capacity = (
+        mod.Tx_Min_Capacity_MW[l, mod.period[tmp]]
+        if limit == "min"
+        else mod.Tx_Max_Capacity_MW[l, mod.period[tmp]]
+    )
+    flow_limit = value(capacity * mod.Tx_Availability_Derate[l, tmp], exception=False)
+    return np.nan if flow_limit is None else flow_limit
+
+
+# Expression Rules
+###############################################################################
+
+
+def transmit_power_expression_rule(mod, l, tmp):
+    """
+    **Expression Name**: TxPtdf_Transmit_Power_MW
+    **Defined Over**: TX_PTDF_MONITORED_OPR_TMPS
+    """
+    return ptdf_flow(mod, l, tmp)
+
+
+def ptdf_flow(mod, l, tmp):
+    """
+    The line flow is the sum of the zone injections multiplied by the
+    line's PTDFs.
+    """
+    p = mod.period[tmp]
+    return sum(
+        mod.tx_ptdf_factor[l, p, z] * mod.TxPtdf_Net_Injection_MW[z, tmp]
+        for z in mod.TX_PTDF_ZONES_BY_OPR_PRD[l, p]
+    )
+
+
+# Constraint Formulations
+###############################################################################
+
+
+def injection_balance_rule(mod, i, tmp):
+    """
+    **Constraint Name**: TxPtdf_Injection_Balance_Constraint
+    **Enforced Over**: TX_PTDF_ISLANDS_OPR_TMPS
+
+    The net injections of the zones in each network island must sum to zero
+    in each operational timepoint. The PTDFs are relative to the island's
+    reference zone, so this ensures that each zone's injection is equal to
+    the flow on the lines starting in the zone minus the flow on the lines
+    ending in the zone.
+    """
+    return (
+        sum(
+            mod.TxPtdf_Net_Injection_MW[z, tmp]
+            for z in mod.TX_PTDF_ZONES_IN_PRD_ISLAND[mod.period[tmp], i]
+        )
+        == 0
+    )
+
+
+def min_injection_rule(mod, z, tmp):
+    """
+    **Constraint Name**: TxPtdf_Min_Injection_Constraint
+    **Enforced Over**: TX_PTDF_ZONES_OPR_TMPS
+
+    A zone's net injection should exceed the minimum flow on the lines
+    starting in the zone minus the maximum flow on the lines ending in the
+    zone. This is implied by the line flow limits, but is needed to screen
+    out the lines that can't reach their limits.
+    """
+    p = mod.period[tmp]
+    return mod.TxPtdf_Net_Injection_MW[z, tmp] >= sum(
+        mod.Tx_Min_Capacity_MW[l, p] * mod.Tx_Availability_Derate[l, tmp]
+        for l in mod.TX_PTDF_FROM_PRD_ZONE[p, z]
+    ) - sum(
+        mod.Tx_Max_Capacity_MW[l, p] * mod.Tx_Availability_Derate[l, tmp]
+        for l in mod.TX_PTDF_TO_PRD_ZONE[p, z]
+    )
+
+
+def max_injection_rule(mod, z, tmp):
+    """
+    **Constraint Name**: TxPtdf_Max_Injection_Constraint
+    **Enforced Over**: TX_PTDF_ZONES_OPR_TMPS
+
+    A zone's net injection cannot exceed the maximum flow on the lines
+    starting in the zone minus the minimum flow on the lines ending in the
+    zone.
+    """
+    p = mod.period[tmp]
+    return mod.TxPtdf_Net_Injection_MW[z, tmp] <= sum(
+        mod.Tx_Max_Capacity_MW[l, p] * mod.Tx_Availability_Derate[l, tmp]
+        for l in mod.TX_PTDF_FROM_PRD_ZONE[p, z]
+    ) - sum(
+        mod.Tx_Min_Capacity_MW[l, p] * mod.Tx_Availability_Derate[l, tmp]
+        for l in mod.TX_PTDF_TO_PRD_ZONE[p, z]
+    )
+
+
+def min_transmit_rule(mod, l, tmp):
+    """
+    **Constraint Name**: TxPtdf_Min_Transmit_Constraint
+    **Enforced Over**: TX_PTDF_MONITORED_OPR_TMPS
+
+    Transmitted power should exceed the minimum transmission flow capacity in
+    each monitored timepoint.
+    """
+    return (
+        mod.TxPtdf_Transmit_Power_MW[l, tmp]
+        >= mod.Tx_Min_Capacity_MW[l, mod.period[tmp]]
+        * mod.Tx_Availability_Derate[l, tmp]
+    )
+
+
+def max_transmit_rule(mod, l, tmp):
+    """
+    **Constraint Name**: TxPtdf_Max_Transmit_Constraint
+    **Enforced Over**: TX_PTDF_MONITORED_OPR_TMPS
+
+    Transmitted power cannot exceed the maximum transmission flow capacity in
+    each monitored timepoint.
+    """
+    return (
+        mod.TxPtdf_Transmit_Power_MW[l, tmp]
+        <= mod.Tx_Max_Capacity_MW[l, mod.period[tmp]]
+        * mod.Tx_Availability_Derate[l, tmp]
+    )
+
+
+# Operational Type Methods
+###############################################################################
+
+
+def transmit_power_rule(mod, l, tmp):
+    """
+    Use the flow expression of monitored lines; the flow on other lines is
+    built here. The load balance uses the zone net injections instead of
+    the flows on *tx_ptdf* lines.
+    """
+    if (l, tmp) in mod.TX_PTDF_MONITORED_OPR_TMPS:
+        return mod.TxPtdf_Transmit_Power_MW[l, tmp]
+    return ptdf_flow(mod, l, tmp)
+
+
+def transmit_power_losses_lz_from_rule(mod, line, tmp):
+    """
+    No losses in the PTDF module for now.
+    """
+    return 0
+
+
+def transmit_power_losses_lz_to_rule(mod, line, tmp):
+    """
+    No losses in the PTDF module for now.
+    """
+    return 0
+
+
+# Input-Output
+###############################################################################
+
+
+def load_model_data(
+    m,
+    d,
+    data_portal,
+    scenario_directory,
+    weather_iteration,
+    hydro_iteration,
+    availability_iteration,
+    subproblem,
+    stage,
+):
+    """
+
+    :param m:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+    """
+
+    # Get the PTDF lines
+    df = read_input_table(
+        os.path.join(
+            scenario_directory,
+            weather_iteration,
+            hydro_iteration,
+            availability_iteration,
+            subproblem,
+            stage,
+            "inputs",
+            "transmission_lines.tab",
+        ),
+        usecols=[
+            "transmission_line",
+            "tx_operational_type",
+            "reactance_ohms",
+        ],
+    )
+    df = df[df["tx_operational_type"] == "tx_ptdf"]
+
+    # Dict of reactance by tx_ptdf line
+    reactance_ohms = dict(
+        zip(df["transmission_line"], pd.to_numeric(df["reactance_ohms"]))
+    )
+
+    # Load data
+    data_portal.data()["tx_ptdf_reactance_ohms"] = reactance_ohms
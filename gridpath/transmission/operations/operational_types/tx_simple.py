@@ -22,7 +22,6 @@ of line flow.
 """
 
 import os
-import pandas as pd
 from pyomo.environ import (
     Set,
     Param,
@@ -33,6 +32,7 @@ from pyomo.environ import (
     PercentFraction,
 )
 
+from gridpath.auxiliary.input_files import read_input_table
 from gridpath.auxiliary.auxiliary import (
     subset_init_by_param_value,
     subset_init_by_set_membership,
@@ -403,7 +403,7 @@ def load_model_data(
     """
 
     # Get the simple transport model lines
-    df = pd.read_csv(
+    df = read_input_table(
         os.path.join(
             scenario_directory,
             weather_iteration,
@@ -414,7 +414,6 @@ def load_model_data(
             "inputs",
             "transmission_lines.tab",
         ),
-        sep="\t",
         usecols=[
             "transmission_line",
             "tx_operational_type",
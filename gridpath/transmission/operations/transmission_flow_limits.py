@@ -23,7 +23,6 @@ of line flow.
 
 import csv
 import os
-import pandas as pd
 from pyomo.environ import (
     Set,
     Param,
@@ -34,6 +33,10 @@ from pyomo.environ import (
     PercentFraction,
 )
 
+from gridpath.auxiliary.input_files import (
+    get_input_table_columns,
+    read_input_table,
+)
 from gridpath.auxiliary.db_interface import directories_to_db_values
 
 Negative_Infinity = float("-inf")
@@ -217,19 +220,13 @@ def load_model_data(
         transmission_tmps_with_min = list()
         min_flow_mw = dict()
 
-        header = pd.read_csv(
-            transmission_flow_limits_file,
-            sep="\t",
-            header=None,
-            nrows=1,
-        ).values[0]
+        header = get_input_table_columns(transmission_flow_limits_file)
 
         optional_columns = ["min_flow_mw"]
         used_columns = [c for c in optional_columns if c in header]
 
-        df = pd.read_csv(
+        df = read_input_table(
             transmission_flow_limits_file,
-            sep="\t",
             usecols=["transmission_line", "timepoint"] + used_columns,
         )
 
@@ -259,19 +256,13 @@ def load_model_data(
         transmission_tmps_with_max = list()
         max_flow_mw = dict()
 
-        header = pd.read_csv(
-            transmission_flow_limits_file,
-            sep="\t",
-            header=None,
-            nrows=1,
-        ).values[0]
+        header = get_input_table_columns(transmission_flow_limits_file)
 
         optional_columns = ["max_flow_mw"]
         used_columns = [c for c in optional_columns if c in header]
 
-        df = pd.read_csv(
+        df = read_input_table(
             transmission_flow_limits_file,
-            sep="\t",
             usecols=["transmission_line", "timepoint"] + used_columns,
         )
 
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import os.path
 from pyomo.environ import (
     Param,
@@ -28,6 +27,7 @@ from pyomo.environ import (
 )
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.input_files import add_input_file_columns
 from gridpath.auxiliary.auxiliary import (
     cursor_to_df,
     subset_init_by_set_membership,
@@ -42,6 +42,8 @@ from gridpath.auxiliary.validations import write_validation_to_database, validat
 from gridpath.common_functions import create_results_df
 from gridpath.transmission import TX_TIMEPOINT_DF
 
+SCENARIO_LEVEL_INPUTS = True
+
 
 def add_model_components(
     m,
@@ -435,15 +437,14 @@ def write_model_inputs(
 
     # Make a dict for easy access
     tx_line_zone_dict = dict()
+    tx_line_contr_net_flow_dict = dict()
     for tx, zone, contr_net_flow in tx_lines_zones:
-        tx_line_zone_dict[str(tx)] = (
-            [".", "."]
-            if zone is None
-            else [str(zone), "." if contr_net_flow is None else contr_net_flow]
-        )
+        if zone is not None:
+            tx_line_zone_dict[str(tx)] = str(zone)
+            tx_line_contr_net_flow_dict[str(tx)] = contr_net_flow
 
-    with open(
-        os.path.join(
+    add_input_file_columns(
+        inputs_directory=os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -451,46 +452,13 @@ def write_model_inputs(
             subproblem,
             stage,
             "inputs",
-            "transmission_lines.tab",
         ),
-        "r",
-    ) as tx_lines_file_in:
-        reader = csv.reader(tx_lines_file_in, delimiter="\t", lineterminator="\n")
-
-        new_rows = list()
-
-        # Append column header
-        header = next(reader)
-        header.extend(["transmission_target_zone", "contributes_net_flow_to_tx_target"])
-        new_rows.append(header)
-
-        # Append correct values
-        for row in reader:
-            # If tx line specified, check if BA specified or not
-            if row[0] in list(tx_line_zone_dict.keys()):
-                row.extend(tx_line_zone_dict[row[0]])
-                new_rows.append(row)
-            # If tx line not specified, specify null BA and params
-            else:
-                row.extend([".", "."])
-                new_rows.append(row)
-
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "transmission_lines.tab",
-        ),
-        "w",
-        newline="",
-    ) as tx_lines_file_out:
-        writer = csv.writer(tx_lines_file_out, delimiter="\t", lineterminator="\n")
-        writer.writerows(new_rows)
+        input_file="transmission_lines.tab",
+        columns={
+            "transmission_target_zone": tx_line_zone_dict,
+            "contributes_net_flow_to_tx_target": tx_line_contr_net_flow_dict,
+        },
+    )
 
 
 # Validation
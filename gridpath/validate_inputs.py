@@ -16,18 +16,33 @@
 This script iterates over all modules required for a GridPath scenario and
 calls their *validate_inputs()* method, which performs various validations
 of the input data and scenario setup.
+
+If *--n_parallel_validation* is greater than 1, the module validations for
+each iteration and subproblem/stage are distributed to a pool of worker
+processes, each with its own read-only database connection. In either case,
+the validation errors found by the modules are collected and written to the
+status_validation table in a single transaction at the end, and the time
+spent in each module's validations is reported.
 """
 
+from multiprocessing import get_context
+import os.path
 import sqlite3
 import sys
+import time
 from argparse import ArgumentParser
+from urllib.request import pathname2url
 
 from db.common_functions import connect_to_database, spin_on_database_lock
 from gridpath.auxiliary.db_interface import (
     get_required_capacity_types_from_database,
     get_scenario_id_and_name,
 )
-from gridpath.auxiliary.validations import write_validation_to_database
+from gridpath.auxiliary.validations import (
+    collect_validation_results,
+    write_validation_to_database,
+    write_validation_rows_to_database,
+)
 from gridpath.common_functions import get_db_parser
 from gridpath.auxiliary.module_list import determine_modules, load_modules
 from gridpath.auxiliary.scenario_chars import (
@@ -46,6 +61,7 @@ def validate_inputs(
     availability_iteration,
     subscenarios,
     conn,
+    module_times=None,
 ):
     """ "
     For each module, load the inputs from the database and validate them
@@ -56,6 +72,8 @@ def validate_inputs(
         objects)
     :param subscenarios: SubScenarios object with all subscenario info
     :param conn: database connection
+    :param module_times: dictionary in which to accumulate the validation
+        time by module (optional)
     :return:
     """
 
@@ -74,6 +92,7 @@ def validate_inputs(
             # 1. input validation within each module
             for m in loaded_modules:
                 if hasattr(m, "validate_inputs"):
+                    module_start_time = time.perf_counter()
                     m.validate_inputs(
                         scenario_id=scenario_id,
                         subscenarios=subscenarios,
@@ -84,6 +103,12 @@ def validate_inputs(
                         stage=stage,
                         conn=conn,
                     )
+                    if module_times is not None:
+                        module_times[m.__name__] = (
+                            module_times.get(m.__name__, 0)
+                            + time.perf_counter()
+                            - module_start_time
+                        )
 
             # 2. input validation across modules
             #    make sure geography and projects are in line
@@ -91,6 +116,154 @@ def validate_inputs(
             #    create separate function for each validation that you call here
 
 
+def get_iterations(scenario_structure):
+    """
+    :param scenario_structure: ScenarioStructure object
+    :return: list of (weather_iteration, hydro_iteration,
+        availability_iteration) tuples
+    """
+    return [
+        (weather_iteration, hydro_iteration, availability_iteration)
+        for weather_iteration in scenario_structure.ITERATION_STRUCTURE.keys()
+        for hydro_iteration in scenario_structure.ITERATION_STRUCTURE[
+            weather_iteration
+        ].keys()
+        for availability_iteration in scenario_structure.ITERATION_STRUCTURE[
+            weather_iteration
+        ][hydro_iteration]
+    ]
+
+
+# Read-only database connection and loaded modules (by name) of a
+# validation worker process
+_VALIDATION_WORKER = {}
+
+
+def initialize_validation_worker(db_path, modules_to_use):
+    """
+    :param db_path: the path to the database
+    :param modules_to_use: list of the names of the modules to load
+
+    Pool initializer for the validation workers. Open a read-only
+    connection to the database and load the modules once when the worker
+    process starts; they are then reused for all the jobs the worker
+    handles. Validation results are returned to the main process, which is
+    the only one writing to the database.
+    """
+    if not os.path.isfile(db_path):
+        raise OSError(
+            "The database file {} was not found. Did you mean to "
+            "specify a different database file?".format(os.path.abspath(db_path))
+        )
+    _VALIDATION_WORKER["conn"] = sqlite3.connect(
+        "file:{}?mode=ro".format(pathname2url(os.path.abspath(db_path))),
+        uri=True,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+    )
+    _VALIDATION_WORKER["modules"] = {
+        m.__name__: m for m in load_modules(modules_to_use=modules_to_use)
+    }
+
+
+def validate_module_inputs_pool(job):
+    """
+    :param job: list with the module name, scenario_id, SubScenarios object,
+        iterations, subproblem, and stage to validate
+    :return: the module name, the list of validation rows, and the time it
+        took to validate the inputs in seconds
+
+    Job function for the validation worker pool: validate the inputs of
+    one module for one iteration and subproblem/stage.
+    """
+    [
+        module_name,
+        scenario_id,
+        subscenarios,
+        weather_iteration,
+        hydro_iteration,
+        availability_iteration,
+        subproblem,
+        stage,
+    ] = job
+
+    start_time = time.perf_counter()
+    with collect_validation_results() as validation_results:
+        _VALIDATION_WORKER["modules"][module_name].validate_inputs(
+            scenario_id=scenario_id,
+            subscenarios=subscenarios,
+            weather_iteration=weather_iteration,
+            hydro_iteration=hydro_iteration,
+            availability_iteration=availability_iteration,
+            subproblem=subproblem,
+            stage=stage,
+            conn=_VALIDATION_WORKER["conn"],
+        )
+
+    return (
+        module_name,
+        validation_results.rows,
+        time.perf_counter() - start_time,
+    )
+
+
+def validate_inputs_in_parallel(
+    scenario_structure,
+    modules_to_use,
+    loaded_modules,
+    scenario_id,
+    subscenarios,
+    db_path,
+    n_parallel_validation,
+    module_times,
+):
+    """
+    :param scenario_structure: ScenarioStructure object with the iteration
+        and subproblem/stage structure
+    :param modules_to_use: list of the names of the modules to use
+    :param loaded_modules: list of the loaded modules
+    :param scenario_id: the scenario_id
+    :param subscenarios: SubScenarios object with all subscenario info
+    :param db_path: the path to the database
+    :param n_parallel_validation: the number of worker processes
+    :param module_times: dictionary in which to accumulate the validation
+        time by module
+    :return: the list of validation rows to write to the database
+
+    Distribute the module x iteration x subproblem/stage validations to a
+    pool of worker processes. Rows are returned in the same order as when
+    validating sequentially.
+    """
+    jobs = [
+        [m.__name__, scenario_id, subscenarios] + list(iteration) + [subproblem, stage]
+        for iteration in get_iterations(scenario_structure)
+        for subproblem in scenario_structure.SUBPROBLEM_STAGES.keys()
+        for stage in scenario_structure.SUBPROBLEM_STAGES[subproblem]
+        for m in loaded_modules
+        if hasattr(m, "validate_inputs")
+    ]
+
+    # Pool must use spawn to work properly on Linux
+    pool = get_context("spawn").Pool(
+        n_parallel_validation,
+        initializer=initialize_validation_worker,
+        initargs=(db_path, modules_to_use),
+    )
+    try:
+        results = pool.map(validate_module_inputs_pool, jobs)
+        pool.close()
+        pool.join()
+    finally:
+        # Don't leave worker processes behind if a validation fails
+        pool.terminate()
+
+    rows = []
+    for module_name, module_rows, module_time in results:
+        rows.extend(module_rows)
+        module_times[module_name] = module_times.get(module_name, 0) + module_time
+
+    return rows
+
+
 def validate_subscenario_ids(scenario_id, subscenarios, optional_features, conn):
     """
     Check whether subscenarios_ids are consistent with:
@@ -349,6 +522,15 @@ def parse_arguments(args):
     parser.add_argument(
         "--quiet", default=False, action="store_true", help="Don't print run output."
     )
+    parser.add_argument(
+        "--n_parallel_validation",
+        default=1,
+        type=int,
+        help="Validate the module inputs for the iterations and "
+        "subproblems/stages in parallel with this many worker processes, each "
+        "with a read-only database connection. Default is 1, i.e. validate "
+        "sequentially.",
+    )
 
     parsed_arguments = parser.parse_known_args(args=args)[0]
 
@@ -439,14 +621,28 @@ def main(args=None):
         )
         loaded_modules = load_modules(modules_to_use=modules_to_use)
 
-        # Read in inputs from db and validate inputs for loaded modules
-        for weather_iteration in scenario_structure.ITERATION_STRUCTURE.keys():
-            for hydro_iteration in scenario_structure.ITERATION_STRUCTURE[
-                weather_iteration
-            ].keys():
-                for availability_iteration in scenario_structure.ITERATION_STRUCTURE[
-                    weather_iteration
-                ][hydro_iteration]:
+        # Read in inputs from db and validate inputs for loaded modules; the
+        # validation errors are collected and written in a single transaction
+        module_times = {}
+        start_time = time.perf_counter()
+        if parsed_arguments.n_parallel_validation > 1:
+            validation_rows = validate_inputs_in_parallel(
+                scenario_structure=scenario_structure,
+                modules_to_use=modules_to_use,
+                loaded_modules=loaded_modules,
+                scenario_id=scenario_id,
+                subscenarios=subscenarios,
+                db_path=db_path,
+                n_parallel_validation=parsed_arguments.n_parallel_validation,
+                module_times=module_times,
+            )
+        else:
+            with collect_validation_results() as validation_results:
+                for (
+                    weather_iteration,
+                    hydro_iteration,
+                    availability_iteration,
+                ) in get_iterations(scenario_structure):
                     validate_inputs(
                         scenario_structure,
                         loaded_modules,
@@ -456,7 +652,19 @@ def main(args=None):
                         availability_iteration,
                         subscenarios,
                         conn,
+                        module_times=module_times,
                     )
+            validation_rows = validation_results.rows
+
+        write_validation_rows_to_database(conn=conn, rows=validation_rows)
+
+        if not parsed_arguments.quiet:
+            print(
+                f"Validated module inputs in "
+                f"{time.perf_counter() - start_time:.2f} seconds."
+            )
+            for m in sorted(module_times.keys(), key=lambda k: -module_times[k]):
+                print(f"--- {m}: {module_times[m]:.2f} seconds")
 
     else:
         if not parsed_arguments.quiet:
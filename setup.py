@@ -21,8 +21,16 @@ extras_coverage = [
 
 extras_gurobi = ["gurobipy"]  # Gurobi Python interface
 extras_highs = ["highspy"]  # HiGHS Python interface
+extras_parquet = ["pyarrow"]  # Columnar (Parquet/Feather) input and results files
 
-extras_all = extras_doc + extras_black + extras_coverage + extras_gurobi + extras_highs
+extras_all = (
+    extras_doc
+    + extras_black
+    + extras_coverage
+    + extras_gurobi
+    + extras_highs
+    + extras_parquet
+)
 
 setup(
     name="GridPath",
@@ -62,6 +70,7 @@ setup(
         "coverage": extras_coverage,
         "gurobi": extras_gurobi,
         "highs": extras_highs,
+        "parquet": extras_parquet,
     },
     include_package_data=True,
     entry_points={
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pyomo.environ import AbstractModel
+import pandas as pd
+from pyomo.environ import AbstractModel, ConcreteModel, DataPortal, Param, Set
 import unittest
 
 import gridpath.auxiliary.auxiliary as auxiliary_module_to_test
@@ -91,6 +92,83 @@ class TestAuxiliary(unittest.TestCase):
         self.assertEqual(True, auxiliary_module_to_test.is_number(100.5))
         self.assertEqual(False, auxiliary_module_to_test.is_number("string"))
 
+    def test_subsets_init_by_param_value(self):
+        """
+        Subsets should be built for all param values, including ones with no
+        elements, and keep the order of the superset
+        :return:
+        """
+        m = ConcreteModel()
+        m.ZONES = Set(initialize=["Z1", "Z2", "Z3"])
+        m.TMPS = Set(initialize=[1, 2])
+        m.PROJECTS = Set(initialize=["A", "B", "C"])
+        m.zone = Param(m.PROJECTS, initialize={"A": "Z1", "B": "Z2", "C": "Z1"})
+        m.OPR_PRJS_IN_TMP = Set(m.TMPS, initialize={1: ["C", "A", "B"], 2: ["B"]})
+
+        self.assertDictEqual(
+            {"Z1": ["A", "C"], "Z2": ["B"], "Z3": []},
+            auxiliary_module_to_test.subsets_init_by_param_value(
+                mod=m,
+                set_name="PROJECTS",
+                param_name="zone",
+                param_value_set="ZONES",
+            ),
+        )
+
+        self.assertDictEqual(
+            {
+                ("Z1", 1): ["C", "A"],
+                ("Z1", 2): [],
+                ("Z2", 1): ["B"],
+                ("Z2", 2): ["B"],
+                ("Z3", 1): [],
+                ("Z3", 2): [],
+            },
+            auxiliary_module_to_test.subsets_init_by_param_value_and_tmp(
+                mod=m,
+                set_by_tmp="OPR_PRJS_IN_TMP",
+                param_name="zone",
+                param_value_set="ZONES",
+            ),
+        )
+
+    def test_df_to_data_portal(self):
+        """
+        Rows with a 0 in a broadcast column should be expanded in place to
+        all values
+        :return:
+        """
+        df = pd.DataFrame(
+            data=[("Wind", 2030, 1.0), ("Gas", 0, 2.0), ("Coal", 2020, 3.0)],
+            columns=["project", "period", "cost"],
+        )
+        data_portal = DataPortal(model=AbstractModel())
+        auxiliary_module_to_test.df_to_data_portal(
+            data_portal=data_portal,
+            df=df,
+            index_columns=["project", "period"],
+            params={"cost": "cost_by_prd"},
+            set_name="PRJ_PRDS",
+            broadcast={"period": {2030, 2020}},
+        )
+
+        expected_index = [
+            ("Wind", 2030),
+            ("Gas", 2020),
+            ("Gas", 2030),
+            ("Coal", 2020),
+        ]
+        self.assertListEqual(expected_index, data_portal.data()["PRJ_PRDS"][None])
+        self.assertDictEqual(
+            {
+                ("Wind", 2030): 1.0,
+                ("Gas", 2020): 2.0,
+                ("Gas", 2030): 2.0,
+                ("Coal", 2020): 3.0,
+            },
+            data_portal.data()["cost_by_prd"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
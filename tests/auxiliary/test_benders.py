@@ -0,0 +1,183 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dill
+import os.path
+import pandas as pd
+from pyomo.environ import (
+    AbstractModel,
+    Constraint,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    SolverFactory,
+    Suffix,
+    Var,
+    maximize,
+    value,
+)
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.opt import TerminationCondition
+import tempfile
+import types
+import unittest
+
+import gridpath.auxiliary.benders as module_to_test
+
+LOAD = {(1, 1): 4, (1, 2): 8, (2, 1): 6, (2, 2): 12}
+
+
+def add_capacity_components(m):
+    m.PERIODS = Set(initialize=[1, 2])
+    m.Capacity_MW = Var(within=NonNegativeReals)
+
+
+def add_operational_components(m):
+    m.TMPS = Set(dimen=2, initialize=sorted(LOAD.keys()))
+    m.load_mw = Param(m.TMPS, initialize=LOAD)
+    m.Power_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Unserved_Energy_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Max_Power_Constraint = Constraint(
+        m.TMPS, rule=lambda mod, prd, tmp: mod.Power_MW[prd, tmp] <= mod.Capacity_MW
+    )
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, prd, tmp: mod.Power_MW[prd, tmp]
+        + mod.Unserved_Energy_MW[prd, tmp]
+        == mod.load_mw[prd, tmp],
+    )
+    m.Max_Energy_Constraint = Constraint(
+        m.PERIODS,
+        rule=lambda mod, prd: sum(
+            mod.Power_MW[_prd, tmp] for (_prd, tmp) in mod.TMPS if _prd == prd
+        )
+        <= 100,
+    )
+    # Maximize the negative of the costs, like the NPV objective
+    m.NPV = Objective(
+        rule=lambda mod: -(
+            15 * mod.Capacity_MW
+            + sum(
+                mod.Power_MW[tmp] + 10 * mod.Unserved_Energy_MW[tmp] for tmp in mod.TMPS
+            )
+        ),
+        sense=maximize,
+    )
+
+
+def solve_function(model, parsed_arguments):
+    return SolverFactory("appsi_highs").solve(model)
+
+
+@unittest.skipUnless(
+    SolverFactory("appsi_highs").available(exception_flag=False),
+    "HiGHS not installed",
+)
+class TestBenders(unittest.TestCase):
+    """ """
+
+    def create_instance(self):
+        """
+        :return: the list of master variable names and the problem instance
+        """
+        master_variables = list()
+        m = AbstractModel()
+        with module_to_test.record_master_variables(
+            master_variables,
+            types.ModuleType("gridpath.project.capacity.test_module"),
+            m,
+        ):
+            add_capacity_components(m)
+        with module_to_test.record_master_variables(
+            master_variables,
+            types.ModuleType("gridpath.project.operations.test_module"),
+            m,
+        ):
+            add_operational_components(m)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+
+        return master_variables, m.create_instance()
+
+    def test_decompose(self):
+        """
+        The capacity variables should be in the master problem, each period
+        should be a subproblem, and the subproblem models should not
+        reference the problem instance
+        :return:
+        """
+        master_variables, instance = self.create_instance()
+        self.assertListEqual(["Capacity_MW"], master_variables)
+
+        subproblems = module_to_test.decompose(
+            instance=instance, master_variable_names=master_variables
+        )[-1]
+        self.assertEqual(2, len(subproblems))
+        for subproblem in subproblems:
+            # Two timepoints with power and unserved energy each, and the
+            # capacity
+            model = dill.loads(dill.dumps(subproblem.get_model()))
+            self.assertEqual(5, len(model.Variable))
+            self.assertEqual(len(subproblem.constraints), len(model.Constraints))
+            for c in model.component_data_objects(Constraint):
+                for var in identify_variables(c.body):
+                    self.assertIs(model, var.model())
+
+    def test_solve_with_benders(self):
+        """
+        The Benders solution should match the solution of the full problem,
+        whether the subproblems are solved sequentially or in parallel
+        :return:
+        """
+        master_variables, instance = self.create_instance()
+        solve_function(instance, None)
+        expected_npv = value(instance.NPV)
+
+        for n_parallel_benders in [1, 2]:
+            master_variables, instance = self.create_instance()
+            parsed_arguments = types.SimpleNamespace(
+                quiet=True,
+                benders_tolerance=1e-9,
+                benders_max_iterations=20,
+                n_parallel_benders=n_parallel_benders,
+            )
+            with tempfile.TemporaryDirectory() as results_directory:
+                termination_condition = module_to_test.solve_with_benders(
+                    instance=instance,
+                    master_variable_names=master_variables,
+                    solve_function=solve_function,
+                    parsed_arguments=parsed_arguments,
+                    results_directory=results_directory,
+                )
+                iterations_df = pd.read_csv(
+                    os.path.join(
+                        results_directory, module_to_test.BENDERS_ITERATIONS_FILENAME
+                    )
+                )
+
+            self.assertEqual(TerminationCondition.optimal, termination_condition)
+            self.assertAlmostEqual(expected_npv, value(instance.NPV), places=6)
+            self.assertAlmostEqual(8, value(instance.Capacity_MW), places=6)
+            self.assertAlmostEqual(
+                4, value(instance.Unserved_Energy_MW[2, 2]), places=6
+            )
+            # The subproblem duals are loaded into the instance
+            self.assertAlmostEqual(
+                -10, instance.dual[instance.Meet_Load_Constraint[2, 2]], places=6
+            )
+            self.assertLessEqual(iterations_df["relative_gap"].iloc[-1], 1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
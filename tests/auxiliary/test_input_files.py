@@ -0,0 +1,243 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from importlib.util import find_spec
+import os.path
+from pyomo.environ import AbstractModel, DataPortal, Param, Set, Any
+import tempfile
+import unittest
+
+import gridpath.auxiliary.input_files as input_files_module_to_test
+
+COLUMNS = ["project", "timepoint", "derate", "hyb_stor_derate"]
+ROWS = [
+    ("Wind", 1, 0.9, None),
+    ("Wind", 2, 0.8, None),
+    ("Solar", 1, 1.0, 0.5),
+]
+
+
+def get_model():
+    m = AbstractModel()
+    m.PRJ_TMPS = Set(dimen=2, within=Any)
+    m.derate = Param(m.PRJ_TMPS)
+    m.hyb_stor_derate = Param(m.PRJ_TMPS)
+
+    return m
+
+
+@unittest.skipUnless(find_spec("pyarrow"), "pyarrow not installed")
+class TestInputFiles(unittest.TestCase):
+    """ """
+
+    def test_columnar_round_trip(self):
+        """
+        Data written in the columnar formats should be loaded into the
+        DataPortal in the same way as from the .tab file
+        :return:
+        """
+        m = get_model()
+        with tempfile.TemporaryDirectory() as scenario_directory:
+            # Default format: nothing is written in columnar format
+            self.assertEqual(
+                "tab",
+                input_files_module_to_test.get_input_file_format(scenario_directory),
+            )
+            self.assertFalse(
+                input_files_module_to_test.write_columnar_input_file(
+                    scenario_directory=scenario_directory,
+                    inputs_directory=scenario_directory,
+                    filename="load_mw.tab",
+                    columns=COLUMNS,
+                    rows=ROWS,
+                )
+            )
+
+            # Tab file for comparison
+            with open(os.path.join(scenario_directory, "load_mw.tab"), "w") as f:
+                f.write("\t".join(COLUMNS) + "\n")
+                for row in ROWS:
+                    f.write(
+                        "\t".join(["." if i is None else str(i) for i in row]) + "\n"
+                    )
+            tab_data_portal = DataPortal(model=m)
+            input_files_module_to_test.load_input_file(
+                data_portal=tab_data_portal,
+                inputs_directory=scenario_directory,
+                filename="load_mw.tab",
+                index=m.PRJ_TMPS,
+                param=(m.derate, m.hyb_stor_derate),
+            )
+            os.remove(os.path.join(scenario_directory, "load_mw.tab"))
+
+            for fmt in ["parquet", "feather"]:
+                input_files_module_to_test.write_input_file_format(
+                    scenario_directory=scenario_directory, input_file_format=fmt
+                )
+                # Write in two batches to check appending
+                for rows in [ROWS[:2], ROWS[2:]]:
+                    self.assertTrue(
+                        input_files_module_to_test.write_columnar_input_file(
+                            scenario_directory=scenario_directory,
+                            inputs_directory=scenario_directory,
+                            filename="load_mw.tab",
+                            columns=COLUMNS,
+                            rows=rows,
+                        )
+                    )
+                self.assertTrue(
+                    input_files_module_to_test.get_input_file_path(
+                        scenario_directory, "load_mw.tab"
+                    ).endswith(fmt)
+                )
+
+                columnar_data_portal = DataPortal(model=m)
+                input_files_module_to_test.load_input_file(
+                    data_portal=columnar_data_portal,
+                    inputs_directory=scenario_directory,
+                    filename="load_mw.tab",
+                    index=m.PRJ_TMPS,
+                    param=(m.derate, m.hyb_stor_derate),
+                )
+                for c in ["PRJ_TMPS", "derate", "hyb_stor_derate"]:
+                    self.assertEqual(
+                        tab_data_portal.data()[c], columnar_data_portal.data()[c]
+                    )
+
+                os.remove(
+                    input_files_module_to_test.get_input_file_path(
+                        scenario_directory, "load_mw.tab"
+                    )
+                )
+
+    def test_unknown_input_file_format(self):
+        """
+        :return:
+        """
+        with self.assertRaises(ValueError):
+            input_files_module_to_test.write_input_file_format(
+                scenario_directory="", input_file_format="csv"
+            )
+
+
+class TestInputTableCache(unittest.TestCase):
+    """ """
+
+    def test_input_table_cache(self):
+        """
+        While the cache is enabled, a file should be parsed once and the
+        requested columns returned in file order; the cache should be
+        bypassed when disabled
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as inputs_directory:
+            file_path = os.path.join(inputs_directory, "projects.tab")
+            with open(file_path, "w") as f:
+                f.write("project\tload_zone\tcapacity_type\nWind\tZ1\tgen_spec\n")
+
+            with input_files_module_to_test.input_table_cache() as cache:
+                self.assertListEqual(
+                    ["project", "load_zone", "capacity_type"],
+                    input_files_module_to_test.get_input_table_columns(file_path),
+                )
+                df = input_files_module_to_test.read_input_table(
+                    file_path, usecols=["capacity_type", "project"]
+                )
+                self.assertListEqual(["project", "capacity_type"], list(df.columns))
+                # Modifying the returned dataframe doesn't modify the cache
+                df["project"] = "Solar"
+                self.assertListEqual(
+                    ["Wind"],
+                    list(
+                        input_files_module_to_test.read_input_table(file_path)[
+                            "project"
+                        ]
+                    ),
+                )
+                with self.assertRaises(ValueError):
+                    input_files_module_to_test.read_input_table(
+                        file_path, usecols=["project", "technology"]
+                    )
+
+            self.assertEqual(1, cache.misses)
+            self.assertEqual(3, cache.hits)
+            self.assertFalse(cache.enabled)
+            self.assertDictEqual({}, cache.tables)
+
+            with input_files_module_to_test.input_table_cache(enabled=False) as cache:
+                input_files_module_to_test.read_input_table(file_path)
+            self.assertEqual(0, cache.hits + cache.misses)
+
+
+class TestInputFileColumns(unittest.TestCase):
+    """ """
+
+    def test_add_input_file_columns(self):
+        """
+        Columns added while the input file columns are collected should only
+        be written on exit, joined to the rows by index, with "." for
+        missing values; outside of the context, they should be written right
+        away
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as inputs_directory:
+            file_path = os.path.join(inputs_directory, "projects.tab")
+            with open(file_path, "w") as f:
+                f.write("project\tload_zone\nWind\tZ1\nCoal\tZ1\nGas\tZ2\n")
+
+            with input_files_module_to_test.input_file_columns():
+                input_files_module_to_test.add_input_file_columns(
+                    inputs_directory=inputs_directory,
+                    input_file="projects.tab",
+                    columns={
+                        "regulation_up_ba": {"Coal": "Z1", "Gas": "Z2"},
+                        "regulation_up_derate": {"Coal": None, "Gas": "0.5"},
+                    },
+                )
+                input_files_module_to_test.add_input_file_columns(
+                    inputs_directory=inputs_directory,
+                    input_file="projects.tab",
+                    columns={"prm_zone": {"Wind": "Z1", "Nuclear": "Z1"}},
+                )
+                self.assertDictEqual(
+                    {"projects.tab": 2},
+                    input_files_module_to_test.get_pending_input_file_columns(
+                        inputs_directory
+                    ),
+                )
+                with open(file_path, "r") as f:
+                    self.assertEqual("project\tload_zone", f.readline().strip())
+
+            input_files_module_to_test.add_input_file_columns(
+                inputs_directory=inputs_directory,
+                input_file="projects.tab",
+                columns={"technology": {("Wind", "Z1"): "wind"}},
+                index_n_columns=2,
+            )
+
+            with open(file_path, "r") as f:
+                self.assertListEqual(
+                    [
+                        "project\tload_zone\tregulation_up_ba\tregulation_up_derate"
+                        "\tprm_zone\ttechnology\n",
+                        "Wind\tZ1\t.\t.\tZ1\twind\n",
+                        "Coal\tZ1\tZ1\t.\t.\t.\n",
+                        "Gas\tZ2\tZ2\t0.5\t.\t.\n",
+                    ],
+                    f.readlines(),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import pandas as pd
+from pyomo.environ import AbstractModel, Constraint, Param, Set, Var
+import tempfile
+import types
+import unittest
+
+import gridpath.auxiliary.model_profile as module_to_test
+
+
+def add_model_components(m):
+    m.TMPS = Set(initialize=[1, 2, 3])
+    m.load_mw = Param(m.TMPS, initialize={1: 1, 2: 2, 3: 3})
+    m.Power = Var(m.TMPS)
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS, rule=lambda mod, tmp: mod.Power[tmp] >= mod.load_mw[tmp]
+    )
+
+
+class TestModelProfile(unittest.TestCase):
+    """ """
+
+    def test_model_profile(self):
+        """
+        Module and component records should be added while profiling and
+        written to the logs directory; nothing should be recorded if not
+        profiling
+        :return:
+        """
+        module = types.ModuleType("gridpath.system.load_balance.test_module")
+        profile = module_to_test.ModelProfile()
+
+        m = AbstractModel()
+        with module_to_test.profile_module(
+            profile, "add_model_components", module, model=m
+        ):
+            add_model_components(m)
+        with module_to_test.profile_construction(profile):
+            m.create_instance()
+
+        # No records if not profiling
+        with module_to_test.profile_module(None, "add_model_components", module):
+            pass
+        with module_to_test.profile_construction(None):
+            AbstractModel().create_instance()
+
+        with tempfile.TemporaryDirectory() as logs_directory:
+            module_to_test.write_model_profile(
+                profile=profile, logs_directory=logs_directory
+            )
+            profile_df = pd.read_csv(
+                os.path.join(logs_directory, module_to_test.MODEL_PROFILE_FILENAME)
+            )
+
+        self.assertListEqual(
+            module_to_test.MODEL_PROFILE_COLUMNS, list(profile_df.columns)
+        )
+        self.assertListEqual(
+            ["add_model_components"] + ["construct_instance"] * 4,
+            list(profile_df["step"]),
+        )
+        self.assertListEqual(
+            ["system.load_balance.test_module"] * 5,
+            list(profile_df["gridpath_module"]),
+        )
+        self.assertEqual(4, profile_df["n_components"][0])
+        self.assertListEqual(
+            ["TMPS", "load_mw", "Power", "Meet_Load_Constraint"],
+            list(profile_df["component"][1:]),
+        )
+        self.assertListEqual(
+            ["Set", "Param", "Var", "Constraint"],
+            list(profile_df["component_type"][1:]),
+        )
+        self.assertListEqual([3, 3, 3, 3], list(profile_df["n_indices"][1:]))
+        self.assertTrue((profile_df["seconds"] >= 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
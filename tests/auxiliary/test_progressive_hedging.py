@@ -0,0 +1,233 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import pandas as pd
+from pyomo.environ import (
+    ConcreteModel,
+    Constraint,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    SolverFactory,
+    Suffix,
+    Var,
+    maximize,
+    value,
+)
+from pyomo.opt import TerminationCondition
+import tempfile
+import types
+import unittest
+
+import gridpath.auxiliary.progressive_hedging as module_to_test
+
+# Period 2020 is followed by either period 2030 or period 2031
+PREV_PERIOD = {2030: 2020, 2031: 2020}
+PROBABILITY = {2020: 1, 2030: 0.5, 2031: 0.5}
+TMP_PERIOD = {1: 2020, 2: 2030, 3: 2031}
+LOAD = {1: 4, 2: 10, 3: 6}
+BUILD_COST = {2020: 5, 2030: 8, 2031: 8}
+
+
+def create_instance():
+    """
+    :return: a small stochastic problem with two future trajectories
+    """
+    m = ConcreteModel()
+    m.PERIODS = Set(initialize=sorted(PROBABILITY.keys()))
+    m.NOT_FIRST_PRDS = Set(initialize=sorted(PREV_PERIOD.keys()))
+    m.prev_period = Param(m.NOT_FIRST_PRDS, initialize=PREV_PERIOD)
+    m.FUTURE_TRAJECTORY_PREV_PERIODS_BY_PERIOD = Set(
+        m.PERIODS,
+        initialize={2020: [2020], 2030: [2020, 2030], 2031: [2020, 2031]},
+    )
+    m.TMPS = Set(initialize=sorted(TMP_PERIOD.keys()))
+    m.period = Param(m.TMPS, initialize=TMP_PERIOD)
+
+    m.Build_MW = Var(m.PERIODS, within=NonNegativeReals)
+    m.Power_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Unserved_Energy_MW = Var(m.TMPS, within=NonNegativeReals)
+    m.Max_Power_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp]
+        <= sum(
+            mod.Build_MW[prd]
+            for prd in mod.FUTURE_TRAJECTORY_PREV_PERIODS_BY_PERIOD[mod.period[tmp]]
+        ),
+    )
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_MW[tmp] + mod.Unserved_Energy_MW[tmp]
+        == LOAD[tmp],
+    )
+    # Maximize the negative of the probability-weighted costs, like the NPV
+    # objective
+    m.NPV = Objective(
+        expr=-(
+            sum(
+                PROBABILITY[prd] * BUILD_COST[prd] * m.Build_MW[prd]
+                for prd in m.PERIODS
+            )
+            + sum(
+                PROBABILITY[TMP_PERIOD[tmp]] * 20 * m.Unserved_Energy_MW[tmp]
+                for tmp in m.TMPS
+            )
+        ),
+        sense=maximize,
+    )
+    m.dual = Suffix(direction=Suffix.IMPORT)
+
+    return m
+
+
+def solve_function(model, parsed_arguments):
+    return SolverFactory("appsi_highs").solve(model)
+
+
+class TestProgressiveHedging(unittest.TestCase):
+    """ """
+
+    def test_decompose(self):
+        """
+        Each future trajectory should be a subproblem, and only the 2020
+        variables should be shared
+        :return:
+        """
+        instance = create_instance()
+        self.assertListEqual(
+            [frozenset([2020, 2030]), frozenset([2020, 2031])],
+            module_to_test.get_trajectories(instance),
+        )
+
+        (
+            shared_variables,
+            shared_coefficients,
+            sense,
+            subproblems,
+        ) = module_to_test.decompose(instance=instance)
+        self.assertEqual(2, len(subproblems))
+        self.assertListEqual(
+            ["Build_MW[2020]", "Power_MW[1]", "Unserved_Energy_MW[1]"],
+            sorted(var.name for var in shared_variables),
+        )
+        self.assertEqual(maximize, sense)
+        # The 2020 timepoint constraints are in both subproblems
+        for subproblem in subproblems:
+            self.assertIn(
+                instance.Meet_Load_Constraint[1].name,
+                [c.name for c in subproblem.constraints],
+            )
+
+    def test_get_variable_periods(self):
+        """
+        The periods of a variable should be determined by the dimensions of
+        its index that are periods or timepoints, even if timepoint IDs are
+        also period IDs
+        :return:
+        """
+        m = ConcreteModel()
+        m.PERIODS = Set(initialize=[2020, 2030])
+        m.TMPS = Set(initialize=[2030, 1])
+        m.period = Param(m.TMPS, initialize={2030: 2020, 1: 2030})
+        m.PROJECTS = Set(initialize=["Project"])
+        m.HRZS = Set(initialize=[2030])
+        m.PRJ_OPR_PRDS = Set(
+            dimen=2,
+            within=m.PROJECTS * m.PERIODS,
+            initialize=[("Project", 2020), ("Project", 2030)],
+        )
+        # No declared domain
+        m.PRJ_OPR_TMPS = Set(dimen=2, initialize=[("Project", 2030), ("Project", 1)])
+        m.Build_MW = Var(m.PRJ_OPR_PRDS)
+        m.Power_MW = Var(m.PRJ_OPR_TMPS)
+        m.Commit = Var(m.PROJECTS, m.TMPS)
+        m.Horizon_Energy_MWh = Var(m.HRZS)
+
+        for var, expected_periods in [
+            (m.Build_MW["Project", 2030], [2030]),
+            (m.Power_MW["Project", 2030], [2020]),
+            (m.Power_MW["Project", 1], [2030]),
+            (m.Commit["Project", 2030], [2020]),
+            (m.Horizon_Energy_MWh[2030], []),
+        ]:
+            period_dimensions = module_to_test.get_period_dimensions(
+                m, var.parent_component().index_set()
+            )
+            self.assertSetEqual(
+                set(expected_periods),
+                set(
+                    module_to_test.get_variable_periods(
+                        var=var, period_dimensions=period_dimensions, instance=m
+                    )
+                ),
+                msg=var.name,
+            )
+
+    @unittest.skipUnless(
+        SolverFactory("appsi_highs").available(exception_flag=False),
+        "HiGHS not installed",
+    )
+    def test_solve_with_progressive_hedging(self):
+        """
+        The progressive hedging solution should match the solution of the
+        extensive form, whether the subproblems are solved sequentially or
+        in parallel
+        :return:
+        """
+        instance = create_instance()
+        solve_function(instance, None)
+        expected_npv = value(instance.NPV)
+
+        for n_parallel_ph in [1, 2]:
+            instance = create_instance()
+            parsed_arguments = types.SimpleNamespace(
+                quiet=True,
+                ph_tolerance=1e-4,
+                ph_max_iterations=100,
+                ph_rho=1.0,
+                n_parallel_ph=n_parallel_ph,
+            )
+            with tempfile.TemporaryDirectory() as results_directory:
+                termination_condition = module_to_test.solve_with_progressive_hedging(
+                    instance=instance,
+                    solve_function=solve_function,
+                    parsed_arguments=parsed_arguments,
+                    results_directory=results_directory,
+                )
+                iterations_df = pd.read_csv(
+                    os.path.join(
+                        results_directory, module_to_test.PH_ITERATIONS_FILENAME
+                    )
+                )
+
+            # Converged, but not proven optimal
+            self.assertEqual(TerminationCondition.feasible, termination_condition)
+            self.assertLessEqual(iterations_df["convergence"].iloc[-1], 1e-4)
+            self.assertLessEqual(
+                abs(value(instance.NPV) - expected_npv), 1e-4 * abs(expected_npv)
+            )
+            self.assertAlmostEqual(6, value(instance.Build_MW[2020]), places=2)
+            self.assertAlmostEqual(4, value(instance.Build_MW[2030]), places=2)
+            self.assertAlmostEqual(0, value(instance.Build_MW[2031]), places=2)
+            # The duals of constraints in a single trajectory are loaded into
+            # the instance
+            self.assertAlmostEqual(
+                -4, instance.dual[instance.Meet_Load_Constraint[2]], places=4
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
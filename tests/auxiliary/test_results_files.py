@@ -0,0 +1,172 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from importlib.util import find_spec
+import os.path
+import pandas as pd
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import gridpath.auxiliary.results_files as results_files_module_to_test
+
+
+def get_results_df():
+    return pd.DataFrame(
+        columns=["project", "timepoint", "power_mw", "committed_units"],
+        data=[
+            ["Wind", 1, 10.0, None],
+            ["Wind", 2, 5.5, None],
+            ["Coal", 1, 100.0, 1.0],
+            ["Coal", 2, 0.0, 0.0],
+            ["Gas", 1, 20.0, 1.0],
+        ],
+    ).set_index(["project", "timepoint"])
+
+
+class TestResultsFiles(unittest.TestCase):
+    """ """
+
+    def write_results_table(self, results_directory, results_file_format):
+        """
+        Write the results in two blocks, the second one with some of the rows
+        and a new column
+        """
+        df = get_results_df()
+        with results_files_module_to_test.ResultsFileWriter(
+            results_directory=results_directory,
+            which_results="project_timepoint",
+            results_file_format=results_file_format,
+        ) as writer:
+            writer.write(df[["power_mw"]])
+            writer.write(df.loc[df["committed_units"].notna(), ["committed_units"]])
+
+        return writer
+
+    def check_round_trip(self, results_file_format):
+        with tempfile.TemporaryDirectory() as results_directory:
+            # Write the rows of each block in several row groups
+            with patch.object(
+                results_files_module_to_test, "RESULTS_ROW_GROUP_SIZE", 2
+            ):
+                writer = self.write_results_table(
+                    results_directory=results_directory,
+                    results_file_format=results_file_format,
+                )
+            extension = results_files_module_to_test.RESULTS_FILE_FORMATS[
+                results_file_format
+            ]
+            self.assertListEqual(
+                [f"part-0{extension}", f"part-1{extension}"], writer.parts
+            )
+
+            results_filepath = results_files_module_to_test.get_results_file_path(
+                results_directory=results_directory,
+                which_results="project_timepoint",
+            )
+            self.assertEqual(
+                os.path.join(results_directory, "project_timepoint"),
+                results_filepath,
+            )
+            pd.testing.assert_frame_equal(
+                get_results_df().reset_index(),
+                results_files_module_to_test.read_results_file(results_filepath),
+                check_dtype=False,
+            )
+
+    def test_csv_round_trip(self):
+        """
+        Results written to CSV in blocks should be read back as one table
+        :return:
+        """
+        self.check_round_trip(results_file_format="csv")
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow not installed")
+    def test_columnar_round_trip(self):
+        """
+        Results written in the columnar formats in blocks should be read
+        back as one table, and replace results written in another format
+        :return:
+        """
+        for results_file_format in ["parquet", "feather"]:
+            self.check_round_trip(results_file_format=results_file_format)
+
+        with tempfile.TemporaryDirectory() as results_directory:
+            get_results_df().to_csv(
+                os.path.join(results_directory, "project_timepoint.csv")
+            )
+            self.write_results_table(
+                results_directory=results_directory, results_file_format="parquet"
+            )
+            self.assertListEqual(["project_timepoint"], os.listdir(results_directory))
+            self.assertListEqual(
+                sorted(
+                    [
+                        "part-0.parquet",
+                        "part-1.parquet",
+                        results_files_module_to_test.RESULTS_TABLE_METADATA_FILENAME,
+                    ]
+                ),
+                sorted(
+                    os.listdir(os.path.join(results_directory, "project_timepoint"))
+                ),
+            )
+
+    def test_read_results_file(self):
+        """
+        Results written as a single file are read as written; results tables
+        that weren't closed can't be read, and blocks must have the same
+        index
+        :return:
+        """
+        df = get_results_df()
+        with tempfile.TemporaryDirectory() as results_directory:
+            df.to_csv(os.path.join(results_directory, "project_timepoint.csv"))
+            results_filepath = results_files_module_to_test.get_results_file_path(
+                results_directory=results_directory,
+                which_results="project_timepoint",
+            )
+            pd.testing.assert_frame_equal(
+                df.reset_index(),
+                results_files_module_to_test.read_results_file(results_filepath),
+                check_dtype=False,
+            )
+
+            writer = results_files_module_to_test.ResultsFileWriter(
+                results_directory=results_directory,
+                which_results="project_timepoint",
+                results_file_format="csv",
+            )
+            writer.write(df)
+            with self.assertRaises(ValueError):
+                writer.write(df.reset_index().set_index("project"))
+            with self.assertRaises(ValueError):
+                results_files_module_to_test.read_results_file(
+                    os.path.join(results_directory, "project_timepoint")
+                )
+
+    def test_unknown_results_file_format(self):
+        """
+        :return:
+        """
+        with self.assertRaises(ValueError):
+            results_files_module_to_test.ResultsFileWriter(
+                results_directory="",
+                which_results="project_timepoint",
+                results_file_format="tab",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
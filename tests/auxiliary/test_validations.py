@@ -66,6 +66,66 @@ class TestValidations(unittest.TestCase):
         # Tear down: close connection
         conn.close()
 
+    def test_collect_validation_results(self):
+        """
+        Validation rows should be collected instead of written while in the
+        collection context and then written in one transaction
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute("""CREATE TABLE status_validation (
+            scenario_id INTEGER, subproblem_id INTEGER, stage_id INTEGER,
+            gridpath_module VARCHAR(64), db_table VARCHAR(64),
+            severity VARCHAR(32), description VARCHAR(1024),
+            time_stamp TEXT
+            );""")
+        conn.commit()
+
+        validation_args = dict(
+            conn=conn,
+            scenario_id=1,
+            weather_iteration=0,
+            hydro_iteration=0,
+            availability_iteration=0,
+            subproblem_id=1,
+            stage_id=1,
+            gridpath_module="project",
+            db_table="inputs_project_portfolios",
+            severity="High",
+        )
+
+        with module_to_test.collect_validation_results() as validation_results:
+            self.assertTrue(
+                module_to_test.write_validation_to_database(
+                    errors=["Error 1", "Error 2"], **validation_args
+                )
+            )
+            self.assertFalse(
+                module_to_test.write_validation_to_database(
+                    errors=[], **validation_args
+                )
+            )
+        self.assertFalse(validation_results.enabled)
+        self.assertListEqual(
+            ["Error 1", "Error 2"], [row[6] for row in validation_results.rows]
+        )
+        self.assertEqual(
+            0, conn.execute("SELECT COUNT(*) FROM status_validation").fetchone()[0]
+        )
+
+        module_to_test.write_validation_rows_to_database(
+            conn=conn, rows=validation_results.rows
+        )
+        module_to_test.write_validation_to_database(
+            errors=["Error 3"], **validation_args
+        )
+        self.assertListEqual(
+            [("Error 1",), ("Error 2",), ("Error 3",)],
+            conn.execute("SELECT description FROM status_validation").fetchall(),
+        )
+
+        conn.close()
+
     def test_validate_dtypes(self):
         """
 
@@ -15,8 +15,15 @@
 
 
 from importlib import import_module
+from importlib.util import find_spec
+import os.path
+import pandas as pd
+import tempfile
 import unittest
 
+from gridpath.auxiliary.results_files import ResultsFileWriter
+import gridpath.project.capacity.capacity_types.common_methods as COMMON_METHODS
+
 NAME_OF_MODULE_BEING_TESTED = "project.capacity.capacity_types.gen_new_lin"
 # Import the module we'll test
 try:
@@ -204,6 +211,73 @@ class TestCapacityTypeCommonMethods(unittest.TestCase):
             )
             self.assertListEqual(expected_project_vintages, actual_project_vintages)
 
+    def check_read_results_file_generic(self, results_file_format):
+        """
+        Write the project-period results in the requested format and check
+        that they are aggregated by load zone, technology, and period for
+        the capacity type
+        :param results_file_format:
+        :return:
+        """
+        df = pd.DataFrame(
+            {
+                "project": ["G1", "G2", "G3", "G4"],
+                "period": [2020, 2020, 2020, 2030],
+                "capacity_type": [
+                    "gen_new_lin",
+                    "gen_new_lin",
+                    "gen_spec",
+                    "gen_new_lin",
+                ],
+                "load_zone": ["Zone1", "Zone1", "Zone1", "Zone1"],
+                "technology": ["Solar", "Solar", "Solar", "Wind"],
+                "capacity_mw": [10.0, 5.0, 100.0, 20.0],
+            }
+        ).set_index(["project", "period"])
+
+        with tempfile.TemporaryDirectory() as scenario_directory:
+            results_directory = os.path.join(scenario_directory, "results")
+            os.makedirs(results_directory)
+            with ResultsFileWriter(
+                results_directory=results_directory,
+                which_results="project_period",
+                results_file_format=results_file_format,
+            ) as writer:
+                writer.write(df)
+            actual_df = COMMON_METHODS.read_results_file_generic(
+                scenario_directory=scenario_directory,
+                weather_iteration="",
+                hydro_iteration="",
+                availability_iteration="",
+                subproblem="",
+                stage="",
+                capacity_type="gen_new_lin",
+            )
+
+        self.assertDictEqual(
+            {("Zone1", "Solar", 2020): 15.0, ("Zone1", "Wind", 2030): 20.0},
+            actual_df["capacity_mw"].to_dict(),
+        )
+
+    def test_read_results_file_generic_csv(self):
+        """
+
+        :return:
+        """
+        self.check_read_results_file_generic(results_file_format="csv")
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow not installed")
+    def test_read_results_file_generic_columnar(self):
+        """
+        The project-period results are read from the Parquet or Feather
+        file if that's the format they were written in
+        :return:
+        """
+        for results_file_format in ["parquet", "feather"]:
+            self.check_read_results_file_generic(
+                results_file_format=results_file_format
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -198,6 +198,12 @@ class TestOperationalTypeCommonFunctions(unittest.TestCase):
             # test case
             self.assertListEqual([], actual_linked_tmps)
 
+        # The relevant timepoints are cached by balancing type and min time
+        self.assertIn(
+            (instance.balancing_type_project["Gas_CCGT"], 4),
+            instance.relevant_tmps_by_bt_min_time.keys(),
+        )
+
     def test_determine_relevant_linked_timepoints(self):
         """
         Check that the lists of relevant timepoints and relevant linked
@@ -472,6 +472,43 @@ class TestHorizons(unittest.TestCase):
             msg="Data for param next_tmp do not match " "expected.",
         )
 
+    def test_get_tmp_by_offset(self):
+        """
+        Offsets of -1 and 1 should give the previous and next timepoints;
+        larger offsets should wrap around circular horizons only
+        """
+        m, data = add_components_and_load_data(
+            prereq_modules=IMPORTED_PREREQ_MODULES,
+            module_to_test=MODULE_BEING_TESTED,
+            test_data_dir=TEST_DATA_DIRECTORY,
+            weather_iteration="",
+            hydro_iteration="",
+            availability_iteration="",
+            subproblem="",
+            stage="",
+        )
+        instance = m.create_instance(data)
+
+        for tmp, bt in instance.TMPS_BLN_TYPES:
+            self.assertEqual(
+                instance.prev_tmp[tmp, bt],
+                MODULE_BEING_TESTED.get_tmp_by_offset(instance, tmp, bt, -1),
+            )
+            self.assertEqual(
+                instance.next_tmp[tmp, bt],
+                MODULE_BEING_TESTED.get_tmp_by_offset(instance, tmp, bt, 1),
+            )
+
+            hrz = instance.horizon[tmp, bt]
+            n_hrz_tmps = len(instance.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])
+            expected_wrapped_tmp = (
+                tmp if instance.boundary[bt, hrz] == "circular" else "."
+            )
+            self.assertEqual(
+                expected_wrapped_tmp,
+                MODULE_BEING_TESTED.get_tmp_by_offset(instance, tmp, bt, n_hrz_tmps),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
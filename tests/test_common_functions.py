@@ -0,0 +1,98 @@
+# Copyright 2016-2025 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+from pyomo.environ import ConcreteModel, Expression, Param, Set, Var
+import unittest
+
+import gridpath.common_functions as common_functions_module_to_test
+
+
+def create_instance():
+    """
+    :return: a small instance with project-timepoint components
+    """
+    m = ConcreteModel()
+    m.PRJ_OPR_TMPS = Set(dimen=2, initialize=[("A", 1), ("A", 2), ("B", 1)])
+    m.Power = Var(m.PRJ_OPR_TMPS, initialize={("A", 1): 10, ("A", 2): 20})
+    m.Power_x2 = Expression(m.PRJ_OPR_TMPS, rule=lambda mod, p, t: 2 * mod.Power[p, t])
+    m.pmax = Param(m.PRJ_OPR_TMPS, default=100, mutable=True)
+    m.pmax["B", 1] = 50
+
+    return m
+
+
+class TestCommonFunctions(unittest.TestCase):
+    """ """
+
+    def test_get_component_values(self):
+        """
+        Check that the values are extracted in the order of the requested
+        indices and that variables without a value are NaN
+        :return:
+        """
+        m = create_instance()
+        np.testing.assert_array_equal(
+            np.array([10, 20, np.nan]),
+            common_functions_module_to_test.get_component_values(
+                component=m.Power, index=m.PRJ_OPR_TMPS
+            ),
+        )
+        m.Power["B", 1].set_value(5)
+        np.testing.assert_array_equal(
+            np.array([10, 40]),
+            common_functions_module_to_test.get_component_values(
+                component=m.Power_x2, index=[("B", 1), ("A", 2)]
+            ),
+        )
+        np.testing.assert_array_equal(
+            np.array([100, 50]),
+            common_functions_module_to_test.get_component_values(
+                component=m.pmax, index=[("A", 2), ("B", 1)]
+            ),
+        )
+
+    def test_create_component_results_df(self):
+        """
+        Check that the results dataframe has a column for each component or
+        array, indexed by the index columns
+        :return:
+        """
+        m = create_instance()
+        m.Power["B", 1].set_value(5)
+        actual_df = common_functions_module_to_test.create_component_results_df(
+            index_columns=["project", "timepoint"],
+            index=m.PRJ_OPR_TMPS,
+            components={
+                "power_mw": m.Power,
+                "power_x2_mw": m.Power_x2,
+                "zone": np.array(["Z1", "Z1", "Z2"], dtype=object),
+            },
+        )
+        expected_df = pd.DataFrame(
+            {
+                "project": ["A", "A", "B"],
+                "timepoint": [1, 2, 1],
+                "power_mw": [10.0, 20.0, 5.0],
+                "power_x2_mw": [20.0, 40.0, 10.0],
+                "zone": ["Z1", "Z1", "Z2"],
+            }
+        ).set_index(["project", "timepoint"])
+
+        pd.testing.assert_frame_equal(expected_df, actual_df)
+
+
+if __name__ == "__main__":
+    unittest.main()
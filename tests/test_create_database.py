@@ -13,9 +13,17 @@
 # limitations under the License.
 
 import os
+import sqlite3
+import tempfile
 import unittest
 
 from db import create_database
+from db.common_functions import (
+    BulkImportConnection,
+    connect_to_database,
+    start_bulk_import,
+    end_bulk_import,
+)
 
 # Change directory to 'db,' as it's what create_database.py expects
 os.chdir(os.path.join(os.path.dirname(__file__), "..", "db"))
@@ -27,3 +35,69 @@ class TestCreateDatabase(unittest.TestCase):
     """
 
     create_database.main(["--in_memory"])
+
+    def test_results_indexes(self):
+        """
+        Check that deleting results for a subproblem uses the results index
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "test.db")
+            create_database.main(["--database", db_path, "--omit_data"])
+            conn = connect_to_database(db_path=db_path)
+            query_plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                DELETE FROM results_project_timepoint
+                WHERE scenario_id = 1
+                AND weather_iteration = 0
+                AND hydro_iteration = 0
+                AND availability_iteration = 0
+                AND subproblem_id = 1
+                AND stage_id = 1;
+                """).fetchall()
+            conn.close()
+
+            self.assertIn(
+                "USING INDEX results_project_timepoint_scenario_idx",
+                " ".join([row[-1] for row in query_plan]),
+            )
+
+    def test_bulk_import_connection(self):
+        """
+        Check that commits are deferred during bulk imports
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "test.db")
+            create_database.main(["--database", db_path, "--omit_data"])
+            conn = connect_to_database(db_path=db_path, factory=BulkImportConnection)
+            # No scenarios in the database
+            conn.execute("PRAGMA foreign_keys=OFF;")
+            start_bulk_import(conn=conn)
+
+            insert_sql = """
+                INSERT INTO results_scenario (scenario_id, weather_iteration, 
+                hydro_iteration, availability_iteration, subproblem_id, stage_id)
+                VALUES (1, 0, 0, 0, 1, 1);
+                """
+            conn.execute(insert_sql)
+            conn.commit()
+            conn.rollback()
+            self.assertEqual(
+                0, conn.execute("SELECT COUNT(*) FROM results_scenario").fetchone()[0]
+            )
+
+            conn.execute(insert_sql)
+            conn.commit_bulk_import()
+            end_bulk_import(conn=conn)
+            # The journal mode is restored and the write-ahead log removed
+            self.assertEqual(
+                "delete", conn.execute("PRAGMA journal_mode;").fetchone()[0]
+            )
+            conn.close()
+            for ext in ["-wal", "-shm"]:
+                self.assertFalse(os.path.exists(db_path + ext))
+
+            conn = sqlite3.connect(db_path)
+            self.assertEqual(
+                1, conn.execute("SELECT COUNT(*) FROM results_scenario").fetchone()[0]
+            )
+            conn.close()
@@ -552,6 +552,33 @@ class TestExamples(unittest.TestCase):
             ]
         )
 
+    def test_example_multi_stage_prod_cost_parallel_persistent_workers(self):
+        """
+        Check objective function values of "multi_stage_prod_cost" example
+        running subproblems in parallel with persistent workers
+        :return:
+        """
+        actual_objective = run_scenario.main(
+            [
+                "--scenario",
+                "multi_stage_prod_cost",
+                "--scenario_location",
+                EXAMPLES_DIRECTORY,
+                "--n_parallel_solve",
+                "3",
+                "--persistent_workers",
+                "--quiet",
+                "--mute_solver_output",
+                "--testing",
+            ]
+        )
+
+        expected_objective = ast.literal_eval(
+            self.df.loc["multi_stage_prod_cost"]["expected_objective"]
+        )
+
+        self.assertDictAlmostEqual(expected_objective, actual_objective, places=1)
+
     def test_example_multi_stage_prod_cost_w_hydro(self):
         """
         Check validation and objective function values of
@@ -0,0 +1,62 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import gridpath.get_scenario_inputs as get_scenario_inputs_module_to_test
+
+
+class TestGetScenarioInputs(unittest.TestCase):
+    """ """
+
+    def test_determine_shared_inputs(self):
+        """
+        Scenario-level modules that write to a file also written by a
+        subproblem-level module can't be skipped
+        :return:
+        """
+        modules_to_use = [
+            "geography.load_zones",
+            "project",
+            "project.capacity.capacity",
+            "project.operations",
+            "system.load_balance.static_load_requirement",
+        ]
+        scenario_level_modules = ["geography.load_zones", "project"]
+        files_by_module = {
+            "geography.load_zones": {"load_zones.tab"},
+            "project": {"projects.tab"},
+            "project.capacity.capacity": {"spec_capacity_period_params.tab"},
+            "project.operations": {"projects.tab", "heat_rate_curves.tab"},
+            "system.load_balance.static_load_requirement": {"load_mw.tab"},
+        }
+
+        expected_modules_to_skip = ["geography.load_zones"]
+        expected_shared_files = ["load_zones.tab"]
+
+        (
+            actual_modules_to_skip,
+            actual_shared_files,
+        ) = get_scenario_inputs_module_to_test.determine_shared_inputs(
+            modules_to_use=modules_to_use,
+            scenario_level_modules=scenario_level_modules,
+            files_by_module=files_by_module,
+        )
+
+        self.assertListEqual(expected_modules_to_skip, actual_modules_to_skip)
+        self.assertListEqual(expected_shared_files, actual_shared_files)
+
+
+if __name__ == "__main__":
+    unittest.main()
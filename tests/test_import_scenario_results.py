@@ -0,0 +1,357 @@
+# Copyright 2016-2025 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from importlib.util import find_spec
+import os
+import pandas as pd
+from pyomo.environ import SolverFactory
+import shutil
+import tempfile
+import unittest
+
+from gridpath import import_scenario_results, run_end_to_end
+from gridpath.auxiliary.db_interface import import_csv
+from gridpath.auxiliary.model_profile import ModelProfile, write_model_profile
+from gridpath.auxiliary.results_files import ResultsFileWriter
+from db import create_database
+from db.common_functions import connect_to_database
+from db.utilities import port_csvs_to_db, scenario
+
+# Change directory to 'gridpath' directory, as that's what run_scenario.py
+# expects; the rest of the global variables are relative paths from there
+os.chdir(os.path.join(os.path.dirname(__file__), "..", "gridpath"))
+DB_SCHEMA = "../db/db_schema.sql"
+DATA_DIRECTORY = "../db/data"
+CSV_PATH = "../db/csvs_test_examples"
+SCENARIOS_CSV = os.path.join(CSV_PATH, "scenarios.csv")
+# A scenario with multiple subproblems and stages
+SCENARIO = "multi_stage_prod_cost"
+
+
+@unittest.skipUnless(
+    SolverFactory("highs").available(exception_flag=False), "HiGHS not installed"
+)
+class TestImportScenarioResults(unittest.TestCase):
+    """
+    Check that importing results in parallel gives the same results tables
+    as importing them sequentially.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up a testing database and run the scenario, importing its
+        results sequentially
+        :return:
+        """
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.db_path = os.path.join(cls.tmp_dir, "test_import.db")
+        cls.scenario_location = os.path.join(cls.tmp_dir, "scenarios")
+
+        create_database.main(
+            [
+                "--database",
+                cls.db_path,
+                "--db_schema",
+                DB_SCHEMA,
+                "--data_directory",
+                DATA_DIRECTORY,
+            ]
+        )
+        port_csvs_to_db.main(
+            ["--database", cls.db_path, "--csv_location", CSV_PATH, "--quiet"]
+        )
+        scenario.main(
+            ["--database", cls.db_path, "--csv_path", SCENARIOS_CSV, "--quiet"]
+        )
+
+        run_end_to_end.main(
+            [
+                "--database",
+                cls.db_path,
+                "--scenario",
+                SCENARIO,
+                "--scenario_location",
+                cls.scenario_location,
+                "--solver",
+                "highs",
+                "--quiet",
+                "--mute_solver_output",
+                "--testing",
+            ]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
+
+    def get_results(self):
+        """
+        :return: dictionary of the sorted rows of each results table for the
+            scenario
+        """
+        conn = connect_to_database(db_path=self.db_path)
+        c = conn.cursor()
+        (scenario_id,) = c.execute(
+            "SELECT scenario_id FROM scenarios WHERE scenario_name = ?;",
+            (SCENARIO,),
+        ).fetchone()
+        tables = [row[0] for row in c.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name LIKE 'results_%';
+                """).fetchall()]
+        results = {}
+        for tbl in tables:
+            columns = [col[1] for col in c.execute(f"PRAGMA table_info({tbl});")]
+            if "scenario_id" not in columns:
+                continue
+            results[tbl] = sorted(
+                c.execute(
+                    f"SELECT * FROM {tbl} WHERE scenario_id = ?;", (scenario_id,)
+                ).fetchall(),
+                key=repr,
+            )
+        conn.close()
+
+        return results
+
+    def import_results(self, n_parallel_import):
+        import_scenario_results.main(
+            [
+                "--database",
+                self.db_path,
+                "--scenario",
+                SCENARIO,
+                "--scenario_location",
+                self.scenario_location,
+                "--n_parallel_import",
+                str(n_parallel_import),
+                "--quiet",
+            ]
+        )
+
+    def test_parallel_import(self):
+        """
+        The results tables should be the same whether the results are
+        imported sequentially or in parallel
+        :return:
+        """
+        self.import_results(n_parallel_import=1)
+        sequential_results = self.get_results()
+        self.assertGreater(len(sequential_results["results_project_timepoint"]), 0)
+
+        self.import_results(n_parallel_import=2)
+        parallel_results = self.get_results()
+
+        self.assertListEqual(
+            sorted(sequential_results.keys()), sorted(parallel_results.keys())
+        )
+        for tbl in sequential_results.keys():
+            self.assertListEqual(
+                sequential_results[tbl], parallel_results[tbl], msg=tbl
+            )
+
+
+class TestImportModelProfile(unittest.TestCase):
+    """
+    Check that the results import profile is imported along with the model
+    profile.
+    """
+
+    def test_import_model_profile(self):
+        """
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "test_profile.db")
+            create_database.main(
+                ["--database", db_path, "--db_schema", DB_SCHEMA, "--omit_data"]
+            )
+            conn = connect_to_database(db_path=db_path)
+            # There are no scenarios in the database
+            conn.execute("PRAGMA foreign_keys=OFF;")
+
+            profile = ModelProfile()
+            profile.add_record(
+                step="add_model_components",
+                gridpath_module="system.load_balance.load_balance",
+                seconds=1.0,
+                memory=1024**2,
+                n_components=2,
+            )
+            write_model_profile(profile=profile, logs_directory=tmp_dir)
+
+            import_profile = ModelProfile()
+            import_profile.add_record(
+                step="import_results_into_database",
+                gridpath_module="system.load_balance.load_balance",
+                seconds=2.0,
+                memory=0,
+            )
+            import_scenario_results.import_model_profile(
+                db=conn,
+                scenario_id=1,
+                weather_iteration=0,
+                hydro_iteration=0,
+                availability_iteration=0,
+                subproblem=1,
+                stage=1,
+                logs_directory=tmp_dir,
+                import_profile=import_profile,
+            )
+            rows = conn.execute("""
+                SELECT step, gridpath_module, n_components, seconds, memory_mb
+                FROM results_scenario_model_profile;
+                """).fetchall()
+            conn.close()
+
+        self.assertListEqual(
+            [
+                (
+                    "add_model_components",
+                    "system.load_balance.load_balance",
+                    2,
+                    1.0,
+                    1.0,
+                ),
+                (
+                    "import_results_into_database",
+                    "system.load_balance.load_balance",
+                    None,
+                    2.0,
+                    0.0,
+                ),
+            ],
+            rows,
+        )
+
+
+class TestImportResultsTable(unittest.TestCase):
+    """
+    Check that a results table written in several blocks is imported as a
+    single table.
+    """
+
+    def check_import_results_table(self, results_file_format):
+        """
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "test_table.db")
+            create_database.main(
+                ["--database", db_path, "--db_schema", DB_SCHEMA, "--omit_data"]
+            )
+            results_directory = os.path.join(tmp_dir, "results")
+            os.makedirs(results_directory)
+
+            def get_df(data):
+                return pd.DataFrame(data).set_index(["project", "timepoint"])
+
+            with ResultsFileWriter(
+                results_directory=results_directory,
+                which_results="project_timepoint",
+                results_file_format=results_file_format,
+            ) as writer:
+                # All rows, then the blocks of two operational types with the
+                # same column, then a block with a new column
+                writer.write(
+                    get_df(
+                        {
+                            "project": ["Coal", "Coal", "Wind"],
+                            "timepoint": [1, 2, 1],
+                            "period": [2020, 2020, 2020],
+                        }
+                    )
+                )
+                writer.write(
+                    get_df({"project": ["Wind"], "timepoint": [1], "power_mw": [5.0]})
+                )
+                writer.write(
+                    get_df(
+                        {
+                            "project": ["Coal", "Coal"],
+                            "timepoint": [1, 2],
+                            "power_mw": [10.0, 20.0],
+                        }
+                    )
+                )
+                writer.write(
+                    get_df(
+                        {
+                            "project": ["Coal"],
+                            "timepoint": [2],
+                            "carbon_emissions_tons": [2.0],
+                        }
+                    )
+                )
+            self.assertEqual(4, len(writer.parts))
+
+            # The staged results (parallel imports) are the same
+            staged_results, _ = import_scenario_results.stage_subproblem_stage_results(
+                (1, ("", "", "", "", "", results_directory), ["project_timepoint"])
+            )
+            self.assertListEqual(
+                [os.path.join(results_directory, "project_timepoint")],
+                list(staged_results.keys()),
+            )
+
+            conn = connect_to_database(db_path=db_path)
+            # There are no scenarios in the database
+            conn.execute("PRAGMA foreign_keys=OFF;")
+            import_csv(
+                conn=conn,
+                cursor=conn.cursor(),
+                scenario_id=1,
+                weather_iteration="",
+                hydro_iteration="",
+                availability_iteration="",
+                subproblem="",
+                stage="",
+                quiet=True,
+                results_directory=results_directory,
+                which_results="project_timepoint",
+            )
+            rows = conn.execute("""
+                SELECT project, timepoint, period, power_mw, carbon_emissions_tons
+                FROM results_project_timepoint
+                ORDER BY project, timepoint;
+                """).fetchall()
+            conn.close()
+
+        self.assertListEqual(
+            [
+                ("Coal", 1, 2020, 10.0, None),
+                ("Coal", 2, 2020, 20.0, 2.0),
+                ("Wind", 1, 2020, 5.0, None),
+            ],
+            rows,
+        )
+
+    def test_import_csv_results_table(self):
+        """
+        :return:
+        """
+        self.check_import_results_table(results_file_format="csv")
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow not installed")
+    def test_import_columnar_results_table(self):
+        """
+        :return:
+        """
+        for results_file_format in ["parquet", "feather"]:
+            self.check_import_results_table(results_file_format=results_file_format)
+
+
+if __name__ == "__main__":
+    unittest.main()
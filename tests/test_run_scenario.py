@@ -0,0 +1,445 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import types
+import unittest
+from unittest import mock
+
+from pyomo.environ import (
+    AbstractModel,
+    Binary,
+    ConcreteModel,
+    Constraint,
+    DataPortal,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    SolverFactory,
+    Suffix,
+    Var,
+    value,
+)
+from pyomo.opt import TerminationCondition
+
+from gridpath.auxiliary.dynamic_components import DynamicComponents
+from gridpath.auxiliary.module_list import clear_module_registry
+import gridpath.run_scenario as run_scenario_module_to_test
+
+
+class TestRunScenario(unittest.TestCase):
+    """ """
+
+    def test_get_subproblem_stage_dependencies(self):
+        """
+        Check the dependency graph for two weather iterations with two
+        subproblems of two stages each
+        :return:
+        """
+        iteration_directory_strings = {
+            "weather_iteration_1": {"empty_string": ["empty_string"]},
+            "weather_iteration_2": {"empty_string": ["empty_string"]},
+        }
+        subproblem_stage_directory_strings = {"1": ["1", "2"], "2": ["1", "2"]}
+
+        # Independent subproblems: only stages depend on each other
+        expected_independent = {}
+        for w in ["weather_iteration_1", "weather_iteration_2"]:
+            for s in ["1", "2"]:
+                expected_independent[(w, "", "", s, "1")] = []
+                expected_independent[(w, "", "", s, "2")] = [(w, "", "", s, "1")]
+
+        actual_independent = (
+            run_scenario_module_to_test.get_subproblem_stage_dependencies(
+                iteration_directory_strings=iteration_directory_strings,
+                subproblem_stage_directory_strings=subproblem_stage_directory_strings,
+                linked_subproblems=False,
+            )
+        )
+        self.assertDictEqual(expected_independent, actual_independent)
+        self.assertListEqual(
+            list(expected_independent.keys()), list(actual_independent.keys())
+        )
+
+        # Linked subproblems: subproblems depend on the previous subproblem
+        # in the same iteration only
+        expected_linked = expected_independent.copy()
+        for w in ["weather_iteration_1", "weather_iteration_2"]:
+            expected_linked[(w, "", "", "2", "1")] = [(w, "", "", "1", "2")]
+
+        actual_linked = run_scenario_module_to_test.get_subproblem_stage_dependencies(
+            iteration_directory_strings=iteration_directory_strings,
+            subproblem_stage_directory_strings=subproblem_stage_directory_strings,
+            linked_subproblems=True,
+        )
+        self.assertDictEqual(expected_linked, actual_linked)
+
+    def test_reuse_model_structure(self):
+        """
+        Check that only the shapes of the sets and the indices and signs of
+        the mutable param values are part of the model structure, and that
+        the reused instance is relabeled with the new set members and its
+        params, including the ones derived from other params, are updated
+        """
+        model = AbstractModel()
+        model.TMPS = Set()
+        model.cap_factor = Param(model.TMPS, mutable=True)
+        model.load_mw = Param(model.TMPS)
+        model.prev_tmp = Param(
+            model.TMPS,
+            initialize=lambda mod, tmp: (
+                "." if tmp == mod.TMPS.first() else mod.TMPS.prev(tmp)
+            ),
+            within=model.TMPS | {"."},
+        )
+        model.peak_cap_factor = Param(
+            initialize=lambda mod: max(value(mod.cap_factor[t]) for t in mod.TMPS),
+            mutable=True,
+        )
+        model.cap_factor_default = Param(
+            model.TMPS,
+            default=lambda mod, tmp: value(mod.cap_factor[tmp]) / 2,
+            mutable=True,
+        )
+        model.Power = Var(model.TMPS)
+        model.Ramp_Constraint = Constraint(
+            model.TMPS,
+            rule=lambda mod, tmp: (
+                Constraint.Skip
+                if mod.prev_tmp[tmp] == "."
+                else mod.Power[tmp] - mod.Power[mod.prev_tmp[tmp]] <= 1
+            ),
+        )
+
+        def get_data(tmps, cap_factors, loads):
+            data = DataPortal(model=model)
+            data["TMPS"] = {None: tmps}
+            data["cap_factor"] = dict(zip(tmps, cap_factors))
+            data["load_mw"] = dict(zip(tmps, loads))
+            return data
+
+        d = DynamicComponents()
+        data_1 = get_data([1, 2], [0.5, 0.2], [10, 20])
+        structure_1 = run_scenario_module_to_test.get_model_structure(
+            model=model, dynamic_components=d, loaded_data=data_1
+        )
+        # Different timepoints and mutable param values with the same signs:
+        # same structure
+        data_2 = get_data([3, 4], [0.1, 0.7], [10, 20])
+        self.assertEqual(
+            structure_1,
+            run_scenario_module_to_test.get_model_structure(
+                model=model, dynamic_components=d, loaded_data=data_2
+            ),
+        )
+        # Different order of the timepoints: different structure
+        self.assertNotEqual(
+            structure_1,
+            run_scenario_module_to_test.get_model_structure(
+                model=model,
+                dynamic_components=d,
+                loaded_data=get_data([4, 3], [0.1, 0.7], [10, 20]),
+            ),
+        )
+        # Different number of timepoints: different structure
+        self.assertNotEqual(
+            structure_1,
+            run_scenario_module_to_test.get_model_structure(
+                model=model,
+                dynamic_components=d,
+                loaded_data=get_data([3, 4, 5], [0.1, 0.7, 0.2], [10, 20, 30]),
+            ),
+        )
+        # Different sign of a mutable param value: different structure
+        self.assertNotEqual(
+            structure_1,
+            run_scenario_module_to_test.get_model_structure(
+                model=model,
+                dynamic_components=d,
+                loaded_data=get_data([1, 2], [-1, 0.7], [10, 20]),
+            ),
+        )
+        # Different immutable param value: different structure
+        self.assertNotEqual(
+            structure_1,
+            run_scenario_module_to_test.get_model_structure(
+                model=model,
+                dynamic_components=d,
+                loaded_data=get_data([1, 2], [0.5, 0.2], [10, 30]),
+            ),
+        )
+        # Immutable param value equal to a timepoint: different structure
+        self.assertNotEqual(
+            structure_1,
+            run_scenario_module_to_test.get_model_structure(
+                model=model,
+                dynamic_components=d,
+                loaded_data=get_data([1, 2], [0.5, 0.2], [10, 2]),
+            ),
+        )
+
+        instance = model.create_instance(data_1)
+        self.assertEqual(value(instance.cap_factor_default[2]), 0.1)
+        ramp_constraint = instance.Ramp_Constraint[2]
+
+        # The timepoints are relabeled by position
+        data_instance = run_scenario_module_to_test.create_data_instance(
+            model=model, loaded_data=data_2
+        )
+        self.assertFalse(hasattr(data_instance, "Power"))
+        relabel = run_scenario_module_to_test.get_relabel_map(
+            instance=instance,
+            set_members=run_scenario_module_to_test.get_set_members(
+                model=model, loaded_data=data_1
+            ),
+            data_instance=data_instance,
+            new_set_members=run_scenario_module_to_test.get_set_members(
+                model=model, loaded_data=data_2
+            ),
+        )
+        self.assertEqual(3, relabel[1])
+        self.assertEqual(4, relabel[2])
+
+        self.assertTrue(run_scenario_module_to_test.can_relabel_instance(instance))
+        run_scenario_module_to_test.relabel_instance(
+            instance=instance, relabel=relabel, data_instance=data_instance
+        )
+        run_scenario_module_to_test.update_mutable_params(
+            instance=instance, data_instance=data_instance
+        )
+        self.assertListEqual([3, 4], list(instance.TMPS))
+        self.assertListEqual([3, 4], list(instance.Power.keys()))
+        self.assertEqual("Power[4]", instance.Power[4].name)
+        self.assertIs(ramp_constraint, instance.Ramp_Constraint[4])
+        self.assertDictEqual(
+            {3: ".", 4: 3}, {tmp: instance.prev_tmp[tmp] for tmp in instance.TMPS}
+        )
+        self.assertDictEqual(
+            {3: 0.1, 4: 0.7},
+            {tmp: value(instance.cap_factor[tmp]) for tmp in instance.TMPS},
+        )
+        self.assertEqual(value(instance.peak_cap_factor), 0.7)
+        self.assertEqual(value(instance.cap_factor_default[4]), 0.35)
+
+        # The instance can't be reused if an immutable param value changes
+        data_3 = get_data([5, 6], [0.1, 0.7], [10, 30])
+        self.assertIsNone(
+            run_scenario_module_to_test.get_relabel_map(
+                instance=instance,
+                set_members=[3, 4],
+                data_instance=run_scenario_module_to_test.create_data_instance(
+                    model=model, loaded_data=data_3
+                ),
+                new_set_members=run_scenario_module_to_test.get_set_members(
+                    model=model, loaded_data=data_3
+                ),
+            )
+        )
+
+    def test_relabel_layout(self):
+        """
+        Check the private Pyomo component layout that *relabel_instance*
+        relies on; if this fails after a Pyomo upgrade, *relabel_instance*
+        must be updated before extending RELABEL_PYOMO_VERSIONS
+        """
+        from_version, to_version = run_scenario_module_to_test.RELABEL_PYOMO_VERSIONS
+        self.assertTrue(
+            from_version
+            <= tuple(run_scenario_module_to_test.pyomo_version_info[:2])
+            < to_version,
+            msg="The installed Pyomo version hasn't been checked",
+        )
+
+        instance = ConcreteModel()
+        instance.TMPS = Set(initialize=[1, 2])
+        instance.TMP_PAIRS = Set(instance.TMPS, initialize={1: [1], 2: [1, 2]})
+        instance.load_mw = Param(instance.TMPS, initialize={1: 10, 2: 20})
+        instance.cap_factor = Param(
+            instance.TMPS, initialize={1: 0.5, 2: 0.2}, mutable=True
+        )
+        instance.Power = Var(instance.TMPS)
+        instance.Max_Power_Constraint = Constraint(
+            instance.TMPS,
+            rule=lambda mod, tmp: mod.Power[tmp] <= mod.cap_factor[tmp],
+        )
+
+        # Each indexed component keeps its component data objects in a
+        # dictionary by index, and each component data object its index
+        for component in [
+            instance.TMP_PAIRS,
+            instance.cap_factor,
+            instance.Power,
+            instance.Max_Power_Constraint,
+        ]:
+            self.assertIsInstance(component._data, dict)
+            self.assertListEqual([1, 2], list(component._data.keys()))
+            for index in [1, 2]:
+                self.assertIs(component[index], component._data[index])
+                self.assertEqual(index, component._data[index]._index)
+                self.assertEqual(index, component[index].index())
+        # Immutable params keep their values
+        self.assertDictEqual({1: 10, 2: 20}, instance.load_mw._data)
+        self.assertTrue(run_scenario_module_to_test.can_relabel_instance(instance))
+
+        # With other Pyomo versions, the instance is not relabeled
+        with mock.patch.object(
+            run_scenario_module_to_test, "pyomo_version_info", (7, 0, 0, "final", 0)
+        ):
+            self.assertFalse(run_scenario_module_to_test.can_relabel_instance(instance))
+
+    @unittest.skipUnless(
+        SolverFactory("appsi_highs").available(exception_flag=False),
+        "HiGHS not installed",
+    )
+    def test_solve_with_persistent_solver(self):
+        """
+        Check that the solution and duals are loaded into the instance and
+        that re-solving the same instance with the kept solver object picks
+        up the updated mutable params and fixed variables
+        """
+        instance = ConcreteModel()
+        instance.demand = Param(initialize=4, mutable=True)
+        instance.Power = Var([1, 2], within=NonNegativeReals)
+        instance.Meet_Demand_Constraint = Constraint(
+            expr=instance.Power[1] + instance.Power[2] >= instance.demand
+        )
+        instance.Max_Power_Constraint = Constraint(expr=instance.Power[1] <= 3)
+        instance.Cost = Objective(expr=2 * instance.Power[1] + 3 * instance.Power[2])
+        instance.dual = Suffix(direction=Suffix.IMPORT)
+        parsed_arguments = types.SimpleNamespace(
+            solver_executable=None,
+            mute_solver_output=True,
+            keepfiles=False,
+            symbolic=False,
+        )
+
+        def solve():
+            results = run_scenario_module_to_test.solve_with_persistent_solver(
+                instance=instance,
+                solver_name="highs",
+                solver_options={},
+                parsed_arguments=parsed_arguments,
+            )
+            self.assertEqual(
+                TerminationCondition.optimal, results.solver.termination_condition
+            )
+            return (
+                value(instance.Power[1]),
+                value(instance.Power[2]),
+                instance.dual[instance.Meet_Demand_Constraint],
+                instance.dual[instance.Max_Power_Constraint],
+            )
+
+        for expected, actual in zip((3, 1, 3, -1), solve()):
+            self.assertAlmostEqual(expected, actual)
+        optimizer = run_scenario_module_to_test._PERSISTENT_SOLVERS["appsi_highs"]
+
+        # Updated mutable param
+        instance.demand = 2
+        for expected, actual in zip((2, 0, 2, 0), solve()):
+            self.assertAlmostEqual(expected, actual)
+
+        # Fixed variable
+        instance.Power[1].fix(0)
+        for expected, actual in zip((0, 2, 3, 0), solve()):
+            self.assertAlmostEqual(expected, actual)
+        self.assertIs(
+            optimizer, run_scenario_module_to_test._PERSISTENT_SOLVERS["appsi_highs"]
+        )
+
+        # Unsupported solver
+        with self.assertRaises(ValueError):
+            run_scenario_module_to_test.solve_with_persistent_solver(
+                instance=instance,
+                solver_name="glpk",
+                solver_options={},
+                parsed_arguments=parsed_arguments,
+            )
+
+    def test_warm_start_values(self):
+        """
+        Check that the variable values of a previous solution are set where
+        the variable and index exist in both instances, skipping fixed
+        variables and rounding integer variables
+        """
+        previous_instance = ConcreteModel()
+        previous_instance.Power = Var([1, 2, 3], initialize=10)
+        previous_instance.Commit = Var([1, 2, 3], within=Binary, initialize=1)
+        previous_instance.Commit[3].set_value(None)
+        previous_instance.Commit[2].set_value(0.9999999, skip_validation=True)
+        solution = run_scenario_module_to_test.get_solution_values(
+            instance=previous_instance
+        )
+        self.assertDictEqual(
+            {
+                "Power": {1: 10, 2: 10, 3: 10},
+                "Commit": {1: 1, 2: 0.9999999},
+            },
+            solution,
+        )
+
+        instance = ConcreteModel()
+        instance.Power = Var([2, 3, 4])
+        instance.Commit = Var([2, 3, 4], within=Binary)
+        instance.Power[3].fix(5)
+        seeded_variables = run_scenario_module_to_test.set_warm_start_values(
+            instance=instance, solution=solution
+        )
+        self.assertEqual(2, seeded_variables)
+        self.assertDictEqual(
+            {2: 10, 3: 5, 4: None},
+            {tmp: instance.Power[tmp].value for tmp in [2, 3, 4]},
+        )
+        self.assertDictEqual(
+            {2: 1, 3: None, 4: None},
+            {tmp: instance.Commit[tmp].value for tmp in [2, 3, 4]},
+        )
+
+    def test_set_up_gridpath_modules(self):
+        """
+        Check that the scenario's modules are loaded once and the same
+        module list and loaded modules are returned until the registry is
+        cleared
+        """
+        scenario_directory = os.path.join(
+            os.path.dirname(__file__), "..", "examples", "test"
+        )
+        clear_module_registry()
+        modules_to_use, loaded_modules = (
+            run_scenario_module_to_test.set_up_gridpath_modules(
+                scenario_directory=scenario_directory, multi_stage=False
+            )
+        )
+        self.assertIn("project.operations.reserves.regulation_up", modules_to_use)
+        self.assertEqual(len(modules_to_use), len(loaded_modules))
+
+        modules_to_use_again, loaded_modules_again = (
+            run_scenario_module_to_test.set_up_gridpath_modules(
+                scenario_directory=scenario_directory, multi_stage=False
+            )
+        )
+        self.assertIs(modules_to_use, modules_to_use_again)
+        self.assertIs(loaded_modules, loaded_modules_again)
+
+        clear_module_registry()
+        modules_to_use_new, _ = run_scenario_module_to_test.set_up_gridpath_modules(
+            scenario_directory=scenario_directory, multi_stage=False
+        )
+        self.assertIsNot(modules_to_use, modules_to_use_new)
+        self.assertListEqual(modules_to_use, modules_to_use_new)
+
+
+if __name__ == "__main__":
+    unittest.main()
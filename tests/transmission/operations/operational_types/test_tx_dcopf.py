@@ -646,6 +646,33 @@ class TestTxOperations(unittest.TestCase):
         )
         self.assertDictEqual(expected_reactance, actual_reactance)
 
+    def test_get_network_cycles(self):
+        """
+        Check the cycle lines and directions of a network with a parallel
+        line and a radial line, and that the cycles are cached by topology
+        :return:
+        """
+        topology = (
+            ("Tx1", "Zone1", "Zone2"),
+            ("Tx1_Parallel", "Zone2", "Zone1"),
+            ("Tx2", "Zone1", "Zone3"),
+            ("Tx3", "Zone2", "Zone3"),
+            ("Tx4", "Zone3", "Zone4"),
+        )
+        cycles = MODULE_BEING_TESTED.get_network_cycles(topology)
+
+        self.assertEqual(1, len(cycles))
+        self.assertListEqual(["Zone1", "Zone2", "Zone3"], sorted(cycles[0].zones))
+        # The first of the parallel lines is used
+        self.assertListEqual(["Tx1", "Tx2", "Tx3"], sorted(cycles[0].tx_lines))
+        directions = dict(zip(cycles[0].tx_lines, cycles[0].directions))
+        self.assertIn(
+            directions,
+            [{"Tx1": 1, "Tx2": -1, "Tx3": 1}, {"Tx1": -1, "Tx2": 1, "Tx3": -1}],
+        )
+
+        self.assertIs(cycles, MODULE_BEING_TESTED.get_network_cycles(topology))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,223 @@
+# Copyright 2016-2023 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from importlib import import_module
+import os.path
+import sys
+import unittest
+
+from tests.common_functions import create_abstract_model, add_components_and_load_data
+
+TEST_DATA_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "test_data"
+)
+
+# Import prerequisite modules
+PREREQUISITE_MODULE_NAMES = [
+    "temporal.operations.timepoints",
+    "temporal.investment.periods",
+    "temporal.operations.horizons",
+    "geography.load_zones",
+    "transmission",
+    "transmission.capacity",
+    "transmission.capacity.capacity_types",
+    "transmission.capacity.capacity",
+    "transmission.availability.availability",
+]
+NAME_OF_MODULE_BEING_TESTED = "transmission.operations.operational_types.tx_ptdf"
+
+IMPORTED_PREREQ_MODULES = list()
+for mdl in PREREQUISITE_MODULE_NAMES:
+    try:
+        imported_module = import_module("." + str(mdl), package="gridpath")
+        IMPORTED_PREREQ_MODULES.append(imported_module)
+    except ImportError:
+        print("ERROR! Module " + str(mdl) + " not found.")
+        sys.exit(1)
+# Import the module we'll test
+try:
+    MODULE_BEING_TESTED = import_module(
+        "." + NAME_OF_MODULE_BEING_TESTED, package="gridpath"
+    )
+except ImportError:
+    print("ERROR! Couldn't import module " + NAME_OF_MODULE_BEING_TESTED + " to test.")
+
+
+class TestTxOperations(unittest.TestCase):
+    """ """
+
+    def test_add_model_components(self):
+        """
+        Test that there are no errors when adding model components
+        :return:
+        """
+        create_abstract_model(
+            prereq_modules=IMPORTED_PREREQ_MODULES,
+            module_to_test=MODULE_BEING_TESTED,
+            test_data_dir=TEST_DATA_DIRECTORY,
+            weather_iteration="",
+            hydro_iteration="",
+            availability_iteration="",
+            subproblem="",
+            stage="",
+        )
+
+    def test_load_model_data(self):
+        """
+        Test that data are loaded with no errors
+        :return:
+        """
+        add_components_and_load_data(
+            prereq_modules=IMPORTED_PREREQ_MODULES,
+            module_to_test=MODULE_BEING_TESTED,
+            test_data_dir=TEST_DATA_DIRECTORY,
+            weather_iteration="",
+            hydro_iteration="",
+            availability_iteration="",
+            subproblem="",
+            stage="",
+        )
+
+    def test_data_loaded_correctly(self):
+        """
+        The test data lines are of the tx_dcopf operational type, so switch
+        them to tx_ptdf (with the same reactances) before creating the
+        instance
+        :return:
+        """
+        m, data = add_components_and_load_data(
+            prereq_modules=IMPORTED_PREREQ_MODULES,
+            module_to_test=MODULE_BEING_TESTED,
+            test_data_dir=TEST_DATA_DIRECTORY,
+            weather_iteration="",
+            hydro_iteration="",
+            availability_iteration="",
+            subproblem="",
+            stage="",
+        )
+        for tx, reactance in [("Tx1", 0.5), ("Tx2", 0.3), ("Tx3", 0.4)]:
+            data.data()["tx_operational_type"][tx] = "tx_ptdf"
+            data.data()["tx_ptdf_reactance_ohms"][tx] = reactance
+        instance = m.create_instance(data)
+
+        # Set: TX_PTDF
+        expected_tx = sorted(["Tx1", "Tx2", "Tx3"])
+        actual_tx = sorted(instance.TX_PTDF)
+        self.assertListEqual(expected_tx, actual_tx)
+
+        # Set: TX_PTDF_OPR_PRDS
+        expected_tx_op_prds = sorted(
+            [(tx, p) for tx in ["Tx1", "Tx2", "Tx3"] for p in [2020, 2030]]
+        )
+        actual_tx_op_prds = sorted(instance.TX_PTDF_OPR_PRDS)
+        self.assertListEqual(expected_tx_op_prds, actual_tx_op_prds)
+
+        # Set: TX_PTDF_ZONES_IN_PRD_ISLAND
+        expected_zones = {
+            (2020, 0): ["Zone1", "Zone2", "Zone3"],
+            (2030, 0): ["Zone1", "Zone2", "Zone3"],
+        }
+        actual_zones = {
+            (p, i): list(instance.TX_PTDF_ZONES_IN_PRD_ISLAND[p, i])
+            for (p, i) in instance.PRDS_TX_PTDF_ISLANDS
+        }
+        self.assertDictEqual(expected_zones, actual_zones)
+
+        # Set: TX_PTDF_FROM_PRD_ZONE
+        expected_lines_from = {
+            (p, z): lines
+            for p in [2020, 2030]
+            for (z, lines) in [
+                ("Zone1", ["Tx1", "Tx2"]),
+                ("Zone2", ["Tx3"]),
+                ("Zone3", []),
+            ]
+        }
+        actual_lines_from = {
+            (p, z): sorted(instance.TX_PTDF_FROM_PRD_ZONE[p, z])
+            for (p, z) in instance.PRDS_TX_PTDF_ZONES
+        }
+        self.assertDictEqual(expected_lines_from, actual_lines_from)
+
+        # Param: tx_ptdf_factor
+        # Zone1 is the reference zone, so its PTDFs are zero and not included
+        expected_ptdf = {
+            (tx, p, z): ptdf
+            for p in [2020, 2030]
+            for (tx, z, ptdf) in [
+                ("Tx1", "Zone2", -7 / 12),
+                ("Tx1", "Zone3", -1 / 4),
+                ("Tx2", "Zone2", -5 / 12),
+                ("Tx2", "Zone3", -3 / 4),
+                ("Tx3", "Zone2", 5 / 12),
+                ("Tx3", "Zone3", -1 / 4),
+            ]
+        }
+        actual_ptdf = {
+            (tx, p, z): instance.tx_ptdf_factor[tx, p, z]
+            for (tx, p, z) in instance.TX_PTDF_OPR_PRDS_ZONES
+        }
+        self.assertListEqual(sorted(expected_ptdf), sorted(actual_ptdf))
+        for k in expected_ptdf:
+            self.assertAlmostEqual(expected_ptdf[k], actual_ptdf[k])
+
+        # Set: TX_PTDF_MONITORED_OPR_TMPS
+        # In January 2020, Tx1 and Tx2 are derated to 5 MW, so the flow on
+        # Tx3 can't reach its 10 MW limit
+        expected_unmonitored = sorted(
+            [("Tx3", tmp) for tmp in range(20200101, 20200125)]
+        )
+        actual_unmonitored = sorted(
+            set(instance.TX_PTDF_OPR_TMPS) - set(instance.TX_PTDF_MONITORED_OPR_TMPS)
+        )
+        self.assertListEqual(expected_unmonitored, actual_unmonitored)
+
+        # Expression: TxPtdf_Transmit_Power_MW
+        # The flow expressions are only built for the monitored lines
+        self.assertListEqual(
+            sorted(instance.TX_PTDF_MONITORED_OPR_TMPS),
+            sorted(instance.TxPtdf_Transmit_Power_MW.keys()),
+        )
+
+    def test_get_ptdf_network(self):
+        """
+        Check the islands and the PTDFs of a network with parallel lines
+        :return:
+        """
+        # Two parallel lines between Z1 and Z2, and a separate Z3-Z4 island
+        topology = (
+            ("L1", "Z1", "Z2", 1.0),
+            ("L2", "Z2", "Z1", 3.0),
+            ("L3", "Z3", "Z4", 2.0),
+        )
+        network = MODULE_BEING_TESTED.get_ptdf_network(topology)
+
+        self.assertTupleEqual((("Z1", "Z2"), ("Z3", "Z4")), network.islands)
+        self.assertTupleEqual((("L1", "L2"), ("L3",)), network.island_lines)
+        # One MW injected in Z2 splits in inverse proportion to reactance
+        self.assertListEqual(
+            [[0, -0.75], [0, 0.25]], network.ptdfs[0].round(6).tolist()
+        )
+        self.assertListEqual([[0, -1]], network.ptdfs[1].tolist())
+        self.assertDictEqual(
+            {"Z1": ("L1",), "Z2": ("L2",), "Z3": ("L3",)}, network.lines_from
+        )
+
+        # Cached by topology
+        self.assertIs(network, MODULE_BEING_TESTED.get_ptdf_network(topology))
+
+
+if __name__ == "__main__":
+    unittest.main()